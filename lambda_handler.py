@@ -12,6 +12,7 @@ from datetime import datetime, timezone, timedelta
 from src.structured_logging import get_structured_logger
 from src.delivery_tracker import DeliveryTracker
 from src.failure_tracker import FailureTracker
+from src import pdf_session
 
 # 워크플로우 모듈
 from src.workflow import check_idempotency, check_failure_limit, send_emails, upload_to_icloud
@@ -19,6 +20,8 @@ from src.workflow.icloud_workflow import upload_itfind_to_icloud
 from src.workflow.pdf_workflow import (
     download_and_process_pdf,
     download_itfind_pdf,
+    optimize_attachment,
+    written_by_pymupdf,
 )
 
 # 로깅 설정
@@ -61,7 +64,7 @@ def handler(event, context):
     logger.info("===== IT뉴스 PDF 전송 작업 시작 =====")
 
     # 안전한 이벤트 로깅 (민감정보 제외)
-    safe_event = {k: v for k, v in event.items() if k in ["mode", "request_id"]}
+    safe_event = {k: v for k, v in event.items() if k in ["mode", "request_id", "pdf_writer"]}
     logger.info(f"Event (safe): {json.dumps(safe_event)}")
 
     # 실행 모드 결정 (기본값: test)
@@ -86,6 +89,7 @@ def handler(event, context):
 
     pdf_path = None
     processed_pdf_path = None
+    attachment_pdf_path = None
 
     try:
         # 0. 멱등성 보장
@@ -126,7 +130,7 @@ def handler(event, context):
         # 2. 전자신문 PDF 다운로드 및 처리
         try:
             pdf_path, processed_pdf_path, page_info = download_and_process_pdf(
-                failure_tracker
+                failure_tracker, pdf_writer=event.get("pdf_writer")
             )
 
         except ValueError as ve:
@@ -183,11 +187,20 @@ def handler(event, context):
         else:
             logger.info("📅 오늘은 목요일이 아님 - ITFIND 다운로드 건너뛰기")
 
+        # 3-1. 첨부 PDF 크기 최적화 (실패 시 처리된 PDF 그대로 첨부)
+        attachment_pdf_path = optimize_attachment(
+            processed_pdf_path,
+            compacted=written_by_pymupdf(pdf_path, processed_pdf_path, event.get("pdf_writer")),
+        )
+        if attachment_pdf_path:
+            # [S20] 1면 렌더링·첨부 인코딩이 같은 문서 세션을 공유
+            pdf_session.open_session(attachment_pdf_path)
+
         # 4. 이메일 전송 (모드에 따라 수신인 결정)
         logger.info("4단계: 이메일 전송 시작")
 
         email_success, success_emails, itfind_email_success, itfind_success_emails = \
-            send_emails(processed_pdf_path, is_test_mode, itfind_pdf_path, itfind_trend_info)
+            send_emails(attachment_pdf_path, is_test_mode, itfind_pdf_path, itfind_trend_info)
 
         if not email_success:
             logger.error("전자신문 이메일 전송 실패")
@@ -263,10 +276,12 @@ def handler(event, context):
         }
 
     finally:
-        # 임시 파일 정리
+        # 문서 세션 닫기 후 임시 파일 정리
+        pdf_session.close_all()
         cleanup_temp_files(
             pdf_path,
             processed_pdf_path,
+            attachment_pdf_path if attachment_pdf_path != processed_pdf_path else None,
             itfind_pdf_path if "itfind_pdf_path" in locals() else None,
         )
 
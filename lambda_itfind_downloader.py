@@ -22,6 +22,10 @@ elif os.path.exists('./src'):
     sys.path.insert(0, './src')
 
 from src.itfind_scraper import ItfindScraper
+from src.utils.keyword_matcher import KeywordMatcher
+from src.pdf_session import get_session, session_scope
+from src.rss_feed_cache import fetch_feed
+from src.utils.http_session import get_http_session, http_stats
 import requests
 import xml.etree.ElementTree as ET
 import re
@@ -30,101 +34,124 @@ import re
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# [S17] 본문 각주(면책 조항) 판별 키워드 — 모두 나오면 각주
+_FOOTNOTE_MATCHER = KeywordMatcher(['본 내용은', '문의하시기 바랍니다'], ignore_case=False)
 
-def get_latest_weekly_trend_from_rss():
-    """
-    RSS 피드에서 최신 주간기술동향 정보 조회 (브라우저 불필요)
 
-    Returns:
-        dict: {'title': str, 'issue_number': str, 'publish_date': str, 'pdf_url': str, 'detail_id': str}
+def _parse_weekly_trend_rss(content: bytes) -> Optional[Dict[str, Any]]:
     """
-    try:
-        rss_url = "https://www.itfind.or.kr/ccenter/rss.do?codeAlias=all&rssType=02"
-        logger.info(f"RSS 피드 조회: {rss_url}")
-
-        response = requests.get(rss_url, timeout=30)
-        response.raise_for_status()
-
-        root = ET.fromstring(response.content)
-        items = root.findall('.//item')
-
-        logger.info(f"RSS 피드 항목 수: {len(items)}")
-
-        # 첫 번째 주간기술동향의 호수 찾기
-        target_issue_number = None
-        topics = []
-        first_detail_id = None
-        first_pdf_url = None
-        first_publish_date = None  # 첫 번째 항목의 발행일 저장
+    RSS 본문에서 최신 주간기술동향 정보 파싱
 
-        for item in items:
-            title_elem = item.find('title')
-            link_elem = item.find('link')
-            pubdate_elem = item.find('pubDate')
+    Args:
+        content: RSS XML 바이트
 
-            if title_elem is None or link_elem is None:
-                continue
+    Returns:
+        dict: get_latest_weekly_trend_from_rss 반환 형식 또는 None
+    """
+    root = ET.fromstring(content)
+    items = root.findall('.//item')
+
+    logger.info(f"RSS 피드 항목 수: {len(items)}")
+
+    # 첫 번째 주간기술동향의 호수 찾기
+    target_issue_number = None
+    topics = []
+    first_detail_id = None
+    first_pdf_url = None
+    first_publish_date = None  # 첫 번째 항목의 발행일 저장
+
+    for item in items:
+        title_elem = item.find('title')
+        link_elem = item.find('link')
+        pubdate_elem = item.find('pubDate')
+
+        if title_elem is None or link_elem is None:
+            continue
+
+        title = title_elem.text
+        link = link_elem.text
+
+        # 주간기술동향 필터링
+        if not title or '[주간기술동향' not in title:
+            continue
+
+        # 호수 추출
+        issue_match = re.search(r'\[주간기술동향\s+(\d+)호\]', title)
+        if not issue_match:
+            continue
+
+        issue_number = issue_match.group(1)
+
+        # 첫 번째 주간기술동향의 호수 저장
+        if target_issue_number is None:
+            target_issue_number = issue_number
+            logger.info(f"✅ 주간기술동향 발견: {title} ({issue_number}호)")
+
+            # 발행일 파싱 (실제 RSS pubDate 사용)
+            if pubdate_elem is not None and pubdate_elem.text:
+                first_publish_date = parse_rss_pubdate(pubdate_elem.text)
+                logger.info(f"   RSS 발행일: {pubdate_elem.text} -> {first_publish_date}")
+
+            # detail_id 추출 (첫 번째 것만 사용)
+            detail_id_match = re.search(r'identifier=([\w-]+)', link)
+            first_detail_id = detail_id_match.group(1).replace('TVOL_', '') if detail_id_match else None
+
+            if first_detail_id:
+                first_pdf_url = f"https://www.itfind.or.kr/admin/getStreamDocsRegi.htm?identifier=TVOL_{first_detail_id}"
+            else:
+                first_pdf_url = link.replace('http://', 'https://')
+
+        # 같은 호수의 모든 토픽 수집
+        if issue_number == target_issue_number:
+            # 제목에서 토픽 추출 (호수 부분 제거)
+            topic = re.sub(r'\s*\[주간기술동향\s+\d+호\]', '', title).strip()
+            if topic:
+                topics.append(topic)
+                logger.info(f"   토픽 추가: {topic}")
+
+    if target_issue_number and first_detail_id:
+        # 첫 번째 토픽을 대표 제목으로 사용
+        main_title = topics[0] if topics else f"주간기술동향 {target_issue_number}호"
 
-            title = title_elem.text
-            link = link_elem.text
+        return {
+            'title': main_title,  # 첫 번째 토픽 (호수 제외)
+            'issue_number': target_issue_number,
+            # pubDate가 없으면 None — 현재 날짜 fallback은 조회 시점에 적용 (캐시된 결과에 고정되지 않도록)
+            'publish_date': first_publish_date,
+            'pdf_url': first_pdf_url,
+            'detail_id': first_detail_id,
+            'topics': topics  # 모든 토픽 리스트
+        }
 
-            # 주간기술동향 필터링
-            if not title or '[주간기술동향' not in title:
-                continue
+    logger.warning("RSS 피드에서 주간기술동향을 찾을 수 없습니다")
+    return None
 
-            # 호수 추출
-            issue_match = re.search(r'\[주간기술동향\s+(\d+)호\]', title)
-            if not issue_match:
-                continue
 
-            issue_number = issue_match.group(1)
+def get_latest_weekly_trend_from_rss(session: Optional[requests.Session] = None, backend=None):
+    """
+    RSS 피드에서 최신 주간기술동향 정보 조회 (브라우저 불필요)
 
-            # 첫 번째 주간기술동향의 호수 저장
-            if target_issue_number is None:
-                target_issue_number = issue_number
-                logger.info(f"✅ 주간기술동향 발견: {title} ({issue_number}호)")
+    [S26] 조건부 GET 캐시(rss_feed_cache) 사용 — 피드가 바뀌지 않았으면 파싱 없이 이전 결과 반환
 
-                # 발행일 파싱 (실제 RSS pubDate 사용)
-                if pubdate_elem is not None and pubdate_elem.text:
-                    first_publish_date = parse_rss_pubdate(pubdate_elem.text)
-                    logger.info(f"   RSS 발행일: {pubdate_elem.text} -> {first_publish_date}")
+    Args:
+        session: [S25] 공유 HTTP 세션 (None이면 get_http_session())
+        backend: [S26] 피드 캐시 StorageBackend (None이면 프로세스 메모리만)
 
-                # detail_id 추출 (첫 번째 것만 사용)
-                detail_id_match = re.search(r'identifier=([\w-]+)', link)
-                first_detail_id = detail_id_match.group(1).replace('TVOL_', '') if detail_id_match else None
+    Returns:
+        dict: {'title': str, 'issue_number': str, 'publish_date': str, 'pdf_url': str, 'detail_id': str}
+    """
+    try:
+        rss_url = "https://www.itfind.or.kr/ccenter/rss.do?codeAlias=all&rssType=02"
+        logger.info(f"RSS 피드 조회: {rss_url}")
 
-                if first_detail_id:
-                    first_pdf_url = f"https://www.itfind.or.kr/admin/getStreamDocsRegi.htm?identifier=TVOL_{first_detail_id}"
-                else:
-                    first_pdf_url = link.replace('http://', 'https://')
-
-            # 같은 호수의 모든 토픽 수집
-            if issue_number == target_issue_number:
-                # 제목에서 토픽 추출 (호수 부분 제거)
-                topic = re.sub(r'\s*\[주간기술동향\s+\d+호\]', '', title).strip()
-                if topic:
-                    topics.append(topic)
-                    logger.info(f"   토픽 추가: {topic}")
-
-        if target_issue_number and first_detail_id:
-            # 발행일 (RSS에서 파싱한 실제 발행일 사용, 없으면 현재 날짜로 fallback)
+        trend = fetch_feed(
+            "itfind_weekly_trend", rss_url, _parse_weekly_trend_rss, session=session, backend=backend
+        )
+        if trend and not trend['publish_date']:
+            # 발행일이 없으면 현재 날짜로 fallback (캐시된 결과는 건드리지 않음)
             kst = timezone(timedelta(hours=9))
-            publish_date = first_publish_date if first_publish_date else datetime.now(kst).strftime("%Y-%m-%d")
-
-            # 첫 번째 토픽을 대표 제목으로 사용
-            main_title = topics[0] if topics else f"주간기술동향 {target_issue_number}호"
-
-            return {
-                'title': main_title,  # 첫 번째 토픽 (호수 제외)
-                'issue_number': target_issue_number,
-                'publish_date': publish_date,
-                'pdf_url': first_pdf_url,
-                'detail_id': first_detail_id,
-                'topics': topics  # 모든 토픽 리스트
-            }
-
-        logger.warning("RSS 피드에서 주간기술동향을 찾을 수 없습니다")
-        return None
+            trend = {**trend, 'publish_date': datetime.now(kst).strftime("%Y-%m-%d")}
+        return trend
 
     except Exception as e:
         logger.error(f"RSS 피드 조회 실패: {e}")
@@ -233,17 +260,25 @@ def extract_topics_from_pdf_page3(pdf_path: str) -> Dict[str, List[str]]:
 
         logger.info(f"PDF 3페이지에서 카테고리별 토픽 추출 (상태 머신): {pdf_path}")
 
-        doc = fitz.open(pdf_path)
+        # [S20] 등록된 문서 세션이 있으면 세션의 페이지 텍스트 캐시 사용
+        session = get_session(pdf_path)
+        if session is not None:
+            if session.page_count < 3:
+                logger.warning(f"PDF에 3페이지가 없습니다 (총 {session.page_count}페이지)")
+                return {}
+            text = session.page_text(2)
+        else:
+            doc = fitz.open(pdf_path)
 
-        # 3페이지(인덱스 2) 텍스트 추출
-        if len(doc) < 3:
-            logger.warning(f"PDF에 3페이지가 없습니다 (총 {len(doc)}페이지)")
-            doc.close()
-            return {}
+            # 3페이지(인덱스 2) 텍스트 추출
+            if len(doc) < 3:
+                logger.warning(f"PDF에 3페이지가 없습니다 (총 {len(doc)}페이지)")
+                doc.close()
+                return {}
 
-        page = doc[2]  # 0-based, so 2 = page 3
-        text = page.get_text()
-        doc.close()
+            page = doc[2]  # 0-based, so 2 = page 3
+            text = page.get_text()
+            doc.close()
 
         # 줄 단위로 분석
         lines = text.split('\n')
@@ -425,19 +460,27 @@ def extract_topics_from_chapters(pdf_path: str) -> Dict[str, List[str]]:
             logger.error(f"PDF 파일이 존재하지 않습니다: {pdf_path}")
             raise FileNotFoundError(f"PDF 파일이 존재하지 않습니다: {pdf_path}")
 
-        doc = fitz.open(pdf_path)
-
-        # PDF 형식 검증
-        if doc.is_encrypted:
-            logger.warning(f"PDF가 암호화되어 있습니다: {pdf_path}")
+        # [S20] 등록된 문서 세션이 있으면 세션의 페이지 텍스트 캐시 사용
+        session = get_session(pdf_path)
+        if session is not None:
+            if session.doc.is_encrypted:
+                logger.warning(f"PDF가 암호화되어 있습니다: {pdf_path}")
+                return {}
+            full_text = session.full_text()
+        else:
+            doc = fitz.open(pdf_path)
+
+            # PDF 형식 검증
+            if doc.is_encrypted:
+                logger.warning(f"PDF가 암호화되어 있습니다: {pdf_path}")
+                doc.close()
+                return {}
+
+            # 전체 PDF 텍스트 추출
+            full_text = ""
+            for page in doc:
+                full_text += page.get_text()
             doc.close()
-            return {}
-
-        # 전체 PDF 텍스트 추출
-        full_text = ""
-        for page in doc:
-            full_text += page.get_text()
-        doc.close()
 
         # 라인 단위 분리
         lines = full_text.split('\n')
@@ -483,7 +526,7 @@ def extract_topics_from_chapters(pdf_path: str) -> Dict[str, List[str]]:
                                 break
 
                             # 각주 패턴 - 중단
-                            if '본 내용은' in prev_line and '문의하시기 바랍니다' in prev_line:
+                            if _FOOTNOTE_MATCHER.contains_all(prev_line):
                                 break
 
                             topic_parts.insert(0, prev_line)
@@ -591,12 +634,13 @@ def _map_topics_to_categories(topics: List[str]) -> Dict[str, List[str]]:
     return result
 
 
-def extract_topics_from_detail_page(detail_id: str) -> List[str]:
+def extract_topics_from_detail_page(detail_id: str, session: Optional[requests.Session] = None) -> List[str]:
     """
     ITFIND 상세 페이지에서 토픽 목차 추출 (브라우저 불필요)
 
     Args:
         detail_id: TVOL을 제외한 ID (예: "1388")
+        session: [S25] 공유 HTTP 세션 (None이면 get_http_session())
 
     Returns:
         토픽 리스트 (로마자 번호 포함)
@@ -605,13 +649,13 @@ def extract_topics_from_detail_page(detail_id: str) -> List[str]:
         detail_url = f"https://www.itfind.or.kr/trend/weekly/weeklyDetail.do?id={detail_id}"
         logger.info(f"ITFIND 상세 페이지에서 토픽 추출: {detail_url}")
 
+        # User-Agent·Referer는 공유 세션 기본 헤더
         headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Referer": "https://www.itfind.or.kr/",
         }
 
-        response = requests.get(detail_url, headers=headers, timeout=30)
+        http = session or get_http_session()
+        response = http.get(detail_url, headers=headers, timeout=30)
         response.raise_for_status()
 
         # HTML에서 dd 요소 추출 (목차 포맷)
@@ -693,12 +737,13 @@ def extract_topics_from_detail_page(detail_id: str) -> List[str]:
         return []
 
 
-def extract_streamdocs_id_from_detail_page(detail_id: str) -> Optional[str]:
+def extract_streamdocs_id_from_detail_page(detail_id: str, session: Optional[requests.Session] = None) -> Optional[str]:
     """
     getStreamDocsRegi.htm에서 StreamDocs 뷰어 URL을 따라가 StreamDocs ID 추출
 
     Args:
         detail_id: TVOL을 제외한 ID (예: "1388")
+        session: [S25] 공유 HTTP 세션 (None이면 get_http_session())
 
     Returns:
         StreamDocs ID 또는 None
@@ -708,13 +753,12 @@ def extract_streamdocs_id_from_detail_page(detail_id: str) -> Optional[str]:
         streamdocs_regi_url = f"https://www.itfind.or.kr/admin/getStreamDocsRegi.htm?identifier=TVOL_{detail_id}"
         logger.info(f"StreamDocs Regi 페이지 접근: {streamdocs_regi_url}")
 
+        # User-Agent·Referer는 공유 세션 기본 헤더
         headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Accept": "*/*",
-            "Referer": "https://www.itfind.or.kr/",
         }
 
-        session = requests.Session()
+        session = session or get_http_session()
         response = session.get(streamdocs_regi_url, headers=headers, timeout=30, allow_redirects=True)
 
         # 0단계: 서버 302 리다이렉트 체인 대응 (2026-07 사이트 변경)
@@ -767,13 +811,14 @@ def extract_streamdocs_id_from_detail_page(detail_id: str) -> Optional[str]:
         return None
 
 
-def download_pdf_direct(streamdocs_id: str, save_path: str) -> bool:
+def download_pdf_direct(streamdocs_id: str, save_path: str, session: Optional[requests.Session] = None) -> bool:
     """
     StreamDocs API를 직접 호출하여 PDF 다운로드 (브라우저 불필요)
 
     Args:
         streamdocs_id: StreamDocs 문서 ID
         save_path: 저장할 파일 경로
+        session: [S25] 공유 HTTP 세션 (None이면 get_http_session())
 
     Returns:
         성공 여부
@@ -783,39 +828,42 @@ def download_pdf_direct(streamdocs_id: str, save_path: str) -> bool:
         api_url = f"https://www.itfind.or.kr/streamdocs/v4/documents/{streamdocs_id}"
         logger.info(f"StreamDocs API 직접 호출: {api_url}")
 
+        # User-Agent·Referer는 공유 세션 기본 헤더
         headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Accept': 'application/pdf,*/*',
-            'Referer': 'https://www.itfind.or.kr/'
         }
 
-        response = requests.get(api_url, headers=headers, timeout=60, stream=True)
-        response.raise_for_status()
-
-        # PDF인지 확인 (Content-Type은 application/octet-stream일 수 있음)
-        content_type = response.headers.get('content-type', '').lower()
-        logger.info(f"Content-Type: {content_type}")
-
-        # PDF 시그니처로 확인 (가장 확실함)
-        first_chunk = next(response.iter_content(5), b'')
-        if first_chunk[:5] != b'%PDF-':
-            logger.error(f"응답이 PDF가 아닙니다: content-type={content_type}, 시그니처={first_chunk[:5]}")
-            return False
-
-        logger.info(f"✅ PDF 시그니처 확인됨: {first_chunk[:5]}")
-
-        # 파일 저장
-        os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else '.', exist_ok=True)
-
-        with open(save_path, 'wb') as f:
-            # 이미 읽은 첫 청크가 있다면 먼저 쓰기
-            if 'first_chunk' in locals():
+        http = session or get_http_session()
+        # 스트리밍 응답은 끝까지 읽거나 닫아야 연결이 풀로 돌아감 → with로 항상 닫기
+        with http.get(api_url, headers=headers, timeout=60, stream=True) as response:
+            response.raise_for_status()
+
+            # PDF인지 확인 (Content-Type은 application/octet-stream일 수 있음)
+            content_type = response.headers.get('content-type', '').lower()
+            logger.info(f"Content-Type: {content_type}")
+
+            # PDF 시그니처로 확인 (가장 확실함)
+            chunks = response.iter_content(chunk_size=8192)
+            first_chunk = b''
+            for chunk in chunks:
+                first_chunk += chunk
+                if len(first_chunk) >= 5:
+                    break
+            if first_chunk[:5] != b'%PDF-':
+                logger.error(f"응답이 PDF가 아닙니다: content-type={content_type}, 시그니처={first_chunk[:5]}")
+                return False
+
+            logger.info(f"✅ PDF 시그니처 확인됨: {first_chunk[:5]}")
+
+            # 파일 저장
+            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else '.', exist_ok=True)
+
+            with open(save_path, 'wb') as f:
+                # 이미 읽은 첫 청크를 먼저 쓰고 나머지 다운로드
                 f.write(first_chunk)
-
-            # 나머지 다운로드
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+                for chunk in chunks:
+                    if chunk:
+                        f.write(chunk)
 
         file_size = os.path.getsize(save_path)
         logger.info(f"✅ PDF 다운로드 완료: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
@@ -826,10 +874,23 @@ def download_pdf_direct(streamdocs_id: str, save_path: str) -> bool:
         return False
 
 
-async def download_itfind_pdf() -> Optional[Dict[str, Any]]:
+def _feed_cache_backend():
+    """[S26] RSS 피드 캐시 스토리지 (운영 진입점에서만 기록, 초기화 실패 시 None → 메모리 캐시만)"""
+    try:
+        from src.storage import get_storage_backend
+        return get_storage_backend()
+    except Exception as e:
+        logger.warning(f"RSS 피드 캐시 스토리지 초기화 실패 (메모리 캐시만 사용): {e}")
+        return None
+
+
+async def download_itfind_pdf(feed_cache_backend=None) -> Optional[Dict[str, Any]]:
     """
     ITFIND 주간기술동향 PDF 다운로드 (브라우저 없이!)
 
+    Args:
+        feed_cache_backend: [S26] RSS 피드 캐시 StorageBackend (None이면 프로세스 메모리만)
+
     Returns:
         Dict: {
             'title': str,
@@ -848,7 +909,7 @@ async def download_itfind_pdf() -> Optional[Dict[str, Any]]:
 
         # 1. RSS에서 최신 주간기술동향 정보 조회
         logger.info("1단계: RSS 피드에서 최신 주간기술동향 조회")
-        trend = get_latest_weekly_trend_from_rss()
+        trend = get_latest_weekly_trend_from_rss(backend=feed_cache_backend)
 
         if not trend:
             logger.warning("주간기술동향을 찾을 수 없습니다")
@@ -895,44 +956,46 @@ async def download_itfind_pdf() -> Optional[Dict[str, Any]]:
 
         file_size = os.path.getsize(local_path)
 
-        # 3.5단계: PDF 전체 본문에서 Chapter 패턴 기반 카테고리별 토픽 추출
-        logger.info("3.5단계: PDF 전체 본문에서 Chapter 패턴 기반 카테고리별 토픽 추출")
-        categorized_topics = extract_topics_from_chapters(local_path)
+        # [S20] 토픽 추출 → 메타데이터 저장 → base64 인코딩이 같은 문서 세션을 공유
+        # (파일 읽기 1회, PyMuPDF 파싱 1회, 메타데이터는 증분 저장분만 다시 읽음)
+        with session_scope(local_path) as session:
+            # 3.5단계: PDF 전체 본문에서 Chapter 패턴 기반 카테고리별 토픽 추출
+            logger.info("3.5단계: PDF 전체 본문에서 Chapter 패턴 기반 카테고리별 토픽 추출")
+            categorized_topics = extract_topics_from_chapters(local_path)
 
-        # 카테고리별 토픽이 추출되지 않으면 빈 딕셔너리 사용
-        if not categorized_topics:
-            categorized_topics = {}
-            logger.warning("카테고리별 토픽 추출 실패, 빈 결과 반환")
+            # 카테고리별 토픽이 추출되지 않으면 빈 딕셔너리 사용
+            if not categorized_topics:
+                categorized_topics = {}
+                logger.warning("카테고리별 토픽 추출 실패, 빈 결과 반환")
 
-        # 3.6단계: PDF 메타데이터에 카테고리별 토픽 저장
-        logger.info("3.6단계: PDF 메타데이터에 카테고리별 토픽 저장")
+            # 3.6단계: PDF 메타데이터에 카테고리별 토픽 저장
+            logger.info("3.6단계: PDF 메타데이터에 카테고리별 토픽 저장")
 
-        try:
-            import fitz  # PyMuPDF
-            doc = fitz.open(local_path)
-
-            # 메타데이터 형식: JSON string
-            import json
-            metadata_description = json.dumps(categorized_topics, ensure_ascii=False)
+            try:
+                # 메타데이터 형식: JSON string
+                import json
+                metadata_description = json.dumps(categorized_topics, ensure_ascii=False)
 
-            # 메타데이터 설정 (PyMuPDF는 'subject' 키 사용)
-            doc.set_metadata({"subject": metadata_description})
-            doc.saveIncr()  # 증분 저장 (빠름)
-            doc.close()
+                # 메타데이터 설정 (PyMuPDF는 'subject' 키 사용, 증분 저장)
+                session.set_metadata({"subject": metadata_description})
 
-            logger.info(f"✅ PDF 메타데이터 저장 완료: {len(metadata_description)} chars")
+                logger.info(f"✅ PDF 메타데이터 저장 완료: {len(metadata_description)} chars")
 
-        except Exception as e:
-            logger.warning(f"PDF 메타데이터 저장 실패 (무시): {e}")
+            except Exception as e:
+                logger.warning(f"PDF 메타데이터 저장 실패 (무시): {e}")
 
-        # 4. PDF를 base64로 인코딩하여 반환 (S3 불필요!)
-        logger.info("4단계: PDF base64 인코딩")
-        with open(local_path, 'rb') as f:
-            pdf_data = f.read()
+            # 4. PDF를 base64로 인코딩하여 반환 (S3 불필요!)
+            logger.info("4단계: PDF base64 인코딩")
+            pdf_data = session.data
             pdf_base64 = base64.b64encode(pdf_data).decode('utf-8')
 
         logger.info("=" * 60)
         logger.info("✅ ITFIND PDF 다운로드 성공")
+        stats = http_stats(get_http_session())
+        logger.info(
+            f"   HTTP: 요청 {stats.get('requests', 0)}회, 새 연결 {stats['connections']}개, "
+            f"응답 대기 {stats.get('elapsed_ms', 0.0):.0f}ms"
+        )
         logger.info("=" * 60)
 
         return {
@@ -971,7 +1034,7 @@ def handler(event, context):
         logger.info(f"이벤트: {event}")
 
         # 비동기 함수 실행
-        result = asyncio.run(download_itfind_pdf())
+        result = asyncio.run(download_itfind_pdf(feed_cache_backend=_feed_cache_backend()))
 
         if result:
             return {
@@ -0,0 +1,423 @@
+"""
+벌크 이메일 전송 벤치마크
+
+목적
+----
+`tests/test_email_sender_bulk.py` 는 SMTP를 모킹하므로 실제 처리량을 알 수 없다.
+이 스크립트는 별도 프로세스로 로컬 SMTP 싱크(Gmail 대역)를 띄우고
+`send_pdf_bulk_email` 과 동일한 경로(EmailSender.send_bulk_email)를 합성 수신자·합성 PDF로 실행해
+단계별 지표를 JSON으로 출력한다. 엔진 간 비교·배포 전 회귀 확인용.
+
+측정 단계
+---------
+- prepare : 공유 자산 준비 (PDF 읽기, 1페이지 이미지 추출, MIME 템플릿 직렬화)
+- deliver : 수신자별 조립 + SMTP 전송
+
+단계별 지표: wall_sec, cpu_sec (이 프로세스의 user+sys), peak_rss_mb (10ms 샘플링)
+시나리오 지표: messages_per_sec, bytes_per_sec (싱크가 실제 수신한 DATA 바이트 기준)
+
+CLI
+---
+    # 기본: 수신자 10/100/1000/10000명 × PDF 2MB, sync 엔진
+    python scripts/benchmark_bulk_email.py
+
+    # 엔진·PDF 크기 비교, 결과 저장
+    python scripts/benchmark_bulk_email.py --engine sync async --pdf-mb 5 40 \\
+        --recipients 10 100 --output bench.json
+
+    # 이전 결과 대비 처리량이 20% 이상 떨어지면 종료 코드 1
+    python scripts/benchmark_bulk_email.py --baseline bench.json --tolerance 0.2
+
+[S9] 적응형 속도 제어(SMTP_MAX_RATE 상한)는 운영 정책이므로 기본적으로 끄고 파이프라인 자체의
+처리량을 측정한다. 운영 설정 그대로 측정하려면 --adaptive-rate를 지정한다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import smtplib
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECIPIENTS = [10, 100, 1000, 10000]
+DEFAULT_PDF_MB = [2.0]
+
+
+# ---------------------------------------------------------------------------
+# SMTP 싱크 (별도 프로세스 — 벤치마크 대상 프로세스의 CPU/RSS 측정에 섞이지 않도록)
+# ---------------------------------------------------------------------------
+class _SinkHandler(socketserver.StreamRequestHandler):
+    """EHLO/MAIL/RCPT/DATA/RSET/NOOP/QUIT만 지원하는 최소 SMTP 수신기 (본문은 버림)"""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self) -> None:
+        server = self.server
+        self._reply("220 benchmark-sink ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line[:4].upper()
+            if verb in (b"EHLO", b"HELO"):
+                self._reply("250 benchmark-sink")
+            elif verb in (b"MAIL", b"RCPT", b"RSET", b"NOOP"):
+                self._reply("250 OK")
+            elif verb == b"DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                size = 0
+                while True:
+                    chunk = self.rfile.readline()
+                    if not chunk or chunk == b".\r\n":
+                        break
+                    size += len(chunk)
+                if server.delay:
+                    time.sleep(server.delay)
+                with server.counter_lock:
+                    server.messages.value += 1
+                    server.bytes.value += size
+                self._reply("250 Message accepted")
+            elif verb == b"QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class _SinkServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _run_sink(port_queue, messages, nbytes, delay: float) -> None:
+    server = _SinkServer(("127.0.0.1", 0), _SinkHandler)
+    server.messages = messages
+    server.bytes = nbytes
+    server.counter_lock = threading.Lock()
+    server.delay = delay
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+class SmtpSink:
+    """로컬 SMTP 싱크 프로세스 (수신 메시지 수·바이트 집계)"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.messages = multiprocessing.Value("q", 0)
+        self.bytes = multiprocessing.Value("q", 0)
+        self.port: Optional[int] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> "SmtpSink":
+        port_queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_run_sink, args=(port_queue, self.messages, self.bytes, self.delay), daemon=True
+        )
+        self._process.start()
+        self.port = port_queue.get(timeout=10)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._process.terminate()
+        self._process.join(timeout=5)
+
+    def reset(self) -> None:
+        with self.messages.get_lock():
+            self.messages.value = 0
+        with self.bytes.get_lock():
+            self.bytes.value = 0
+
+
+# ---------------------------------------------------------------------------
+# 측정 유틸
+# ---------------------------------------------------------------------------
+def _current_rss_mb() -> float:
+    """현재 RSS (MB). /proc가 없으면 ru_maxrss로 대체"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+@dataclass
+class PhaseMetrics:
+    wall_sec: float = 0.0
+    cpu_sec: float = 0.0
+    peak_rss_mb: float = 0.0
+
+
+@dataclass
+class ScenarioResult:
+    engine: str
+    recipients: int
+    pdf_bytes: int
+    ok: bool = False
+    delivered: int = 0
+    sink_messages: int = 0
+    sink_bytes: int = 0
+    messages_per_sec: float = 0.0
+    bytes_per_sec: float = 0.0
+    phases: Dict[str, PhaseMetrics] = field(default_factory=dict)
+
+
+@contextmanager
+def _measure(phases: Dict[str, PhaseMetrics], name: str):
+    """단계 wall/CPU 시간과 RSS 최대값 측정 (10ms 샘플링 스레드)"""
+    peak = [_current_rss_mb()]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(0.01):
+            peak[0] = max(peak[0], _current_rss_mb())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    wall, cpu = time.perf_counter(), _cpu_seconds()
+    try:
+        yield
+    finally:
+        done.set()
+        sampler.join()
+        peak[0] = max(peak[0], _current_rss_mb())
+        phases[name] = PhaseMetrics(
+            wall_sec=round(time.perf_counter() - wall, 4),
+            cpu_sec=round(_cpu_seconds() - cpu, 4),
+            peak_rss_mb=round(peak[0], 1),
+        )
+
+
+# ---------------------------------------------------------------------------
+# 합성 입력
+# ---------------------------------------------------------------------------
+@dataclass
+class _SyntheticRecipient:
+    email: str
+    name: str = "Benchmark"
+
+
+def make_recipients(count: int) -> List[_SyntheticRecipient]:
+    return [_SyntheticRecipient(f"bench{i:05d}@example.com") for i in range(count)]
+
+
+def make_pdf(path: str, size_bytes: int) -> str:
+    """1페이지 PDF + 무작위 첨부 스트림으로 지정 크기의 합성 PDF 생성
+
+    PyMuPDF가 없으면 PDF 헤더 + 무작위 바이트로 대체한다 (1페이지 이미지 추출 단계는 생략됨).
+    """
+    try:
+        import fitz
+    except ImportError:
+        with open(path, "wb") as f:
+            f.write(b"%PDF-1.4\n" + os.urandom(max(0, size_bytes - 16)) + b"\n%%EOF")
+        return path
+
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "IT뉴스 벤치마크", fontsize=24)
+    padding = max(0, size_bytes - 4096)
+    if padding:
+        doc.embfile_add("padding.bin", os.urandom(padding))
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class _BenchmarkConfig:
+    """Config를 감싸 SMTP 접속 대상·인증·원장·토큰 캐시 설정만 덮어쓴 설정 객체"""
+
+    def __init__(self, base, overrides: dict):
+        self._base = base
+        self._overrides = overrides
+
+    def __getattr__(self, name):
+        if name in self._overrides:
+            return self._overrides[name]
+        return getattr(self._base, name)
+
+
+def _build_sender(engine: str, port: int, pool_size: int, concurrency: int,
+                  adaptive_rate: bool = False):
+    from src.config import Config
+    from src.email_sender import create_email_sender
+
+    sender = create_email_sender(engine)
+    sender.config = _BenchmarkConfig(Config, {
+        "GMAIL_USER": "bench-sender@example.com",
+        "GMAIL_APP_PASSWORD": "",
+        "GMAIL_SMTP_SERVER": "127.0.0.1",
+        "GMAIL_SMTP_PORT": port,
+        "ADMIN_EMAIL": "admin@example.com",
+        "SMTP_POOL_SIZE": pool_size,
+        "SMTP_ASYNC_CONCURRENCY": concurrency,
+        # 합성 수신자 기록이 실제 스토리지(SQLite/DynamoDB)에 남지 않도록 끔
+        "DELIVERY_LEDGER_ENABLED": False,
+        "UNSUBSCRIBE_TOKEN_CACHE": False,
+        "EMAIL_SPOOL_DIR": "",
+        "SMTP_ADAPTIVE_RATE": adaptive_rate,
+    })
+    sender.unsubscribe_secret = "benchmark-secret"
+    sender.unsubscribe_url_base = "https://example.com/unsubscribe"
+
+    # 싱크는 STARTTLS/AUTH를 지원하지 않음 — 평문 연결로 대체
+    def open_plain_connection():
+        server = smtplib.SMTP("127.0.0.1", port)
+        server.ehlo()
+        return server
+
+    sender._open_smtp_connection = open_plain_connection
+    if hasattr(sender, "use_starttls"):
+        sender.smtp_host = "127.0.0.1"
+        sender.smtp_port = port
+        sender.use_starttls = False
+    return sender
+
+
+def run_scenario(
+    sink: SmtpSink,
+    engine: str,
+    recipient_count: int,
+    pdf_path: str,
+    pool_size: int = 1,
+    concurrency: int = 5,
+    adaptive_rate: bool = False,
+) -> ScenarioResult:
+    """시나리오 1회 실행 (수신자 N명 × PDF 1개)"""
+    sender = _build_sender(engine, sink.port, pool_size, concurrency, adaptive_rate)
+    result = ScenarioResult(engine=engine, recipients=recipient_count,
+                            pdf_bytes=os.path.getsize(pdf_path))
+
+    prepare, deliver = sender._prepare_shared_assets, sender._deliver
+
+    def timed_prepare(*args, **kwargs):
+        with _measure(result.phases, "prepare"):
+            return prepare(*args, **kwargs)
+
+    def timed_deliver(*args, **kwargs):
+        with _measure(result.phases, "deliver"):
+            return deliver(*args, **kwargs)
+
+    sender._prepare_shared_assets = timed_prepare
+    sender._deliver = timed_deliver
+
+    sink.reset()
+    with patch("src.email_sender.get_active_recipients",
+               return_value=make_recipients(recipient_count)):
+        ok, success = sender.send_bulk_email(pdf_path=pdf_path, subject="IT뉴스 [benchmark]")
+
+    result.ok = ok
+    result.delivered = len(success)
+    result.sink_messages = sink.messages.value
+    result.sink_bytes = sink.bytes.value
+    deliver_wall = result.phases.get("deliver", PhaseMetrics()).wall_sec
+    if deliver_wall > 0:
+        result.messages_per_sec = round(result.sink_messages / deliver_wall, 2)
+        result.bytes_per_sec = round(result.sink_bytes / deliver_wall, 1)
+    return result
+
+
+def find_regressions(results: List[dict], baseline: List[dict], tolerance: float) -> List[str]:
+    """동일 시나리오(engine, recipients, pdf_bytes) 기준 처리량이 tolerance 이상 떨어진 항목"""
+    def key(r):
+        return (r["engine"], r["recipients"], r["pdf_bytes"])
+
+    previous = {key(r): r for r in baseline}
+    regressions = []
+    for r in results:
+        base = previous.get(key(r))
+        if not base or not base.get("messages_per_sec"):
+            continue
+        floor = base["messages_per_sec"] * (1 - tolerance)
+        if r["messages_per_sec"] < floor:
+            regressions.append(
+                f"{r['engine']} × {r['recipients']}명 × {r['pdf_bytes']:,}B: "
+                f"{r['messages_per_sec']} msg/s < 기준 {base['messages_per_sec']} msg/s"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="벌크 이메일 전송 벤치마크 (로컬 SMTP 싱크)")
+    parser.add_argument("--engine", nargs="+", default=["sync"], choices=["sync", "async"])
+    parser.add_argument("--recipients", nargs="+", type=int, default=DEFAULT_RECIPIENTS)
+    parser.add_argument("--pdf-mb", nargs="+", type=float, default=DEFAULT_PDF_MB)
+    parser.add_argument("--pool-size", type=int, default=1, help="sync 엔진 SMTP_POOL_SIZE")
+    parser.add_argument("--concurrency", type=int, default=5, help="async 엔진 SMTP_ASYNC_CONCURRENCY")
+    parser.add_argument("--adaptive-rate", action="store_true",
+                        help="[S9] 적응형 속도 제어를 운영 설정대로 적용")
+    parser.add_argument("--sink-delay", type=float, default=0.0, help="싱크의 메시지당 응답 지연 (초)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: stdout)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 처리량 감소율")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp, SmtpSink(args.sink_delay) as sink:
+        for pdf_mb in args.pdf_mb:
+            pdf_path = make_pdf(os.path.join(tmp, f"etnews_bench_{pdf_mb}mb.pdf"),
+                                int(pdf_mb * 1024 * 1024))
+            for engine in args.engine:
+                for count in args.recipients:
+                    result = run_scenario(sink, engine, count, pdf_path,
+                                          pool_size=args.pool_size, concurrency=args.concurrency,
+                                          adaptive_rate=args.adaptive_rate)
+                    results.append(asdict(result))
+                    print(
+                        f"{engine:5s} {count:6d}명 {pdf_mb:6.1f}MB → "
+                        f"{result.messages_per_sec:8.2f} msg/s, "
+                        f"{result.bytes_per_sec / 1e6:8.2f} MB/s",
+                        file=sys.stderr,
+                    )
+
+    report = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload)
+    else:
+        print(payload)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+광고 페이지 분석 벤치마크
+
+목적
+----
+PDFProcessor._identify_ad_pages의 텍스트 추출 엔진별 처리 시간을 합성 신문 PDF로 비교한다.
+
+- pypdf         : 기존 경로 (page.extract_text() 순차)
+- pymupdf-full  : [S13] MuPDF 순차 추출, 단계별 판정 없음
+- pymupdf       : [S13] MuPDF 순차 추출 + [S14] 단계별 판정 (workers=1)
+- pymupdf-pN    : MuPDF + 단계별 판정 + 프로세스 풀 (workers=N)
+
+합성 PDF는 기사 면(다단 텍스트), 전면 광고 면(이미지 + 짧은 문구),
+광고 키워드 면(전면광고 표기 + 본문)을 섞어 만들며, 모든 엔진이 같은 광고 페이지를
+찾는지도 함께 확인한다. 반복 실행 간 재사용을 막기 위해 [S16] 판정 캐시는 끈다.
+
+CLI
+---
+    # 기본: 24/32면 × 3회 반복
+    python scripts/benchmark_pdf_classifier.py
+
+    # 페이지 수·워커 수 지정, 결과 저장
+    python scripts/benchmark_pdf_classifier.py --pages 24 32 64 --workers 2 4 --output bench.json
+
+    # 합성 코퍼스 지면(한글 본문, seed 고정)으로 측정
+    python scripts/benchmark_pdf_classifier.py --seed 7
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGES = [24, 32]
+DEFAULT_WORKERS = [2, 4]
+
+_ARTICLE_TEXT = (
+    "The committee reviewed semiconductor export figures for the third quarter "
+    "and noted that memory shipments recovered faster than expected. "
+)
+
+
+def build_fixture(path: str, pages: int, ad_every: int = 6) -> List[int]:
+    """합성 신문 PDF 생성
+
+    Args:
+        path: 저장 경로
+        pages: 페이지 수
+        ad_every: 이 간격마다 광고 면 배치 (전면 이미지 광고와 키워드 광고를 번갈아)
+
+    Returns:
+        광고 페이지 번호 목록 (0-based)
+    """
+    import fitz
+
+    doc = fitz.open()
+    banner = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 200, 280), False)
+    banner.set_rect(banner.irect, (200, 40, 40))
+    ad_pages = []
+
+    for page_num in range(pages):
+        page = doc.new_page(width=595, height=842)
+        is_ad = page_num % ad_every == ad_every - 1
+        if is_ad and (page_num // ad_every) % 2 == 0:
+            # 전면 이미지 광고: 큰 래스터 + 짧은 문구
+            page.insert_image(fitz.Rect(20, 20, 575, 780), pixmap=banner)
+            page.insert_text((40, 810), "SALE", fontsize=18)
+            ad_pages.append(page_num)
+            continue
+
+        if is_ad:
+            page.insert_text((40, 40), "Advertisement", fontsize=14)
+            ad_pages.append(page_num)
+
+        # 4단 기사 본문
+        for col in range(4):
+            rect = fitz.Rect(30 + col * 138, 60, 160 + col * 138, 820)
+            page.insert_textbox(rect, _ARTICLE_TEXT * 12, fontsize=7)
+
+    doc.save(path)
+    doc.close()
+    return ad_pages
+
+
+def _run_engine(
+    pdf_path: str, engine: str, workers: int, cascade: bool = True
+) -> Tuple[List[int], Dict[str, int]]:
+    """엔진 설정을 바꿔 PDFProcessor._identify_ad_pages 1회 실행 (광고 페이지, 단계별 판정 수)"""
+    from pypdf import PdfReader
+
+    from src.config import Config
+    from src.pdf_processor import PDFProcessor
+
+    processor = PDFProcessor()
+    with patch.object(Config, "PDF_CLASSIFIER_ENGINE", engine), \
+         patch.object(Config, "PDF_CLASSIFIER_WORKERS", workers), \
+         patch.object(Config, "PDF_CLASSIFIER_PARALLEL_MIN_PAGES", 1), \
+         patch.object(Config, "AD_CASCADE_ENABLED", cascade), \
+         patch.object(Config, "AD_PAGE_CACHE_ENABLED", False):
+        reader = PdfReader(pdf_path)
+        ad_pages = processor._identify_ad_pages(reader, None, pdf_path=pdf_path)
+    return ad_pages, processor.cascade_stats
+
+
+def run_benchmark(
+    pages_list: List[int], workers_list: List[int], repeat: int = 3, seed: Optional[int] = None
+) -> List[Dict]:
+    """페이지 수 × 엔진 조합별 실행 시간 측정 (median/min)
+
+    seed를 주면 build_fixture 대신 pdf_corpus.build_edition(한글 본문 지면)으로 측정한다.
+    """
+    engines = [
+        ("pypdf", "pypdf", 1, True),
+        ("pymupdf-full", "pymupdf", 1, False),
+        ("pymupdf", "pymupdf", 1, True),
+    ]
+    engines += [(f"pymupdf-p{w}", "pymupdf", w, True) for w in workers_list]
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="pdf_classifier_bench_") as tmp:
+        for pages in pages_list:
+            pdf_path = os.path.join(tmp, f"etnews_{pages}p.pdf")
+            if seed is None:
+                expected = build_fixture(pdf_path, pages)
+            else:
+                from scripts.pdf_corpus import build_edition
+
+                expected = build_edition(pdf_path, pages, seed=seed).ad_pages
+
+            for label, engine, workers, cascade in engines:
+                timings = []
+                detected: Optional[List[int]] = None
+                stats: Dict[str, int] = {}
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    detected, stats = _run_engine(pdf_path, engine, workers, cascade)
+                    timings.append(time.perf_counter() - start)
+
+                results.append({
+                    "engine": label,
+                    "pages": pages,
+                    "workers": workers,
+                    "median_sec": round(statistics.median(timings), 4),
+                    "min_sec": round(min(timings), 4),
+                    "ad_pages": detected,
+                    "matches_fixture": detected == expected,
+                    "cascade": stats,
+                })
+                logger.info(
+                    f"{label:>12} {pages:>3}p: median {statistics.median(timings) * 1000:.1f}ms "
+                    f"(광고 {detected})"
+                )
+
+    # pypdf 대비 속도 비율
+    baseline = {r["pages"]: r["median_sec"] for r in results if r["engine"] == "pypdf"}
+    for r in results:
+        base = baseline.get(r["pages"])
+        r["speedup_vs_pypdf"] = round(base / r["median_sec"], 2) if base and r["median_sec"] else None
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="광고 페이지 분석 엔진 벤치마크")
+    parser.add_argument("--pages", type=int, nargs="+", default=DEFAULT_PAGES)
+    parser.add_argument("--workers", type=int, nargs="*", default=DEFAULT_WORKERS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--seed", type=int, help="합성 코퍼스(scripts/pdf_corpus.py) 지면으로 측정할 때의 seed")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    results = run_benchmark(args.pages, args.workers, repeat=args.repeat, seed=args.seed)
+    report = {"cpu_count": os.cpu_count(), "results": results}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    # 엔진 간 판정이 다르면 실패
+    return 0 if all(r["matches_fixture"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+메일 스풀 전송 워커
+
+send_bulk_email이 EMAIL_SPOOL_DIR에 렌더링해 둔 메시지를 전송한다.
+같은 스풀을 여러 프로세스가 동시에 비워도 메시지는 한 번만 전송된다 (rename 기반 점유).
+조기 중단·프로세스 종료로 스풀에 남은 메시지를 재렌더링 없이 다시 보낼 때도 사용.
+
+사용법:
+  python scripts/drain_mail_spool.py                       # EMAIL_SPOOL_DIR, 워커 1개
+  python scripts/drain_mail_spool.py --spool-dir /tmp/spool --workers 3
+"""
+import argparse
+import logging
+import os
+import sys
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main() -> int:
+    from src.config import Config
+
+    parser = argparse.ArgumentParser(description="메일 스풀 전송 워커")
+    parser.add_argument("--spool-dir", default=Config.EMAIL_SPOOL_DIR, help="스풀 디렉토리")
+    parser.add_argument("--workers", type=int, default=1, help="전송 스레드(SMTP 세션) 수")
+    args = parser.parse_args()
+
+    from src.structured_logging import setup_logging
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    if not args.spool_dir:
+        logger.error("스풀 디렉토리가 지정되지 않았습니다 (--spool-dir 또는 EMAIL_SPOOL_DIR)")
+        return 1
+
+    Config.validate()
+
+    from src.email_sender import EmailSender
+    from src.mail_spool import MailSpool, SpoolTransmitter
+
+    spool = MailSpool(args.spool_dir)
+    spool.recover_stale(Config.SPOOL_STALE_SECONDS)
+    logger.info(f"=== 스풀 전송 시작: {args.spool_dir} (대기 {spool.pending()}건, 워커 {args.workers}개) ===")
+
+    transmitter = SpoolTransmitter(
+        EmailSender(), spool, workers=args.workers, max_attempts=Config.SPOOL_MAX_ATTEMPTS
+    )
+    delivered, fail_count = transmitter.run()
+
+    for batch_id in {e.batch_id for e in delivered}:
+        spool.release_batch(batch_id)
+
+    logger.info(
+        f"=== 스풀 전송 완료: 성공 {len(delivered)}건, 실패 {fail_count}건, 남은 메시지 {spool.pending()}건 ==="
+    )
+    return 0 if fail_count == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
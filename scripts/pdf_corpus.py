@@ -0,0 +1,312 @@
+"""
+합성 PDF 코퍼스 생성기
+
+목적
+----
+실제 전자신문·ITFIND PDF는 저장소에 커밋할 수 없으므로, 성능 테스트와 벤치마크용으로
+구조가 비슷한 PDF를 PyMuPDF로 생성한다. 같은 seed에서는 바이트 단위로 같은 파일이 나온다.
+
+- build_edition: 전자신문형 지면
+    - 기사 면: 제목 + 다단 한글 본문
+    - 전면 이미지 광고 면: 페이지 대부분을 덮는 JPEG + 짧은 문구
+    - 표기 광고 면: 상단 "전면광고" 표기 + 본문
+  페이지 수, 페이지 크기(a4/a3/tabloid), 광고 이미지 해상도(파일 크기)를 지정할 수 있다.
+- build_itfind_issue: ITFIND 주간기술동향형 호
+    - 1면 표지, 2면 발간사, 3면 목차 (extract_topics_from_pdf_page3가 읽는 구조)
+    - 주제마다 "제목 / - 부제 - / Chapter / 01" 시작 면 + 본문 면
+      (extract_topics_from_chapters가 읽는 구조)
+
+CLI
+---
+    # 24/32면 지면 + ITFIND 1호를 ./corpus에 생성 (manifest.json 포함)
+    python scripts/pdf_corpus.py --output-dir corpus
+
+    # seed·페이지 수·크기 지정
+    python scripts/pdf_corpus.py --output-dir corpus --seed 7 --pages 24 48 --page-size a3
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+PAGE_SIZES = {
+    "a4": (595, 842),
+    "a3": (842, 1191),
+    "tabloid": (792, 1224),
+}
+
+# 본문 문장 (광고 키워드·영문 "ad"가 들어가지 않도록 구성)
+_SENTENCES = (
+    "정부는 반도체 설계 인력 양성을 위해 내년 예산을 확대하기로 했다.",
+    "국내 메모리 업계의 3분기 출하량은 시장 예상보다 빠르게 회복됐다.",
+    "통신 3사는 6G 표준화 논의에 대응하기 위한 공동 연구를 시작한다.",
+    "클라우드 기업들은 데이터센터 전력 효율을 높이는 냉각 기술에 투자하고 있다.",
+    "인공지능 반도체 스타트업의 투자 유치가 올해 들어 크게 늘었다.",
+    "전문가들은 공급망 재편이 장비 업계에 새로운 기회가 될 것으로 본다.",
+    "디스플레이 업계는 차량용 패널 수요 증가에 맞춰 생산 라인을 전환한다.",
+    "소프트웨어 업계는 공공 클라우드 전환 사업의 발주 일정을 주시하고 있다.",
+    "배터리 소재 기업들은 북미 공장 가동률을 끌어올리는 데 주력하고 있다.",
+    "보안 업계는 생성형 인공지능을 악용한 피싱 공격에 대한 경고를 내놨다.",
+)
+_HEADLINES = (
+    "AI 반도체 투자 확대", "6G 표준화 경쟁 본격화", "데이터센터 전력 효율 경쟁",
+    "메모리 업황 회복세", "공공 클라우드 전환 가속", "차량용 디스플레이 수요 증가",
+    "배터리 소재 북미 공략", "생성형 AI 보안 위협",
+)
+_AD_COPY = ("SALE", "NEW", "OPEN", "EVENT", "봄 신상품", "특별 할인")
+
+# ITFIND 주제 제목 (15~100자, 저자 표기 "_" 없음)
+_ITFIND_TOPICS = (
+    "6G 이동통신을 위한 과금정책 및 경제모델 연구 동향",
+    "공간 확장을 위한 차세대 통신 네트워크 기술 동향 분석",
+    "생성형 인공지능 모델 경량화 기술 동향과 시사점",
+    "양자 내성 암호 전환을 위한 표준화 및 적용 동향",
+    "저궤도 위성통신 서비스의 주파수 공유 기술 동향",
+    "디지털 트윈 기반 스마트 제조 플랫폼 기술 동향",
+    "초거대 언어모델 학습용 데이터 품질 관리 기술 동향",
+    "차세대 메모리 반도체 패키징 기술 개발 동향",
+)
+_ITFIND_SUBTITLES = ("기술 및 표준 중심", "국내외 사례 분석", "정책 과제 중심", "시장 전망")
+_ITFIND_AUTHORS = ("김정민_한국전자통신연구원", "이서연_정보통신기획평가원", "박도윤_한국과학기술원",
+                   "최하은_정보통신정책연구원")
+_ITFIND_SUBSERIES = ("인공지능(AI)", "5Gㆍ6Gㆍ위성", "양자정보통신")
+
+
+@dataclass
+class EditionInfo:
+    """생성된 전자신문형 지면 정보"""
+    path: str
+    pages: int
+    page_size: str
+    ad_pages: List[int] = field(default_factory=list)  # 0-based, 이미지·표기 광고 모두
+    image_ad_pages: List[int] = field(default_factory=list)
+    marked_ad_pages: List[int] = field(default_factory=list)
+
+
+@dataclass
+class ItfindIssueInfo:
+    """생성된 ITFIND형 호 정보"""
+    path: str
+    issue_number: int
+    pages: int
+    topics: List[str] = field(default_factory=list)  # 본문 Chapter 순서
+    categorized_topics: Dict[str, List[str]] = field(default_factory=dict)  # 3면 목차 기준
+
+
+def _fitz():
+    import fitz  # PyMuPDF
+
+    return fitz
+
+
+def _paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(rng.choice(_SENTENCES) for _ in range(sentences))
+
+
+def _fill_textbox(page, rect, rng: random.Random, sentences: int, fontsize: float) -> None:
+    """상자에 들어가는 만큼 본문 채우기
+
+    insert_textbox는 글이 넘치면 아무것도 쓰지 않으므로 들어갈 때까지 문장 수를 줄인다.
+    """
+    text = _paragraph(rng, sentences)
+    while text:
+        if page.insert_textbox(rect, text, fontname="korea", fontsize=fontsize) >= 0:
+            return
+        text = text[: text.rfind(" ", 0, len(text) * 4 // 5)] if " " in text else ""
+
+
+def _ad_image(rng: random.Random, width_px: int, height_px: int) -> bytes:
+    """seed로 정해지는 블록 무늬 JPEG (작은 난수 타일을 확대)"""
+    fitz = _fitz()
+    tile_w, tile_h = max(2, width_px // 24), max(2, height_px // 24)
+    tile = fitz.Pixmap(fitz.csRGB, tile_w, tile_h, rng.randbytes(tile_w * tile_h * 3), False)
+    return fitz.Pixmap(tile, width_px, height_px, None).tobytes("jpeg", jpg_quality=90)
+
+
+def _save(doc, path: str) -> None:
+    """같은 입력이면 같은 바이트가 나오도록 저장 (파일 ID 고정)"""
+    doc.set_metadata({})
+    doc.save(path, garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+
+
+def build_edition(
+    path: str,
+    pages: int = 24,
+    seed: int = 0,
+    page_size: str = "a4",
+    ad_ratio: float = 0.2,
+    ad_image_px: int = 1200,
+) -> EditionInfo:
+    """
+    전자신문형 합성 지면 생성
+
+    Args:
+        path: 저장 경로
+        pages: 페이지 수
+        seed: 난수 seed (같으면 같은 파일)
+        page_size: PAGE_SIZES 키
+        ad_ratio: 광고 면 비율 (1면은 항상 기사 면, 광고 면 3개 중 1개는 표기 광고)
+        ad_image_px: 전면 광고 이미지의 긴 변 픽셀 수 (파일 크기 조절)
+
+    Returns:
+        EditionInfo (광고 페이지 정답 포함)
+    """
+    fitz = _fitz()
+    rng = random.Random(seed)
+    width, height = PAGE_SIZES[page_size]
+    info = EditionInfo(path=path, pages=pages, page_size=page_size)
+
+    candidates = list(range(1, pages))
+    ad_pages = sorted(rng.sample(candidates, min(len(candidates), round(pages * ad_ratio))))
+
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page(width=width, height=height)
+
+        if page_num in ad_pages and ad_pages.index(page_num) % 3 != 2:
+            # 전면 이미지 광고 (광고 면 3개 중 2개)
+            image = _ad_image(rng, ad_image_px * width // height, ad_image_px)
+            page.insert_image(fitz.Rect(18, 18, width - 18, height - 60), stream=image)
+            page.insert_text((40, height - 30), rng.choice(_AD_COPY), fontname="korea", fontsize=22)
+            info.image_ad_pages.append(page_num)
+            continue
+
+        top = 40
+        if page_num in ad_pages:
+            page.insert_text((40, top), "전면광고", fontname="korea", fontsize=12)
+            info.marked_ad_pages.append(page_num)
+            top += 20
+
+        page.insert_text((40, top + 30), rng.choice(_HEADLINES), fontname="korea", fontsize=26)
+        columns = 4 if width < 800 else 5
+        col_width = (width - 60) / columns
+        for col in range(columns):
+            rect = fitz.Rect(30 + col * col_width, top + 50, 30 + (col + 1) * col_width - 8, height - 30)
+            _fill_textbox(page, rect, rng, 30, fontsize=8)
+
+    info.ad_pages = sorted(info.image_ad_pages + info.marked_ad_pages)
+    _save(doc, path)
+    return info
+
+
+def build_itfind_issue(
+    path: str,
+    seed: int = 0,
+    issue_number: int = 2200,
+    planning_topics: int = 1,
+    ict_topics: int = 1,
+    body_pages: int = 3,
+) -> ItfindIssueInfo:
+    """
+    ITFIND 주간기술동향형 합성 호 생성
+
+    Args:
+        path: 저장 경로
+        seed: 난수 seed
+        issue_number: 호수 (표지에 표기)
+        planning_topics: 기획시리즈 주제 수
+        ict_topics: ICT 신기술 주제 수
+        body_pages: 주제마다 Chapter 시작 면 뒤에 붙는 본문 면 수
+
+    Returns:
+        ItfindIssueInfo (주제 정답 포함)
+    """
+    fitz = _fitz()
+    rng = random.Random(seed)
+    titles = rng.sample(_ITFIND_TOPICS, planning_topics + ict_topics)
+    planning, ict = titles[:planning_topics], titles[planning_topics:]
+    info = ItfindIssueInfo(path=path, issue_number=issue_number, pages=0, topics=list(titles))
+    info.categorized_topics["기획시리즈"] = list(planning)
+    if ict:
+        info.categorized_topics["ICT 신기술"] = list(ict)
+
+    doc = fitz.open()
+
+    def lines(page, items, x=60, y=80, size=11, gap=20):
+        for text in items:
+            page.insert_text((x, y), text, fontname="korea", fontsize=size)
+            y += gap
+
+    # 1면 표지, 2면 발간사
+    lines(doc.new_page(), ["주간기술동향", f"{issue_number}호"], y=300, size=28, gap=40)
+    page = doc.new_page()
+    _fill_textbox(page, fitz.Rect(60, 80, 535, 780), rng, 20, fontsize=10)
+
+    # 3면 목차: 카테고리 → 주제 → 저자 → 하위 목차(짧은 항목 + 페이지 번호)
+    toc = ["목차", "기획시리즈:", rng.choice(_ITFIND_SUBSERIES)]
+    start_page = 4
+    for index, title in enumerate(titles):
+        if index == planning_topics:
+            toc.append("ICT 신기술")
+        toc += [title, rng.choice(_ITFIND_AUTHORS)]
+        for roman, heading, offset in (("Ⅰ", "서론", 0), ("Ⅱ", "주요 동향", 1), ("Ⅲ", "결론", body_pages)):
+            toc += [f"{roman}. {heading}", str(start_page + offset)]
+        start_page += 1 + body_pages
+    lines(doc.new_page(), toc, y=60, gap=17)
+
+    # 주제별 Chapter 시작 면 + 본문 면
+    for index, title in enumerate(titles):
+        category = "기획시리즈-인공지능(AI)" if index < planning_topics else "ICT신기술"
+        page = doc.new_page()
+        lines(page, [category], y=60, size=9)
+        lines(page, [title, f"- {rng.choice(_ITFIND_SUBTITLES)} -", "Chapter", f"{index + 1:02d}"],
+              y=200, size=16, gap=30)
+        _fill_textbox(page, fitz.Rect(60, 340, 535, 780), rng, 12, fontsize=10)
+        for _ in range(body_pages):
+            page = doc.new_page()
+            _fill_textbox(page, fitz.Rect(60, 60, 535, 780), rng, 30, fontsize=10)
+
+    info.pages = doc.page_count
+    _save(doc, path)
+    return info
+
+
+def build_corpus(
+    output_dir: str,
+    seed: int = 0,
+    pages: Optional[List[int]] = None,
+    page_size: str = "a4",
+    itfind_issues: int = 1,
+) -> Dict[str, list]:
+    """지면·ITFIND 호 묶음 생성 + manifest.json 기록"""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest: Dict[str, list] = {"editions": [], "itfind": []}
+    for count in pages or [24, 32]:
+        path = os.path.join(output_dir, f"etnews_{page_size}_{count}p_s{seed}.pdf")
+        manifest["editions"].append(asdict(build_edition(path, count, seed=seed, page_size=page_size)))
+    for offset in range(itfind_issues):
+        issue = 2200 + offset
+        path = os.path.join(output_dir, f"itfind_{issue}_s{seed}.pdf")
+        manifest["itfind"].append(
+            asdict(build_itfind_issue(path, seed=seed + offset, issue_number=issue, ict_topics=1 + offset % 2))
+        )
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="합성 전자신문·ITFIND PDF 코퍼스 생성")
+    parser.add_argument("--output-dir", required=True, help="생성 디렉터리")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pages", type=int, nargs="+", default=[24, 32], help="지면 페이지 수")
+    parser.add_argument("--page-size", choices=sorted(PAGE_SIZES), default="a4")
+    parser.add_argument("--itfind", type=int, default=1, help="ITFIND 호 수")
+    args = parser.parse_args(argv)
+
+    manifest = build_corpus(args.output_dir, args.seed, args.pages, args.page_size, args.itfind)
+    for edition in manifest["editions"]:
+        print(f"{edition['path']}: {edition['pages']}면, 광고 {edition['ad_pages']}")
+    for issue in manifest["itfind"]:
+        print(f"{issue['path']}: {issue['issue_number']}호, 주제 {len(issue['topics'])}개")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/bin/bash
+# 범용 키-값 캐시 테이블 생성 및 IAM 권한 안내 (수신거부 토큰 캐시 등)
+
+set -e
+
+REGION="ap-northeast-2"
+TABLE_NAME="etnews-cache"
+LAMBDA_FUNCTION="etnews-pdf-sender"
+
+echo "===== 범용 캐시 테이블 설정 시작 ====="
+
+# 1. DynamoDB 테이블 생성 (namespace: 캐시 종류, cache_key: 항목 키)
+echo ""
+echo "1. DynamoDB 테이블 생성: ${TABLE_NAME}"
+
+aws dynamodb create-table \
+  --region ${REGION} \
+  --table-name ${TABLE_NAME} \
+  --attribute-definitions AttributeName=namespace,AttributeType=S AttributeName=cache_key,AttributeType=S \
+  --key-schema AttributeName=namespace,KeyType=HASH AttributeName=cache_key,KeyType=RANGE \
+  --billing-mode PAY_PER_REQUEST \
+  --tags Key=Project,Value=etnews-pdf-sender Key=Purpose,Value=cache
+
+aws dynamodb wait table-exists --region ${REGION} --table-name ${TABLE_NAME}
+
+aws dynamodb update-time-to-live \
+  --region ${REGION} \
+  --table-name ${TABLE_NAME} \
+  --time-to-live-specification "Enabled=true,AttributeName=ttl"
+
+echo "✅ DynamoDB 테이블 생성 완료"
+
+# 2. 테이블 확인
+echo ""
+echo "2. 테이블 상태 확인"
+aws dynamodb describe-table \
+  --region ${REGION} \
+  --table-name ${TABLE_NAME} \
+  --query 'Table.[TableName,TableStatus,BillingModeSummary.BillingMode]' \
+  --output text
+
+# 3. Lambda IAM 정책 안내
+echo ""
+echo "3. Lambda IAM 정책 업데이트 필요"
+echo ""
+echo "Lambda 함수의 실행 역할에 다음 권한을 추가해야 합니다:"
+echo ""
+echo "-------- IAM 정책 (JSON) --------"
+cat <<'EOF'
+{
+  "Version": "2012-10-17",
+  "Statement": [
+    {
+      "Effect": "Allow",
+      "Action": [
+        "dynamodb:BatchGetItem",
+        "dynamodb:BatchWriteItem",
+        "dynamodb:Query"
+      ],
+      "Resource": "arn:aws:dynamodb:ap-northeast-2:*:table/etnews-cache"
+    }
+  ]
+}
+EOF
+echo "--------------------------------"
+echo ""
+echo "AWS Console에서 Lambda > ${LAMBDA_FUNCTION} > 구성 > 권한 > 실행 역할에서 정책을 추가하세요."
+echo ""
+
+echo "===== 범용 캐시 테이블 설정 완료 ====="
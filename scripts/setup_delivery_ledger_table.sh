@@ -0,0 +1,69 @@
+#!/bin/bash
+# 수신인별 발송 원장 테이블 생성 및 IAM 권한 안내
+
+set -e
+
+REGION="ap-northeast-2"
+TABLE_NAME="etnews-delivery-ledger"
+LAMBDA_FUNCTION="etnews-pdf-sender"
+
+echo "===== 수신인별 발송 원장 테이블 설정 시작 ====="
+
+# 1. DynamoDB 테이블 생성 (issue_key: 발송 단위, email: 수신인)
+echo ""
+echo "1. DynamoDB 테이블 생성: ${TABLE_NAME}"
+
+aws dynamodb create-table \
+  --region ${REGION} \
+  --table-name ${TABLE_NAME} \
+  --attribute-definitions AttributeName=issue_key,AttributeType=S AttributeName=email,AttributeType=S \
+  --key-schema AttributeName=issue_key,KeyType=HASH AttributeName=email,KeyType=RANGE \
+  --billing-mode PAY_PER_REQUEST \
+  --tags Key=Project,Value=etnews-pdf-sender Key=Purpose,Value=delivery-ledger
+
+aws dynamodb wait table-exists --region ${REGION} --table-name ${TABLE_NAME}
+
+aws dynamodb update-time-to-live \
+  --region ${REGION} \
+  --table-name ${TABLE_NAME} \
+  --time-to-live-specification "Enabled=true,AttributeName=ttl"
+
+echo "✅ DynamoDB 테이블 생성 완료"
+
+# 2. 테이블 확인
+echo ""
+echo "2. 테이블 상태 확인"
+aws dynamodb describe-table \
+  --region ${REGION} \
+  --table-name ${TABLE_NAME} \
+  --query 'Table.[TableName,TableStatus,BillingModeSummary.BillingMode]' \
+  --output text
+
+# 3. Lambda IAM 정책 안내
+echo ""
+echo "3. Lambda IAM 정책 업데이트 필요"
+echo ""
+echo "Lambda 함수의 실행 역할에 다음 권한을 추가해야 합니다:"
+echo ""
+echo "-------- IAM 정책 (JSON) --------"
+cat <<'EOF'
+{
+  "Version": "2012-10-17",
+  "Statement": [
+    {
+      "Effect": "Allow",
+      "Action": [
+        "dynamodb:PutItem",
+        "dynamodb:Query"
+      ],
+      "Resource": "arn:aws:dynamodb:ap-northeast-2:*:table/etnews-delivery-ledger"
+    }
+  ]
+}
+EOF
+echo "--------------------------------"
+echo ""
+echo "AWS Console에서 Lambda > ${LAMBDA_FUNCTION} > 구성 > 권한 > 실행 역할에서 정책을 추가하세요."
+echo ""
+
+echo "===== 수신인별 발송 원장 테이블 설정 완료 ====="
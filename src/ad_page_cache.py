@@ -0,0 +1,210 @@
+"""
+광고 페이지 판정 캐시 모듈
+
+[S16] 광고주는 같은 전면 광고 소재를 며칠씩 게재하지만 _identify_ad_pages는 매일 모든 페이지를
+처음부터 다시 분석한다. 페이지 내용 지문(content stream + 이미지·Form XObject 스트림 해시)을 키로
+판정 결과를 저장해 두고, 같은 페이지가 다시 나오면 분석 없이 바로 판정을 반환한다.
+
+- 1차: 프로세스 메모리 LRU (Lambda warm 컨테이너 재사용 시 스토리지 조회도 생략)
+- 2차: 스토리지 범용 캐시 (SQLite kv_cache / DynamoDB etnews-cache) — persistent=True일 때만
+  조회된 항목은 ttl을 갱신(sliding TTL)하고 항목 수 상한을 넘으면 ttl이 이른 순(= 오래 안 쓴 순)으로 축출
+
+xref 번호는 PDF 파일마다 새로 매겨지므로 지문에는 번호 대신 스트림 내용 해시를 쓴다.
+판정 규칙 설정이 바뀌면 네임스페이스가 달라져 이전 판정을 재사용하지 않는다.
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable
+
+from .storage import get_storage_backend
+
+logger = logging.getLogger(__name__)
+
+# 네임스페이스에 반영할 판정 설정 (바뀌면 이전 판정 무효)
+_VERDICT_CONFIG_KEYS = (
+    "AD_KEYWORDS",
+    "AD_TEXT_LENGTH_THRESHOLD",
+    "AD_KEYWORD_COUNT_THRESHOLD",
+    "AD_CASCADE_ENABLED",
+    "AD_CASCADE_BLANK_STREAM_BYTES",
+    "AD_CASCADE_DENSE_STREAM_BYTES",
+    "AD_IMAGE_COVERAGE_THRESHOLD",
+    "AD_CASCADE_BAND_RATIO",
+    "AD_SCORER",
+    "AD_SCORE_THRESHOLD",
+    "AD_SCORE_IMAGE_WEIGHT",
+    "AD_SCORE_LAYOUT_WEIGHT",
+    "AD_DENSE_TEXT_DENSITY",
+    "AD_DISPLAY_FONT_SPREAD",
+    "AD_LAYOUT_MAX_BLOCKS",
+)
+
+# 프로세스 메모리 LRU (네임스페이스#지문 → 판정)
+_memory: "OrderedDict[str, bool]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def verdict_namespace(config) -> str:
+    """판정 설정 지문이 포함된 캐시 네임스페이스"""
+    settings = repr([(key, getattr(config, key, None)) for key in _VERDICT_CONFIG_KEYS])
+    digest = hashlib.sha256(settings.encode("utf-8")).hexdigest()[:12]
+    return f"ad_page_verdict:v1:{digest}"
+
+
+def page_fingerprint(doc, page) -> str:
+    """페이지 내용 지문
+
+    content stream은 해제된 내용으로(재압축에 영향받지 않음), 이미지·Form XObject는
+    원본(압축) 스트림으로 해시한다. 이미지 디코딩은 하지 않는다.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{page.rect.width:.1f}x{page.rect.height:.1f}".encode("ascii"))
+    for xref in page.get_contents():
+        h.update(b"C")
+        h.update(doc.xref_stream(xref) or b"")
+    for image in page.get_images(full=True):
+        h.update(b"I")
+        h.update(doc.xref_stream_raw(image[0]) or b"")
+    for xobject in page.get_xobjects():
+        h.update(b"X")
+        h.update(doc.xref_stream(xobject[0]) or b"")
+    return h.hexdigest()
+
+
+class AdPageVerdictCache:
+    """페이지 지문 → 광고 판정 캐시 (메모리 LRU + 스토리지 TTL/LRU)"""
+
+    def __init__(self, config, backend=None, persistent: bool = True):
+        """
+        Args:
+            config: Config (AD_PAGE_CACHE_* 설정과 판정 설정 사용)
+            backend: StorageBackend (None이면 get_storage_backend(), 실패 시 메모리만 사용)
+            persistent: False면 스토리지 없이 메모리 LRU만 사용 (backend 무시)
+        """
+        self.namespace = verdict_namespace(config)
+        self.ttl_days = config.AD_PAGE_CACHE_TTL_DAYS
+        self.max_entries = config.AD_PAGE_CACHE_MAX_ENTRIES
+        self.stats: Dict[str, int] = {
+            "memory_hits": 0, "storage_hits": 0, "misses": 0, "stored": 0,
+            "memory_evicted": 0, "storage_evicted": 0,
+        }
+
+        if not persistent:
+            backend = None
+        elif backend is None:
+            try:
+                backend = get_storage_backend()
+            except Exception as e:
+                logger.warning(f"광고 판정 캐시 스토리지 초기화 실패 (메모리 캐시만 사용): {e}")
+        self._backend = backend
+
+    def _memory_key(self, fingerprint: str) -> str:
+        return f"{self.namespace}#{fingerprint}"
+
+    def _remember(self, fingerprint: str, is_ad: bool) -> None:
+        """메모리 LRU 갱신 (lock 보유 상태에서 호출)"""
+        key = self._memory_key(fingerprint)
+        _memory[key] = is_ad
+        _memory.move_to_end(key)
+        while len(_memory) > self.max_entries:
+            _memory.popitem(last=False)
+            self.stats["memory_evicted"] += 1
+
+    def lookup(self, fingerprints: Dict[int, str]) -> Dict[int, bool]:
+        """
+        알려진 판정 조회
+
+        Args:
+            fingerprints: {페이지 번호: 지문}
+
+        Returns:
+            {페이지 번호: 광고 여부} — 캐시에 있는 페이지만
+        """
+        verdicts: Dict[int, bool] = {}
+        pending: Dict[str, list] = {}
+
+        with _memory_lock:
+            for page_num, fingerprint in fingerprints.items():
+                key = self._memory_key(fingerprint)
+                if key in _memory:
+                    _memory.move_to_end(key)
+                    verdicts[page_num] = _memory[key]
+                    self.stats["memory_hits"] += 1
+                else:
+                    pending.setdefault(fingerprint, []).append(page_num)
+
+        if pending and self._backend is not None:
+            try:
+                found = self._backend.get_cache_items(self.namespace, list(pending))
+            except Exception as e:
+                logger.warning(f"광고 판정 캐시 조회 실패: {e}")
+                found = {}
+
+            if found:
+                with _memory_lock:
+                    for fingerprint, value in found.items():
+                        is_ad = value == "1"
+                        self._remember(fingerprint, is_ad)
+                        for page_num in pending.pop(fingerprint):
+                            verdicts[page_num] = is_ad
+                            self.stats["storage_hits"] += 1
+                # sliding TTL: 조회된 항목의 ttl 갱신 (ttl 순서 = 최근 사용 순서)
+                self._put(found)
+
+        self.stats["misses"] += sum(len(pages) for pages in pending.values())
+        return verdicts
+
+    def store(self, verdicts: Dict[str, bool]) -> None:
+        """
+        새 판정 저장
+
+        Args:
+            verdicts: {지문: 광고 여부}
+        """
+        if not verdicts:
+            return
+        with _memory_lock:
+            for fingerprint, is_ad in verdicts.items():
+                self._remember(fingerprint, is_ad)
+        items = {fingerprint: "1" if is_ad else "0" for fingerprint, is_ad in verdicts.items()}
+        if self._put(items):
+            self.stats["stored"] += len(items)
+            try:
+                self.stats["storage_evicted"] += self._backend.prune_cache_items(self.namespace, self.max_entries)
+            except Exception as e:
+                logger.warning(f"광고 판정 캐시 축출 실패: {e}")
+
+    def _put(self, items: Dict[str, str]) -> bool:
+        if self._backend is None or not items:
+            return False
+        try:
+            return bool(self._backend.put_cache_items(self.namespace, items, ttl_days=self.ttl_days))
+        except Exception as e:
+            logger.warning(f"광고 판정 캐시 저장 실패: {e}")
+            return False
+
+
+def fingerprint_pages(pdf_path: str, page_indices: Iterable[int], doc=None) -> Dict[int, str]:
+    """페이지별 내용 지문 계산 (실패한 페이지는 제외, doc이 주어지면 파일을 다시 열지 않음)"""
+    from .pdf_ad_classifier import fitz
+
+    if doc is None:
+        with fitz.open(pdf_path) as opened:
+            return fingerprint_pages(pdf_path, page_indices, doc=opened)
+
+    fingerprints: Dict[int, str] = {}
+    for page_num in page_indices:
+        try:
+            fingerprints[page_num] = page_fingerprint(doc, doc[page_num])
+        except Exception as e:
+            logger.warning(f"페이지 {page_num + 1} 지문 계산 실패: {e}")
+    return fingerprints
+
+
+def clear_memory_cache() -> None:
+    """프로세스 메모리 LRU 초기화 (테스트용)"""
+    with _memory_lock:
+        _memory.clear()
+
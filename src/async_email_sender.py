@@ -0,0 +1,237 @@
+"""
+asyncio 기반 이메일 전송 모듈
+
+[S6] EmailSender의 메시지 조립([S1] 공유 자산, [S4] MIME 템플릿)은 그대로 재사용하고,
+전송 단계만 aiosmtplib로 교체한다.
+- 세마포어로 동시 진행 SMTP 트랜잭션 수를 SMTP_ASYNC_CONCURRENCY로 제한
+- 연결 수립(STARTTLS/LOGIN)도 이벤트 루프를 막지 않음
+- 메시지별 타임아웃(SMTP_MESSAGE_TIMEOUT)
+- 재연결 주기(SMTP_RECONNECT_EVERY)·연속 실패 회로 차단은 sync 엔진과 동일한 규칙
+- [S9] 전송 간격·일시 정지·동시성 축소는 SMTPRateController를 sync 엔진과 공유
+"""
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+from .email_sender import EmailSender
+from .smtp_rate_controller import HALTED, THROTTLED
+
+logger = logging.getLogger(__name__)
+
+# aiosmtplib import with graceful degradation
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+    logger.warning("aiosmtplib not available. async delivery engine disabled.")
+
+
+class AsyncEmailSender(EmailSender):
+    """aiosmtplib 기반 벌크 전송 엔진 (send_bulk_email 계약은 EmailSender와 동일)"""
+
+    def __init__(self):
+        super().__init__()
+        self.smtp_host = self.config.GMAIL_SMTP_SERVER
+        self.smtp_port = self.config.GMAIL_SMTP_PORT
+        # 로컬 SMTP 싱크(aiosmtpd 등) 대상 테스트 시 False로 설정
+        self.use_starttls = True
+
+    def _deliver(self, recipients: list, shared: dict) -> tuple[List[str], int]:
+        """동기 호출부(send_bulk_email)에서 asyncio 전송 루프 실행"""
+        return asyncio.run(self._deliver_async(recipients, shared))
+
+    def _start_smtp_prewarm(self) -> None:
+        """[S21] 동기 smtplib 선행 연결은 쓰지 않음 (연결은 asyncio 루프 안에서 수립)"""
+        return None
+
+    async def _open_async_connection(self) -> "aiosmtplib.SMTP":
+        """SMTP 연결 수립 (STARTTLS + LOGIN, 비동기). 실패 시 SMTP_MAX_RETRIES만큼 재시도.
+
+        Raises:
+            Exception — 최대 재시도 초과 시
+        """
+        max_retries = self.config.SMTP_MAX_RETRIES
+        timeout = self.config.SMTP_MESSAGE_TIMEOUT
+        last_err: Optional[Exception] = None
+
+        for attempt in range(1, max_retries + 1):
+            client = aiosmtplib.SMTP(
+                hostname=self.smtp_host,
+                port=self.smtp_port,
+                timeout=timeout,
+                start_tls=False,
+            )
+            try:
+                await client.connect()
+                if self.use_starttls:
+                    await client.starttls()
+                password = self.config.GMAIL_APP_PASSWORD
+                if password:
+                    await client.login(self.config.GMAIL_USER, password)
+                logger.info(f"[async] SMTP 연결 수립 성공 (시도 {attempt}/{max_retries})")
+                return client
+            except Exception as e:
+                last_err = e
+                client.close()
+                logger.warning(f"[async] SMTP 연결 실패 (시도 {attempt}/{max_retries}): {e}")
+                if attempt < max_retries:
+                    await asyncio.sleep(self.config.SMTP_RETRY_DELAY)
+        raise Exception(f"SMTP 연결 최대 재시도 초과: {last_err}")
+
+    async def _close_async_connection(self, client: "aiosmtplib.SMTP") -> None:
+        """QUIT 후 연결 종료 (실패해도 무시)"""
+        try:
+            await asyncio.wait_for(client.quit(), timeout=5)
+        except Exception:
+            client.close()
+
+    async def _send_async(
+        self, client: "aiosmtplib.SMTP", msg: bytes, to_emails: List[str]
+    ) -> "aiosmtplib.SMTP":
+        """메시지 1통 전송 (메시지별 타임아웃). 연결이 끊어졌으면 1회 재연결 후 재전송.
+
+        Returns:
+            사용(또는 교체)된 SMTP 클라이언트
+        """
+        timeout = self.config.SMTP_MESSAGE_TIMEOUT
+        try:
+            await asyncio.wait_for(
+                client.sendmail(self.config.GMAIL_USER, to_emails, msg), timeout=timeout
+            )
+            return client
+        except aiosmtplib.SMTPServerDisconnected as e:
+            logger.warning(f"[async] SMTP 연결 끊김 감지 ({e.__class__.__name__}), 재연결 후 재시도")
+            client.close()
+            client = await self._open_async_connection()
+            await asyncio.wait_for(
+                client.sendmail(self.config.GMAIL_USER, to_emails, msg), timeout=timeout
+            )
+            return client
+
+    async def _deliver_async(self, recipients: list, shared: dict) -> tuple[List[str], int]:
+        """세마포어로 동시성을 제한한 비동기 전송 루프
+
+        연결은 유휴 목록에서 재사용하며, 세마포어 한도만큼만 동시에 열린다.
+        [S9] SMTPRateController가 동시성을 줄이면 진행 중 트랜잭션이 그 이하가 될 때까지 대기하고,
+        스로틀링 응답을 받은 수신자는 일시 정지 후 재시도한다.
+
+        Returns:
+            (성공한 수신인 이메일 리스트 — 원래 수신자 순서, 실패 건수)
+        """
+        fail_limit = self.config.SMTP_CONSECUTIVE_FAIL_LIMIT
+        reconnect_every = self.config.SMTP_RECONNECT_EVERY
+        throttle_retries = self._throttle_retry_limit()
+        concurrency = max(1, min(self.config.SMTP_ASYNC_CONCURRENCY, len(recipients)))
+        controller = self._create_rate_controller(concurrency)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        # [S9] 진행 중 트랜잭션 수가 제어기 동시성 한도 미만이 될 때까지 대기 (전송 종료·한도 상향 시 notify)
+        slots = asyncio.Condition()
+        idle: list = []  # (client, 해당 연결로 보낸 건수)
+        succeeded: set = set()
+        state = {"fail_count": 0, "consecutive_fail": 0, "stopped": False, "in_flight": 0}
+
+        async def acquire_slot() -> bool:
+            """동시성 슬롯 확보 (중단되었으면 False)"""
+            async with slots:
+                await slots.wait_for(
+                    lambda: state["stopped"] or state["in_flight"] < controller.concurrency
+                )
+                if state["stopped"]:
+                    return False
+                state["in_flight"] += 1
+                return True
+
+        async def release_slot() -> None:
+            async with slots:
+                state["in_flight"] -= 1
+                slots.notify_all()
+
+        async def send_once(recipient) -> None:
+            client, sent = idle.pop() if idle else (None, 0)
+            try:
+                # Gmail 단일 연결 한도 대비: reconnect_every마다 재연결
+                if client is not None and sent >= reconnect_every:
+                    logger.info(f"[async] SMTP 재연결 (연속 {sent}통 발송 후)")
+                    await self._close_async_connection(client)
+                    client = None
+                if client is None:
+                    client = await self._open_async_connection()
+                    sent = 0
+
+                # aiosmtplib는 전체 bytes만 받으므로 [S7] 스트리밍 대신 bytes로 변환.
+                # 스풀된 공유 템플릿(MIME_SPOOL_THRESHOLD 초과)은 파일을 읽으므로 이벤트 루프 밖에서 조립
+                msg = await asyncio.to_thread(
+                    lambda: bytes(self._assemble_message(recipient.email, shared))
+                )
+                started = time.monotonic()
+                client = await self._send_async(client, msg, [recipient.email])
+                before = controller.concurrency
+                controller.on_success(time.monotonic() - started)
+                idle.append((client, sent + 1))
+                if controller.concurrency > before:
+                    # 한도가 올라갔으면 대기 중인 수신자를 깨움
+                    async with slots:
+                        slots.notify_all()
+            except BaseException:
+                # 실패한 연결은 상태를 알 수 없으므로 재사용하지 않음
+                if client is not None:
+                    client.close()
+                raise
+
+        async def deliver_one(recipient) -> None:
+            async with semaphore:
+                for attempt in range(throttle_retries + 1):
+                    # [S9] 줄어든 동시성 한도 이하가 될 때까지 대기
+                    if not await acquire_slot():
+                        return
+                    try:
+                        await asyncio.sleep(controller.reserve())
+                        if state["stopped"]:
+                            return
+                        await send_once(recipient)
+                    except Exception as e:
+                        verdict = controller.on_failure(e)
+                        if verdict == THROTTLED and attempt < throttle_retries:
+                            logger.warning(
+                                f"[async] 이메일 전송 보류 (스로틀링, 재시도 예정): {recipient.email} - {e}"
+                            )
+                            continue
+
+                        state["fail_count"] += 1
+                        state["consecutive_fail"] += 1
+                        reason = "타임아웃" if isinstance(e, asyncio.TimeoutError) else str(e)
+                        logger.error(f"[async] 이메일 전송 실패: {recipient.email} - {reason}")
+                        if verdict == HALTED and not state["stopped"]:
+                            state["stopped"] = True
+                            logger.error("🛑 async 벌크 전송 중단")
+                        elif state["consecutive_fail"] >= fail_limit and not state["stopped"]:
+                            state["stopped"] = True
+                            logger.error(
+                                f"🛑 연속 {state['consecutive_fail']}회 실패 — async 벌크 전송 조기 중단"
+                            )
+                        return
+                    finally:
+                        await release_slot()
+
+                    succeeded.add(recipient.email)
+                    state["consecutive_fail"] = 0
+                    # [S8] 원장 기록은 블로킹 I/O이므로 이벤트 루프 밖에서 수행
+                    await asyncio.to_thread(self._record_delivery, shared, recipient.email)
+                    logger.info(
+                        f"[async] 이메일 전송 완료: {recipient.email} ({len(succeeded)}/{len(recipients)})"
+                    )
+                    return
+
+        logger.info(f"[S6] async SMTP 전송: 동시 트랜잭션 {concurrency}개, 수신자 {len(recipients)}명")
+        try:
+            await asyncio.gather(*(deliver_one(r) for r in recipients))
+        finally:
+            for client, _ in idle:
+                await self._close_async_connection(client)
+            self._report_rate_metrics(controller)
+
+        success_emails = [r.email for r in recipients if r.email in succeeded]
+        return success_emails, state["fail_count"]
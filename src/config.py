@@ -51,6 +51,105 @@ class ConfigClass:
     SMTP_CONSECUTIVE_FAIL_LIMIT = 5  # 연속 실패 허용치 (초과 시 루프 조기 중단)
     SMTP_RECONNECT_EVERY = 50        # 연결 재오픈 주기 (Gmail 단일 연결 100통 한계 대비)
 
+    # [S5] 병렬 전송 설정
+    SMTP_POOL_SIZE = 1  # 동시 SMTP 세션 수 (1이면 단일 연결 순차 전송)
+
+    # [S6] asyncio 전송 엔진 설정
+    EMAIL_DELIVERY_ENGINE = os.getenv("EMAIL_DELIVERY_ENGINE", "sync")  # "sync" 또는 "async"
+    SMTP_ASYNC_CONCURRENCY = 5  # 동시 진행 SMTP 트랜잭션 상한 (세마포어)
+    SMTP_MESSAGE_TIMEOUT = 120  # 메시지 1통 전송 타임아웃 (초)
+
+    # [S7] 스트리밍 전송 설정
+    SMTP_STREAMING = True  # DATA 단계에서 메시지를 청크 단위로 소켓에 직접 기록
+    SMTP_STREAM_CHUNK_SIZE = 64 * 1024  # 스트리밍 청크 크기 (bytes)
+    MIME_SPOOL_THRESHOLD = 8 * 1024 * 1024  # 공유 파트가 이 크기를 넘으면 임시 파일에 직렬화
+
+    # [S8] 수신인별 발송 원장 (재실행 시 이미 받은 수신인 제외)
+    DELIVERY_LEDGER_ENABLED = True
+    DELIVERY_LEDGER_TTL_DAYS = 14  # 원장 레코드 보관 기간 (일)
+
+    # [S9] 적응형 전송 속도 제어 (AIMD)
+    SMTP_ADAPTIVE_RATE = True  # False면 고정 규칙(재연결 주기·연속 실패 한도)만 사용
+    SMTP_MAX_RATE = 5.0  # 전송 속도 상한 (통/초)
+    SMTP_RATE_INCREASE = 0.1  # 성공 1건당 속도 증가량 (통/초)
+    SMTP_LATENCY_TARGET = 60  # 메시지 1통 전송 지연 목표 (초, 초과 시 감속)
+    SMTP_THROTTLE_PAUSE = 5  # 스로틀링 응답(421/450/451/454) 시 첫 정지 시간 (초, 연속 시 2배)
+    SMTP_THROTTLE_PAUSE_MAX = 60  # 1회 정지 시간 상한 (초)
+    SMTP_THROTTLE_PAUSE_BUDGET = 120  # 누적 정지 시간 상한 (초, Lambda 타임아웃 고려)
+    SMTP_THROTTLE_MAX_RETRIES = 3  # 스로틀링으로 인한 수신자별 재시도 한도
+
+    # [S10] 디스크 스풀 (렌더링/전송 단계 분리)
+    EMAIL_SPOOL_DIR = os.getenv("EMAIL_SPOOL_DIR", "")  # 비어 있으면 스풀 미사용 (메모리에서 바로 전송)
+    SPOOL_MAX_ATTEMPTS = 3  # 메시지별 최대 전송 시도 횟수 (초과 시 failed/)
+    SPOOL_STALE_SECONDS = 600  # 점유 후 이 시간이 지난 메시지는 워커 비정상 종료로 보고 복구
+
+    # [S11] 수신거부 토큰 캐시 (토큰은 월 단위로만 바뀜)
+    UNSUBSCRIBE_TOKEN_CACHE = True
+    UNSUBSCRIBE_TOKEN_CACHE_TTL_DAYS = 62  # 이전 달 토큰도 검증되므로 두 달 보관
+
+    # [S12] 본문 템플릿 사전 인코딩 (수신자별로는 수신거부 URL 줄만 인코딩)
+    EMAIL_BODY_PRECOMPILE = True
+
+    # [S13] 광고 페이지 분석 엔진
+    PDF_CLASSIFIER_ENGINE = "pymupdf"  # "pymupdf" (MuPDF + 프로세스 풀) 또는 "pypdf" (기존 순차 추출)
+    PDF_CLASSIFIER_WORKERS = min(4, os.cpu_count() or 1)  # 텍스트 추출 프로세스 수
+    PDF_CLASSIFIER_PARALLEL_MIN_PAGES = 8  # 이 페이지 수 미만이면 현재 프로세스에서 순차 추출
+
+    # [S14] 단계별 광고 판정 (구조 신호 → 상단 띠 텍스트 → 전체 텍스트)
+    AD_CASCADE_ENABLED = True  # PDF_CLASSIFIER_ENGINE="pymupdf"일 때만 적용
+    AD_CASCADE_BLANK_STREAM_BYTES = 64  # 이보다 작은 content stream + 이미지 없음 → 빈 페이지
+    AD_CASCADE_DENSE_STREAM_BYTES = 2048  # 이 이상이면 상단 띠 텍스트로 판정, 미만이면 이미지 면적 확인
+    AD_IMAGE_COVERAGE_THRESHOLD = 0.6  # 이미지가 덮는 면적 비율이 이 이상이면 전면 광고
+    AD_CASCADE_BAND_RATIO = 0.15  # 2단계에서 텍스트를 추출할 상단 영역 비율
+
+    # [S15] 레이아웃 특성 벡터 점수 (NumPy, 미설치 시 텍스트 규칙)
+    AD_SCORER = "vector"  # "vector" (특성 행렬 점수) 또는 "rules" (텍스트 길이·키워드 규칙)
+    AD_SCORE_THRESHOLD = 1.0  # 이 점수 이상이면 광고
+    AD_SCORE_IMAGE_WEIGHT = 1.25  # 이미지 면적 비율 × 텍스트 희소도 가중치
+    AD_SCORE_LAYOUT_WEIGHT = 0.5  # 적은 블록 + 큰 글자 크기 차이(헤드카피형 레이아웃) 가중치
+    AD_DENSE_TEXT_DENSITY = 2.0  # 1000pt²당 글자 수가 이 이상이면 텍스트 희소도 0 (기사 면)
+    AD_DISPLAY_FONT_SPREAD = 24.0  # 글자 크기 차이(pt)가 이 이상이면 레이아웃 점수 최대
+    AD_LAYOUT_MAX_BLOCKS = 3  # 텍스트 블록이 이 수 이하일 때만 레이아웃 점수 적용
+
+    # [S16] 광고 판정 캐시 (페이지 내용 지문 → 판정)
+    AD_PAGE_CACHE_ENABLED = True
+    AD_PAGE_CACHE_TTL_DAYS = 14  # 마지막 조회 후 보관 기간 (조회 시 갱신)
+    AD_PAGE_CACHE_MAX_ENTRIES = 4096  # 메모리 LRU·스토리지 항목 수 상한
+
+    # [S18] 광고 제거 PDF 저장 엔진 (실행마다 process_pdf(writer=...) 또는 Lambda 이벤트 pdf_writer로 지정 가능)
+    PDF_WRITER_ENGINE = os.getenv("PDF_WRITER_ENGINE", "pymupdf")  # "pymupdf" (select + garbage/deflate) 또는 "pypdf" (기존 PdfWriter 복사)
+    PDF_WRITER_GARBAGE_LEVEL = 4  # 3: 참조 끊긴 객체 제거 + 중복 객체 병합, 4: + 동일 스트림 병합
+
+    # [S19] 첨부 PDF 크기 최적화 (process_pdf → send_emails 사이)
+    PDF_OPTIMIZE_ENABLED = True
+    PDF_OPTIMIZE_BUDGET_MB = 10.0  # 첨부 목표 크기 (Gmail 첨부 한도 25MB)
+    # (이 DPI를 넘는 이미지를, 목표 DPI로, JPEG 품질) — 예산 안에 들 때까지 차례로 시도
+    PDF_OPTIMIZE_STEPS = ((200, 150, 80), (160, 120, 65), (128, 96, 50))
+
+    # [S21] 이메일 미리보기 렌더링을 PDF 로딩·SMTP 연결 수립과 겹침
+    EMAIL_PREVIEW_RENDER_WORKERS = 2  # 1면·목차 미리보기 렌더링 스레드 수 (1이면 순차 렌더링)
+    EMAIL_SMTP_PREWARM = True  # 공통 자산을 준비하는 동안 첫 SMTP 연결(TLS + LOGIN)을 미리 수립
+
+    # [S22] 이메일 미리보기 렌더링 디스크 캐시 (PDF sha256·페이지·렌더링 인자 → 이미지)
+    PREVIEW_RENDER_CACHE_ENABLED = True
+    PREVIEW_RENDER_CACHE_DIR = os.getenv("PREVIEW_RENDER_CACHE_DIR", os.path.join(TEMP_DIR, "preview_render_cache"))
+    PREVIEW_RENDER_CACHE_MAX_MB = 32  # 캐시 전체 크기 상한 (넘으면 오래 안 쓴 순으로 삭제)
+
+    # [S23] 이메일 미리보기 바이트 예산 (inline 이미지는 수신자마다 복제됨)
+    EMAIL_PREVIEW_BUDGET_KB = 200  # 미리보기 1장 JPEG 목표 크기 (0이면 품질 85 고정)
+    EMAIL_FIRST_PAGE_CLIP = None  # 1면 렌더링 영역 (페이지 비율 x0, y0, x1, y1), 예: (0, 0, 1, 0.35) 상단 헤드라인
+    EMAIL_FIRST_PAGE_CLIP_DPI = 300  # clip 렌더링 DPI 상한
+    EMAIL_FIRST_PAGE_CLIP_MAX_WIDTH = 1000  # clip 렌더링 최대 너비 (px)
+
+    # [S25] ITFIND HTTP 세션 (RSS·상세 페이지·PDF 다운로드가 keep-alive 연결 공유)
+    HTTP_POOL_MAXSIZE = 4  # 호스트별 유지할 연결 수
+    HTTP_RETRY_TOTAL = 3  # 연결 실패·429/5xx 재시도 횟수 (GET/HEAD만)
+    HTTP_RETRY_BACKOFF = 0.5  # 재시도 대기 = backoff × 2^(n-1)초
+
+    # [S26] RSS 피드 조건부 조회 캐시 (ETag/Last-Modified + 본문 sha256 → 파싱 결과)
+    RSS_FEED_CACHE_ENABLED = True
+    RSS_FEED_CACHE_TTL_DAYS = 30  # 마지막으로 피드가 바뀐 뒤 검증자·파싱 결과 보관 기간
+
     # ITFIND 컨텐츠 신선도 설정
     ITFIND_STALENESS_DAYS = 6  # ITFIND 주간기술동향 컨텐츠 신선도 임계값 (일)
 
@@ -150,6 +249,16 @@ class ConfigClass:
         """DynamoDB 실행 이력 테이블명"""
         return os.getenv("DYNAMODB_EXECUTION_TABLE", "etnews-execution-log")
 
+    @property
+    def DYNAMODB_LEDGER_TABLE(self):
+        """DynamoDB 수신인별 발송 원장 테이블명"""
+        return os.getenv("DYNAMODB_LEDGER_TABLE", "etnews-delivery-ledger")
+
+    @property
+    def DYNAMODB_CACHE_TABLE(self):
+        """DynamoDB 범용 캐시 테이블명"""
+        return os.getenv("DYNAMODB_CACHE_TABLE", "etnews-cache")
+
     @property
     def AWS_REGION(self):
         """AWS 리전"""
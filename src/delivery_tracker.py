@@ -1,11 +1,15 @@
 """
 이메일 발송 이력 추적
 수신인별 마지막 발송 날짜를 Storage에 기록하여 중복 발송 방지
+
+[S8] DeliveryLedger: 메시지 1통이 SMTP 서버에 수락될 때마다 발송 단위(issue_key)별로
+기록해, 회로 차단·프로세스 중단 후 재실행 시 아직 받지 못한 수신인에게만 전송한다.
 """
 
 import logging
+import threading
 from datetime import datetime, timezone, timedelta
-from typing import List
+from typing import List, Set
 from .storage import get_storage_backend
 from .recipients.recipient_manager import get_active_recipients
 
@@ -111,3 +115,63 @@ class DeliveryTracker:
             f"발송 이력 업데이트 완료: 성공 {success_count}명, 실패 {fail_count}명 (날짜: {today})"
         )
         return success_count > 0
+
+
+class DeliveryLedger:
+    """[S8] 발송 단위(issue_key)별 수신인 전송 원장
+
+    DeliveryTracker.mark_as_delivered는 루프 종료 후 한 번에 기록하므로 중간에 중단되면
+    아무 기록도 남지 않는다. 원장은 전송 성공 직후 1건씩 기록한다.
+    병렬 전송 워커가 동시에 호출하므로 기록은 lock으로 직렬화한다.
+    """
+
+    def __init__(self, issue_key: str, ttl_days: int = 14):
+        """
+        Args:
+            issue_key: 발송 단위 키 (make_issue_key로 생성)
+            ttl_days: 원장 레코드 보관 기간 (일)
+        """
+        self.issue_key = issue_key
+        self.ttl_days = ttl_days
+        self._backend = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def today_kst() -> str:
+        """발송 단위 날짜 (KST, YYYY-MM-DD) — 기본 제목 날짜도 같은 시계를 써야 키가 갈리지 않음"""
+        kst = timezone(timedelta(hours=9))
+        return datetime.now(kst).strftime("%Y-%m-%d")
+
+    @staticmethod
+    def make_issue_key(subject: str) -> str:
+        """발송 단위 키 생성 (KST 날짜 + 이메일 제목)
+
+        같은 날 전자신문·ITFIND를 별도 발송하므로 제목까지 포함해 구분한다.
+        """
+        return f"{DeliveryLedger.today_kst()}#{subject}"
+
+    def _get_backend(self):
+        """StorageBackend lazy 초기화"""
+        if self._backend is None:
+            self._backend = get_storage_backend()
+        return self._backend
+
+    def delivered_emails(self) -> Set[str]:
+        """이미 전송 성공 기록이 있는 수신인 이메일 집합 (조회 실패 시 빈 집합)"""
+        try:
+            with self._lock:
+                return self._get_backend().get_delivered_emails(self.issue_key)
+        except Exception as e:
+            logger.error(f"발송 원장 조회 오류: {self.issue_key} - {e}")
+            return set()
+
+    def record(self, email: str) -> bool:
+        """수신인 1명의 전송 성공 기록 (실패해도 예외를 던지지 않음 — 발송은 계속)"""
+        try:
+            with self._lock:
+                return self._get_backend().put_delivery_record(
+                    self.issue_key, email, ttl_days=self.ttl_days
+                )
+        except Exception as e:
+            logger.error(f"발송 원장 기록 오류: {email} - {e}")
+            return False
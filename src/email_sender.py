@@ -3,27 +3,39 @@
 Gmail SMTP를 사용하여 처리된 PDF 파일 전송
 """
 import os
+import queue
 import smtplib
 import logging
+import threading
+import time
 import email
+import secrets
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from email.mime.image import MIMEImage
 from datetime import datetime
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Union, TYPE_CHECKING
 from urllib.parse import quote
 import email.utils
 
 from .config import Config
+from .delivery_tracker import DeliveryLedger
+from . import pdf_image_extractor
+from .mime_template import BodyTemplate, DotStuffer, MessageTemplate, RenderedMessage
+from .pdf_session import read_pdf_bytes
 from .recipients import get_active_recipients
-from .unsubscribe_token import generate_token
-import email.utils
+from .smtp_rate_controller import HALTED, THROTTLED, SMTPRateController
+from .structured_logging import get_structured_logger
+from .unsubscribe_token import generate_token, get_monthly_tokens
 
 if TYPE_CHECKING:
     from .itfind_scraper import WeeklyTrend
 
 logger = logging.getLogger(__name__)
+structured_logger = get_structured_logger(__name__)
 
 
 def _detect_image_subtype(image_bytes: bytes) -> tuple[str, str]:
@@ -84,12 +96,19 @@ def generate_korean_filename(itfind_info: Optional["WeeklyTrend"] = None) -> tup
 class EmailSender:
     """Gmail SMTP 이메일 전송"""
 
+    # [S21] 공통 자산 준비 중 미리 수립한 첫 SMTP 연결 (전송 엔진이 처음 연결할 때 가져감)
+    _smtp_prewarm: Optional[Future] = None
+
     def __init__(self):
         self.config = Config
         # 수신거부 토큰 생성을 위한 시크릿 키 (Config에서 로드)
         self.unsubscribe_secret = self.config.UNSUBSCRIBE_SECRET
         # Lambda Function URL for unsubscribe (Config에서 로드)
         self.unsubscribe_url_base = self.config.UNSUBSCRIBE_FUNCTION_URL
+        # [S9] 마지막 벌크 전송의 속도 제어 지표 (SMTPRateController.snapshot())
+        self.rate_metrics: dict = {}
+        # [S11] 벌크 전송 중 미리 준비한 수신거부 토큰 {email: token}
+        self._unsubscribe_tokens: dict = {}
 
     def send_email(
         self,
@@ -114,8 +133,8 @@ class EmailSender:
 
             # 제목 설정
             if not subject:
-                today = datetime.now().strftime("%Y-%m-%d")
-                subject = f"IT뉴스 [{today}]"
+                # 발송 원장 키(make_issue_key)와 같은 KST 날짜 사용 (UTC Lambda 자정 전후 키 분리 방지)
+                subject = f"IT뉴스 [{DeliveryLedger.today_kst()}]"
 
             # 이메일 메시지 생성
             msg = self._create_message(pdf_path, [to_email], subject)
@@ -176,8 +195,24 @@ class EmailSender:
 
             # 제목 설정
             if not subject:
-                today = datetime.now().strftime("%Y-%m-%d")
-                subject = f"IT뉴스 [{today}]"
+                # 발송 원장 키(make_issue_key)와 같은 KST 날짜 사용 (UTC Lambda 자정 전후 키 분리 방지)
+                subject = f"IT뉴스 [{DeliveryLedger.today_kst()}]"
+
+            # [S8] 발송 원장: 이번 발송 단위에서 이미 전송 성공한 수신인은 제외
+            ledger = self._open_delivery_ledger(subject, test_mode)
+            already_delivered = ledger.delivered_emails() if ledger else set()
+            pending = [r for r in recipients if r.email not in already_delivered]
+            if already_delivered:
+                logger.info(
+                    f"발송 원장: {len(recipients) - len(pending)}명 이미 전송됨, "
+                    f"남은 수신인 {len(pending)}명에게만 전송"
+                )
+            if not pending:
+                logger.info("모든 수신인에게 이미 전송됨 (발송 원장 기준) — 전송 생략")
+                return True, [r.email for r in recipients]
+
+            # [S21] 공통 자산 준비(미리보기 렌더링·PDF 로딩)와 첫 SMTP 연결 수립을 겹침
+            self._smtp_prewarm = self._start_smtp_prewarm()
 
             # [S1 최적화] 수신자와 무관한 공통 자산(이미지·PDF 바이트)을 1회만 준비
             shared = self._prepare_shared_assets(
@@ -186,65 +221,386 @@ class EmailSender:
                 itfind_pdf_path=itfind_pdf_path,
                 itfind_info=itfind_info,
             )
+            shared["ledger"] = ledger
+
+            # [S11] 수신거부 토큰을 전송 루프 밖에서 일괄 준비 (월별 캐시)
+            self._unsubscribe_tokens = self._prepare_unsubscribe_tokens([r.email for r in pending])
 
             # 각 수신자에게 개별 전송
-            success_emails = []
-            fail_count = 0
-            consecutive_fail = 0  # [S2] 연속 실패 카운터 (회로 차단용)
-            fail_limit = getattr(self.config, "SMTP_CONSECUTIVE_FAIL_LIMIT", 5)
-            reconnect_every = getattr(self.config, "SMTP_RECONNECT_EVERY", 50)
+            try:
+                sent_emails, fail_count = self._deliver(pending, shared)
+            finally:
+                shared["template"].close()
+                self._unsubscribe_tokens = {}
 
-            # [S2 최적화] SMTP 연결을 1회만 수립하고 루프 전체에서 재사용
-            server = self._open_smtp_connection()
+            logger.info(f"이메일 전송 완료: 성공 {len(sent_emails)}명, 실패 {fail_count}명")
+
+            # 반환 목록에는 이전 실행에서 이미 받은 수신인도 포함 (발송 이력 기록용)
+            delivered = already_delivered.union(sent_emails)
+            if ledger is not None and len(delivered) < len(recipients):
+                # 같은 스풀을 비우는 다른 전송 워커가 보낸 건도 원장에는 기록되어 있음
+                delivered |= ledger.delivered_emails()
+            success_emails = [r.email for r in recipients if r.email in delivered]
+            # 이번 실행에서 보낸 건이 없어도 전원이 (이전 실행 포함) 받았으면 성공
+            return len(sent_emails) > 0 or len(success_emails) == len(recipients), success_emails
+
+        except Exception as e:
+            logger.error(f"이메일 전송 실패: {e}")
+            return False, []
+
+        finally:
+            self._discard_smtp_prewarm()
+
+    def _open_delivery_ledger(self, subject: str, test_mode: bool) -> Optional[DeliveryLedger]:
+        """[S8] 발송 원장 생성 (OPR 모드 + DELIVERY_LEDGER_ENABLED일 때만)
+
+        TEST 모드는 관리자 재발송이 잦으므로 원장을 사용하지 않는다.
+        """
+        if test_mode or getattr(self.config, "DELIVERY_LEDGER_ENABLED", False) is not True:
+            return None
+        ttl_days = getattr(self.config, "DELIVERY_LEDGER_TTL_DAYS", 14)
+        return DeliveryLedger(DeliveryLedger.make_issue_key(subject), ttl_days=ttl_days)
+
+    def _record_delivery(self, shared: dict, recipient_email: str) -> None:
+        """[S8] SMTP 서버가 메시지를 수락한 직후 원장에 기록 (원장 미사용 시 무시)"""
+        ledger = shared.get("ledger")
+        if ledger is not None:
+            ledger.record(recipient_email)
+
+    def _deliver(self, recipients: list, shared: dict) -> tuple[List[str], int]:
+        """수신자 목록 전송 엔진 선택 (하위 클래스에서 교체 가능)
+
+        [S5] SMTP_POOL_SIZE > 1이면 다중 연결 병렬 전송, 아니면 단일 연결 순차 전송.
+
+        Returns:
+            (성공한 수신인 이메일 리스트, 실패 건수)
+        """
+        pool_size = getattr(self.config, "SMTP_POOL_SIZE", 1)
+        spool_dir = getattr(self.config, "EMAIL_SPOOL_DIR", "")
+        if isinstance(spool_dir, str) and spool_dir:
+            workers = pool_size if isinstance(pool_size, int) else 1
+            return self._send_via_spool(recipients, shared, spool_dir, workers)
+        if isinstance(pool_size, int) and pool_size > 1 and len(recipients) > 1:
+            return self._send_parallel(recipients, shared, pool_size)
+        return self._send_serial(recipients, shared)
+
+    def _send_via_spool(
+        self, recipients: list, shared: dict, spool_dir: str, workers: int
+    ) -> tuple[List[str], int]:
+        """[S10] 수신자별 메시지를 디스크 스풀에 렌더링한 뒤 전송 워커로 스풀을 비움
+
+        같은 스풀을 공유하는 다른 전송 프로세스(scripts/drain_mail_spool.py)가 있으면
+        이 배치의 메시지 일부를 그쪽에서 보낼 수 있으므로, 반환값은 이 프로세스가 보낸 건만 포함한다.
+
+        Returns:
+            (성공한 수신인 이메일 리스트 — 원래 수신자 순서, 실패 건수)
+        """
+        from .mail_spool import MailSpool, SpoolTransmitter
+
+        spool = MailSpool(spool_dir)
+        template = shared["template"]
+        spool.recover_stale(getattr(self.config, "SPOOL_STALE_SECONDS", 600))
+
+        # [S8] 재실행: 같은 발송 단위의 이전 배치 대기 메시지는 삭제하고 미전송 수신인만 새 배치로
+        # (다른 전송 워커가 점유 중인 수신인은 그쪽 전송 결과를 원장으로 확인)
+        ledger = shared.get("ledger")
+        issue_key = ledger.issue_key if ledger is not None else None
+        if issue_key:
+            in_flight = spool.discard_issue_batches(issue_key)
+            if in_flight:
+                logger.info(f"[S10] 다른 전송 워커가 점유 중인 수신인 {len(in_flight)}명 제외")
+                recipients = [r for r in recipients if r.email not in in_flight]
+        if not recipients:
+            return [], 0
+
+        # 1단계: 렌더링 (공유 구간은 배치당 1회, 수신자별 구간만 메시지 파일로)
+        batch_id = spool.new_batch(template, issue_key=issue_key)
+        for seq, recipient in enumerate(recipients):
+            msg = self._assemble_message(recipient.email, shared)
+            spool.enqueue(batch_id, seq, recipient.email, msg.head)
+        logger.info(f"[S10] 스풀 렌더링 완료: {len(recipients)}건 → {spool_dir}")
+
+        # 2단계: 전송 (이 배치만 — 다른 배치는 해당 실행 또는 별도 전송 워커가 처리)
+        transmitter = SpoolTransmitter(
+            self, spool,
+            workers=min(max(1, workers), len(recipients)),
+            max_attempts=getattr(self.config, "SPOOL_MAX_ATTEMPTS", 3),
+            shared=shared,
+            batch_id=batch_id,
+        )
+        delivered, fail_count = transmitter.run()
+
+        remaining = spool.pending(batch_id)
+        if remaining:
+            logger.warning(f"[S10] 스풀에 미전송 메시지 {remaining}건 보존 (재실행 또는 별도 전송 워커로 처리)")
+        spool.release_batch(batch_id)
+
+        sent = {e.email for e in delivered}
+        success_emails = [r.email for r in recipients if r.email in sent]
+        return success_emails, fail_count
+
+    def _create_rate_controller(self, max_concurrency: int) -> SMTPRateController:
+        """[S9] 전송 속도 제어기 생성 (SMTP_ADAPTIVE_RATE가 아니면 제어 없이 통과하는 제어기)"""
+        if getattr(self.config, "SMTP_ADAPTIVE_RATE", False) is not True:
+            return SMTPRateController(max_concurrency=max_concurrency, enabled=False)
+        return SMTPRateController(
+            max_concurrency=max_concurrency,
+            max_rate=self.config.SMTP_MAX_RATE,
+            rate_increase=self.config.SMTP_RATE_INCREASE,
+            latency_target=self.config.SMTP_LATENCY_TARGET,
+            pause_base=self.config.SMTP_THROTTLE_PAUSE,
+            pause_max=self.config.SMTP_THROTTLE_PAUSE_MAX,
+            pause_budget=self.config.SMTP_THROTTLE_PAUSE_BUDGET,
+        )
+
+    def _throttle_retry_limit(self) -> int:
+        """[S9] 스로틀링으로 인한 수신자별 재시도 한도"""
+        limit = getattr(self.config, "SMTP_THROTTLE_MAX_RETRIES", 3)
+        return limit if isinstance(limit, int) else 3
+
+    def _report_rate_metrics(self, controller: SMTPRateController) -> None:
+        """[S9] 전송 종료 시 속도 제어 상태를 구조화 로그로 남김 (CloudWatch 지표 필터용)"""
+        self.rate_metrics = controller.snapshot()
+        if controller.enabled:
+            structured_logger.info(
+                event="smtp_rate_metrics",
+                message="SMTP 전송 속도 제어 지표",
+                **self.rate_metrics,
+            )
+
+    def _send_serial(self, recipients: list, shared: dict) -> tuple[List[str], int]:
+        """[S2] 단일 SMTP 연결로 수신자를 순차 전송
+
+        [S9] 전송 간격·일시 정지는 SMTPRateController가 결정하며,
+        스로틀링 응답을 받은 수신자는 정지 후 재시도한다.
+
+        Returns:
+            (성공한 수신인 이메일 리스트, 실패 건수)
+        """
+        success_emails = []
+        fail_count = 0
+        consecutive_fail = 0  # [S2] 연속 실패 카운터 (회로 차단용)
+        fail_limit = getattr(self.config, "SMTP_CONSECUTIVE_FAIL_LIMIT", 5)
+        reconnect_every = getattr(self.config, "SMTP_RECONNECT_EVERY", 50)
+        throttle_retries = self._throttle_retry_limit()
+        controller = self._create_rate_controller(1)
+
+        pending = deque((recipient, 0) for recipient in recipients)
+
+        # [S2 최적화] SMTP 연결을 1회만 수립하고 루프 전체에서 재사용
+        server = self._acquire_smtp_connection()
+        sent_since_connect = 0
+        try:
+            while pending:
+                recipient, attempts = pending.popleft()
+
+                # Gmail 단일 연결 한도 대비: reconnect_every마다 재연결
+                if sent_since_connect >= reconnect_every:
+                    logger.info(f"SMTP 재연결 (연속 {sent_since_connect}통 발송 후)")
+                    try:
+                        server.quit()
+                    except Exception:
+                        pass
+                    server = self._open_smtp_connection()
+                    sent_since_connect = 0
+
+                # [S9] 전송 간격·일시 정지 대기
+                delay = controller.reserve()
+                if delay > 0:
+                    time.sleep(delay)
+
+                try:
+                    # 개인화된 메시지 조립 (공유 자산 재사용)
+                    msg = self._assemble_message(recipient.email, shared)
+
+                    # 기존 SMTP 연결로 전송 (끊어진 경우 1회 재연결)
+                    started = time.monotonic()
+                    server = self._send_on_server(server, msg, [recipient.email])
+                    controller.on_success(time.monotonic() - started)
+
+                    success_emails.append(recipient.email)
+                    self._record_delivery(shared, recipient.email)
+                    sent_since_connect += 1
+                    consecutive_fail = 0
+                    logger.info(
+                        f"이메일 전송 완료: {recipient.email} ({len(success_emails)}/{len(recipients)})"
+                    )
+
+                except Exception as e:
+                    verdict = controller.on_failure(e)
+                    if verdict == THROTTLED and attempts < throttle_retries:
+                        logger.warning(f"이메일 전송 보류 (스로틀링, 재시도 예정): {recipient.email} - {e}")
+                        pending.appendleft((recipient, attempts + 1))
+                        continue
+
+                    fail_count += 1
+                    consecutive_fail += 1
+                    logger.error(f"이메일 전송 실패: {recipient.email} - {e}")
+                    if verdict == HALTED:
+                        logger.error(f"🛑 벌크 전송 중단 (남은 수신자 {len(pending)}명)")
+                        break
+                    if consecutive_fail >= fail_limit:
+                        logger.error(
+                            f"🛑 연속 {consecutive_fail}회 실패 — 벌크 전송 조기 중단 "
+                            f"(남은 수신자 {len(pending)}명)"
+                        )
+                        break
+        finally:
+            try:
+                server.quit()
+            except Exception:
+                pass
+            self._report_rate_metrics(controller)
+
+        return success_emails, fail_count
+
+    def _send_parallel(
+        self, recipients: list, shared: dict, pool_size: int
+    ) -> tuple[List[str], int]:
+        """[S5] N개의 인증된 SMTP 세션을 스레드 풀로 구동해 병렬 전송
+
+        수신자는 공유 큐에서 꺼내 가며, 각 워커는 자신의 연결을 lazy하게 열고
+        SMTP_RECONNECT_EVERY마다 재연결한다. 연속 실패 회로 차단은 전체 워커 기준으로 판정한다.
+        [S9] SMTPRateController가 줄인 동시성을 넘는 워커는 연결을 닫고 대기한다.
+
+        Returns:
+            (성공한 수신인 이메일 리스트 — 원래 수신자 순서, 실패 건수)
+        """
+        fail_limit = getattr(self.config, "SMTP_CONSECUTIVE_FAIL_LIMIT", 5)
+        reconnect_every = getattr(self.config, "SMTP_RECONNECT_EVERY", 50)
+        throttle_retries = self._throttle_retry_limit()
+        worker_count = min(pool_size, len(recipients))
+        controller = self._create_rate_controller(worker_count)
+
+        work: "queue.Queue" = queue.Queue()
+        for recipient in recipients:
+            work.put((recipient, 0))
+
+        lock = threading.Lock()
+        stop = threading.Event()
+        succeeded: set = set()
+        state = {"fail_count": 0, "consecutive_fail": 0}
+
+        def close(server) -> None:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+        def worker(worker_id: int) -> None:
+            server = None
             sent_since_connect = 0
             try:
-                for recipient in recipients:
-                    # Gmail 단일 연결 한도 대비: reconnect_every마다 재연결
-                    if sent_since_connect >= reconnect_every:
-                        logger.info(f"SMTP 재연결 (연속 {sent_since_connect}통 발송 후)")
+                while not stop.is_set():
+                    # [S9] 허용 동시성 밖의 워커는 연결을 반납하고 대기
+                    if worker_id >= controller.concurrency:
+                        if server is not None:
+                            close(server)
+                            server = None
+                        if work.empty():
+                            return
+                        stop.wait(0.2)
+                        continue
+
+                    try:
+                        recipient, attempts = work.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    # 연결은 첫 수신자를 꺼낸 시점에 수립 (lazy), 이후 reconnect_every마다 재연결
+                    if server is None or sent_since_connect >= reconnect_every:
+                        if server is not None:
+                            logger.info(
+                                f"[pool-{worker_id}] SMTP 재연결 (연속 {sent_since_connect}통 발송 후)"
+                            )
+                            close(server)
+                            server = None
                         try:
-                            server.quit()
-                        except Exception:
-                            pass
-                        server = self._open_smtp_connection()
-                        sent_since_connect = 0
+                            server = self._acquire_smtp_connection()
+                            sent_since_connect = 0
+                        except Exception as e:
+                            # 연결 불가 워커는 종료 — 수신자는 큐에 되돌려 다른 워커가 처리
+                            logger.error(f"[pool-{worker_id}] SMTP 연결 실패, 워커 종료: {e}")
+                            work.put((recipient, attempts))
+                            return
+
+                    # [S9] 전송 간격·일시 정지 대기 (중단 시 즉시 해제)
+                    delay = controller.reserve()
+                    if delay > 0 and stop.wait(delay):
+                        work.put((recipient, attempts))
+                        return
 
                     try:
-                        # 개인화된 메시지 조립 (공유 자산 재사용)
                         msg = self._assemble_message(recipient.email, shared)
-
-                        # 기존 SMTP 연결로 전송 (끊어진 경우 1회 재연결)
+                        started = time.monotonic()
                         server = self._send_on_server(server, msg, [recipient.email])
-
-                        success_emails.append(recipient.email)
+                        controller.on_success(time.monotonic() - started)
                         sent_since_connect += 1
-                        consecutive_fail = 0
+                        self._record_delivery(shared, recipient.email)
+                        with lock:
+                            succeeded.add(recipient.email)
+                            state["consecutive_fail"] = 0
+                            done = len(succeeded)
                         logger.info(
-                            f"이메일 전송 완료: {recipient.email} ({len(success_emails)}/{len(recipients)})"
+                            f"[pool-{worker_id}] 이메일 전송 완료: {recipient.email} ({done}/{len(recipients)})"
                         )
-
                     except Exception as e:
-                        fail_count += 1
-                        consecutive_fail += 1
-                        logger.error(f"이메일 전송 실패: {recipient.email} - {e}")
-                        if consecutive_fail >= fail_limit:
-                            logger.error(
-                                f"🛑 연속 {consecutive_fail}회 실패 — 벌크 전송 조기 중단 "
-                                f"(남은 수신자 {len(recipients) - len(success_emails) - fail_count}명)"
+                        verdict = controller.on_failure(e)
+                        if verdict == THROTTLED and attempts < throttle_retries:
+                            logger.warning(
+                                f"[pool-{worker_id}] 이메일 전송 보류 (스로틀링, 재시도 예정): "
+                                f"{recipient.email} - {e}"
                             )
-                            break
+                            work.put((recipient, attempts + 1))
+                            continue
+
+                        logger.error(f"[pool-{worker_id}] 이메일 전송 실패: {recipient.email} - {e}")
+                        with lock:
+                            state["fail_count"] += 1
+                            state["consecutive_fail"] += 1
+                            if verdict == HALTED and not stop.is_set():
+                                logger.error(f"🛑 병렬 벌크 전송 중단 (남은 수신자 약 {work.qsize()}명)")
+                                stop.set()
+                            elif state["consecutive_fail"] >= fail_limit and not stop.is_set():
+                                logger.error(
+                                    f"🛑 연속 {state['consecutive_fail']}회 실패 — 병렬 벌크 전송 조기 중단 "
+                                    f"(남은 수신자 약 {work.qsize()}명)"
+                                )
+                                stop.set()
             finally:
-                try:
-                    server.quit()
-                except Exception:
-                    pass
+                if server is not None:
+                    close(server)
 
-            logger.info(f"이메일 전송 완료: 성공 {len(success_emails)}명, 실패 {fail_count}명")
-            return len(success_emails) > 0, success_emails
+        logger.info(f"[S5] SMTP 병렬 전송: 세션 {worker_count}개, 수신자 {len(recipients)}명")
+        try:
+            with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="smtp-pool") as executor:
+                futures = [executor.submit(worker, i) for i in range(worker_count)]
+                for future in futures:
+                    future.result()
+        finally:
+            self._report_rate_metrics(controller)
+
+        # 큐에 남은 수신자: 연결 실패 워커가 되돌려 놓은 뒤 나머지 워커가 이미 종료한 경우
+        leftover = []
+        while True:
+            try:
+                leftover.append(work.get_nowait()[0])
+            except queue.Empty:
+                break
+        if leftover and stop.is_set():
+            logger.warning(f"[S5] 미전송 수신자 {len(leftover)}명 (조기 중단)")
+        elif leftover:
+            logger.warning(f"[S5] 처리 워커 없이 남은 수신자 {len(leftover)}명 — 단일 연결로 재시도")
+            try:
+                retry_sent, retry_failed = self._send_serial(leftover, shared)
+            except Exception as e:
+                logger.error(f"[S5] 남은 수신자 재시도 실패 (SMTP 연결 불가): {e}")
+                retry_sent, retry_failed = [], len(leftover)
+            succeeded.update(retry_sent)
+            state["fail_count"] += retry_failed
 
-        except Exception as e:
-            logger.error(f"이메일 전송 실패: {e}")
-            return False, []
+        success_emails = [r.email for r in recipients if r.email in succeeded]
+        return success_emails, state["fail_count"]
 
     def _create_message(
         self,
@@ -360,19 +716,46 @@ class EmailSender:
 
         return msg
 
+    def _prepare_unsubscribe_tokens(self, emails: List[str]) -> dict:
+        """[S11] 벌크 전송 대상의 수신거부 토큰 일괄 준비
+
+        UNSUBSCRIBE_TOKEN_CACHE가 켜져 있으면 스토리지 캐시를 사용한다.
+        실패하면 빈 dict를 반환하고 수신자별 생성(_generate_unsubscribe_token)으로 대체된다.
+        """
+        backend = None
+        ttl_days = 62
+        if getattr(self.config, "UNSUBSCRIBE_TOKEN_CACHE", False) is True:
+            from .storage import get_storage_backend
+
+            ttl_days = self.config.UNSUBSCRIBE_TOKEN_CACHE_TTL_DAYS
+            try:
+                backend = get_storage_backend()
+            except Exception as e:
+                logger.warning(f"토큰 캐시 백엔드 초기화 실패 (캐시 없이 생성): {e}")
+        try:
+            return get_monthly_tokens(emails, self.unsubscribe_secret, backend=backend, ttl_days=ttl_days)
+        except Exception as e:
+            logger.warning(f"수신거부 토큰 일괄 준비 실패 (수신자별 생성으로 대체): {e}")
+            return {}
+
     def _generate_unsubscribe_token(self, email: str) -> str:
         """
         수신거부 토큰 생성 (HMAC 기반)
 
+        [S11] 벌크 전송 중이면 미리 준비한 토큰을 사용한다.
+
         Args:
             email: 이메일 주소
 
         Returns:
             Base64 인코딩된 토큰
         """
+        token = self._unsubscribe_tokens.get(email)
+        if token is not None:
+            return token
         return generate_token(email, self.unsubscribe_secret)
 
-    def _create_email_body(self, recipient_email: Optional[str] = None, itfind_info: Optional["WeeklyTrend"] = None, has_toc_image: bool = False, has_etnews_image: bool = False) -> str:
+    def _create_email_body(self, recipient_email: Optional[str] = None, itfind_info: Optional["WeeklyTrend"] = None, has_toc_image: bool = False, has_etnews_image: bool = False, unsubscribe_url: Optional[str] = None) -> str:
         """이메일 본문 HTML 생성
 
         Args:
@@ -380,14 +763,18 @@ class EmailSender:
             itfind_info: ITFIND 정보 (dict 또는 WeeklyTrend 객체)
             has_toc_image: 목차 이미지 포함 여부
             has_etnews_image: 전자신문 1페이지 이미지 포함 여부
+            unsubscribe_url: 수신거부 URL 직접 지정 ([S12] 본문 템플릿 자리표시자용, 지정 시 recipient_email 무시)
+
+        수신거부 링크의 href는 한 줄에 단독으로 둔다 ([S12] BodyTemplate은 이 줄만 수신자별로 인코딩).
         """
         today = datetime.now().strftime("%Y년 %m월 %d일")
 
         # 수신거부 URL 생성
-        unsubscribe_url = "#"
-        if recipient_email:
-            token = self._generate_unsubscribe_token(recipient_email)
-            unsubscribe_url = f"{self.unsubscribe_url_base}/?token={token}"
+        if unsubscribe_url is None:
+            unsubscribe_url = "#"
+            if recipient_email:
+                token = self._generate_unsubscribe_token(recipient_email)
+                unsubscribe_url = f"{self.unsubscribe_url_base}/?token={token}"
 
         # ITFIND 단독 발송인 경우
         if itfind_info:
@@ -469,7 +856,9 @@ class EmailSender:
                     <hr>
                     <small>
                         문의사항이 있으시면 {self.config.ADMIN_EMAIL}으로 연락주세요.<br>
-                        이 뉴스레터를 더 이상 받고 싶지 않으시면 <a href="{unsubscribe_url}" style="color: #666;">여기</a>를 클릭하세요.
+                        이 뉴스레터를 더 이상 받고 싶지 않으시면 <a
+                            href="{unsubscribe_url}"
+                            style="color: #666;">여기</a>를 클릭하세요.
                     </small>
                 </body>
             </html>
@@ -504,7 +893,9 @@ class EmailSender:
                     <hr>
                     <small>
                         문의사항이 있으시면 {self.config.ADMIN_EMAIL}으로 연락주세요.<br>
-                        이 뉴스레터를 더 이상 받고 싶지 않으시면 <a href="{unsubscribe_url}" style="color: #666;">여기</a>를 클릭하세요.
+                        이 뉴스레터를 더 이상 받고 싶지 않으시면 <a
+                            href="{unsubscribe_url}"
+                            style="color: #666;">여기</a>를 클릭하세요.
                     </small>
                 </body>
             </html>
@@ -521,8 +912,7 @@ class EmailSender:
             itfind_info: ITFIND 정보 (한국어 파일명 생성용)
         """
         try:
-            with open(pdf_path, "rb") as pdf_file:
-                pdf_data = pdf_file.read()
+            pdf_data = read_pdf_bytes(pdf_path)
             etnews_filename = os.path.basename(pdf_path) if pdf_type == "etnews" else None
             self._attach_pdf_from_bytes(
                 msg, pdf_data, pdf_type=pdf_type,
@@ -550,34 +940,10 @@ class EmailSender:
             etnews_filename: 전자신문 PDF 파일명 (pdf_type="etnews"일 때 필수)
         """
         try:
-            # PDF 첨부 파일 생성
-            pdf_attachment = MIMEApplication(pdf_data, _subtype="pdf")
-
-            # 파일명 결정
-            if pdf_type == "itfind":
-                # 한국어 파일명 생성 (RFC 2231 인코딩)
-                korean_filename, ascii_filename = generate_korean_filename(itfind_info)
-
-                # RFC 2231 인코딩: email.utils.encode_rfc2231 사용
-                # 반환값 형식: "utf-8''%EC%A3%BC%EA%B8%B0%EB%8F%99..."
-                params_string = email.utils.encode_rfc2231(korean_filename, charset='utf-8')
-
-                # Content-Disposition 헤더 생성
-                # format: attachment; filename*=utf-8''%EC%A3%BC...
-                disposition = f"attachment; filename*={params_string}"
-                pdf_attachment.add_header('Content-Disposition', disposition)
-
-                filename_display = f"{korean_filename} ({ascii_filename})"
-            else:
-                # 전자신문: 기존 방식 사용
-                filename = etnews_filename or "etnews.pdf"
-                pdf_attachment.add_header('Content-Transfer-Encoding', 'base64')
-                pdf_attachment.add_header(
-                    "Content-Disposition",
-                    f"attachment; filename=\"{filename}\""
-                )
-                filename_display = filename
-
+            pdf_attachment, filename_display = self._build_pdf_part(
+                pdf_data, pdf_type=pdf_type,
+                itfind_info=itfind_info, etnews_filename=etnews_filename,
+            )
             msg.attach(pdf_attachment)
             logger.info(f"PDF 파일 첨부 완료: {filename_display} ({len(pdf_data):,} bytes)")
 
@@ -585,6 +951,60 @@ class EmailSender:
             logger.error(f"PDF 파일 첨부 실패: {e}")
             raise
 
+    def _build_pdf_part(
+        self,
+        pdf_data: bytes,
+        pdf_type: str = "etnews",
+        itfind_info: Optional["WeeklyTrend"] = None,
+        etnews_filename: Optional[str] = None,
+    ) -> tuple[MIMEApplication, str]:
+        """PDF 첨부 MIME 파트 생성 (base64 인코딩은 이 시점에 수행됨)
+
+        Returns:
+            (PDF 첨부 파트, 로그용 파일명) 튜플
+        """
+        # PDF 첨부 파일 생성
+        pdf_attachment = MIMEApplication(pdf_data, _subtype="pdf")
+
+        # 파일명 결정
+        if pdf_type == "itfind":
+            # 한국어 파일명 생성 (RFC 2231 인코딩)
+            korean_filename, ascii_filename = generate_korean_filename(itfind_info)
+
+            # RFC 2231 인코딩: email.utils.encode_rfc2231 사용
+            # 반환값 형식: "utf-8''%EC%A3%BC%EA%B8%B0%EB%8F%99..."
+            params_string = email.utils.encode_rfc2231(korean_filename, charset='utf-8')
+
+            # Content-Disposition 헤더 생성
+            # format: attachment; filename*=utf-8''%EC%A3%BC...
+            disposition = f"attachment; filename*={params_string}"
+            pdf_attachment.add_header('Content-Disposition', disposition)
+
+            filename_display = f"{korean_filename} ({ascii_filename})"
+        else:
+            # 전자신문: 기존 방식 사용
+            filename = etnews_filename or "etnews.pdf"
+            pdf_attachment.add_header('Content-Transfer-Encoding', 'base64')
+            pdf_attachment.add_header(
+                "Content-Disposition",
+                f"attachment; filename=\"{filename}\""
+            )
+            filename_display = filename
+
+        return pdf_attachment, filename_display
+
+    def _build_inline_image_part(
+        self, image_bytes: bytes, content_id: str, filename_stem: str
+    ) -> MIMEImage:
+        """inline 이미지 MIME 파트 생성 (CID 참조) — [S3] 포맷 자동 감지 (JPEG 또는 PNG)"""
+        subtype, ext = _detect_image_subtype(image_bytes)
+        image_part = MIMEImage(image_bytes, _subtype=subtype)
+        image_part.add_header('Content-ID', f'<{content_id}>')
+        image_part.add_header(
+            'Content-Disposition', 'inline', filename=f'{filename_stem}.{ext}'
+        )
+        return image_part
+
     def _prepare_shared_assets(
         self,
         pdf_path: str,
@@ -596,12 +1016,15 @@ class EmailSender:
 
         수신자가 N명이어도 이미지 추출·PDF 디스크 I/O는 각 1회만 수행됩니다.
 
+        [S4] 이미지·PDF 파트는 여기서 MessageTemplate으로 1회만 직렬화(base64)되며,
+        수신자별 조립 시에는 To 헤더와 본문만 새로 만든다.
+
         Returns:
             dict — 아래 키 포함:
                 subject, itfind_info, is_itfind_only,
                 toc_image_bytes, etnews_image_bytes,
                 etnews_pdf_data, itfind_pdf_data,
-                etnews_filename
+                etnews_filename, template
         """
         # ITFIND 단독 이메일 판정 (email_workflow.py에서 pdf_path == itfind_pdf_path로 호출)
         is_itfind_only = (
@@ -610,31 +1033,15 @@ class EmailSender:
             and os.path.exists(itfind_pdf_path)
         )
 
+        # [S21] 미리보기 렌더링은 워커 스레드에서 시작하고, 그동안 아래에서 PDF 바이트 로딩
+        renders = {}
         # ITFIND 목차 이미지 (수요일/단독 모두 해당)
-        toc_image_bytes: Optional[bytes] = None
         if itfind_pdf_path and os.path.exists(itfind_pdf_path):
-            try:
-                from .pdf_image_extractor import extract_toc_page_for_email
-                toc_image_bytes = extract_toc_page_for_email(itfind_pdf_path)
-                if toc_image_bytes:
-                    logger.info("✅ ITFIND 목차 이미지 추출 성공 (1회, 공유)")
-                else:
-                    logger.info("ITFIND 목차 이미지 추출 실패 (텍스트만 발송)")
-            except Exception as e:
-                logger.warning(f"목차 이미지 추출 중 오류: {e} (텍스트만 발송)")
-
+            renders["toc"] = (pdf_image_extractor.extract_toc_page_for_email, itfind_pdf_path)
         # 전자신문 1페이지 이미지 (전자신문 이메일만)
-        etnews_image_bytes: Optional[bytes] = None
         if not is_itfind_only and os.path.exists(pdf_path):
-            try:
-                from .pdf_image_extractor import extract_first_page_for_email
-                etnews_image_bytes = extract_first_page_for_email(pdf_path)
-                if etnews_image_bytes:
-                    logger.info("✅ 전자신문 1페이지 이미지 추출 성공 (1회, 공유)")
-                else:
-                    logger.info("전자신문 1페이지 이미지 추출 실패 (텍스트만 발송)")
-            except Exception as e:
-                logger.warning(f"전자신문 이미지 추출 중 오류: {e} (텍스트만 발송)")
+            renders["etnews"] = (pdf_image_extractor.extract_first_page_for_email, pdf_path)
+        previews = self._start_preview_renders(renders)
 
         # PDF 바이트 로딩
         etnews_pdf_data: Optional[bytes] = None
@@ -643,22 +1050,32 @@ class EmailSender:
 
         if is_itfind_only:
             # 단독 모드: pdf_path와 itfind_pdf_path가 동일 경로이므로 1회만 읽음
-            with open(itfind_pdf_path, "rb") as f:
-                itfind_pdf_data = f.read()
+            itfind_pdf_data = read_pdf_bytes(itfind_pdf_path)
             logger.info(f"ITFIND PDF 로드(단독): {len(itfind_pdf_data):,} bytes")
         else:
             # 전자신문 모드: 전자신문 PDF는 반드시, ITFIND PDF는 수요일만
             if os.path.exists(pdf_path):
-                with open(pdf_path, "rb") as f:
-                    etnews_pdf_data = f.read()
+                etnews_pdf_data = read_pdf_bytes(pdf_path)
                 etnews_filename = os.path.basename(pdf_path)
                 logger.info(f"전자신문 PDF 로드: {len(etnews_pdf_data):,} bytes")
             if itfind_pdf_path and os.path.exists(itfind_pdf_path):
-                with open(itfind_pdf_path, "rb") as f:
-                    itfind_pdf_data = f.read()
+                itfind_pdf_data = read_pdf_bytes(itfind_pdf_path)
                 logger.info(f"ITFIND PDF 로드: {len(itfind_pdf_data):,} bytes")
 
-        return {
+        toc_image_bytes = self._collect_preview(
+            previews.get("toc"),
+            "✅ ITFIND 목차 이미지 추출 성공 (1회, 공유)",
+            "ITFIND 목차 이미지 추출 실패 (텍스트만 발송)",
+            "목차 이미지 추출 중 오류",
+        )
+        etnews_image_bytes = self._collect_preview(
+            previews.get("etnews"),
+            "✅ 전자신문 1페이지 이미지 추출 성공 (1회, 공유)",
+            "전자신문 1페이지 이미지 추출 실패 (텍스트만 발송)",
+            "전자신문 이미지 추출 중 오류",
+        )
+
+        shared = {
             "subject": subject,
             "itfind_info": itfind_info,
             "is_itfind_only": is_itfind_only,
@@ -668,77 +1085,157 @@ class EmailSender:
             "itfind_pdf_data": itfind_pdf_data,
             "etnews_filename": etnews_filename,
         }
+        shared["template"] = self._build_message_template(shared)
+        shared["body_template"] = self._build_body_template(shared)
+        return shared
 
-    def _assemble_message(self, recipient_email: str, shared: dict) -> MIMEMultipart:
-        """[S1] 공유 자산을 이용해 수신자별 메시지를 조립.
+    def _start_preview_renders(self, renders: dict) -> dict:
+        """[S21] 미리보기 이미지 렌더링 시작
 
-        수신자별로 달라지는 부분: To 헤더, 본문 내 수신거부 URL.
-        나머지는 shared에서 재사용.
-        """
-        msg = MIMEMultipart('related')
-        msg["From"] = self.config.GMAIL_USER
-        msg["Subject"] = shared["subject"]
-        msg["To"] = recipient_email
+        EMAIL_PREVIEW_RENDER_WORKERS > 1이면 스레드 풀에서 동시에 렌더링하고 바로 반환해
+        호출자가 그동안 PDF 로딩 등을 진행할 수 있게 한다. 1 이하면 여기서 순차 렌더링한다.
 
-        itfind_info = shared["itfind_info"]
-        toc_image_bytes = shared["toc_image_bytes"]
-        etnews_image_bytes = shared["etnews_image_bytes"]
+        Args:
+            renders: {이름: (렌더링 함수, PDF 경로)}
 
-        # 본문 HTML (수신자별 — 수신거부 토큰 포함)
-        body = self._create_email_body(
-            recipient_email,
-            itfind_info,
-            has_toc_image=(toc_image_bytes is not None),
-            has_etnews_image=(etnews_image_bytes is not None),
+        Returns:
+            {이름: Future} — 결과 또는 렌더링 중 발생한 예외를 담음
+        """
+        workers = getattr(self.config, "EMAIL_PREVIEW_RENDER_WORKERS", 1)
+        if not isinstance(workers, int) or workers <= 1 or len(renders) == 0:
+            futures = {}
+            for name, (render, path) in renders.items():
+                future: Future = Future()
+                try:
+                    future.set_result(render(path))
+                except Exception as e:
+                    future.set_exception(e)
+                futures[name] = future
+            return futures
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(workers, len(renders)), thread_name_prefix="preview-render"
         )
-        msg.attach(MIMEText(body, "html", "utf-8"))
+        try:
+            return {name: executor.submit(render, path) for name, (render, path) in renders.items()}
+        finally:
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _collect_preview(
+        future: Optional[Future], success_log: str, empty_log: str, error_log: str
+    ) -> Optional[bytes]:
+        """[S21] 미리보기 렌더링 결과 수거 (실패하면 None — 이미지 없이 텍스트만 발송)"""
+        if future is None:
+            return None
+        try:
+            image_bytes = future.result()
+        except Exception as e:
+            logger.warning(f"{error_log}: {e} (텍스트만 발송)")
+            return None
+        logger.info(success_log if image_bytes else empty_log)
+        return image_bytes
 
-        # 전자신문 1페이지 이미지 (inline, CID 참조) — [S3] 포맷 자동 감지 (JPEG 또는 PNG)
-        if etnews_image_bytes:
+    def _build_body_template(self, shared: dict) -> Optional[BodyTemplate]:
+        """[S12] 수신자 공통 HTML 본문을 1회 생성·인코딩 (EMAIL_BODY_PRECOMPILE이 꺼져 있으면 None)
+
+        수신자별로 다른 값은 수신거부 URL뿐이므로 자리표시자로 본문을 만들어 두고,
+        _assemble_message에서는 URL이 들어가는 한 줄만 인코딩해 이어 붙인다.
+        """
+        if getattr(self.config, "EMAIL_BODY_PRECOMPILE", False) is not True:
+            return None
+        slot = f"__unsubscribe_url_{secrets.token_hex(8)}__"
+        try:
+            html = self._create_email_body(
+                itfind_info=shared["itfind_info"],
+                has_toc_image=(shared["toc_image_bytes"] is not None),
+                has_etnews_image=(shared["etnews_image_bytes"] is not None),
+                unsubscribe_url=slot,
+            )
+            return BodyTemplate(html, slot)
+        except Exception as e:
+            logger.warning(f"본문 템플릿 생성 실패 (수신자별 본문 생성으로 대체): {e}")
+            return None
+
+    def _build_message_template(self, shared: dict) -> MessageTemplate:
+        """[S4] 공유 파트(inline 이미지, PDF 첨부)를 전송용 바이트로 1회 직렬화
+
+        파트 순서는 기존 조립 순서와 동일: (본문) → 전자신문 1p 이미지 → 목차 이미지 → PDF
+        """
+        itfind_info = shared["itfind_info"]
+        parts = []
+
+        # 전자신문 1페이지 이미지 (inline, CID 참조)
+        if shared["etnews_image_bytes"]:
             try:
-                subtype, ext = _detect_image_subtype(etnews_image_bytes)
-                etnews_image = MIMEImage(etnews_image_bytes, _subtype=subtype)
-                etnews_image.add_header('Content-ID', '<etnews_first_page>')
-                etnews_image.add_header(
-                    'Content-Disposition', 'inline', filename=f'etnews_p1.{ext}'
-                )
-                msg.attach(etnews_image)
+                parts.append(self._build_inline_image_part(
+                    shared["etnews_image_bytes"], "etnews_first_page", "etnews_p1"
+                ))
             except Exception as e:
                 logger.warning(f"전자신문 이미지 첨부 실패: {e}")
+                shared["etnews_image_bytes"] = None
 
         # ITFIND 목차 이미지 (inline, CID 참조)
-        if toc_image_bytes:
+        if shared["toc_image_bytes"]:
             try:
-                subtype, ext = _detect_image_subtype(toc_image_bytes)
-                toc_image = MIMEImage(toc_image_bytes, _subtype=subtype)
-                toc_image.add_header('Content-ID', '<toc_image>')
-                toc_image.add_header(
-                    'Content-Disposition', 'inline', filename=f'toc.{ext}'
-                )
-                msg.attach(toc_image)
+                parts.append(self._build_inline_image_part(
+                    shared["toc_image_bytes"], "toc_image", "toc"
+                ))
             except Exception as e:
                 logger.warning(f"목차 이미지 첨부 실패: {e}")
+                shared["toc_image_bytes"] = None
 
         # PDF 첨부 (공유 bytes 재사용)
+        pdf_specs = []
         if shared["is_itfind_only"]:
-            self._attach_pdf_from_bytes(
-                msg, shared["itfind_pdf_data"],
-                pdf_type="itfind", itfind_info=itfind_info,
-            )
+            pdf_specs.append((shared["itfind_pdf_data"], "itfind", None))
         else:
             if shared["etnews_pdf_data"] is not None:
-                self._attach_pdf_from_bytes(
-                    msg, shared["etnews_pdf_data"],
-                    pdf_type="etnews",
-                    etnews_filename=shared["etnews_filename"],
-                )
+                pdf_specs.append((shared["etnews_pdf_data"], "etnews", shared["etnews_filename"]))
             if shared["itfind_pdf_data"] is not None:
-                self._attach_pdf_from_bytes(
-                    msg, shared["itfind_pdf_data"],
-                    pdf_type="itfind", itfind_info=itfind_info,
-                )
+                pdf_specs.append((shared["itfind_pdf_data"], "itfind", None))
 
-        return msg
+        for pdf_data, pdf_type, etnews_filename in pdf_specs:
+            pdf_part, filename_display = self._build_pdf_part(
+                pdf_data, pdf_type=pdf_type,
+                itfind_info=itfind_info, etnews_filename=etnews_filename,
+            )
+            parts.append(pdf_part)
+            logger.info(f"PDF 파일 첨부 준비: {filename_display} ({len(pdf_data):,} bytes, 1회 인코딩)")
+
+        # [S7] 대용량 첨부는 임시 파일에 직렬화 (Mock config 등 정수가 아니면 메모리 보관)
+        spool_threshold = getattr(self.config, "MIME_SPOOL_THRESHOLD", None)
+        if not isinstance(spool_threshold, int):
+            spool_threshold = None
+        return MessageTemplate(
+            self.config.GMAIL_USER, shared["subject"], parts,
+            spool_threshold=spool_threshold, spool_dir=Config.TEMP_DIR,
+        )
+
+    def _assemble_message(self, recipient_email: str, shared: dict) -> RenderedMessage:
+        """[S1] 공유 자산을 이용해 수신자별 메시지를 조립.
+
+        수신자별로 달라지는 부분: To 헤더, 본문 내 수신거부 URL.
+        [S4] 나머지 파트는 shared["template"]에 직렬화된 바이트를 그대로 이어 붙인다.
+
+        Returns:
+            SMTP 전송용 메시지 (RenderedMessage — bytes(msg) 또는 iter_chunks()로 사용)
+        """
+        # [S12] 사전 인코딩된 본문 템플릿이 있으면 수신거부 URL 줄만 채워 이어 붙임
+        body_template = shared.get("body_template")
+        if body_template is not None:
+            token = self._generate_unsubscribe_token(recipient_email)
+            unsubscribe_url = f"{self.unsubscribe_url_base}/?token={token}"
+            return shared["template"].render_compiled(recipient_email, body_template, unsubscribe_url)
+
+        # 본문 HTML (수신자별 — 수신거부 토큰 포함)
+        body = self._create_email_body(
+            recipient_email,
+            shared["itfind_info"],
+            has_toc_image=(shared["toc_image_bytes"] is not None),
+            has_etnews_image=(shared["etnews_image_bytes"] is not None),
+        )
+        return shared["template"].render(recipient_email, body)
 
     def _open_smtp_connection(self) -> smtplib.SMTP:
         """[S2] SMTP 연결 수립 (TLS + LOGIN). 초기 실패 시 SMTP_MAX_RETRIES만큼 재시도.
@@ -767,21 +1264,59 @@ class EmailSender:
                     _time.sleep(self.config.SMTP_RETRY_DELAY)
         raise Exception(f"SMTP 연결 최대 재시도 초과: {last_err}")
 
+    def _start_smtp_prewarm(self) -> Optional[Future]:
+        """[S21] 첫 SMTP 연결(TLS + LOGIN)을 백그라운드 스레드에서 수립 시작
+
+        미리보기 렌더링·PDF 로딩과 네트워크 왕복이 겹치도록 공통 자산 준비 전에 호출한다.
+        EMAIL_SMTP_PREWARM이 꺼져 있으면 None (연결은 전송 엔진이 처음 필요할 때 수립).
+        """
+        if getattr(self.config, "EMAIL_SMTP_PREWARM", False) is not True:
+            return None
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp-prewarm")
+        try:
+            return executor.submit(self._open_smtp_connection)
+        finally:
+            executor.shutdown(wait=False)
+
+    def _acquire_smtp_connection(self) -> smtplib.SMTP:
+        """[S21] 미리 수립 중인 연결이 있으면 가져가고, 없으면 새로 연결
+
+        Raises:
+            Exception — 연결 실패 시 (_open_smtp_connection과 동일)
+        """
+        future, self._smtp_prewarm = self._smtp_prewarm, None
+        if future is not None:
+            return future.result()
+        return self._open_smtp_connection()
+
+    def _discard_smtp_prewarm(self) -> None:
+        """[S21] 전송 엔진이 가져가지 않은 선행 연결 정리 (전송 생략·자산 준비 실패 시)"""
+        future, self._smtp_prewarm = self._smtp_prewarm, None
+        if future is None:
+            return
+        try:
+            future.result().quit()
+        except Exception:
+            pass
+
     def _send_on_server(
         self,
         server: smtplib.SMTP,
-        msg: MIMEMultipart,
+        msg: Union[bytes, RenderedMessage, MIMEMultipart],
         to_emails: List[str],
     ) -> smtplib.SMTP:
         """[S2] 기존 SMTP 연결로 전송. 연결이 끊어졌으면 1회 재연결 후 재전송.
 
+        msg가 [S4] 템플릿 렌더링 결과면 재직렬화 없이 그대로 전송한다
+        ([S7] SMTP_STREAMING이면 청크 단위 스트리밍).
+
         Returns:
             사용(또는 교체)된 SMTP 객체 — 호출자가 이후 재사용
         Raises:
             Exception — 재연결·재전송 모두 실패 시
         """
         try:
-            server.send_message(msg, to_addrs=to_emails)
+            self._transmit(server, msg, to_emails)
             return server
         except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionResetError) as e:
             logger.warning(f"SMTP 연결 끊김 감지 ({e.__class__.__name__}), 재연결 후 재시도")
@@ -790,9 +1325,87 @@ class EmailSender:
             except Exception:
                 pass
             server = self._open_smtp_connection()
-            server.send_message(msg, to_addrs=to_emails)
+            self._transmit(server, msg, to_emails)
             return server
 
+    def _transmit(
+        self,
+        server: smtplib.SMTP,
+        msg: Union[bytes, RenderedMessage, MIMEMultipart],
+        to_emails: List[str],
+    ) -> None:
+        """메시지 1통 전송 (RenderedMessage는 스트리밍, bytes는 sendmail, MIME 객체는 send_message)"""
+        if isinstance(msg, RenderedMessage):
+            if getattr(self.config, "SMTP_STREAMING", False) is True:
+                self._send_streaming(server, msg, to_emails)
+            else:
+                server.sendmail(self.config.GMAIL_USER, to_emails, bytes(msg))
+        elif isinstance(msg, bytes):
+            server.sendmail(self.config.GMAIL_USER, to_emails, msg)
+        else:
+            server.send_message(msg, to_addrs=to_emails)
+
+    def _send_streaming(
+        self,
+        server: smtplib.SMTP,
+        msg: RenderedMessage,
+        to_emails: List[str],
+    ) -> None:
+        """[S7] SMTP 트랜잭션을 직접 수행하며 DATA 본문을 청크 단위로 소켓에 기록
+
+        smtplib.sendmail은 메시지 전체를 bytes로 받아 dot-stuffing 사본까지 만들기 때문에
+        40MB PDF 기준 수신자(세션)마다 100MB 이상이 상주한다. 여기서는 MAIL/RCPT/DATA를
+        sendmail과 같은 규칙으로 보내되, 본문은 SMTP_STREAM_CHUNK_SIZE 단위로만 메모리에 올린다.
+
+        Raises:
+            smtplib.SMTPSenderRefused / SMTPRecipientsRefused / SMTPDataError — sendmail과 동일
+        """
+        chunk_size = getattr(self.config, "SMTP_STREAM_CHUNK_SIZE", 64 * 1024)
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            chunk_size = 64 * 1024
+        from_addr = self.config.GMAIL_USER
+
+        server.ehlo_or_helo_if_needed()
+        code, resp = server.mail(from_addr)
+        if code != 250:
+            self._abort_transaction(server, code)
+            raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+
+        refused = {}
+        for to_email in to_emails:
+            code, resp = server.rcpt(to_email)
+            if code not in (250, 251):
+                refused[to_email] = (code, resp)
+        if len(refused) == len(to_emails):
+            self._abort_transaction(server, next(iter(refused.values()))[0])
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        code, resp = server.docmd("data")
+        if code != 354:
+            self._abort_transaction(server, code)
+            raise smtplib.SMTPDataError(code, resp)
+
+        stuffer = DotStuffer()
+        for chunk in msg.iter_chunks(chunk_size):
+            server.send(stuffer.feed(chunk))
+        server.send(stuffer.finish())
+
+        code, resp = server.getreply()
+        if code != 250:
+            self._abort_transaction(server, code)
+            raise smtplib.SMTPDataError(code, resp)
+
+    @staticmethod
+    def _abort_transaction(server: smtplib.SMTP, code: int) -> None:
+        """트랜잭션 실패 후 정리 — 421이면 연결 종료, 아니면 RSET (sendmail과 동일)"""
+        if code == 421:
+            server.close()
+            return
+        try:
+            server.rset()
+        except smtplib.SMTPServerDisconnected:
+            pass
+
     def _send_via_smtp(self, msg: MIMEMultipart, to_emails: List[str]):
         """SMTP 서버를 통해 이메일 전송 (단일 수신자 경로 호환용)"""
         max_retries = self.config.SMTP_MAX_RETRIES
@@ -863,7 +1476,8 @@ def send_pdf_bulk_email(
     subject: Optional[str] = None,
     test_mode: bool = False,
     itfind_pdf_path: Optional[str] = None,
-    itfind_info: Optional["WeeklyTrend"] = None
+    itfind_info: Optional["WeeklyTrend"] = None,
+    engine: Optional[str] = None,
 ) -> tuple[bool, List[str]]:
     """
     PDF 이메일 전송 메인 함수 (다중 수신자 개별 전송)
@@ -874,14 +1488,33 @@ def send_pdf_bulk_email(
         test_mode: True면 테스트 모드 (admin@example.com에게만 발송)
         itfind_pdf_path: ITFIND 주간기술동향 PDF 경로 (수요일만, Optional)
         itfind_info: ITFIND 주간기술동향 정보 (Optional)
+        engine: 전송 엔진 "sync" 또는 "async" (None이면 Config.EMAIL_DELIVERY_ENGINE)
 
     Returns:
         (전송 성공 여부, 성공한 수신인 이메일 리스트)
     """
-    sender = EmailSender()
+    sender = create_email_sender(engine)
     return sender.send_bulk_email(pdf_path, subject, test_mode, itfind_pdf_path, itfind_info)
 
 
+def create_email_sender(engine: Optional[str] = None) -> EmailSender:
+    """전송 엔진 이름에 맞는 EmailSender 생성
+
+    [S6] "async"는 aiosmtplib 기반 AsyncEmailSender. 라이브러리가 없으면 sync 엔진으로 대체.
+    """
+    engine = (engine or getattr(Config, "EMAIL_DELIVERY_ENGINE", "sync") or "sync").lower()
+
+    if engine == "async":
+        from .async_email_sender import AsyncEmailSender, AIOSMTPLIB_AVAILABLE
+        if AIOSMTPLIB_AVAILABLE:
+            return AsyncEmailSender()
+        logger.warning("aiosmtplib 미설치 — async 엔진 대신 sync 엔진으로 전송")
+    elif engine != "sync":
+        logger.warning(f"알 수 없는 전송 엔진: {engine} — sync 엔진으로 전송")
+
+    return EmailSender()
+
+
 if __name__ == "__main__":
     # 테스트
     import sys
@@ -8,7 +8,7 @@ https://www.itfind.or.kr/trend/weekly/weekly.do
 import asyncio
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Optional, List, Dict
 from playwright.async_api import async_playwright, Page, Browser
 import requests
@@ -16,6 +16,8 @@ import xml.etree.ElementTree as ET
 from datetime import datetime
 from io import BytesIO
 
+from .rss_feed_cache import fetch_feed
+
 logger = logging.getLogger(__name__)
 
 
@@ -79,127 +81,148 @@ class ItfindScraper:
             except Exception as e:
                 logger.warning(f"Playwright 정리 실패: {e}")
 
-    def get_latest_weekly_trend_from_rss(self) -> Optional[WeeklyTrend]:
+    def get_latest_weekly_trend_from_rss(self, backend=None) -> Optional[WeeklyTrend]:
         """
         RSS 피드에서 최신 주간기술동향 정보 조회 (빠르고 안정적)
 
+        [S26] 조건부 GET 캐시(rss_feed_cache) 사용 — 피드가 바뀌지 않았으면 파싱 없이 이전 결과 반환
+
+        Args:
+            backend: 피드 캐시 StorageBackend (None이면 프로세스 메모리만)
+
         Returns:
             WeeklyTrend: (제목, PDF URL, 토픽 리스트) 또는 None
         """
         try:
             logger.info(f"ITFIND RSS 피드 조회: {self.RSS_URL}")
 
-            # RSS 피드 가져오기
-            response = requests.get(self.RSS_URL, timeout=30)
-            response.raise_for_status()
+            # 캐시에는 JSON으로 저장되므로 dict로 주고받음
+            cached = fetch_feed(
+                "itfind_scraper_weekly_trend", self.RSS_URL, self._parse_rss_as_dict, backend=backend
+            )
+            return WeeklyTrend(**cached) if cached else None
 
-            # XML 파싱 (BytesIO 사용)
-            tree = ET.parse(BytesIO(response.content))
-            root = tree.getroot()
+        except Exception as e:
+            logger.error(f"RSS 피드 조회 실패: {e}", exc_info=True)
+            return None
 
-            # RSS 2.0 포맷: channel/item
-            channel = root.find('channel')
-            if not channel:
-                logger.warning("RSS 피드에서 channel을 찾을 수 없습니다")
-                return None
+    def _parse_rss_as_dict(self, content: bytes) -> Optional[Dict]:
+        trend = self._parse_rss(content)
+        return asdict(trend) if trend else None
+
+    def _parse_rss(self, content: bytes) -> Optional[WeeklyTrend]:
+        """
+        RSS 본문에서 최신 주간기술동향 정보 파싱
 
-            items = channel.findall('item')
-            logger.info(f"RSS 피드 항목 수: {len(items)}")
+        Args:
+            content: RSS XML 바이트
 
-            #  디버깅: 첫 항목 확인
-            if items:
-                first = items[0]
-                logger.info(f"첫 항목 - title elem: {first.find('title')}, link elem: {first.find('link')}")
+        Returns:
+            WeeklyTrend 또는 None
+        """
+        # XML 파싱 (BytesIO 사용)
+        tree = ET.parse(BytesIO(content))
+        root = tree.getroot()
+
+        # RSS 2.0 포맷: channel/item
+        channel = root.find('channel')
+        if not channel:
+            logger.warning("RSS 피드에서 channel을 찾을 수 없습니다")
+            return None
 
-            # 주간기술동향 항목 찾기
-            for idx, item in enumerate(items):
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                pub_date_elem = item.find('pubDate')
-                description_elem = item.find('description')
+        items = channel.findall('item')
+        logger.info(f"RSS 피드 항목 수: {len(items)}")
 
-                if title_elem is None or link_elem is None:
-                    if idx < 3:
-                        logger.info(f"항목 {idx+1} 스킵 - title_elem={title_elem}, link_elem={link_elem}")
-                    continue
+        #  디버깅: 첫 항목 확인
+        if items:
+            first = items[0]
+            logger.info(f"첫 항목 - title elem: {first.find('title')}, link elem: {first.find('link')}")
 
-                title = title_elem.text
-                link = link_elem.text
+        # 주간기술동향 항목 찾기
+        for idx, item in enumerate(items):
+            title_elem = item.find('title')
+            link_elem = item.find('link')
+            pub_date_elem = item.find('pubDate')
+            description_elem = item.find('description')
 
-                # 디버깅: 처음 몇 개 항목의 값 확인
+            if title_elem is None or link_elem is None:
                 if idx < 3:
-                    logger.info(f"항목 {idx+1} - title type: {type(title)}, link type: {type(link)}")
-                    logger.info(f"항목 {idx+1} - title value: {repr(title)}, link value: {repr(link)}")
-
-                # None 체크 후 strip
-                if not title or not link:
-                    if idx >= len(items) - 5:
-                        logger.info(f"항목 {idx+1}/{len(items)} 스킵 - title={title is not None}, link={link is not None}")
-                    continue
+                    logger.info(f"항목 {idx+1} 스킵 - title_elem={title_elem}, link_elem={link_elem}")
+                continue
 
-                title = title.strip()
-                link = link.strip()
+            title = title_elem.text
+            link = link_elem.text
 
-                pub_date = pub_date_elem.text if pub_date_elem is not None else ''
-                description = description_elem.text if description_elem is not None else ''
+            # 디버깅: 처음 몇 개 항목의 값 확인
+            if idx < 3:
+                logger.info(f"항목 {idx+1} - title type: {type(title)}, link type: {type(link)}")
+                logger.info(f"항목 {idx+1} - title value: {repr(title)}, link value: {repr(link)}")
 
-                # 디버깅: 마지막 5개 항목 로깅
+            # None 체크 후 strip
+            if not title or not link:
                 if idx >= len(items) - 5:
-                    logger.info(f"RSS 항목 {idx+1}/{len(items)}: {title[:50]}...")
-
-                # 주간기술동향인지 확인
-                if '주간기술동향' not in title:
-                    continue
-
-                logger.info(f"주간기술동향 발견: {title}")
-
-                # detail_id 추출 (링크에서)
-                # RSS link 예: https://www.itfind.or.kr/admin/getStreamDocsRegi.htm?identifier=TVOL_1388
-                # detail_id는 TVOL_ 다음의 숫자
-                detail_id = ''
-                if 'identifier=TVOL_' in link:
-                    detail_id = link.split('identifier=TVOL_')[-1].split('&')[0]
-                elif 'id=' in link:
-                    detail_id = link.split('id=')[-1].split('&')[0]
-
-                # 호수 추출
-                import re
-                issue_match = re.search(r'(\d{4})호', title)
-                issue_number = issue_match.group(0) if issue_match else "N/A"
-
-                # 발행일 파싱 (RFC 822 형식)
-                # 예: "Tue, 28 Jan 2026 00:00:00 GMT"
-                publish_date = ''
-                if pub_date:
-                    try:
-                        from email.utils import parsedate_to_datetime
-                        dt = parsedate_to_datetime(pub_date)
-                        publish_date = dt.strftime('%Y-%m-%d')
-                    except Exception as e:
-                        logger.warning(f"발행일 파싱 실패: {e}")
-                        publish_date = pub_date
-
-                # PDF URL은 RSS link를 그대로 사용 (이미 PDF 다운로드 URL)
-                pdf_url = link
-
-                # 토픽은 RSS에 없으므로 빈 리스트 (필요시 상세 페이지 방문)
-                topics = []
-
-                return WeeklyTrend(
-                    title=title,
-                    issue_number=issue_number,
-                    publish_date=publish_date,
-                    pdf_url=pdf_url,
-                    topics=topics,
-                    detail_id=detail_id
-                )
-
-            logger.warning("RSS 피드에서 주간기술동향을 찾을 수 없습니다")
-            return None
+                    logger.info(f"항목 {idx+1}/{len(items)} 스킵 - title={title is not None}, link={link is not None}")
+                continue
 
-        except Exception as e:
-            logger.error(f"RSS 피드 조회 실패: {e}", exc_info=True)
-            return None
+            title = title.strip()
+            link = link.strip()
+
+            pub_date = pub_date_elem.text if pub_date_elem is not None else ''
+            description = description_elem.text if description_elem is not None else ''
+
+            # 디버깅: 마지막 5개 항목 로깅
+            if idx >= len(items) - 5:
+                logger.info(f"RSS 항목 {idx+1}/{len(items)}: {title[:50]}...")
+
+            # 주간기술동향인지 확인
+            if '주간기술동향' not in title:
+                continue
+
+            logger.info(f"주간기술동향 발견: {title}")
+
+            # detail_id 추출 (링크에서)
+            # RSS link 예: https://www.itfind.or.kr/admin/getStreamDocsRegi.htm?identifier=TVOL_1388
+            # detail_id는 TVOL_ 다음의 숫자
+            detail_id = ''
+            if 'identifier=TVOL_' in link:
+                detail_id = link.split('identifier=TVOL_')[-1].split('&')[0]
+            elif 'id=' in link:
+                detail_id = link.split('id=')[-1].split('&')[0]
+
+            # 호수 추출
+            import re
+            issue_match = re.search(r'(\d{4})호', title)
+            issue_number = issue_match.group(0) if issue_match else "N/A"
+
+            # 발행일 파싱 (RFC 822 형식)
+            # 예: "Tue, 28 Jan 2026 00:00:00 GMT"
+            publish_date = ''
+            if pub_date:
+                try:
+                    from email.utils import parsedate_to_datetime
+                    dt = parsedate_to_datetime(pub_date)
+                    publish_date = dt.strftime('%Y-%m-%d')
+                except Exception as e:
+                    logger.warning(f"발행일 파싱 실패: {e}")
+                    publish_date = pub_date
+
+            # PDF URL은 RSS link를 그대로 사용 (이미 PDF 다운로드 URL)
+            pdf_url = link
+
+            # 토픽은 RSS에 없으므로 빈 리스트 (필요시 상세 페이지 방문)
+            topics = []
+
+            return WeeklyTrend(
+                title=title,
+                issue_number=issue_number,
+                publish_date=publish_date,
+                pdf_url=pdf_url,
+                topics=topics,
+                detail_id=detail_id
+            )
+
+        logger.warning("RSS 피드에서 주간기술동향을 찾을 수 없습니다")
+        return None
 
     async def get_latest_weekly_trend(self) -> Optional[WeeklyTrend]:
         """
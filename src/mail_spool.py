@@ -0,0 +1,413 @@
+"""
+디스크 스풀 기반 발송 큐
+
+[S10] send_bulk_email을 렌더링 단계와 전송 단계로 분리한다.
+- 렌더링: 수신자별 메시지를 스풀 디렉토리(maildir 유사 구조)에 기록
+- 전송: 하나 이상의 전송 워커(스레드 또는 별도 프로세스)가 스풀을 비움
+
+디렉토리 구조:
+    <root>/tmp/     작성 중인 파일 (완료 후 rename으로 new/에 게시)
+    <root>/new/     전송 대기 메시지
+    <root>/cur/     전송 워커가 점유한 메시지 (rename으로 원자적 점유 — 여러 프로세스가 공유 가능)
+    <root>/failed/  재시도 한도를 넘긴 메시지
+    <root>/shared/  렌더링 배치별 공유 구간(이미지·PDF 첨부, [S4] 템플릿 tail) — 배치당 1개
+                    + 발송 원장을 쓰는 배치는 <batch_id>.key에 발송 단위 키(issue_key) 기록
+
+40MB PDF를 수신자마다 디스크에 복제하지 않도록, 메시지 파일에는 수신자별 구간(헤더 + 본문)만
+기록하고 공유 구간은 shared/에 1회만 기록한다. 전송 시 두 파일을 이어서 스트리밍하므로
+재시도 시에도 메시지를 다시 렌더링하지 않는다.
+
+메시지 파일명: <batch_id>.<seq>.<base64url(수신자)>.<시도 횟수>
+"""
+import base64
+import logging
+import os
+import secrets
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .delivery_tracker import DeliveryLedger
+from .mime_template import DEFAULT_CHUNK_SIZE, RenderedMessage
+from .smtp_rate_controller import FAILED, HALTED, THROTTLED
+
+logger = logging.getLogger(__name__)
+
+SPOOL_SUBDIRS = ("tmp", "new", "cur", "failed", "shared")
+ISSUE_KEY_SUFFIX = ".key"
+
+
+def _encode_email(email: str) -> str:
+    return base64.urlsafe_b64encode(email.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_email(token: str) -> str:
+    padded = token + "=" * (-len(token) % 4)
+    return base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+
+
+class SharedTailFile:
+    """shared/에 기록된 공유 구간 — RenderedMessage가 요구하는 템플릿 인터페이스 구현"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._size = os.path.getsize(path)
+
+    @property
+    def shared_size(self) -> int:
+        return self._size
+
+    def shared_bytes(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def iter_shared(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        with open(self.path, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+
+class SpoolEntry:
+    """스풀 메시지 1건 (파일명에서 배치·수신자·시도 횟수 복원)"""
+
+    __slots__ = ("name", "batch_id", "seq", "email", "attempts")
+
+    def __init__(self, name: str):
+        batch_id, seq, email_token, attempts = name.split(".")
+        self.name = name
+        self.batch_id = batch_id
+        self.seq = int(seq)
+        self.email = _decode_email(email_token)
+        self.attempts = int(attempts)
+
+    @staticmethod
+    def make_name(batch_id: str, seq: int, email: str, attempts: int = 0) -> str:
+        return f"{batch_id}.{seq:06d}.{_encode_email(email)}.{attempts}"
+
+    def with_attempts(self, attempts: int) -> str:
+        return self.make_name(self.batch_id, self.seq, self.email, attempts)
+
+
+class MailSpool:
+    """maildir 유사 디스크 스풀 (rename 기반 원자적 게시·점유)"""
+
+    def __init__(self, root: str):
+        self.root = root
+        for sub in SPOOL_SUBDIRS:
+            os.makedirs(os.path.join(root, sub), exist_ok=True)
+
+    def _path(self, sub: str, name: str) -> str:
+        return os.path.join(self.root, sub, name)
+
+    def _publish(self, sub: str, name: str, chunks) -> None:
+        """tmp/에 기록 후 rename으로 게시 (부분 기록된 파일이 노출되지 않음)"""
+        tmp_path = self._path("tmp", f"{sub}.{name}")
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, self._path(sub, name))
+
+    # --- 렌더링 단계 ---
+    def new_batch(self, template, issue_key: Optional[str] = None) -> str:
+        """공유 구간을 shared/에 1회 기록하고 배치 ID 반환
+
+        Args:
+            template: 공유 구간 (iter_shared, shared_size)
+            issue_key: [S8] 발송 원장 키 — 전송 워커가 이 배치의 전송 성공을 같은 원장에 기록
+        """
+        batch_id = secrets.token_hex(8)
+        self._publish("shared", batch_id, template.iter_shared())
+        if issue_key:
+            self._publish("shared", batch_id + ISSUE_KEY_SUFFIX, [issue_key.encode("utf-8")])
+        logger.info(f"[S10] 스풀 배치 생성: {batch_id} (공유 구간 {template.shared_size:,} bytes)")
+        return batch_id
+
+    def batch_issue_key(self, batch_id: str) -> Optional[str]:
+        """배치의 발송 원장 키 (원장 없이 렌더링된 배치는 None)"""
+        try:
+            with open(self._path("shared", batch_id + ISSUE_KEY_SUFFIX), "rb") as f:
+                return f.read().decode("utf-8")
+        except FileNotFoundError:
+            return None
+
+    def discard_issue_batches(self, issue_key: str) -> Set[str]:
+        """같은 발송 단위의 이전 배치에서 전송 대기(new/) 메시지를 삭제
+
+        조기 중단 후 재실행은 원장 기준 미전송 수신인을 새 배치로 다시 렌더링하므로,
+        이전 배치의 대기 메시지를 남겨 두면 같은 수신인에게 두 번 전송된다.
+
+        Returns:
+            다른 워커가 점유 중(cur/)이라 삭제하지 않은 메시지의 수신인 집합
+        """
+        batch_ids = [
+            name[:-len(ISSUE_KEY_SUFFIX)]
+            for name in os.listdir(os.path.join(self.root, "shared"))
+            if name.endswith(ISSUE_KEY_SUFFIX)
+        ]
+        in_flight: Set[str] = set()
+        discarded = 0
+        for batch_id in batch_ids:
+            if self.batch_issue_key(batch_id) != issue_key:
+                continue
+            prefix = batch_id + "."
+            for name in os.listdir(os.path.join(self.root, "new")):
+                if name.startswith(prefix):
+                    try:
+                        os.remove(self._path("new", name))
+                        discarded += 1
+                    except FileNotFoundError:
+                        continue  # 그 사이 다른 워커가 점유
+            for name in os.listdir(os.path.join(self.root, "cur")):
+                if name.startswith(prefix):
+                    in_flight.add(SpoolEntry(name).email)
+            self.release_batch(batch_id)
+        if discarded:
+            logger.info(f"[S10] 이전 배치의 대기 메시지 {discarded}건 삭제 (새 배치로 다시 렌더링)")
+        return in_flight
+
+    def enqueue(self, batch_id: str, seq: int, email: str, head: bytes) -> str:
+        """수신자별 구간을 new/에 게시하고 파일명 반환"""
+        name = SpoolEntry.make_name(batch_id, seq, email)
+        self._publish("new", name, [head])
+        return name
+
+    # --- 전송 단계 ---
+    def claim(self, batch_id: Optional[str] = None) -> Optional[SpoolEntry]:
+        """new/의 메시지 1건을 cur/로 옮겨 점유 (다른 워커가 먼저 점유하면 다음 건 시도)
+
+        Args:
+            batch_id: 지정하면 해당 배치 메시지만 점유
+        """
+        prefix = batch_id + "." if batch_id else ""
+        for name in sorted(os.listdir(os.path.join(self.root, "new"))):
+            if not name.startswith(prefix):
+                continue
+            try:
+                os.rename(self._path("new", name), self._path("cur", name))
+            except FileNotFoundError:
+                continue
+            # 점유 시각 기록 (recover_stale 판정용)
+            os.utime(self._path("cur", name))
+            return SpoolEntry(name)
+        return None
+
+    def load(self, entry: SpoolEntry) -> RenderedMessage:
+        """점유한 메시지를 전송 가능한 RenderedMessage로 복원 (재렌더링 없음)"""
+        with open(self._path("cur", entry.name), "rb") as f:
+            head = f.read()
+        return RenderedMessage(head, SharedTailFile(self._path("shared", entry.batch_id)))
+
+    def complete(self, entry: SpoolEntry) -> None:
+        """전송 완료 — 메시지 파일 삭제"""
+        os.remove(self._path("cur", entry.name))
+
+    def retry(self, entry: SpoolEntry) -> None:
+        """시도 횟수를 올려 new/로 되돌림"""
+        os.rename(self._path("cur", entry.name), self._path("new", entry.with_attempts(entry.attempts + 1)))
+
+    def fail(self, entry: SpoolEntry) -> None:
+        """재시도 한도 초과 — failed/로 이동 (수동 확인용)"""
+        os.rename(self._path("cur", entry.name), self._path("failed", entry.name))
+
+    def recover_stale(self, max_age: float) -> int:
+        """점유 후 max_age초가 지난 cur/ 메시지를 new/로 복구 (전송 워커 비정상 종료 대비)"""
+        now = time.time()
+        recovered = 0
+        for name in os.listdir(os.path.join(self.root, "cur")):
+            path = self._path("cur", name)
+            try:
+                if now - os.path.getmtime(path) > max_age:
+                    os.rename(path, self._path("new", name))
+                    recovered += 1
+            except FileNotFoundError:
+                continue
+        if recovered:
+            logger.warning(f"[S10] 점유 만료 메시지 {recovered}건 복구")
+        return recovered
+
+    def pending(self, batch_id: Optional[str] = None) -> int:
+        """전송 대기·진행 중 메시지 수 (batch_id 지정 시 해당 배치만)"""
+        count = 0
+        for sub in ("new", "cur"):
+            for name in os.listdir(os.path.join(self.root, sub)):
+                if batch_id is None or name.startswith(batch_id + "."):
+                    count += 1
+        return count
+
+    def release_batch(self, batch_id: str) -> bool:
+        """배치에 대기·진행·실패 메시지가 하나도 없으면 공유 구간 삭제"""
+        if self.pending(batch_id):
+            return False
+        if any(n.startswith(batch_id + ".") for n in os.listdir(os.path.join(self.root, "failed"))):
+            return False
+        for name in (batch_id, batch_id + ISSUE_KEY_SUFFIX):
+            try:
+                os.remove(self._path("shared", name))
+            except FileNotFoundError:
+                pass
+        return True
+
+
+class SpoolTransmitter:
+    """스풀을 비우는 전송 워커 묶음 (EmailSender의 SMTP 연결·전송·원장·속도 제어 재사용)
+
+    여러 프로세스가 같은 스풀에 대해 각자 SpoolTransmitter를 실행해도 claim()이 rename으로
+    원자적이므로 같은 메시지를 중복 전송하지 않는다.
+    전송 성공은 메시지가 속한 배치의 발송 원장(batch_issue_key)에 기록한다.
+    """
+
+    def __init__(
+        self,
+        sender,
+        spool: MailSpool,
+        workers: int = 1,
+        max_attempts: int = 3,
+        shared: Optional[dict] = None,
+        batch_id: Optional[str] = None,
+    ):
+        """
+        Args:
+            sender: EmailSender (연결 수립·전송·속도 제어기 생성에 사용)
+            spool: 대상 스풀
+            workers: 전송 스레드 수 (스레드마다 SMTP 세션 1개)
+            max_attempts: 메시지별 최대 전송 시도 횟수 (초과 시 failed/)
+            shared: 발송 원장 등 전송 컨텍스트 ([S8] shared["ledger"])
+            batch_id: 지정하면 해당 배치만 전송 (None이면 스풀 전체)
+        """
+        self.sender = sender
+        self.spool = spool
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.shared = shared if shared is not None else {}
+        self.batch_id = batch_id
+        self._contexts: Dict[str, dict] = {}
+        self._contexts_lock = threading.Lock()
+
+    def _delivery_context(self, batch_id: str) -> dict:
+        """[S8] 배치별 원장 컨텍스트 (배치를 렌더링한 실행의 issue_key 기준, 원장 없는 배치는 빈 dict)"""
+        with self._contexts_lock:
+            context = self._contexts.get(batch_id)
+            if context is None:
+                issue_key = self.spool.batch_issue_key(batch_id)
+                ledger = self.shared.get("ledger")
+                if issue_key is None:
+                    context = {}
+                elif ledger is not None and ledger.issue_key == issue_key:
+                    context = self.shared
+                else:
+                    ttl_days = getattr(self.sender.config, "DELIVERY_LEDGER_TTL_DAYS", 14)
+                    context = {"ledger": DeliveryLedger(
+                        issue_key, ttl_days=ttl_days if isinstance(ttl_days, int) else 14
+                    )}
+                self._contexts[batch_id] = context
+            return context
+
+    def run(self) -> Tuple[List[SpoolEntry], int]:
+        """스풀이 빌 때까지 전송
+
+        Returns:
+            (전송 성공한 SpoolEntry 리스트, 최종 실패 건수)
+        """
+        sender = self.sender
+        config = sender.config
+        fail_limit = getattr(config, "SMTP_CONSECUTIVE_FAIL_LIMIT", 5)
+        reconnect_every = getattr(config, "SMTP_RECONNECT_EVERY", 50)
+        controller = sender._create_rate_controller(self.workers)
+
+        lock = threading.Lock()
+        stop = threading.Event()
+        delivered: List[SpoolEntry] = []
+        state = {"fail_count": 0, "consecutive_fail": 0}
+
+        def close(server) -> None:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+        def worker(worker_id: int) -> None:
+            server = None
+            sent_since_connect = 0
+            try:
+                while not stop.is_set():
+                    entry = self.spool.claim(self.batch_id)
+                    if entry is None:
+                        return
+
+                    try:
+                        if server is None or sent_since_connect >= reconnect_every:
+                            if server is not None:
+                                close(server)
+                                server = None
+                            server = sender._acquire_smtp_connection()
+                            sent_since_connect = 0
+                    except Exception as e:
+                        logger.error(f"[spool-{worker_id}] SMTP 연결 실패, 워커 종료: {e}")
+                        self.spool.retry(entry)
+                        return
+
+                    delay = controller.reserve()
+                    if delay > 0 and stop.wait(delay):
+                        self.spool.retry(entry)
+                        return
+
+                    try:
+                        msg = self.spool.load(entry)
+                        started = time.monotonic()
+                        server = sender._send_on_server(server, msg, [entry.email])
+                        controller.on_success(time.monotonic() - started)
+                        sent_since_connect += 1
+                        self.spool.complete(entry)
+                        sender._record_delivery(self._delivery_context(entry.batch_id), entry.email)
+                        with lock:
+                            delivered.append(entry)
+                            state["consecutive_fail"] = 0
+                        logger.info(f"[spool-{worker_id}] 이메일 전송 완료: {entry.email}")
+                    except Exception as e:
+                        verdict = controller.on_failure(e)
+                        # 스로틀링·중단은 메시지를 스풀에 보존, 일반 실패는 시도 한도까지 재시도
+                        if verdict != FAILED or entry.attempts + 1 < self.max_attempts:
+                            logger.warning(
+                                f"[spool-{worker_id}] 이메일 전송 보류 (시도 {entry.attempts + 1}회): "
+                                f"{entry.email} - {e}"
+                            )
+                            self.spool.retry(entry)
+                            if verdict == THROTTLED:
+                                continue
+                        else:
+                            logger.error(f"[spool-{worker_id}] 이메일 전송 실패: {entry.email} - {e}")
+                            self.spool.fail(entry)
+                            with lock:
+                                state["fail_count"] += 1
+
+                        with lock:
+                            state["consecutive_fail"] += 1
+                            if verdict == HALTED and not stop.is_set():
+                                logger.error("🛑 스풀 전송 중단 (남은 메시지는 스풀에 보존)")
+                                stop.set()
+                            elif state["consecutive_fail"] >= fail_limit and not stop.is_set():
+                                logger.error(
+                                    f"🛑 연속 {state['consecutive_fail']}회 실패 — 스풀 전송 조기 중단 "
+                                    f"(남은 메시지는 스풀에 보존)"
+                                )
+                                stop.set()
+            finally:
+                if server is not None:
+                    close(server)
+
+        threads = [
+            threading.Thread(target=worker, args=(i,), name=f"spool-{i}")
+            for i in range(self.workers)
+        ]
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sender._report_rate_metrics(controller)
+
+        return delivered, state["fail_count"]
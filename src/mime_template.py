@@ -0,0 +1,303 @@
+"""
+MIME 메시지 템플릿 모듈
+
+[S4] 벌크 발송 시 수신자와 무관한 파트(inline 이미지, PDF 첨부)를
+전송용 바이트(base64 + CRLF)로 1회만 직렬화해 두고,
+수신자별로는 To 헤더와 HTML 본문 파트만 만들어 이어 붙인다.
+
+기존 방식은 수신자마다 MIMEApplication 생성(base64 인코딩) +
+smtplib.send_message의 generator flatten을 반복해, 수백 명 발송 시
+40MB PDF의 인코딩 비용이 실제 네트워크 전송보다 더 큰 CPU를 소모했다.
+
+[S7] 직렬화된 공유 구간이 spool_threshold를 넘으면 메모리 대신 임시 파일에 두고,
+iter_chunks()로 고정 크기 청크씩 읽어 SMTP DATA에 바로 흘려보낸다.
+수신자 수·병렬 세션 수와 무관하게 메시지 전체를 메모리에 만들지 않는다.
+
+[S12] HTML 본문도 발송 1회당 한 번만 만들어 UTF-8 + quoted-printable로 인코딩해 두고
+(BodyTemplate), 수신자별로는 수신거부 URL이 들어가는 한 줄만 인코딩해 이어 붙인다.
+"""
+import io
+import logging
+import os
+import secrets
+import tempfile
+from email import charset as email_charset
+from email import quoprimime
+from email.generator import BytesGenerator
+from email.message import Message
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.policy import compat32
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# SMTP 전송용 정책 (줄바꿈 CRLF)
+SMTP_POLICY = compat32.clone(linesep="\r\n")
+CRLF = b"\r\n"
+
+# 스트리밍 전송 기본 청크 크기
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def serialize_part(part: Message) -> bytes:
+    """MIME 파트(헤더 포함)를 CRLF 줄바꿈의 전송용 바이트로 직렬화"""
+    buf = io.BytesIO()
+    BytesGenerator(buf, mangle_from_=False, policy=SMTP_POLICY).flatten(part)
+    return buf.getvalue()
+
+
+def _estimate_part_size(part: Message) -> int:
+    """직렬화 전 파트 크기 추정 (인코딩된 payload 길이 기준)"""
+    payload = part.get_payload()
+    if isinstance(payload, (str, bytes)):
+        return len(payload)
+    return 0
+
+
+class DotStuffer:
+    """[S7] SMTP DATA 투명성 처리(RFC 5321 4.5.2)를 청크 단위로 수행
+
+    줄 첫 글자가 "."이면 ".."로 바꾼다. 청크 경계에서 줄이 나뉘어도
+    직전 청크가 줄바꿈으로 끝났는지를 기억해 올바르게 처리한다.
+    """
+
+    def __init__(self):
+        self._at_line_start = True
+
+    def feed(self, chunk: bytes) -> bytes:
+        if not chunk:
+            return chunk
+        if self._at_line_start and chunk[:1] == b".":
+            chunk = b"." + chunk
+        if b"\n." in chunk:
+            chunk = chunk.replace(b"\n.", b"\n..")
+        self._at_line_start = chunk[-1:] == b"\n"
+        return chunk
+
+    def finish(self) -> bytes:
+        """DATA 종료 시퀀스 (필요 시 CRLF 보충 후 "." + CRLF)"""
+        return (b"" if self._at_line_start else CRLF) + b"." + CRLF
+
+
+class RenderedMessage:
+    """수신자별로 렌더링된 메시지 (수신자 구간 bytes + 공유 템플릿 참조)
+
+    bytes(msg)로 전체 바이트를 만들 수도 있고, iter_chunks()로
+    전체를 메모리에 만들지 않고 순서대로 읽을 수도 있다.
+    """
+
+    __slots__ = ("head", "template")
+
+    def __init__(self, head: bytes, template: "MessageTemplate"):
+        self.head = head
+        self.template = template
+
+    def __len__(self) -> int:
+        return len(self.head) + self.template.shared_size
+
+    def __bytes__(self) -> bytes:
+        return self.head + self.template.shared_bytes()
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """수신자 구간 → 공유 구간 순서로 최대 chunk_size 바이트씩 반환"""
+        yield self.head
+        yield from self.template.iter_shared(chunk_size)
+
+
+class BodyTemplate:
+    """[S12] 수신자별 값 1개(slot)만 교체 가능한 사전 인코딩 HTML 본문 파트
+
+    slot이 들어 있는 줄을 기준으로 본문을 앞/슬롯 줄/뒤 세 구간으로 나누고,
+    앞·뒤 구간은 생성 시점에 quoted-printable 바이트로 인코딩해 둔다.
+    QP는 줄 단위 인코딩이므로 hard line break 경계에서 나눈 구간은 독립적으로 인코딩해
+    이어 붙여도 전체를 한 번에 인코딩한 결과와 디코딩 결과가 같다.
+    slot은 반드시 한 줄에 1번만 나와야 한다.
+    """
+
+    def __init__(self, html_body: str, slot: str):
+        """
+        Args:
+            html_body: slot 자리표시자를 포함한 HTML 본문
+            slot: 수신자별 값으로 바뀔 자리표시자 문자열
+        """
+        index = html_body.find(slot)
+        if index < 0 or html_body.find(slot, index + len(slot)) >= 0:
+            raise ValueError("본문 템플릿에는 자리표시자가 정확히 1번 있어야 합니다")
+
+        line_start = html_body.rfind("\n", 0, index) + 1
+        line_end = html_body.find("\n", index)
+        if line_end < 0:
+            line_end = len(html_body)
+
+        self.slot = slot
+        self._line = html_body[line_start:line_end]
+
+        # 본문 파트 헤더 (MIMEText와 동일, Content-Transfer-Encoding만 quoted-printable)
+        cs = email_charset.Charset("utf-8")
+        cs.body_encoding = email_charset.QP
+        header = serialize_part(MIMEText("", "html", cs))
+        self._header = header.split(CRLF + CRLF, 1)[0] + CRLF + CRLF
+
+        self._prefix = self._encode(html_body[:line_start])
+        self._suffix = self._encode(html_body[line_end:])
+
+    @staticmethod
+    def _encode(text: str) -> bytes:
+        """UTF-8 → quoted-printable (CRLF 줄바꿈)"""
+        if not text:
+            return b""
+        latin = text.encode("utf-8").decode("latin-1")
+        return quoprimime.body_encode(latin, eol="\r\n").encode("ascii")
+
+    def render(self, value: str) -> bytes:
+        """slot을 value로 채운 본문 파트 바이트 (헤더 포함)"""
+        line = self._encode(self._line.replace(self.slot, value))
+        return b"".join([self._header, self._prefix, line, self._suffix])
+
+
+class MessageTemplate:
+    """수신자별 To 헤더·본문만 교체 가능한 multipart/related 메시지 템플릿
+
+    공유 파트는 생성 시점에 한 번만 직렬화되며, render()는 바이트 이어 붙이기만 수행한다.
+    파트 순서는 기존 _assemble_message와 동일하다: HTML 본문 → inline 이미지 → PDF 첨부.
+    """
+
+    def __init__(
+        self,
+        from_addr: str,
+        subject: str,
+        shared_parts: List[Message],
+        spool_threshold: Optional[int] = None,
+        spool_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            from_addr: 발신자 주소 (From 헤더)
+            subject: 이메일 제목 (Subject 헤더)
+            shared_parts: 모든 수신자에게 동일한 MIME 파트 리스트 (본문 뒤에 순서대로 배치)
+            spool_threshold: 공유 파트 추정 크기가 이 값(바이트)을 넘으면 임시 파일에 보관
+                (None이면 항상 메모리)
+            spool_dir: 임시 파일 디렉토리 (None이면 시스템 기본값)
+        """
+        # boundary 고정 (수신자 간 동일 boundary 사용 — 공유 파트 바이트 재사용 전제)
+        boundary = "=" * 15 + secrets.token_hex(16) + "=="
+        self.boundary = boundary.encode("ascii")
+
+        prototype = MIMEMultipart("related", boundary=boundary)
+        prototype["From"] = from_addr
+        prototype["Subject"] = subject
+
+        # 최상위 헤더 (To 제외) — 헤더/본문 구분 빈 줄 앞까지만 사용
+        prototype.set_payload([])
+        head = serialize_part(prototype)
+        self._head = head.split(CRLF + CRLF, 1)[0] + CRLF
+
+        # [S7] 대용량 첨부는 임시 파일로 직렬화 (메모리에 전체 tail을 두지 않음)
+        estimated = sum(_estimate_part_size(p) for p in shared_parts)
+        spool = spool_threshold is not None and estimated > spool_threshold
+
+        # 공유 파트: "\r\n--boundary\r\n<part>" ... "\r\n--boundary--\r\n"
+        out = tempfile.TemporaryFile(dir=spool_dir) if spool else io.BytesIO()
+        generator = BytesGenerator(out, mangle_from_=False, policy=SMTP_POLICY)
+        for part in shared_parts:
+            out.write(CRLF + b"--" + self.boundary + CRLF)
+            generator.flatten(part)
+        out.write(CRLF + b"--" + self.boundary + b"--" + CRLF)
+        self._size = out.tell()
+
+        if spool:
+            out.flush()
+            self._spool_file = out
+            self._tail: Optional[bytes] = None
+        else:
+            self._spool_file = None
+            self._tail = out.getvalue()
+
+        logger.info(
+            f"MIME 템플릿 생성: 공유 파트 {len(shared_parts)}개, "
+            f"직렬화 {self._size:,} bytes (1회, {'임시 파일' if spool else '메모리'})"
+        )
+
+    @property
+    def shared_size(self) -> int:
+        """직렬화된 공유 파트 바이트 크기"""
+        return self._size
+
+    @property
+    def is_spooled(self) -> bool:
+        """공유 파트가 임시 파일에 보관되어 있는지 여부"""
+        return self._spool_file is not None
+
+    def shared_bytes(self) -> bytes:
+        """공유 파트 전체 바이트 (임시 파일이면 읽어서 반환)"""
+        if self._tail is not None:
+            return self._tail
+        return b"".join(self.iter_shared())
+
+    def iter_shared(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """공유 파트를 최대 chunk_size 바이트씩 반환
+
+        임시 파일은 os.pread(위치 지정 읽기)로 읽으므로 여러 세션이 동시에 읽어도 안전하다.
+        """
+        if self._tail is not None:
+            for offset in range(0, self._size, chunk_size):
+                yield self._tail[offset:offset + chunk_size]
+            return
+
+        fd = self._spool_file.fileno()
+        offset = 0
+        while offset < self._size:
+            chunk = os.pread(fd, min(chunk_size, self._size - offset), offset)
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        """임시 파일 정리 (메모리 보관 시에는 아무 작업 없음)"""
+        if self._spool_file is not None:
+            try:
+                self._spool_file.close()
+            except Exception:
+                pass
+
+    def render_head(self, to_email: str, body_part: Message) -> bytes:
+        """수신자별 부분(최상위 헤더 + To + 본문 파트)만 직렬화"""
+        return b"".join([
+            self._head,
+            SMTP_POLICY.fold_binary("To", to_email),
+            CRLF,
+            b"--" + self.boundary + CRLF,
+            serialize_part(body_part),
+        ])
+
+    def render_compiled(self, to_email: str, body: BodyTemplate, value: str) -> RenderedMessage:
+        """[S12] 사전 인코딩된 본문 템플릿으로 수신자별 메시지 생성 (바이트 이어 붙이기만 수행)
+
+        Args:
+            to_email: 수신자 이메일 (To 헤더)
+            body: 발송 1회당 1번 만든 본문 템플릿
+            value: 본문 slot에 넣을 수신자별 값 (수신거부 URL)
+        """
+        head = b"".join([
+            self._head,
+            SMTP_POLICY.fold_binary("To", to_email),
+            CRLF,
+            b"--" + self.boundary + CRLF,
+            body.render(value),
+        ])
+        return RenderedMessage(head, self)
+
+    def render(self, to_email: str, html_body: str) -> RenderedMessage:
+        """수신자별 메시지 생성
+
+        Args:
+            to_email: 수신자 이메일 (To 헤더)
+            html_body: 수신자별 HTML 본문 (수신거부 URL 포함)
+
+        Returns:
+            RenderedMessage — bytes(msg)는 SMTP DATA로 그대로 전송 가능한 RFC 5322 메시지
+        """
+        body_part = MIMEText(html_body, "html", "utf-8")
+        return RenderedMessage(self.render_head(to_email, body_part), self)
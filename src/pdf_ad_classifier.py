@@ -0,0 +1,185 @@
+"""
+PyMuPDF 기반 광고 페이지 분석 엔진
+
+[S13] pypdf의 page.extract_text()는 content stream을 순수 파이썬으로 해석하므로
+24~32면 신문 1부의 텍스트 추출이 3단계(PDF 처리) 시간 대부분을 차지한다.
+이 모듈은 MuPDF(C 구현)로 페이지 텍스트를 추출하고, 페이지 수가 충분하면
+연속된 페이지 구간을 프로세스 풀에 나눠 분석한다.
+
+광고 판정 규칙(텍스트 길이 임계값, 광고 키워드)은 PDFProcessor가 그대로 적용하며,
+이 모듈은 페이지별 분석 결과만 반환한다.
+
+fitz 문서 객체는 프로세스 간 전달이 불가능하므로 각 워커가 파일을 직접 연다.
+현재 프로세스에서 순차 분석할 때는 [S20] 문서 세션의 문서(doc)를 받아 다시 열지 않는다.
+Lambda처럼 프로세스 풀을 만들 수 없는 환경(/dev/shm 없음)에서는 순차 추출로 대체한다.
+
+[S14] 단계별 분류(PDFProcessor._cascade_classify)에 쓰는 저비용 신호도 제공한다.
+- content_stream_bytes: 페이지 content stream 크기 (압축 상태, 해석 없음)
+- image_coverage: 이미지가 덮는 페이지 면적 비율 (content stream이 작은 페이지에만 사용)
+- bounded_text: 페이지 상단 띠 영역만 텍스트 추출
+"""
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# PyMuPDF (fitz) import with graceful degradation
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+    logger.warning("PyMuPDF (fitz) not available. pypdf 광고 분석으로 대체합니다.")
+
+
+def content_stream_bytes(doc: "fitz.Document", page: "fitz.Page") -> int:
+    """페이지 content stream 크기 (압축 상태 바이트, 스트림을 해제·해석하지 않음)"""
+    total = 0
+    for xref in page.get_contents():
+        kind, value = doc.xref_get_key(xref, "Length")
+        if kind == "int":
+            total += int(value)
+        else:
+            # Length가 간접 참조인 경우
+            total += len(doc.xref_stream_raw(xref) or b"")
+    return total
+
+
+def image_coverage(page: "fitz.Page") -> float:
+    """이미지가 덮는 페이지 면적 비율 (0.0 ~ 1.0, 겹침은 단순 합산 후 상한 적용)
+
+    content stream을 해석하므로 스트림이 큰 페이지에서는 텍스트 추출과 비용이 비슷하다.
+    """
+    page_area = page.rect.get_area()
+    if page_area <= 0 or not page.get_images():
+        return 0.0
+    covered = sum(
+        fitz.Rect(info["bbox"]).intersect(page.rect).get_area()
+        for info in page.get_image_info()
+    )
+    return min(1.0, covered / page_area)
+
+
+def bounded_text(page: "fitz.Page", band_ratio: float) -> str:
+    """페이지 상단 band_ratio 높이 영역의 텍스트 (면 머리·광고 표기 위치)"""
+    rect = page.rect
+    band = fitz.Rect(rect.x0, rect.y0, rect.x1, rect.y0 + rect.height * band_ratio)
+    return page.get_text(clip=band)
+
+
+def _split_ranges(page_indices: List[int], parts: int) -> List[List[int]]:
+    """페이지 목록을 parts개의 연속 구간으로 분할 (워커마다 페이지 트리 접근 지역성 유지)"""
+    size, extra = divmod(len(page_indices), parts)
+    chunks, start = [], 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            chunks.append(page_indices[start:end])
+        start = end
+    return chunks
+
+
+def _page_text(page: "fitz.Page") -> str:
+    """페이지 전체 텍스트"""
+    return page.get_text()
+
+
+def _map_chunk(
+    pdf_path: str,
+    page_indices: List[int],
+    page_fn: Callable[["fitz.Page"], Any],
+    doc: Optional["fitz.Document"] = None,
+) -> List[Tuple[int, Any]]:
+    """워커: PDF를 열어(doc이 주어지면 그대로 사용) 지정 페이지마다 page_fn 실행 (실패한 페이지는 None)"""
+    if doc is None:
+        with fitz.open(pdf_path) as opened:
+            return _map_chunk(pdf_path, page_indices, page_fn, doc=opened)
+
+    results = []
+    for page_num in page_indices:
+        try:
+            results.append((page_num, page_fn(doc[page_num])))
+        except Exception as e:
+            logger.warning(f"페이지 {page_num + 1} 분석 오류: {e}")
+            results.append((page_num, None))
+    return results
+
+
+def map_pages(
+    pdf_path: str,
+    page_indices: Iterable[int],
+    page_fn: Callable[["fitz.Page"], Any],
+    workers: int = 1,
+    min_parallel_pages: int = 8,
+    doc: Optional["fitz.Document"] = None,
+) -> Dict[int, Any]:
+    """
+    페이지별 분석 함수 실행 (MuPDF, 필요 시 프로세스 풀)
+
+    Args:
+        pdf_path: PDF 파일 경로
+        page_indices: 분석할 페이지 번호 (0-based)
+        page_fn: fitz.Page를 받는 분석 함수 (프로세스 풀에 전달되므로 모듈 최상위 함수여야 함)
+        workers: 프로세스 수 (1이면 현재 프로세스에서 순차 실행)
+        min_parallel_pages: 이 페이지 수 미만이면 프로세스 풀을 쓰지 않음 (풀 기동 비용이 더 큼)
+        doc: 이미 연 문서 (순차 실행 시 파일을 다시 열지 않음, 프로세스 풀 워커는 파일을 직접 엶)
+
+    Returns:
+        {페이지 번호: page_fn 결과} — 분석에 실패한 페이지는 None
+
+    Raises:
+        RuntimeError: PyMuPDF가 설치되어 있지 않은 경우
+    """
+    if not PYMUPDF_AVAILABLE:
+        raise RuntimeError("PyMuPDF (fitz) not available")
+
+    page_indices = list(page_indices)
+    if not page_indices:
+        return {}
+
+    workers = max(1, min(workers, len(page_indices)))
+    if workers == 1 or len(page_indices) < min_parallel_pages:
+        return dict(_map_chunk(pdf_path, page_indices, page_fn, doc=doc))
+
+    chunks = _split_ranges(page_indices, workers)
+    try:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [pool.submit(_map_chunk, pdf_path, chunk, page_fn) for chunk in chunks]
+            results: Dict[int, Any] = {}
+            for future in futures:
+                results.update(future.result())
+    except (OSError, NotImplementedError, ImportError, BrokenProcessPool) as e:
+        # Lambda 등 세마포어(/dev/shm)를 쓸 수 없는 환경, 또는 워커 비정상 종료
+        logger.warning(f"프로세스 풀 사용 불가 ({e}) — 순차 분석으로 대체")
+        return dict(_map_chunk(pdf_path, page_indices, page_fn, doc=doc))
+
+    logger.info(f"[S13] MuPDF 페이지 분석: {len(page_indices)}페이지, 프로세스 {len(chunks)}개")
+    return results
+
+
+def extract_page_texts(
+    pdf_path: str,
+    page_indices: Iterable[int],
+    workers: int = 1,
+    min_parallel_pages: int = 8,
+    doc: Optional["fitz.Document"] = None,
+) -> Dict[int, Optional[str]]:
+    """
+    페이지별 텍스트 추출 (MuPDF)
+
+    Args:
+        pdf_path: PDF 파일 경로
+        page_indices: 분석할 페이지 번호 (0-based)
+        workers: 프로세스 수 (1이면 현재 프로세스에서 순차 추출)
+        min_parallel_pages: 이 페이지 수 미만이면 프로세스 풀을 쓰지 않음
+        doc: 이미 연 문서 (순차 추출 시 사용)
+
+    Returns:
+        {페이지 번호: 텍스트} — 추출에 실패한 페이지는 None
+
+    Raises:
+        RuntimeError: PyMuPDF가 설치되어 있지 않은 경우
+    """
+    return map_pages(pdf_path, page_indices, _page_text, workers, min_parallel_pages, doc=doc)
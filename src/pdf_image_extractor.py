@@ -7,12 +7,25 @@ Extract PDF pages as images using PyMuPDF for email embedding.
 - max_width 기반 동적 zoom 계산 → 렌더링 단계에서 바로 목표 크기로 생성
   (큰 Pixmap 생성 후 축소하는 비효율 제거)
 - JPEG 인코딩 실패 시 PNG로 자동 fallback
+
+[S20] 문서 세션(pdf_session)이 등록된 PDF는 세션의 파싱 결과와 렌더링 캐시를 쓴다.
+[S22] 이메일용 1면·목차 추출은 PDF 내용 해시 기반 디스크 캐시(render_cache)를 먼저 조회한다.
+[S23] 이메일용 미리보기는 바이트 예산 안으로 JPEG 품질·크기를 탐색하고, 1면은 영역(clip)만 렌더링할 수 있다.
+[S24] extract_renditions는 페이지를 1회만 래스터화해 여러 크기·포맷(이메일, 썸네일, PNG, 보관본)을 만든다.
 """
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from .config import Config
+from .pdf_session import get_session
+from .render_cache import RenderCache, get_render_cache, pdf_digest
 
 logger = logging.getLogger(__name__)
 
+# 페이지 비율 좌표 (x0, y0, x1, y1), 0~1
+ClipBox = Tuple[float, float, float, float]
+
 # PyMuPDF (fitz) import with graceful degradation
 try:
     import fitz  # PyMuPDF
@@ -37,6 +50,267 @@ def _compute_render_zoom(
     return max(zoom, 0.5)
 
 
+def _clip_rect(page_rect, clip: Optional[ClipBox]):
+    """페이지 비율 좌표 (x0, y0, x1, y1) → 페이지 좌표 Rect (None이면 페이지 전체)"""
+    if clip is None:
+        return None
+    x0, y0, x1, y1 = clip
+    if not (0.0 <= x0 < x1 <= 1.0 and 0.0 <= y0 < y1 <= 1.0):
+        raise ValueError(f"clip은 0~1 비율 좌표 (x0 < x1, y0 < y1)여야 합니다: {clip}")
+    return fitz.Rect(
+        page_rect.x0 + x0 * page_rect.width,
+        page_rect.y0 + y0 * page_rect.height,
+        page_rect.x0 + x1 * page_rect.width,
+        page_rect.y0 + y1 * page_rect.height,
+    )
+
+
+def _encode_jpeg(pix, quality: int) -> bytes:
+    try:
+        # PyMuPDF 1.24+: jpg_quality 지원
+        return pix.tobytes("jpeg", jpg_quality=quality)
+    except TypeError:
+        # 더 구버전: jpg_quality 인자 미지원 → 기본 품질로 시도
+        return pix.tobytes("jpeg")
+
+
+def _encode_within_budget(
+    pix, budget_bytes: int, max_quality: int, min_quality: int, min_width: int
+) -> Tuple[bytes, int, int]:
+    """[S23] 바이트 예산 이하가 되는 가장 높은 JPEG 품질·가장 큰 크기 탐색
+
+    1. 최고 품질로 인코딩해 예산 이하면 그대로 사용 (대부분의 경우 인코딩 1회)
+    2. 아니면 [min_quality, max_quality] 이진 탐색으로 예산 이하 최고 품질 선택
+    3. 최저 품질로도 넘으면 Pixmap을 0.8배씩 줄여 다시 탐색 (min_width까지)
+    예산을 끝내 못 맞추면 가장 작은 결과를 반환한다.
+
+    Returns:
+        (JPEG 바이트, 사용한 품질, 너비)
+    """
+    current = pix
+    while True:
+        data = _encode_jpeg(current, max_quality)
+        if len(data) <= budget_bytes:
+            return data, max_quality, current.width
+        smallest = (data, max_quality, current.width)
+
+        best = None
+        low, high = min_quality, max_quality - 1
+        while low <= high:
+            quality = (low + high) // 2
+            data = _encode_jpeg(current, quality)
+            if len(data) <= budget_bytes:
+                best = (data, quality, current.width)
+                low = quality + 1
+            else:
+                smallest = (data, quality, current.width)
+                high = quality - 1
+        if best is not None:
+            return best
+
+        # 최저 품질로도 초과 → 축소 후 다시 탐색
+        width = int(current.width * 0.8)
+        if width < min_width:
+            return smallest
+        height = max(1, round(current.height * width / current.width))
+        current = fitz.Pixmap(current, width, height, None)
+
+
+def _native_width(page, clip_rect) -> float:
+    """페이지(또는 clip 영역) 네이티브 너비(pt, 72 DPI 기준)"""
+    try:
+        return float(clip_rect.width if clip_rect is not None else page.rect.width)
+    except Exception:
+        # 테스트 환경 등에서 rect.width가 Mock이면 fallback
+        return 595.0  # A4 width in points
+
+
+def _rasterize(page, zoom: float, clip_rect):
+    mat = fitz.Matrix(zoom, zoom)
+    if clip_rect is not None:
+        return page.get_pixmap(matrix=mat, clip=clip_rect)
+    return page.get_pixmap(matrix=mat)
+
+
+def _encode_pixmap(
+    pix,
+    output_format: str,
+    jpeg_quality: int,
+    budget_bytes: Optional[int],
+    min_quality: int,
+    min_width: int,
+) -> Tuple[Optional[bytes], str, int, int, int]:
+    """Pixmap 인코딩 (JPEG 우선, 실패 시 PNG fallback)
+
+    Returns:
+        (이미지 바이트, 사용한 포맷, JPEG 품질, 너비, 높이)
+    """
+    width = getattr(pix, "width", 0) or 0
+    height = getattr(pix, "height", 0) or 0
+    used_quality = jpeg_quality
+
+    # 출력 포맷 정규화 및 JPEG 우선 시도
+    fmt = (output_format or "jpeg").lower()
+    if fmt in ("jpg", "jpeg"):
+        img_bytes = None
+        try:
+            if budget_bytes:
+                img_bytes, used_quality, encoded_width = _encode_within_budget(
+                    pix, budget_bytes, jpeg_quality, min(min_quality, jpeg_quality), min_width
+                )
+                if encoded_width != width:
+                    height = round(height * encoded_width / width)
+                    width = encoded_width
+                if len(img_bytes) > budget_bytes:
+                    logger.warning(
+                        f"이미지 바이트 예산 초과: {len(img_bytes):,} > {budget_bytes:,} bytes "
+                        f"(최저 품질 {used_quality}, {width}px)"
+                    )
+            else:
+                img_bytes = _encode_jpeg(pix, jpeg_quality)
+            used_format = "jpeg"
+        except Exception as e:
+            logger.warning(f"JPEG 인코딩 실패({e}), PNG로 fallback")
+            img_bytes = pix.tobytes("png")
+            used_format = "png"
+    else:
+        img_bytes = pix.tobytes("png")
+        used_format = "png"
+    return img_bytes, used_format, used_quality, width, height
+
+
+def render_page(
+    page,
+    page_number: int,
+    dpi: int = 200,
+    max_width: int = 800,
+    output_format: str = "jpeg",
+    jpeg_quality: int = 85,
+    budget_bytes: Optional[int] = None,
+    clip: Optional[ClipBox] = None,
+    min_quality: int = 40,
+    min_width: int = 480,
+) -> Optional[bytes]:
+    """열린 페이지를 이메일용 이미지로 렌더링 (extract_page_as_image·PDFSession 공용).
+
+    Args:
+        budget_bytes: [S23] JPEG 바이트 예산 (None이면 jpeg_quality 고정)
+        clip: [S23] 렌더링할 영역, 페이지 비율 좌표 (x0, y0, x1, y1) — 예: 1면 상단 헤드라인
+            (0, 0, 1, 0.35). 너비 기준 zoom이 잘린 영역에 맞춰지므로 같은 max_width에서 더 선명하다.
+        min_quality / min_width: [S23] 예산 탐색 시 JPEG 품질·너비 하한
+
+    Raises:
+        Exception: 렌더링 실패 시 (호출자가 처리)
+    """
+    clip_rect = _clip_rect(page.rect, clip) if clip is not None else None
+
+    # 목표 max_width에 맞는 zoom으로 바로 렌더링
+    zoom = _compute_render_zoom(_native_width(page, clip_rect), dpi, max_width)
+    pix = _rasterize(page, zoom, clip_rect)
+
+    img_bytes, used_format, used_quality, actual_width, actual_height = _encode_pixmap(
+        pix, output_format, jpeg_quality, budget_bytes, min_quality, min_width
+    )
+
+    if not img_bytes:
+        logger.error("이미지 바이트 생성 실패")
+        return None
+
+    max_size = 512000  # 500KB 경고 임계값
+    if len(img_bytes) > max_size:
+        logger.warning(
+            f"이미지 크기가 {len(img_bytes):,} bytes로 500KB 경고 임계값 초과"
+        )
+
+    logger.info(
+        f"✅ PDF 페이지 {page_number + 1} 이미지 추출 성공: "
+        f"{len(img_bytes):,} bytes ({actual_width}x{actual_height}px, "
+        f"zoom={zoom:.2f}, fmt={used_format}"
+        + (f", q={used_quality}" if used_format == "jpeg" else "")
+        + (f", clip={clip}" if clip is not None else "")
+        + ")"
+    )
+    return img_bytes
+
+
+@dataclass(frozen=True)
+class RenditionSpec:
+    """[S24] 1회 래스터화에서 파생할 출력 1종"""
+    name: str
+    max_width: int  # 최대 너비 (px)
+    dpi: int = 200  # 해상도 상한
+    output_format: str = "jpeg"  # "jpeg" 또는 "png"
+    jpeg_quality: int = 85
+    budget_bytes: Optional[int] = None  # JPEG 바이트 예산 (render_page와 같은 탐색)
+
+
+def default_renditions() -> Tuple[RenditionSpec, ...]:
+    """기본 출력 세트: 이메일 inline JPEG, 썸네일, PNG fallback, 고해상도 보관본"""
+    budget_kb = Config.EMAIL_PREVIEW_BUDGET_KB
+    return (
+        RenditionSpec("email", max_width=800, budget_bytes=int(budget_kb * 1024) if budget_kb else None),
+        RenditionSpec("thumbnail", max_width=240, jpeg_quality=70),
+        RenditionSpec("png", max_width=800, output_format="png"),
+        RenditionSpec("archive", max_width=2480, dpi=300, jpeg_quality=92),
+    )
+
+
+def render_renditions(
+    page,
+    page_number: int,
+    specs: Sequence[RenditionSpec],
+    clip: Optional[ClipBox] = None,
+) -> Dict[str, Optional[bytes]]:
+    """[S24] 페이지를 가장 높은 필요 해상도로 1회만 래스터화하고 출력별로 축소·인코딩
+
+    래스터화 zoom은 render_page와 같은 규칙(_compute_render_zoom)으로 가장 큰 출력에 맞추고,
+    더 작은 출력은 래스터화한 Pixmap을 축소해 만든다 (같은 너비의 출력은 Pixmap 공유).
+    축소 출력에는 zoom 하한(0.5)이 없으므로 썸네일도 max_width를 그대로 따른다.
+
+    Returns:
+        {출력 이름: 이미지 바이트} — 인코딩에 실패한 출력은 None
+
+    Raises:
+        Exception: 래스터화 실패 시 (호출자가 처리)
+    """
+    if not specs:
+        return {}
+    clip_rect = _clip_rect(page.rect, clip) if clip is not None else None
+    native_width = _native_width(page, clip_rect)
+    zooms = {spec.name: min(spec.dpi / 72.0, spec.max_width / native_width) for spec in specs}
+
+    master_zoom = max(_compute_render_zoom(native_width, spec.dpi, spec.max_width) for spec in specs)
+    master = _rasterize(page, master_zoom, clip_rect)
+    scaled = {master.width: master}
+
+    results: Dict[str, Optional[bytes]] = {}
+    for spec in specs:
+        try:
+            width = min(master.width, max(1, round(master.width * zooms[spec.name] / master_zoom)))
+            pix = scaled.get(width)
+            if pix is None:
+                height = max(1, round(master.height * width / master.width))
+                pix = scaled[width] = fitz.Pixmap(master, width, height, None)
+            img_bytes, used_format, used_quality, out_width, out_height = _encode_pixmap(
+                pix, spec.output_format, spec.jpeg_quality, spec.budget_bytes,
+                min_quality=40, min_width=min(480, width),
+            )
+            results[spec.name] = img_bytes or None
+            logger.info(
+                f"PDF 페이지 {page_number + 1} 출력 '{spec.name}': "
+                f"{len(img_bytes or b''):,} bytes ({out_width}x{out_height}px, fmt={used_format})"
+            )
+        except Exception as e:
+            logger.warning(f"PDF 페이지 {page_number + 1} 출력 '{spec.name}' 생성 실패: {e}")
+            results[spec.name] = None
+
+    logger.info(
+        f"✅ PDF 페이지 {page_number + 1} 래스터화 1회 ({master.width}x{master.height}px) → "
+        f"출력 {sum(1 for v in results.values() if v)}/{len(specs)}개"
+    )
+    return results
+
+
 def extract_page_as_image(
     pdf_path: str,
     page_number: int = 2,  # 0-based, so 2 = page 3
@@ -44,6 +318,8 @@ def extract_page_as_image(
     max_width: int = 800,
     output_format: str = "jpeg",
     jpeg_quality: int = 85,
+    budget_bytes: Optional[int] = None,
+    clip: Optional[ClipBox] = None,
 ) -> Optional[bytes]:
     """PDF 페이지를 이미지로 추출 (이메일 임베딩용).
 
@@ -54,6 +330,9 @@ def extract_page_as_image(
         max_width: 최대 너비 (픽셀, 기본값 800)
         output_format: 출력 포맷 "jpeg"(기본) 또는 "png"
         jpeg_quality: JPEG quality 0-100 (기본값 85, 크기 vs 화질 균형점)
+            — budget_bytes가 있으면 품질 상한
+        budget_bytes: [S23] JPEG 바이트 예산 (품질·크기를 낮춰 예산 이하로 맞춤)
+        clip: [S23] 렌더링 영역, 페이지 비율 좌표 (x0, y0, x1, y1)
 
     Returns:
         이미지 바이트 (JPEG 또는 PNG) 또는 None (실패 시)
@@ -62,6 +341,18 @@ def extract_page_as_image(
         logger.warning("PyMuPDF를 사용할 수 없어 이미지 추출을 건너뜁니다")
         return None
 
+    # [S20] 실행 중 등록된 문서 세션이 있으면 세션의 파싱 결과·렌더링 캐시 사용
+    session = get_session(pdf_path)
+    if session is not None:
+        try:
+            return session.render(
+                page_number, dpi, max_width, output_format, jpeg_quality,
+                budget_bytes=budget_bytes, clip=clip,
+            )
+        except Exception as e:
+            logger.error(f"PDF 페이지 이미지 추출 실패: {e}")
+            return None
+
     doc = None
     try:
         doc = fitz.open(pdf_path)
@@ -72,65 +363,10 @@ def extract_page_as_image(
             )
             return None
 
-        page = doc[page_number]
-
-        # 페이지 네이티브 너비(pt, 72 DPI 기준)를 얻어 목표 max_width에 맞는 zoom 계산
-        try:
-            native_width = float(page.rect.width)
-        except Exception:
-            # 테스트 환경 등에서 rect.width가 Mock이면 fallback
-            native_width = 595.0  # A4 width in points
-
-        zoom = _compute_render_zoom(native_width, dpi, max_width)
-        mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat)
-
-        actual_width = getattr(pix, "width", 0) or 0
-        actual_height = getattr(pix, "height", 0) or 0
-
-        # 출력 포맷 정규화 및 JPEG 우선 시도
-        fmt = (output_format or "jpeg").lower()
-        if fmt in ("jpg", "jpeg"):
-            img_bytes = None
-            try:
-                # PyMuPDF 1.24+: jpg_quality 지원
-                img_bytes = pix.tobytes("jpeg", jpg_quality=jpeg_quality)
-                used_format = "jpeg"
-            except TypeError:
-                # 더 구버전: jpg_quality 인자 미지원 → 기본 품질로 시도
-                try:
-                    img_bytes = pix.tobytes("jpeg")
-                    used_format = "jpeg"
-                except Exception as e_inner:
-                    logger.warning(
-                        f"JPEG 인코딩 실패({e_inner}), PNG로 fallback"
-                    )
-                    img_bytes = pix.tobytes("png")
-                    used_format = "png"
-            except Exception as e:
-                logger.warning(f"JPEG 인코딩 실패({e}), PNG로 fallback")
-                img_bytes = pix.tobytes("png")
-                used_format = "png"
-        else:
-            img_bytes = pix.tobytes("png")
-            used_format = "png"
-
-        if not img_bytes:
-            logger.error("이미지 바이트 생성 실패")
-            return None
-
-        max_size = 512000  # 500KB 경고 임계값
-        if len(img_bytes) > max_size:
-            logger.warning(
-                f"이미지 크기가 {len(img_bytes):,} bytes로 500KB 경고 임계값 초과"
-            )
-
-        logger.info(
-            f"✅ PDF 페이지 {page_number + 1} 이미지 추출 성공: "
-            f"{len(img_bytes):,} bytes ({actual_width}x{actual_height}px, "
-            f"zoom={zoom:.2f}, fmt={used_format})"
+        return render_page(
+            doc[page_number], page_number, dpi, max_width, output_format, jpeg_quality,
+            budget_bytes=budget_bytes, clip=clip,
         )
-        return img_bytes
 
     except Exception as e:
         logger.error(f"PDF 페이지 이미지 추출 실패: {e}")
@@ -143,6 +379,97 @@ def extract_page_as_image(
                 pass
 
 
+def extract_renditions(
+    pdf_path: str,
+    page_number: int = 0,
+    specs: Optional[Sequence[RenditionSpec]] = None,
+    clip: Optional[ClipBox] = None,
+) -> Dict[str, Optional[bytes]]:
+    """[S24] PDF 페이지 1회 래스터화로 여러 출력 생성
+
+    Args:
+        pdf_path: PDF 파일 경로
+        page_number: 페이지 번호 (0-based)
+        specs: 출력 목록 (None이면 default_renditions())
+        clip: 렌더링 영역, 페이지 비율 좌표 (x0, y0, x1, y1)
+
+    Returns:
+        {출력 이름: 이미지 바이트 또는 None} — 페이지를 열거나 래스터화하지 못하면 모두 None
+    """
+    specs = tuple(specs) if specs is not None else default_renditions()
+    empty = {spec.name: None for spec in specs}
+    if not PYMUPDF_AVAILABLE:
+        logger.warning("PyMuPDF를 사용할 수 없어 이미지 추출을 건너뜁니다")
+        return empty
+
+    # [S20] 등록된 문서 세션이 있으면 세션의 파싱 결과 사용
+    session = get_session(pdf_path)
+    if session is not None:
+        try:
+            return session.renditions(page_number, specs, clip=clip)
+        except Exception as e:
+            logger.error(f"PDF 페이지 출력 생성 실패: {e}")
+            return empty
+
+    try:
+        with fitz.open(pdf_path) as doc:
+            if page_number >= len(doc):
+                logger.warning(f"PDF에 {page_number + 1}페이지가 없습니다 (총 {len(doc)}페이지)")
+                return empty
+            return render_renditions(doc[page_number], page_number, specs, clip=clip)
+    except Exception as e:
+        logger.error(f"PDF 페이지 출력 생성 실패: {e}")
+        return empty
+
+
+def _extract_for_email(
+    pdf_path: str,
+    page_number: int,
+    dpi: int = 200,
+    max_width: int = 800,
+    output_format: str = "jpeg",
+    jpeg_quality: int = 85,
+    clip: Optional[ClipBox] = None,
+) -> Optional[bytes]:
+    """[S22] 렌더링 캐시 조회 → 없으면 extract_page_as_image로 렌더링 후 저장
+
+    [S23] Config.EMAIL_PREVIEW_BUDGET_KB가 있으면 바이트 예산 인코딩
+    (inline 이미지는 수신자마다 복제되므로 1KB 절감 = 수신자 수 × 1KB)
+    """
+    budget_kb = Config.EMAIL_PREVIEW_BUDGET_KB
+    budget_bytes = int(budget_kb * 1024) if budget_kb else None
+    cache = get_render_cache()
+    key = None
+    if cache is not None:
+        try:
+            key = RenderCache.make_key(
+                pdf_digest(pdf_path), page_number, dpi, max_width, output_format, jpeg_quality,
+                budget_bytes=budget_bytes, clip=clip,
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                logger.info(
+                    f"✅ PDF 페이지 {page_number + 1} 이미지 렌더링 캐시 사용: {len(cached):,} bytes"
+                )
+                return cached
+        except Exception as e:
+            logger.warning(f"렌더링 캐시 조회 실패 (직접 렌더링): {e}")
+            key = None
+
+    img_bytes = extract_page_as_image(
+        pdf_path, page_number=page_number, dpi=dpi, max_width=max_width,
+        output_format=output_format, jpeg_quality=jpeg_quality,
+        budget_bytes=budget_bytes, clip=clip,
+    )
+
+    if img_bytes and key is not None:
+        try:
+            cache.put(key, img_bytes)
+        except Exception as e:
+            logger.warning(f"렌더링 캐시 저장 실패 (무시): {e}")
+    return img_bytes
+
+
 def extract_toc_page_for_email(pdf_path: str) -> Optional[bytes]:
     """이메일용 ITFIND PDF 목차 페이지 추출 (page 3, JPEG).
 
@@ -153,7 +480,7 @@ def extract_toc_page_for_email(pdf_path: str) -> Optional[bytes]:
         JPEG 이미지 바이트 (실패 시 PNG fallback) 또는 None
     """
     # ITFIND 목차는 보통 page 3 (index 2)
-    return extract_page_as_image(
+    return _extract_for_email(
         pdf_path, page_number=2, dpi=200, max_width=800,
         output_format="jpeg", jpeg_quality=85,
     )
@@ -162,13 +489,23 @@ def extract_toc_page_for_email(pdf_path: str) -> Optional[bytes]:
 def extract_first_page_for_email(pdf_path: str) -> Optional[bytes]:
     """이메일용 전자신문 PDF 1페이지 추출 (JPEG).
 
+    [S23] Config.EMAIL_FIRST_PAGE_CLIP이 있으면 그 영역(예: 상단 헤드라인)만
+    EMAIL_FIRST_PAGE_CLIP_DPI / EMAIL_FIRST_PAGE_CLIP_MAX_WIDTH로 렌더링한다.
+
     Args:
         pdf_path: PDF 파일 경로
 
     Returns:
         JPEG 이미지 바이트 (실패 시 PNG fallback) 또는 None
     """
-    return extract_page_as_image(
+    clip = Config.EMAIL_FIRST_PAGE_CLIP
+    if clip:
+        return _extract_for_email(
+            pdf_path, page_number=0,
+            dpi=Config.EMAIL_FIRST_PAGE_CLIP_DPI, max_width=Config.EMAIL_FIRST_PAGE_CLIP_MAX_WIDTH,
+            output_format="jpeg", jpeg_quality=85, clip=tuple(clip),
+        )
+    return _extract_for_email(
         pdf_path, page_number=0, dpi=200, max_width=800,
         output_format="jpeg", jpeg_quality=85,
     )
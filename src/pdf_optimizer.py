@@ -0,0 +1,166 @@
+"""
+첨부 PDF 크기 최적화 모듈
+
+[S19] 처리된 신문 PDF는 수신자 수만큼 곱해져 전송되므로 첨부 1MB가 발송 전체에서는
+수신자 수 × 1MB가 된다. process_pdf와 send_emails 사이에서 PDF를 바이트 예산 안으로 다시 압축한다.
+
+단계별 시도 (PDF_OPTIMIZE_STEPS의 (임계 DPI, 목표 DPI, JPEG 품질) 순서, 매번 원본에서 시작):
+1. 임계 DPI를 넘는 이미지를 목표 DPI로 다운샘플 + JPEG 재압축 (Document.rewrite_images)
+2. 폰트 서브셋 (Document.subset_fonts)
+3. garbage=4(참조 끊긴 객체 제거, 동일 객체·스트림 병합) + deflate 저장
+
+원본이 이미 예산 이하이면 1단계(이미지 재압축)는 하지 않고 2·3단계 무손실 정리만 한다.
+[S18] PyMuPDF 저장 엔진이 이미 폰트 서브셋 + garbage/deflate로 저장한 PDF(compacted=True)는
+무손실 정리도 같은 결과이므로 건너뛴다.
+
+결과가 예산 이하이고 원본보다 작으며 검증(다시 열어 페이지 수·페이지 크기 비교)을 통과하면
+최적화본을 쓰고, 어느 단계도 조건을 만족하지 못하면 원본을 그대로 쓴다.
+"""
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+from .config import Config
+from . import pdf_ad_classifier
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OptimizationResult:
+    """첨부 최적화 결과"""
+    path: str  # 첨부할 PDF 경로 (최적화본 또는 원본)
+    original_bytes: int
+    optimized_bytes: int  # 첨부할 PDF 크기 (원본을 쓰면 original_bytes와 같음)
+    duration_ms: float
+    optimized: bool
+    step: Optional[Tuple[int, int, int]] = None  # 채택한 (임계 DPI, 목표 DPI, JPEG 품질), 무손실 정리는 None
+    reason: str = ""
+
+    @property
+    def saved_ratio(self) -> float:
+        if not self.original_bytes:
+            return 0.0
+        return 1.0 - self.optimized_bytes / self.original_bytes
+
+
+def _page_geometry(doc) -> list:
+    return [(round(page.rect.width, 1), round(page.rect.height, 1)) for page in doc]
+
+
+def _validate(path: str, expected_geometry: list) -> bool:
+    """최적화본을 다시 열어 페이지 수·페이지 크기가 원본과 같은지 확인 (본문 텍스트는 추출하지 않음)"""
+    try:
+        with pdf_ad_classifier.fitz.open(path) as doc:
+            return not doc.needs_pass and _page_geometry(doc) == expected_geometry
+    except Exception as e:
+        logger.warning(f"최적화 PDF 검증 실패: {e}")
+        return False
+
+
+def _rewrite(pdf_path: str, output_path: str, step: Optional[Tuple[int, int, int]]) -> list:
+    """원본을 열어 이미지 재압축(step이 None이면 생략) + 폰트 서브셋 후 garbage collection 저장
+
+    Returns:
+        원본 페이지 크기 목록 (검증 기준, 같은 문서에서 읽어 원본을 따로 열지 않음)
+    """
+    with pdf_ad_classifier.fitz.open(pdf_path) as doc:
+        geometry = _page_geometry(doc)
+        if step is not None:
+            threshold, dpi, quality = step
+            doc.rewrite_images(dpi_threshold=threshold, dpi_target=dpi, quality=quality)
+        try:
+            doc.subset_fonts()
+        except Exception as e:
+            logger.warning(f"폰트 서브셋 실패 (건너뜀): {e}")
+        doc.save(output_path, garbage=4, deflate=True, deflate_images=True, deflate_fonts=True, use_objstms=1)
+    return geometry
+
+
+def optimize_pdf(
+    pdf_path: str,
+    budget_bytes: Optional[int] = None,
+    steps: Optional[Sequence[Tuple[int, int, int]]] = None,
+    output_path: Optional[str] = None,
+    compacted: bool = False,
+) -> OptimizationResult:
+    """
+    PDF를 바이트 예산 안으로 재압축
+
+    Args:
+        pdf_path: 처리된 PDF 경로
+        budget_bytes: 목표 크기 (None이면 Config.PDF_OPTIMIZE_BUDGET_MB)
+        steps: (임계 DPI, 목표 DPI, JPEG 품질) 시도 순서 (None이면 Config.PDF_OPTIMIZE_STEPS)
+        output_path: 최적화본 경로 (None이면 "파일명_optimized.pdf")
+        compacted: [S18] PyMuPDF 저장 엔진이 이미 무손실 정리해 저장한 PDF인지 (예산 이내면 그대로 사용)
+
+    Returns:
+        OptimizationResult — 실패해도 예외 없이 원본 경로를 담아 반환
+    """
+    started = time.perf_counter()
+    original_bytes = os.path.getsize(pdf_path)
+    if budget_bytes is None:
+        budget_bytes = int(Config.PDF_OPTIMIZE_BUDGET_MB * 1024 * 1024)
+    steps = tuple(steps if steps is not None else Config.PDF_OPTIMIZE_STEPS)
+
+    def _original(reason: str) -> OptimizationResult:
+        return OptimizationResult(
+            path=pdf_path,
+            original_bytes=original_bytes,
+            optimized_bytes=original_bytes,
+            duration_ms=(time.perf_counter() - started) * 1000,
+            optimized=False,
+            reason=reason,
+        )
+
+    if not pdf_ad_classifier.PYMUPDF_AVAILABLE:
+        return _original("PyMuPDF 없음")
+
+    if original_bytes <= budget_bytes and compacted:
+        return _original("예산 이내 (이미 무손실 정리됨)")
+
+    if output_path is None:
+        name, ext = os.path.splitext(pdf_path)
+        output_path = f"{name}_optimized{ext}"
+
+    # 이미 예산 안이면 화질을 건드리지 않고 무손실 정리만
+    attempts = [None] if original_bytes <= budget_bytes else list(steps)
+
+    reason = "최적화 단계 없음"
+    for step in attempts:
+        label = "무손실" if step is None else f"{step[1]}dpi/q{step[2]}"
+        try:
+            geometry = _rewrite(pdf_path, output_path, step)
+        except Exception as e:
+            reason = f"재압축 실패 ({label}): {e}"
+            logger.warning(reason)
+            continue
+
+        size = os.path.getsize(output_path)
+        if not _validate(output_path, geometry):
+            reason = f"검증 실패 ({label})"
+            continue
+        if size >= original_bytes:
+            reason = f"원본보다 작아지지 않음 ({label}: {size:,} bytes)"
+            continue
+        if size > budget_bytes:
+            reason = f"예산 초과 ({label}: {size:,} > {budget_bytes:,} bytes)"
+            continue
+
+        return OptimizationResult(
+            path=output_path,
+            original_bytes=original_bytes,
+            optimized_bytes=size,
+            duration_ms=(time.perf_counter() - started) * 1000,
+            optimized=True,
+            step=step,
+        )
+
+    if os.path.exists(output_path):
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+    return _original(reason)
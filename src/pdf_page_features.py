@@ -0,0 +1,185 @@
+"""
+광고 페이지 레이아웃 특성 추출 및 벡터 점수 모듈
+
+[S15] 전면 광고는 대부분 큰 래스터 이미지 1장 + 적은 텍스트로 구성된다.
+페이지별 문자열 규칙(텍스트 길이, 키워드 횟수)만으로는 문구가 조금 많은 이미지 광고를 놓치므로,
+PyMuPDF get_image_info / get_text("dict")에서 레이아웃 특성을 뽑아 (페이지 × 특성) NumPy 행렬을 만들고
+문서 전체를 한 번의 벡터 연산으로 점수화한다.
+
+특성 (열 순서):
+- image_ratio     : 이미지가 덮는 페이지 면적 비율 (0~1)
+- text_blocks     : 텍스트 블록 수
+- font_spread     : 글자 크기 최댓값 - 최솟값 (pt)
+- text_density    : 1000pt²당 글자 수
+- text_chars      : 공백 제외 앞뒤를 다듬은 텍스트 길이
+- strong_keywords : 강한 광고 표기(전면광고, Advertisement, advertorial) 출현 수
+- weak_keywords   : 약한 광고 표기("광고", "AD") 출현 수
+
+점수는 기존 규칙(텍스트 길이·키워드)을 지시 변수로 포함하므로 기존에 광고로 판정되던 페이지는
+그대로 광고로 판정되고, 이미지 면적·레이아웃 점수가 추가로 이미지 광고를 잡아낸다.
+"""
+import logging
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import pdf_ad_classifier
+from .utils.keyword_matcher import compile_keywords
+
+logger = logging.getLogger(__name__)
+
+# NumPy import with graceful degradation
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    logger.warning("NumPy not available. 벡터 점수 대신 텍스트 규칙으로 광고를 판정합니다.")
+
+FEATURE_NAMES = (
+    "image_ratio",
+    "text_blocks",
+    "font_spread",
+    "text_density",
+    "text_chars",
+    "strong_keywords",
+    "weak_keywords",
+)
+IMAGE_RATIO, TEXT_BLOCKS, FONT_SPREAD, TEXT_DENSITY, TEXT_CHARS, STRONG_KEYWORDS, WEAK_KEYWORDS = range(
+    len(FEATURE_NAMES)
+)
+
+# PDFProcessor._contains_ad_keywords와 같은 분류
+STRONG_AD_KEYWORDS = ("전면광고", "Advertisement", "advertorial")
+WEAK_AD_KEYWORDS = ("광고", "AD")
+
+
+def page_features(page: "pdf_ad_classifier.fitz.Page", keywords: Sequence[str]) -> Tuple[float, ...]:
+    """페이지 1개의 특성 벡터 (FEATURE_NAMES 순서)
+
+    프로세스 풀 워커에서도 실행되므로 모듈 최상위 함수로 둔다.
+    """
+    page_area = page.rect.get_area() or 1.0
+
+    covered = sum(
+        pdf_ad_classifier.fitz.Rect(info["bbox"]).intersect(page.rect).get_area()
+        for info in page.get_image_info()
+    )
+    image_ratio = min(1.0, covered / page_area)
+
+    blocks = 0
+    sizes: List[float] = []
+    lines: List[str] = []
+    for block in page.get_text("dict")["blocks"]:
+        if block.get("type") != 0:
+            continue
+        blocks += 1
+        for line in block["lines"]:
+            lines.append("".join(span["text"] for span in line["spans"]))
+            sizes.extend(span["size"] for span in line["spans"] if span["text"].strip())
+
+    text = "\n".join(lines)
+    text_chars = len(text.strip())
+    font_spread = (max(sizes) - min(sizes)) if sizes else 0.0
+
+    counts = compile_keywords(tuple(keywords)).counts(text)
+    strong = sum(counts.get(k, 0) for k in STRONG_AD_KEYWORDS)
+    weak = max((counts.get(k, 0) for k in WEAK_AD_KEYWORDS if k in counts), default=0)
+
+    return (
+        image_ratio,
+        float(blocks),
+        font_spread,
+        text_chars / (page_area / 1000.0),
+        float(text_chars),
+        float(strong),
+        float(weak),
+    )
+
+
+def build_feature_matrix(
+    pdf_path: str,
+    page_indices: Iterable[int],
+    keywords: Sequence[str],
+    workers: int = 1,
+    min_parallel_pages: int = 8,
+    doc: Optional["pdf_ad_classifier.fitz.Document"] = None,
+) -> Tuple[List[int], "np.ndarray"]:
+    """
+    문서의 (페이지 × 특성) 행렬 생성 (doc: 이미 연 문서, 순차 분석 시 다시 열지 않음)
+
+    Returns:
+        (행 순서의 페이지 번호, float64 행렬) — 분석에 실패한 페이지는 제외
+
+    Raises:
+        RuntimeError: NumPy 또는 PyMuPDF가 설치되어 있지 않은 경우
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy not available")
+
+    rows = pdf_ad_classifier.map_pages(
+        pdf_path,
+        page_indices,
+        partial(page_features, keywords=tuple(keywords)),
+        workers=workers,
+        min_parallel_pages=min_parallel_pages,
+        doc=doc,
+    )
+    pages = sorted(page_num for page_num, row in rows.items() if row is not None)
+    matrix = np.array([rows[p] for p in pages], dtype=np.float64).reshape(len(pages), len(FEATURE_NAMES))
+    return pages, matrix
+
+
+def score_pages(matrix: "np.ndarray", config) -> "np.ndarray":
+    """
+    광고 점수 (행마다 1개, AD_SCORE_THRESHOLD 이상이면 광고)
+
+    - 기존 규칙: 텍스트 길이 < AD_TEXT_LENGTH_THRESHOLD, 강한 키워드 1회 이상,
+      약한 키워드 > AD_KEYWORD_COUNT_THRESHOLD → 각각 1.0
+    - 이미지 면적 × 텍스트 희소도 × AD_SCORE_IMAGE_WEIGHT
+    - 블록 수가 적고 글자 크기 차이가 큰 레이아웃(헤드카피형) × AD_SCORE_LAYOUT_WEIGHT
+    """
+    text_chars = matrix[:, TEXT_CHARS]
+    sparse = np.clip(1.0 - matrix[:, TEXT_DENSITY] / config.AD_DENSE_TEXT_DENSITY, 0.0, 1.0)
+    display = np.clip(matrix[:, FONT_SPREAD] / config.AD_DISPLAY_FONT_SPREAD, 0.0, 1.0)
+
+    score = (
+        (text_chars < config.AD_TEXT_LENGTH_THRESHOLD).astype(np.float64)
+        + (matrix[:, STRONG_KEYWORDS] > 0)
+        + (matrix[:, WEAK_KEYWORDS] > config.AD_KEYWORD_COUNT_THRESHOLD)
+        + config.AD_SCORE_IMAGE_WEIGHT * matrix[:, IMAGE_RATIO] * sparse
+        + config.AD_SCORE_LAYOUT_WEIGHT * (matrix[:, TEXT_BLOCKS] <= config.AD_LAYOUT_MAX_BLOCKS) * display
+    )
+    return score
+
+
+def classify_pages(
+    pdf_path: str,
+    page_indices: Iterable[int],
+    config,
+    workers: int = 1,
+    min_parallel_pages: int = 8,
+    doc: Optional["pdf_ad_classifier.fitz.Document"] = None,
+) -> Dict[int, float]:
+    """
+    문서 전체를 한 번의 벡터 연산으로 점수화
+
+    Returns:
+        {페이지 번호: 점수} — 분석에 실패한 페이지는 제외
+    """
+    pages, matrix = build_feature_matrix(
+        pdf_path, page_indices, config.AD_KEYWORDS, workers, min_parallel_pages, doc=doc
+    )
+    if not pages:
+        return {}
+    scores = score_pages(matrix, config)
+    if logger.isEnabledFor(logging.DEBUG):
+        for page_num, row in zip(pages, matrix):
+            features = ", ".join(f"{n}={v:.2f}" for n, v in zip(FEATURE_NAMES, row))
+            logger.debug(f"[S15] 페이지 {page_num + 1} 특성: {features}")
+    return dict(zip(pages, scores.tolist()))
+
+
+def ad_pages_from_scores(scores: Dict[int, float], threshold: float) -> List[int]:
+    """점수 → 광고 페이지 목록"""
+    return sorted(page_num for page_num, score in scores.items() if score >= threshold)
+
@@ -1,34 +1,77 @@
 """
 PDF 처리 모듈
 광고 페이지 제거 및 PDF 최적화
+
+[S13] 페이지 텍스트 추출은 PDF_CLASSIFIER_ENGINE에 따라 PyMuPDF(프로세스 풀) 또는 pypdf로 수행한다.
+[S14] 전체 텍스트 추출 전에 저비용 신호로 판정 가능한 페이지를 먼저 거른다 (_cascade_classify).
+[S15] 남은 페이지는 레이아웃 특성 행렬의 벡터 점수로 판정한다 (NumPy 미설치 시 텍스트 규칙).
+[S16] 페이지 내용 지문으로 이전 판정을 재사용한다 (ad_page_cache).
+[S17] 광고 키워드는 컴파일된 다중 키워드 매처로 한 번에 센다 (utils.keyword_matcher).
+[S18] 광고 제거 결과는 PDF_WRITER_ENGINE에 따라 PyMuPDF select() + garbage collection 또는 pypdf로 저장한다.
+[S20] 문서 세션이 등록되어 있으면 지문·단계별 판정·특성 추출·저장이 세션의 PyMuPDF 문서 1개를 공유하고,
+pypdf 리더는 pypdf 텍스트 추출·저장 경로를 탈 때만 만든다.
 """
 import os
 import logging
-from typing import List, Dict
+import time
+from contextlib import nullcontext
+from typing import List, Dict, Iterable, Optional, Tuple
 from datetime import datetime
 from pypdf import PdfReader, PdfWriter
 
 from .config import Config
+from . import pdf_ad_classifier, pdf_page_features
+from .ad_page_cache import AdPageVerdictCache, fingerprint_pages
+from .utils.keyword_matcher import compile_keywords
+from .pdf_session import get_session
 
 logger = logging.getLogger(__name__)
 
 
+class _LazyPdfReader:
+    """[S20] pages에 처음 접근할 때 pypdf PdfReader 생성 (pypdf 경로를 타지 않으면 파싱 생략)"""
+
+    def __init__(self, pdf_path: str, session=None):
+        self._pdf_path = pdf_path
+        self._session = session
+        self._reader: Optional[PdfReader] = None
+
+    @property
+    def pages(self):
+        if self._reader is None:
+            self._reader = self._session.reader() if self._session is not None else PdfReader(self._pdf_path)
+        return self._reader.pages
+
+
 class PDFProcessor:
     """PDF 광고 제거 및 처리"""
 
     # PDF 파일 최대 크기 (바이트): 50MB
     MAX_PDF_SIZE = 50 * 1024 * 1024
 
-    def __init__(self):
+    def __init__(self, verdict_cache_backend=None):
+        """
+        Args:
+            verdict_cache_backend: [S16] 광고 판정 캐시 StorageBackend
+                (None이면 프로세스 메모리 캐시만 사용 — 운영 진입점만 스토리지를 넘겨 판정을 기록)
+        """
         self.config = Config
-
-    def remove_ads(self, pdf_path: str, page_info: List[Dict[str, str]] = None) -> str:
+        self.verdict_cache_backend = verdict_cache_backend
+        # [S14] 마지막 분석의 단계별 판정 수
+        self.cascade_stats: Dict[str, int] = {}
+        # [S16] 마지막 분석의 판정 캐시 적중·미스 수
+        self.verdict_cache_stats: Dict[str, int] = {}
+
+    def remove_ads(
+        self, pdf_path: str, page_info: List[Dict[str, str]] = None, writer: Optional[str] = None
+    ) -> str:
         """
         PDF에서 광고 페이지 제거
 
         Args:
             pdf_path: 원본 PDF 파일 경로
             page_info: 페이지 정보 리스트 (광고 페이지 식별용)
+            writer: 저장 엔진 "pymupdf" 또는 "pypdf" (None이면 Config.PDF_WRITER_ENGINE)
 
         Returns:
             처리된 PDF 파일 경로
@@ -49,13 +92,15 @@ class PDFProcessor:
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            # PDF 읽기
-            reader = PdfReader(pdf_path)
-            total_pages = len(reader.pages)
+            # PDF 읽기 ([S20] 등록된 문서 세션이 있으면 세션의 PyMuPDF 문서를 모든 단계가 공유)
+            session = get_session(pdf_path)
+            doc = session.doc if session is not None and pdf_ad_classifier.PYMUPDF_AVAILABLE else None
+            reader = _LazyPdfReader(pdf_path, session)
+            total_pages = len(doc) if doc is not None else len(reader.pages)
             logger.info(f"총 페이지 수: {total_pages}")
 
             # 광고 페이지 식별
-            ad_pages = self._identify_ad_pages(reader, page_info)
+            ad_pages = self._identify_ad_pages(reader, page_info, pdf_path=pdf_path, doc=doc)
 
             if not ad_pages:
                 logger.info("광고 페이지가 감지되지 않았습니다. 원본 PDF 반환")
@@ -63,17 +108,11 @@ class PDFProcessor:
 
             logger.info(f"광고 페이지 감지: {ad_pages}")
 
-            # 새 PDF 작성 (광고 페이지 제외)
-            writer = PdfWriter()
-
-            for page_num in range(total_pages):
-                if page_num not in ad_pages:
-                    writer.add_page(reader.pages[page_num])
-
-            # 처리된 PDF 저장
+            # 처리된 PDF 저장 (광고 페이지 제외)
             output_path = self._generate_output_path(pdf_path)
-            with open(output_path, "wb") as output_file:
-                writer.write(output_file)
+            ad_page_set = set(ad_pages)
+            keep_pages = [page_num for page_num in range(total_pages) if page_num not in ad_page_set]
+            self._write_pages(reader, pdf_path, keep_pages, output_path, writer, session=session)
 
             removed_count = len(ad_pages)
             final_pages = total_pages - removed_count
@@ -89,7 +128,8 @@ class PDFProcessor:
             return pdf_path
 
     def _identify_ad_pages(
-        self, reader: PdfReader, page_info: List[Dict[str, str]] = None
+        self, reader: PdfReader, page_info: List[Dict[str, str]] = None, pdf_path: Optional[str] = None,
+        doc=None,
     ) -> List[int]:
         """
         광고 페이지 식별
@@ -97,12 +137,14 @@ class PDFProcessor:
         Args:
             reader: PDF 리더 객체
             page_info: 웹 스크래핑에서 수집한 페이지 정보
+            pdf_path: PDF 파일 경로 ([S13] PyMuPDF 엔진용, 없으면 pypdf로 분석)
+            doc: [S20] 세션의 PyMuPDF 문서 (주어지면 단계마다 파일을 다시 열지 않음)
 
         Returns:
             광고 페이지 번호 리스트 (0-based index)
         """
         ad_pages = []
-        total_pages = len(reader.pages)
+        total_pages = len(doc) if doc is not None else len(reader.pages)
 
         # 방법 1: 웹에서 수집한 페이지 정보 활용
         if page_info:
@@ -116,58 +158,315 @@ class PDFProcessor:
                     except (ValueError, KeyError):
                         continue
 
-        # 방법 2: PDF 메타데이터 및 텍스트 분석
-        for page_num in range(total_pages):
-            if page_num in ad_pages:
-                continue  # 이미 광고로 식별된 경우 스킵
+        # 방법 2: PDF 텍스트 분석 (이미 광고로 식별된 페이지는 스킵)
+        candidates = [page_num for page_num in range(total_pages) if page_num not in ad_pages]
+
+        # [S16] 이전에 본 페이지(같은 광고 소재 등)는 저장된 판정 재사용
+        cache, fingerprints, verdicts = self._lookup_cached_verdicts(candidates, pdf_path, doc=doc)
+        candidates = [page_num for page_num in candidates if page_num not in verdicts]
+        cached_pages = set(verdicts)
+
+        # [S14] 저비용 신호로 판정되는 페이지는 전체 텍스트 추출 생략
+        settled_ads, remaining = self._cascade_classify(candidates, pdf_path, doc=doc)
+        for page_num in candidates:
+            if page_num not in remaining:
+                verdicts[page_num] = page_num in settled_ads
+
+        # [S15] 남은 페이지 전체를 특성 행렬 1회 연산으로 점수화 (불가 시 텍스트 규칙)
+        scored = self._score_ad_pages(remaining, pdf_path, doc=doc)
+        if scored is None:
+            scored = self._rule_verdicts(reader, remaining, pdf_path, doc=doc)
+        verdicts.update(scored)
+
+        if cache is not None:
+            cache.store({
+                fingerprints[page_num]: is_ad
+                for page_num, is_ad in verdicts.items()
+                if page_num not in cached_pages and page_num in fingerprints
+            })
+            self.verdict_cache_stats = dict(cache.stats)
+            logger.info(f"[S16] 광고 판정 캐시: {self.verdict_cache_stats}")
+
+        ad_pages.extend(page_num for page_num, is_ad in verdicts.items() if is_ad)
+        return sorted(set(ad_pages))  # 중복 제거 및 정렬
 
-            page = reader.pages[page_num]
+    def _lookup_cached_verdicts(
+        self, page_indices: List[int], pdf_path: Optional[str], doc=None
+    ) -> Tuple[Optional[AdPageVerdictCache], Dict[int, str], Dict[int, bool]]:
+        """[S16] 페이지 지문으로 저장된 판정 조회
 
-            # 페이지 텍스트 추출
-            try:
-                text = page.extract_text()
-                text_length = len(text.strip())
+        Returns:
+            (캐시 객체 또는 None, {페이지: 지문}, {페이지: 광고 여부} — 캐시 적중 페이지만)
+        """
+        self.verdict_cache_stats = {}
+        if (
+            not page_indices
+            or not pdf_path
+            or getattr(self.config, "AD_PAGE_CACHE_ENABLED", False) is not True
+            or not pdf_ad_classifier.PYMUPDF_AVAILABLE
+        ):
+            return None, {}, {}
+
+        try:
+            cache = AdPageVerdictCache(
+                self.config,
+                backend=self.verdict_cache_backend,
+                persistent=self.verdict_cache_backend is not None,
+            )
+            fingerprints = fingerprint_pages(pdf_path, page_indices, doc=doc)
+            return cache, fingerprints, cache.lookup(fingerprints)
+        except Exception as e:
+            logger.warning(f"광고 판정 캐시 사용 불가 — 전체 분석: {e}")
+            return None, {}, {}
+
+    def _rule_verdicts(
+        self, reader: PdfReader, page_indices: List[int], pdf_path: Optional[str], doc=None
+    ) -> Dict[int, bool]:
+        """텍스트 길이·키워드 규칙 판정 (분석 오류 페이지는 제외)"""
+        texts = self._extract_page_texts(reader, page_indices, pdf_path, doc=doc)
+        verdicts: Dict[int, bool] = {}
+
+        for page_num in page_indices:
+            text = texts.get(page_num)
+            if text is None:
+                continue  # 분석 오류 페이지는 유지
+
+            text_length = len(text.strip())
+
+            # 방법 1: 텍스트가 매우 짧은 페이지는 광고 (거의 빈 페이지)
+            if text_length < self.config.AD_TEXT_LENGTH_THRESHOLD:
+                logger.debug(f"페이지 {page_num + 1}: 텍스트 길이 {text_length}자 - 광고로 판단")
+                verdicts[page_num] = True
+                continue
+
+            # 방법 2: 광고 키워드 검색
+            verdicts[page_num] = self._contains_ad_keywords(text)
+
+        return verdicts
+
+    def _cascade_classify(
+        self, page_indices: List[int], pdf_path: Optional[str], doc=None
+    ) -> Tuple[List[int], List[int]]:
+        """[S14] 저비용 신호부터 차례로 적용하는 단계별 광고 판정
+
+        1단계 (구조): content stream 크기, 이미지 면적 비율
+            - 스트림이 거의 없고 이미지·Form XObject도 없음 → 빈 페이지 (광고)
+            - 스트림이 작고 이미지가 페이지 대부분을 덮음 → 전면 이미지 광고
+        2단계 (상단 띠 텍스트, 스트림이 큰 페이지만)
+            - 광고 키워드 검출 → 광고 (부분 텍스트에서 검출되면 전체 텍스트에서도 검출됨)
+            - 텍스트가 AD_TEXT_LENGTH_THRESHOLD 이상 → 기사 면 (전체 텍스트 길이 규칙에 걸릴 수 없음)
+        3단계: 남은 페이지만 전체 텍스트 추출 + 길이·키워드 규칙 (호출자가 수행)
+
+        2단계의 기사 면 판정은 본문 중간에만 광고 키워드가 반복되는 페이지를 검사하지 않는다.
+
+        Returns:
+            (광고로 판정된 페이지, 전체 텍스트 분석이 필요한 페이지)
+        """
+        self.cascade_stats = {"pages": len(page_indices), "tier1_ad": 0, "tier2_ad": 0,
+                              "tier2_article": 0, "tier3": len(page_indices)}
+        if (
+            not page_indices
+            or not pdf_path
+            or getattr(self.config, "AD_CASCADE_ENABLED", False) is not True
+            or getattr(self.config, "PDF_CLASSIFIER_ENGINE", "pypdf") != "pymupdf"
+            or not pdf_ad_classifier.PYMUPDF_AVAILABLE
+        ):
+            return [], page_indices
+
+        ads: List[int] = []
+        remaining: List[int] = []
+        stats = self.cascade_stats
+        try:
+            opened = nullcontext(doc) if doc is not None else pdf_ad_classifier.fitz.open(pdf_path)
+            with opened as doc:
+                for page_num in page_indices:
+                    page = doc[page_num]
+
+                    # 1단계: 구조 신호
+                    stream_bytes = pdf_ad_classifier.content_stream_bytes(doc, page)
+                    if stream_bytes < self.config.AD_CASCADE_DENSE_STREAM_BYTES:
+                        if (
+                            stream_bytes < self.config.AD_CASCADE_BLANK_STREAM_BYTES
+                            and not page.get_images()
+                            and not page.get_xobjects()
+                        ):
+                            logger.debug(f"페이지 {page_num + 1}: 빈 페이지 ({stream_bytes} bytes) - 광고로 판단")
+                            stats["tier1_ad"] += 1
+                            ads.append(page_num)
+                            continue
+                        coverage = pdf_ad_classifier.image_coverage(page)
+                        if coverage >= self.config.AD_IMAGE_COVERAGE_THRESHOLD:
+                            logger.debug(f"페이지 {page_num + 1}: 이미지 면적 {coverage:.0%} - 광고로 판단")
+                            stats["tier1_ad"] += 1
+                            ads.append(page_num)
+                            continue
+                        remaining.append(page_num)
+                        continue
+
+                    # 2단계: 상단 띠 텍스트
+                    band = pdf_ad_classifier.bounded_text(page, self.config.AD_CASCADE_BAND_RATIO)
+                    if self._contains_ad_keywords(band):
+                        stats["tier2_ad"] += 1
+                        ads.append(page_num)
+                    elif len(band.strip()) >= self.config.AD_TEXT_LENGTH_THRESHOLD:
+                        stats["tier2_article"] += 1
+                    else:
+                        remaining.append(page_num)
+        except Exception as e:
+            logger.warning(f"단계별 광고 판정 실패 — 전체 텍스트 분석으로 대체: {e}")
+            self.cascade_stats["tier3"] = len(page_indices)
+            return [], page_indices
+
+        stats["tier3"] = len(remaining)
+        saved = len(page_indices) - len(remaining)
+        logger.info(
+            f"[S14] 단계별 광고 판정: {len(page_indices)}페이지 중 "
+            f"1단계 광고 {stats['tier1_ad']}, 2단계 광고 {stats['tier2_ad']}, "
+            f"2단계 기사 {stats['tier2_article']}, 전체 추출 {stats['tier3']} "
+            f"(전체 텍스트 추출 {saved / len(page_indices):.0%} 절감)"
+        )
+        return ads, remaining
+
+    def _score_ad_pages(
+        self, page_indices: List[int], pdf_path: Optional[str], doc=None
+    ) -> Optional[Dict[int, bool]]:
+        """[S15] 레이아웃 특성 벡터 점수로 광고 페이지 판정 ({페이지: 광고 여부}, 분석 오류 페이지는 제외)
+
+        AD_SCORER가 "vector"이고 PyMuPDF·NumPy를 쓸 수 있을 때만 동작한다.
+        사용할 수 없거나 실패하면 None을 반환하고 호출자가 텍스트 규칙으로 판정한다.
+        """
+        if (
+            not pdf_path
+            or getattr(self.config, "AD_SCORER", "rules") != "vector"
+            or getattr(self.config, "PDF_CLASSIFIER_ENGINE", "pypdf") != "pymupdf"
+            or not pdf_ad_classifier.PYMUPDF_AVAILABLE
+            or not pdf_page_features.NUMPY_AVAILABLE
+        ):
+            return None
+        if not page_indices:
+            return {}
+
+        try:
+            scores = pdf_page_features.classify_pages(
+                pdf_path,
+                page_indices,
+                self.config,
+                workers=self.config.PDF_CLASSIFIER_WORKERS,
+                min_parallel_pages=self.config.PDF_CLASSIFIER_PARALLEL_MIN_PAGES,
+                doc=doc,
+            )
+        except Exception as e:
+            logger.warning(f"벡터 점수 판정 실패 — 텍스트 규칙으로 대체: {e}")
+            return None
 
-                # 방법 1: 텍스트가 매우 짧은 페이지는 광고 (거의 빈 페이지)
-                if text_length < self.config.AD_TEXT_LENGTH_THRESHOLD:
-                    logger.debug(f"페이지 {page_num + 1}: 텍스트 길이 {text_length}자 - 광고로 판단")
-                    ad_pages.append(page_num)
-                    continue
+        threshold = self.config.AD_SCORE_THRESHOLD
+        for page_num in pdf_page_features.ad_pages_from_scores(scores, threshold):
+            logger.debug(f"페이지 {page_num + 1}: 광고 점수 {scores[page_num]:.2f} - 광고로 판단")
+        return {page_num: score >= threshold for page_num, score in scores.items()}
 
-                # 방법 2: 광고 키워드 검색
-                if self._contains_ad_keywords(text):
-                    ad_pages.append(page_num)
-                    continue
+    def _extract_page_texts(
+        self, reader: PdfReader, page_indices: Iterable[int], pdf_path: Optional[str] = None, doc=None
+    ) -> Dict[int, Optional[str]]:
+        """[S13] 페이지별 텍스트 추출 (분석 오류 페이지는 None)
 
+        PDF_CLASSIFIER_ENGINE이 "pymupdf"이고 PyMuPDF를 쓸 수 있으면 MuPDF + 프로세스 풀,
+        그 외에는(또는 실패 시) 기존 pypdf 순차 추출을 사용한다.
+        """
+        page_indices = list(page_indices)
+        engine = getattr(self.config, "PDF_CLASSIFIER_ENGINE", "pypdf")
+
+        if engine == "pymupdf" and pdf_path and pdf_ad_classifier.PYMUPDF_AVAILABLE:
+            try:
+                return pdf_ad_classifier.extract_page_texts(
+                    pdf_path,
+                    page_indices,
+                    workers=self.config.PDF_CLASSIFIER_WORKERS,
+                    min_parallel_pages=self.config.PDF_CLASSIFIER_PARALLEL_MIN_PAGES,
+                    doc=doc,
+                )
+            except Exception as e:
+                logger.warning(f"PyMuPDF 텍스트 추출 실패 — pypdf로 대체: {e}")
+
+        texts: Dict[int, Optional[str]] = {}
+        for page_num in page_indices:
+            try:
+                texts[page_num] = reader.pages[page_num].extract_text()
             except Exception as e:
                 logger.warning(f"페이지 {page_num + 1} 분석 중 오류: {e}")
-                continue
+                texts[page_num] = None
+        return texts
 
-        return sorted(set(ad_pages))  # 중복 제거 및 정렬
+    def _write_pages(
+        self, reader: PdfReader, pdf_path: str, keep_pages: List[int], output_path: str,
+        writer: Optional[str] = None, session=None,
+    ) -> str:
+        """[S18] 남길 페이지만 output_path에 저장
+
+        - pymupdf: 원본 문서에서 select()로 페이지를 제거하고 폰트를 서브셋한 뒤 garbage collection
+          (참조 끊긴 리소스 제거 + 동일 객체·스트림 병합)과 deflate로 저장.
+          [S20] 세션이 있으면 세션 문서를 떼어(take_doc) 그대로 select() — 파일을 다시 열지 않음
+        - pypdf: 남길 페이지를 새 PdfWriter에 복사해 저장 (기존 방식)
+
+        PyMuPDF가 없거나 저장에 실패하면 pypdf로 대체한다.
+
+        Returns:
+            실제 사용한 저장 엔진
+        """
+        engine = (writer or getattr(self.config, "PDF_WRITER_ENGINE", "pypdf") or "pypdf").lower()
+
+        if engine == "pymupdf" and pdf_ad_classifier.PYMUPDF_AVAILABLE:
+            started = time.perf_counter()
+            try:
+                doc = session.take_doc() if session is not None else pdf_ad_classifier.fitz.open(pdf_path)
+                with doc:
+                    doc.select(keep_pages)
+                    # [S19] 첨부 최적화의 무손실 정리와 같은 결과가 되도록 폰트 서브셋까지 여기서 수행
+                    try:
+                        doc.subset_fonts()
+                    except Exception as e:
+                        logger.warning(f"폰트 서브셋 실패 (건너뜀): {e}")
+                    doc.save(
+                        output_path,
+                        garbage=self.config.PDF_WRITER_GARBAGE_LEVEL,
+                        deflate=True,
+                        deflate_images=True,
+                        deflate_fonts=True,
+                        use_objstms=1,
+                    )
+                logger.info(
+                    f"[S18] PyMuPDF 저장: {len(keep_pages)}페이지, "
+                    f"{os.path.getsize(output_path) / (1024 * 1024):.2f} MB, "
+                    f"{(time.perf_counter() - started) * 1000:.0f} ms"
+                )
+                return "pymupdf"
+            except Exception as e:
+                logger.warning(f"PyMuPDF 저장 실패 — pypdf로 대체: {e}")
+
+        pdf_writer = PdfWriter()
+        for page_num in keep_pages:
+            pdf_writer.add_page(reader.pages[page_num])
+        with open(output_path, "wb") as output_file:
+            pdf_writer.write(output_file)
+        return "pypdf"
 
     def _contains_ad_keywords(self, text: str) -> bool:
-        """텍스트에 광고 키워드가 포함되어 있는지 확인"""
+        """텍스트에 광고 키워드가 포함되어 있는지 확인
+
+        [S17] 키워드별 in/count 대신 컴파일된 매처로 키워드별 횟수를 한 번에 구한다.
+        """
         if not text:
             return False
 
-        text_lower = text.lower()
-
-        # 광고 키워드 검색
-        for keyword in self.config.AD_KEYWORDS:
-            if keyword.lower() in text_lower:
-                # 오탐 방지: "광고" 키워드가 본문에 자연스럽게 나오는 경우 제외
-                # 예: "광고 산업", "광고 시장" 등
-                # 하지만 "전면광고", "Advertisement" 등은 광고 페이지일 가능성 높음
-                if keyword in ["전면광고", "Advertisement", "advertorial"]:
-                    return True
+        counts = compile_keywords(tuple(self.config.AD_KEYWORDS)).counts(text)
 
-                # "광고" 단독으로 나오거나 페이지 전체에서 비중이 높은 경우
-                if keyword == "광고" or keyword == "AD":
-                    keyword_count = text_lower.count(keyword.lower())
-                    if keyword_count > self.config.AD_KEYWORD_COUNT_THRESHOLD:
-                        return True
+        # "전면광고", "Advertisement" 등은 광고 페이지일 가능성 높음
+        if any(counts.get(keyword) for keyword in pdf_page_features.STRONG_AD_KEYWORDS):
+            return True
 
-        return False
+        # 오탐 방지: "광고" 키워드가 본문에 자연스럽게 나오는 경우 제외
+        # 예: "광고 산업", "광고 시장" 등 — 페이지 전체에서 비중이 높은 경우만 광고
+        threshold = self.config.AD_KEYWORD_COUNT_THRESHOLD
+        return any(counts.get(keyword, 0) > threshold for keyword in pdf_page_features.WEAK_AD_KEYWORDS)
 
     def _generate_output_path(self, original_path: str) -> str:
         """처리된 PDF 파일 경로 생성"""
@@ -180,19 +479,26 @@ class PDFProcessor:
         return os.path.join(dir_name, output_name)
 
 
-def process_pdf(pdf_path: str, page_info: List[Dict[str, str]] = None) -> str:
+def process_pdf(
+    pdf_path: str,
+    page_info: List[Dict[str, str]] = None,
+    writer: Optional[str] = None,
+    verdict_cache_backend=None,
+) -> str:
     """
     PDF 처리 메인 함수
 
     Args:
         pdf_path: 원본 PDF 파일 경로
         page_info: 페이지 정보 리스트
+        writer: 저장 엔진 "pymupdf" 또는 "pypdf" (None이면 Config.PDF_WRITER_ENGINE)
+        verdict_cache_backend: [S16] 광고 판정 캐시 StorageBackend (None이면 메모리 캐시만)
 
     Returns:
         처리된 PDF 파일 경로
     """
-    processor = PDFProcessor()
-    return processor.remove_ads(pdf_path, page_info)
+    processor = PDFProcessor(verdict_cache_backend=verdict_cache_backend)
+    return processor.remove_ads(pdf_path, page_info, writer=writer)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,280 @@
+"""
+PDF 문서 세션 모듈
+
+[S20] 한 번의 실행에서 같은 PDF를 단계마다 다시 읽고 파싱하던 것을 세션 1개로 공유한다.
+(예: 목요일 ITFIND PDF는 토픽 추출 → 메타데이터 저장 → 목차 렌더링 → base64 인코딩에서 4번 열림)
+
+- 원본 바이트는 처음 필요할 때 한 번만 읽는다 (이미 메모리에 있으면 data로 넘겨 읽기 생략)
+- PyMuPDF 문서·pypdf PdfReader는 한 번만 파싱한다
+- 페이지 텍스트와 이메일용 렌더링 결과는 세션에 캐시한다
+- 메타데이터 저장은 증분 저장(saveIncr) 후 파일 끝에 덧붙은 부분만 다시 읽는다
+
+세션은 경로별 레지스트리에 등록되며, 기존 함수(extract_page_as_image, remove_ads,
+토픽 추출 등)는 등록된 세션이 있을 때만 세션을 사용하고 없으면 기존처럼 파일을 직접 연다.
+파일이 세션 밖에서 바뀌면(크기·수정 시각 변경) 세션은 무효화된다.
+"""
+import io
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# PyMuPDF (fitz) import with graceful degradation
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class PDFSession:
+    """PDF 1개를 한 번만 읽고 파싱해 여러 단계에 공유"""
+
+    def __init__(self, path: str, data: Optional[bytes] = None):
+        """
+        Args:
+            path: PDF 파일 경로
+            data: 파일 내용 (이미 메모리에 있으면 전달해 다시 읽지 않음)
+        """
+        self.path = path
+        self._data = data
+        self._doc = None
+        self._reader = None
+        self._texts: Dict[int, str] = {}
+        self._renders: Dict[tuple, Optional[bytes]] = {}
+        self._lock = threading.RLock()
+        # 바이트 로딩은 렌더링(_lock 점유)과 별도 잠금 — 렌더링 중에도 첨부 바이트를 읽을 수 있게
+        self._data_lock = threading.Lock()
+        self._stamp = _file_stamp(path)
+        self.stats: Dict[str, int] = {"reads": 0, "parses": 0, "text_hits": 0, "render_hits": 0}
+
+    def is_current(self) -> bool:
+        """세션을 만든 뒤 파일이 바뀌지 않았는지"""
+        return self._stamp is not None and _file_stamp(self.path) == self._stamp
+
+    @property
+    def data(self) -> bytes:
+        """원본 바이트 (첫 호출 시 1회 읽기)"""
+        with self._data_lock:
+            if self._data is None:
+                with open(self.path, "rb") as f:
+                    self._data = f.read()
+                self.stats["reads"] += 1
+            return self._data
+
+    @property
+    def doc(self) -> "fitz.Document":
+        """PyMuPDF 문서 (첫 호출 시 1회 파싱)
+
+        Raises:
+            RuntimeError: PyMuPDF가 설치되어 있지 않은 경우
+        """
+        if not PYMUPDF_AVAILABLE:
+            raise RuntimeError("PyMuPDF not available")
+        with self._lock:
+            if self._doc is None:
+                # 증분 저장(saveIncr)이 가능하도록 파일 경로로 연다
+                self._doc = fitz.open(self.path)
+                self.stats["parses"] += 1
+            return self._doc
+
+    def take_doc(self) -> "fitz.Document":
+        """PyMuPDF 문서를 세션에서 떼어 반환 (select() 등 문서를 바꾸는 마지막 단계용)
+
+        반환된 문서는 호출자가 닫는다. 세션은 다음 doc 접근 시 파일을 다시 파싱한다.
+        """
+        with self._lock:
+            doc = self.doc
+            self._doc = None
+            return doc
+
+    def reader(self):
+        """pypdf PdfReader (세션 바이트에서 1회 파싱)"""
+        from pypdf import PdfReader
+
+        with self._lock:
+            if self._reader is None:
+                self._reader = PdfReader(io.BytesIO(self.data))
+                self.stats["parses"] += 1
+            return self._reader
+
+    @property
+    def page_count(self) -> int:
+        return len(self.doc)
+
+    def page_text(self, page_number: int) -> str:
+        """페이지 텍스트 (PyMuPDF get_text, 캐시)"""
+        with self._lock:
+            if page_number in self._texts:
+                self.stats["text_hits"] += 1
+            else:
+                self._texts[page_number] = self.doc[page_number].get_text()
+            return self._texts[page_number]
+
+    def full_text(self) -> str:
+        """전체 페이지 텍스트 이어붙이기"""
+        return "".join(self.page_text(n) for n in range(self.page_count))
+
+    def render(
+        self,
+        page_number: int,
+        dpi: int = 200,
+        max_width: int = 800,
+        output_format: str = "jpeg",
+        jpeg_quality: int = 85,
+        budget_bytes: Optional[int] = None,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> Optional[bytes]:
+        """이메일용 페이지 이미지 (pdf_image_extractor와 같은 규칙, 인자별 캐시)"""
+        from .pdf_image_extractor import render_page
+
+        key = (
+            page_number, dpi, max_width, (output_format or "jpeg").lower(), jpeg_quality,
+            budget_bytes, tuple(clip) if clip else None,
+        )
+        with self._lock:
+            if key in self._renders:
+                self.stats["render_hits"] += 1
+                return self._renders[key]
+            doc = self.doc
+            if page_number >= len(doc):
+                logger.warning(f"PDF에 {page_number + 1}페이지가 없습니다 (총 {len(doc)}페이지)")
+                result = None
+            else:
+                result = render_page(
+                    doc[page_number], page_number, dpi, max_width, output_format, jpeg_quality,
+                    budget_bytes=budget_bytes, clip=clip,
+                )
+            self._renders[key] = result
+            return result
+
+    def renditions(self, page_number: int, specs, clip=None) -> Dict[str, Optional[bytes]]:
+        """[S24] 페이지 1회 래스터화로 여러 출력 생성 (pdf_image_extractor.render_renditions)"""
+        from .pdf_image_extractor import render_renditions
+
+        with self._lock:
+            doc = self.doc
+            if page_number >= len(doc):
+                logger.warning(f"PDF에 {page_number + 1}페이지가 없습니다 (총 {len(doc)}페이지)")
+                return {spec.name: None for spec in specs}
+            return render_renditions(doc[page_number], page_number, specs, clip=clip)
+
+    def set_metadata(self, metadata: Dict[str, str]) -> None:
+        """메타데이터 교체 + 증분 저장 후 덧붙은 바이트만 읽어 세션 바이트 갱신"""
+        with self._lock:
+            before = self.data
+            doc = self.doc
+            doc.set_metadata(metadata)
+            doc.saveIncr()
+            with open(self.path, "rb") as f:
+                f.seek(len(before))
+                tail = f.read()
+            if tail and _file_stamp(self.path)[0] == len(before) + len(tail):
+                self._data = before + tail
+            else:
+                self._data = None  # 예상과 다르면 다음 접근 때 다시 읽기
+            self._reader = None
+            self._stamp = _file_stamp(self.path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._doc is not None:
+                try:
+                    self._doc.close()
+                except Exception:
+                    pass
+            self._doc = None
+            self._reader = None
+            self._data = None
+            self._texts.clear()
+            self._renders.clear()
+
+    def __enter__(self) -> "PDFSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# 경로별 세션 레지스트리
+_sessions: Dict[str, PDFSession] = {}
+_registry_lock = threading.Lock()
+
+
+def _key(path: str) -> str:
+    return os.path.realpath(path)
+
+
+def open_session(path: str, data: Optional[bytes] = None) -> PDFSession:
+    """경로의 세션 등록 (이미 있고 파일이 그대로면 기존 세션 반환)"""
+    key = _key(path)
+    with _registry_lock:
+        session = _sessions.get(key)
+        if session is not None and session.is_current():
+            return session
+        if session is not None:
+            session.close()
+        session = _sessions[key] = PDFSession(path, data=data)
+        return session
+
+
+def get_session(path: Optional[str]) -> Optional[PDFSession]:
+    """등록된 세션 (없거나 파일이 바뀌었으면 None)"""
+    if not path:
+        return None
+    key = _key(path)
+    with _registry_lock:
+        session = _sessions.get(key)
+        if session is None:
+            return None
+        if not session.is_current():
+            session.close()
+            del _sessions[key]
+            return None
+        return session
+
+
+def close_session(path: str) -> None:
+    with _registry_lock:
+        session = _sessions.pop(_key(path), None)
+    if session is not None:
+        session.close()
+
+
+def close_all() -> None:
+    """등록된 세션 모두 닫기 (실행 종료 시)"""
+    with _registry_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+@contextmanager
+def session_scope(path: str, data: Optional[bytes] = None) -> Iterator[PDFSession]:
+    """블록 안에서만 세션 등록"""
+    session = open_session(path, data=data)
+    try:
+        yield session
+    finally:
+        close_session(path)
+
+
+def read_pdf_bytes(path: str) -> bytes:
+    """등록된 세션이 있으면 세션 바이트, 없으면 파일 읽기"""
+    session = get_session(path)
+    if session is not None:
+        return session.data
+    with open(path, "rb") as f:
+        return f.read()
@@ -0,0 +1,177 @@
+"""
+미리보기 이미지 렌더링 캐시 모듈
+
+[S22] 같은 호의 1면·목차 미리보기는 test 모드 → opr 모드 연속 실행, --skip-idempotency 재시도,
+scripts/send_itfind_manual.py 재실행 때마다 처음부터 다시 래스터화된다.
+렌더링 결과를 (PDF sha256, 페이지, DPI, 최대 너비, 포맷, 품질) 키로 디스크에 저장해 두고
+같은 입력이면 렌더링 없이 바로 반환한다.
+
+- 키는 PDF 내용 해시 기반이므로 파일 경로·파일명이 달라도 같은 호면 재사용된다
+- 항목마다 파일 1개, 쓰기는 임시 파일 + os.replace (동시 실행에도 반쯤 쓴 파일을 읽지 않음)
+- 조회 시 수정 시각을 갱신하고, 전체 크기가 상한을 넘으면 수정 시각이 오래된 순(LRU)으로 삭제
+- 렌더링 규칙이 바뀌면 RENDER_CACHE_VERSION을 올려 이전 결과를 재사용하지 않는다
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+from .config import Config
+from .pdf_session import get_session
+
+logger = logging.getLogger(__name__)
+
+RENDER_CACHE_VERSION = 1
+
+# PDF 경로별 해시 메모 (realpath → ((크기, 수정 시각), sha256)) — 같은 실행에서 재해시 방지
+_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_digests_lock = threading.Lock()
+
+
+def pdf_digest(pdf_path: str) -> str:
+    """PDF 내용 sha256 (등록된 문서 세션이 있으면 세션 바이트 사용)
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+    """
+    st = os.stat(pdf_path)
+    stamp = (st.st_size, st.st_mtime_ns)
+    key = os.path.realpath(pdf_path)
+    with _digests_lock:
+        known = _digests.get(key)
+    if known is not None and known[0] == stamp:
+        return known[1]
+
+    session = get_session(pdf_path)
+    if session is not None:
+        digest = hashlib.sha256(session.data).hexdigest()
+    else:
+        with open(pdf_path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+
+    with _digests_lock:
+        _digests[key] = (stamp, digest)
+    return digest
+
+
+class RenderCache:
+    """렌더링 결과 디스크 캐시 (크기 상한 LRU)"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Args:
+            directory: 캐시 디렉터리 (없으면 생성)
+            max_bytes: 캐시 전체 크기 상한
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        digest: str,
+        page_number: int,
+        dpi: int,
+        max_width: int,
+        output_format: str,
+        jpeg_quality: int,
+        budget_bytes: Optional[int] = None,
+        clip: Optional[Sequence[float]] = None,
+    ) -> str:
+        fmt = (output_format or "jpeg").lower()
+        raw = f"v{RENDER_CACHE_VERSION}|{digest}|{page_number}|{dpi}|{max_width}|{fmt}|{jpeg_quality}"
+        if budget_bytes or clip:
+            clip_repr = ",".join(f"{v:.4f}" for v in clip) if clip else ""
+            raw += f"|{budget_bytes or 0}|{clip_repr}"
+        return hashlib.sha256(raw.encode("ascii")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.img")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.stats["misses"] += 1
+            return None
+        if not data:
+            self.stats["misses"] += 1
+            return None
+        try:
+            os.utime(path)  # LRU: 최근 사용 시각 갱신
+        except OSError:
+            pass
+        self.stats["hits"] += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.stats["stored"] += 1
+        self.evict()
+
+    def evict(self) -> int:
+        """전체 크기가 상한 이하가 될 때까지 오래 안 쓴 항목 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".img"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                total += st.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self.stats["evicted"] += removed
+        return removed
+
+
+def get_render_cache() -> Optional[RenderCache]:
+    """설정 기준 렌더링 캐시 (비활성화 또는 디렉터리 생성 실패 시 None)"""
+    if not Config.PREVIEW_RENDER_CACHE_ENABLED:
+        return None
+    try:
+        return RenderCache(
+            Config.PREVIEW_RENDER_CACHE_DIR,
+            int(Config.PREVIEW_RENDER_CACHE_MAX_MB * 1024 * 1024),
+        )
+    except OSError as e:
+        logger.warning(f"렌더링 캐시 디렉터리 사용 불가 (캐시 없이 렌더링): {e}")
+        return None
+
+
+def clear_digest_memo() -> None:
+    """PDF 해시 메모 초기화 (테스트용)"""
+    with _digests_lock:
+        _digests.clear()
@@ -0,0 +1,175 @@
+"""
+RSS 피드 조건부 조회 캐시 모듈
+
+[S26] ITFIND RSS 피드는 주 1회 바뀌지만 get_latest_weekly_trend_from_rss는 실행마다
+피드 전체를 내려받아 XML을 다시 파싱한다. 응답 검증자(ETag, Last-Modified)와 본문 해시,
+파싱 결과를 저장해 두고 다음 조회에서 조건부 GET(If-None-Match / If-Modified-Since)을 보낸다.
+
+- 304 Not Modified → 본문 없이 저장된 파싱 결과 반환
+- 200인데 본문 sha256이 같음(검증자를 안 주는 서버) → 파싱 없이 저장된 결과 반환
+- 본문이 바뀐 경우에만 파싱하고 결과를 저장
+- 1차: 프로세스 메모리 (Lambda warm 컨테이너 재사용 시 스토리지 조회도 생략)
+- 2차: 스토리지 범용 캐시 (SQLite kv_cache / DynamoDB etnews-cache) — 본문은 저장하지 않음,
+  진입점이 backend를 넘길 때만 사용 (없으면 메모리만)
+
+파싱 결과는 JSON으로 저장되므로 parse는 JSON 직렬화 가능한 값(dict, list, None 등)을 반환해야 한다.
+같은 URL이라도 파싱 규칙(name)이 다르면 네임스페이스가 달라 결과를 섞지 않는다.
+"""
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from .config import Config
+from .utils.http_session import get_http_session
+
+logger = logging.getLogger(__name__)
+
+FEED_CACHE_VERSION = 1
+
+# 프로세스 메모리 캐시 (네임스페이스#URL → 항목)
+_memory: Dict[str, Dict[str, Any]] = {}
+_memory_lock = threading.Lock()
+
+
+class FeedCache:
+    """URL → (검증자, 본문 해시, 파싱 결과) 캐시"""
+
+    def __init__(self, name: str, backend=None, ttl_days: Optional[int] = None):
+        """
+        Args:
+            name: 파싱 규칙 이름 (네임스페이스에 포함)
+            backend: StorageBackend (None이면 프로세스 메모리만 사용)
+            ttl_days: 스토리지 보관 기간 (None이면 Config.RSS_FEED_CACHE_TTL_DAYS)
+        """
+        self.namespace = f"rss_feed:v{FEED_CACHE_VERSION}:{name}"
+        self.ttl_days = Config.RSS_FEED_CACHE_TTL_DAYS if ttl_days is None else ttl_days
+        self.stats: Dict[str, int] = {"not_modified": 0, "unchanged": 0, "parsed": 0}
+        self._backend = backend
+
+    def _memory_key(self, url: str) -> str:
+        return f"{self.namespace}#{url}"
+
+    def _load(self, url: str) -> Optional[Dict[str, Any]]:
+        with _memory_lock:
+            entry = _memory.get(self._memory_key(url))
+        if entry is not None or self._backend is None:
+            return entry
+
+        try:
+            raw = self._backend.get_cache_items(self.namespace, [url]).get(url)
+            entry = json.loads(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"RSS 피드 캐시 조회 실패: {e}")
+            return None
+        if entry is not None:
+            with _memory_lock:
+                _memory[self._memory_key(url)] = entry
+        return entry
+
+    def _save(self, url: str, entry: Dict[str, Any]) -> None:
+        with _memory_lock:
+            _memory[self._memory_key(url)] = entry
+        if self._backend is None:
+            return
+        try:
+            self._backend.put_cache_items(
+                self.namespace, {url: json.dumps(entry, ensure_ascii=False)}, ttl_days=self.ttl_days
+            )
+        except Exception as e:
+            logger.warning(f"RSS 피드 캐시 저장 실패: {e}")
+
+    def fetch(
+        self,
+        url: str,
+        parse: Callable[[bytes], Any],
+        session: Optional[requests.Session] = None,
+        timeout: float = 30,
+    ) -> Any:
+        """
+        조건부 GET으로 피드 조회 후 파싱 결과 반환 (바뀌지 않았으면 저장된 결과)
+
+        Args:
+            url: 피드 URL
+            parse: 응답 본문 → JSON 직렬화 가능한 결과
+            session: HTTP 세션 (None이면 get_http_session())
+            timeout: 요청 타임아웃 (초)
+
+        Raises:
+            requests.RequestException: 조회 실패 (HTTP 오류 포함)
+            parse에서 발생한 예외 (결과는 저장하지 않음)
+        """
+        entry = self._load(url)
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        http = session or get_http_session()
+        response = http.get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry is not None:
+            self.stats["not_modified"] += 1
+            logger.info("RSS 피드 변경 없음 (304 Not Modified) → 캐시된 파싱 결과 사용")
+            return entry["result"]
+
+        response.raise_for_status()
+        digest = hashlib.sha256(response.content).hexdigest()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if entry is not None and entry.get("sha256") == digest:
+            self.stats["unchanged"] += 1
+            logger.info("RSS 피드 본문 동일 (sha256 일치) → 캐시된 파싱 결과 사용")
+            if (etag, last_modified) != (entry.get("etag"), entry.get("last_modified")):
+                self._save(url, {**entry, "etag": etag, "last_modified": last_modified})
+            return entry["result"]
+
+        result = parse(response.content)
+        self.stats["parsed"] += 1
+        self._save(url, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "sha256": digest,
+            "result": result,
+        })
+        return result
+
+
+def fetch_feed(
+    name: str,
+    url: str,
+    parse: Callable[[bytes], Any],
+    session: Optional[requests.Session] = None,
+    timeout: float = 30,
+    backend=None,
+) -> Any:
+    """
+    설정 기준 피드 조회 (RSS_FEED_CACHE_ENABLED가 False면 매번 내려받아 파싱)
+
+    Args:
+        name: 파싱 규칙 이름
+        url: 피드 URL
+        parse: 응답 본문 → JSON 직렬화 가능한 결과
+        session: HTTP 세션 (None이면 get_http_session())
+        timeout: 요청 타임아웃 (초)
+        backend: 검증자·파싱 결과를 보관할 StorageBackend (None이면 프로세스 메모리만)
+    """
+    if not Config.RSS_FEED_CACHE_ENABLED:
+        http = session or get_http_session()
+        response = http.get(url, timeout=timeout)
+        response.raise_for_status()
+        return parse(response.content)
+
+    return FeedCache(name, backend=backend).fetch(url, parse, session=session, timeout=timeout)
+
+
+def clear_memory_cache() -> None:
+    """프로세스 메모리 캐시 초기화 (테스트용)"""
+    with _memory_lock:
+        _memory.clear()
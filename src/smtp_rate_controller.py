@@ -0,0 +1,250 @@
+"""
+SMTP 적응형 전송 속도 제어 모듈
+
+[S9] 고정값(SMTP_RECONNECT_EVERY, SMTP_CONSECUTIVE_FAIL_LIMIT)만으로는 Gmail 스로틀링에
+대응할 수 없어, 서버 응답 코드와 메시지별 지연 시간으로 전송 속도·동시성을 AIMD 방식으로 조절한다.
+
+- 성공: 전송 속도(통/초)와 동시 세션 한도를 조금씩 증가 (Additive Increase)
+- 스로틀링 응답(421/450/451/454) 또는 지연 목표 초과: 절반으로 감소 (Multiplicative Decrease)
+- 스로틀링 응답 시 지수 백오프로 일시 정지 후 재개 (해당 수신자는 재시도 대상)
+- 일일 한도 초과(550 5.4.5)나 누적 정지 시간 초과 시에만 중단
+
+스레드 풀([S5])·asyncio([S6]) 엔진이 함께 사용하므로 모든 상태 변경은 lock으로 보호하고,
+대기는 호출자가 수행하도록 "기다려야 할 초"만 반환한다.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# on_failure() 판정 결과
+FAILED = "failed"        # 일반 실패 (수신자 단위 실패로 집계)
+THROTTLED = "throttled"  # 일시적 스로틀링 (정지 후 같은 수신자 재시도)
+HALTED = "halted"        # 일일 한도 초과 등 — 남은 전송 중단
+
+# 일시적 스로틀링으로 간주하는 SMTP 응답 코드
+THROTTLE_CODES = frozenset({421, 450, 451, 454})
+
+
+def extract_smtp_reply(exc: BaseException) -> Tuple[Optional[int], str]:
+    """smtplib / aiosmtplib 예외에서 (응답 코드, 메시지) 추출 (코드가 없으면 None)"""
+    code = getattr(exc, "smtp_code", None)  # smtplib.SMTPResponseException
+    if code is None:
+        code = getattr(exc, "code", None)   # aiosmtplib.SMTPResponseException
+    message = getattr(exc, "smtp_error", None)
+    if message is None:
+        message = getattr(exc, "message", None)
+
+    if code is None:
+        # SMTPRecipientsRefused: smtplib은 {addr: (code, msg)}, aiosmtplib은 [SMTPRecipientRefused]
+        recipients = getattr(exc, "recipients", None)
+        if isinstance(recipients, dict) and recipients:
+            code, message = next(iter(recipients.values()))
+        elif isinstance(recipients, list) and recipients:
+            return extract_smtp_reply(recipients[0])
+
+    if isinstance(message, bytes):
+        message = message.decode("utf-8", errors="replace")
+    return (code if isinstance(code, int) else None), str(message or exc)
+
+
+def is_quota_exceeded(code: Optional[int], message: str) -> bool:
+    """발신 한도 초과 응답 여부 (Gmail: 550 5.4.5 Daily user sending limit exceeded)"""
+    return code in (550, 552) and "5.4.5" in message
+
+
+class SMTPRateController:
+    """AIMD 기반 SMTP 전송 속도·동시성 제어기
+
+    enabled=False면 대기 없이 통과시키고 모든 실패를 FAILED로 판정한다 (기존 동작과 동일).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        max_rate: float = 5.0,
+        min_rate: float = 0.1,
+        rate_increase: float = 0.1,
+        decrease_factor: float = 0.5,
+        latency_target: float = 60.0,
+        pause_base: float = 5.0,
+        pause_max: float = 60.0,
+        pause_budget: float = 120.0,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_concurrency: 동시 SMTP 세션(트랜잭션) 상한
+            max_rate: 전송 속도 상한 (통/초, 프로세스 전체)
+            min_rate: 전송 속도 하한 (통/초)
+            rate_increase: 성공 1건당 속도 증가량 (통/초)
+            decrease_factor: 혼잡 감지 시 속도·동시성 감소 배율
+            latency_target: 메시지 1통 전송 지연 목표 (초) — 초과 시 혼잡으로 간주
+            pause_base: 스로틀링 응답 시 첫 정지 시간 (초, 연속 발생 시 2배씩 증가)
+            pause_max: 1회 정지 시간 상한 (초)
+            pause_budget: 누적 정지 시간 상한 (초) — 초과 시 중단
+            enabled: False면 제어 없이 통과
+            clock: 단조 시계 (테스트 주입용)
+        """
+        self.enabled = enabled
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.rate_increase = rate_increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.pause_base = pause_base
+        self.pause_max = pause_max
+        self.pause_budget = pause_budget
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # 제어 상태
+        self._rate = max_rate
+        self._window = float(self.max_concurrency)
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._throttle_streak = 0
+        self._halted = False
+
+        # 지표
+        self._sent = 0
+        self._failed = 0
+        self._throttled = 0
+        self._pauses = 0
+        self._paused_seconds = 0.0
+        self._latency_ewma: Optional[float] = None
+        self._latency_max = 0.0
+        self._last_code: Optional[int] = None
+        self._codes: Dict[int, int] = {}
+
+    @property
+    def halted(self) -> bool:
+        """전송 중단 여부 (일일 한도 초과 또는 누적 정지 시간 초과)"""
+        return self._halted
+
+    @property
+    def concurrency(self) -> int:
+        """현재 허용 동시 세션 수 (1 ~ max_concurrency)"""
+        if not self.enabled:
+            return self.max_concurrency
+        return max(1, min(self.max_concurrency, int(self._window)))
+
+    def reserve(self) -> float:
+        """다음 전송 시각을 예약하고, 호출자가 기다려야 할 시간(초)을 반환
+
+        일시 정지 중이면 정지 해제 시각까지, 아니면 현재 속도의 전송 간격만큼 기다린다.
+        """
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot, self._paused_until)
+            self._next_slot = slot + 1.0 / self._rate
+            return slot - now
+
+    def on_success(self, latency: float) -> None:
+        """전송 성공 반영 (지연 목표 이내면 속도·동시성 증가, 초과면 감소)"""
+        with self._lock:
+            self._sent += 1
+            self._throttle_streak = 0
+            self._record_latency(latency)
+            if not self.enabled:
+                return
+            if latency > self.latency_target:
+                self._decrease(f"지연 {latency:.1f}s > 목표 {self.latency_target:.0f}s")
+            else:
+                self._rate = min(self.max_rate, self._rate + self.rate_increase)
+                self._window = min(
+                    float(self.max_concurrency), self._window + 1.0 / max(self._window, 1.0)
+                )
+
+    def on_failure(self, exc: BaseException) -> str:
+        """전송 실패 반영 후 판정 반환 (FAILED / THROTTLED / HALTED)"""
+        code, message = extract_smtp_reply(exc)
+        with self._lock:
+            self._last_code = code
+            if code is not None:
+                self._codes[code] = self._codes.get(code, 0) + 1
+
+            if not self.enabled:
+                self._failed += 1
+                return FAILED
+
+            if is_quota_exceeded(code, message):
+                self._halted = True
+                logger.error(f"🛑 [S9] 발신 한도 초과 응답 ({code} {message[:80]}) — 남은 전송 중단")
+                return HALTED
+
+            if code not in THROTTLE_CODES:
+                self._failed += 1
+                return FAILED
+
+            self._throttled += 1
+            self._decrease(f"스로틀링 응답 {code}")
+            pause = min(self.pause_max, self.pause_base * (2 ** self._throttle_streak))
+            self._throttle_streak += 1
+
+            if self._paused_seconds + pause > self.pause_budget:
+                self._halted = True
+                logger.error(
+                    f"🛑 [S9] 누적 정지 {self._paused_seconds:.0f}s — 정지 한도 "
+                    f"{self.pause_budget:.0f}s 초과로 남은 전송 중단"
+                )
+                return HALTED
+
+            now = self._clock()
+            # 다른 세션이 이미 더 긴 정지를 걸어 둔 경우 중복 집계하지 않음
+            if now + pause > self._paused_until:
+                added = now + pause - max(now, self._paused_until)
+                self._paused_until = now + pause
+                self._paused_seconds += added
+                self._pauses += 1
+                logger.warning(
+                    f"⏸️ [S9] SMTP {code} 응답 — {pause:.0f}초 일시 정지 후 재개 "
+                    f"(속도 {self._rate:.2f}통/s, 동시성 {self.concurrency})"
+                )
+            return THROTTLED
+
+    def snapshot(self) -> dict:
+        """현재 제어 상태·누적 지표 (구조화 로그/모니터링용)"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "rate_per_sec": round(self._rate, 3),
+                "max_rate_per_sec": self.max_rate,
+                "concurrency": self.concurrency,
+                "max_concurrency": self.max_concurrency,
+                "sent": self._sent,
+                "failed": self._failed,
+                "throttled": self._throttled,
+                "pauses": self._pauses,
+                "paused_seconds": round(self._paused_seconds, 1),
+                "pause_budget_seconds": self.pause_budget,
+                "latency_ewma_sec": (
+                    round(self._latency_ewma, 3) if self._latency_ewma is not None else None
+                ),
+                "latency_max_sec": round(self._latency_max, 3),
+                "last_reply_code": self._last_code,
+                "reply_codes": dict(self._codes),
+                "halted": self._halted,
+            }
+
+    def _record_latency(self, latency: float) -> None:
+        """지연 시간 지표 갱신 (EWMA α=0.2)"""
+        self._latency_max = max(self._latency_max, latency)
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma = 0.8 * self._latency_ewma + 0.2 * latency
+
+    def _decrease(self, reason: str) -> None:
+        """Multiplicative Decrease (lock 보유 상태에서 호출)"""
+        self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+        self._window = max(1.0, self._window * self.decrease_factor)
+        logger.info(
+            f"[S9] 전송 속도 감소 ({reason}): {self._rate:.2f}통/s, 동시성 {self.concurrency}"
+        )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 
 class StorageBackend(ABC):
@@ -65,3 +65,33 @@ class StorageBackend(ABC):
     def delete_failure(self, date: str) -> bool:
         """실패 기록 삭제 (성공 후 리셋용)"""
         ...
+
+    # --- Delivery Ledger ---
+    @abstractmethod
+    def get_delivered_emails(self, issue_key: str) -> Set[str]:
+        """발송 단위(issue_key)별 전송 성공 기록이 있는 수신인 이메일 집합"""
+        ...
+
+    @abstractmethod
+    def put_delivery_record(self, issue_key: str, email: str, ttl_days: int = 14) -> bool:
+        """수신인 1명의 전송 성공 기록 (이미 있으면 덮어쓰기)"""
+        ...
+
+    # --- Cache ---
+    @abstractmethod
+    def get_cache_items(self, namespace: str, keys: List[str]) -> Dict[str, str]:
+        """네임스페이스별 캐시 조회 (존재하고 만료되지 않은 키만 반환)"""
+        ...
+
+    @abstractmethod
+    def put_cache_items(self, namespace: str, items: Dict[str, str], ttl_days: int = 7) -> bool:
+        """네임스페이스별 캐시 일괄 저장 (이미 있으면 덮어쓰기)"""
+        ...
+
+    @abstractmethod
+    def prune_cache_items(self, namespace: str, max_items: int) -> int:
+        """네임스페이스 항목 수를 max_items 이하로 축소 (ttl이 가장 이른 항목부터 삭제, 삭제 건수 반환)
+
+        조회 시 ttl을 갱신해 두면 ttl 순서가 최근 사용 순서가 되므로 LRU 축출로 동작한다.
+        """
+        ...
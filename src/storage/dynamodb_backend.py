@@ -5,7 +5,7 @@ AWS Lambda 환경에서 DynamoDB를 사용하여 Mac Mini 환경을 대체
 
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 import boto3
 from botocore.exceptions import ClientError
 
@@ -30,6 +30,8 @@ class DynamoDBBackend(StorageBackend):
         self._recipients_table = Config.DYNAMODB_RECIPIENTS_TABLE
         self._failures_table = Config.DYNAMODB_FAILURES_TABLE
         self._execution_table = Config.DYNAMODB_EXECUTION_TABLE
+        self._ledger_table = Config.DYNAMODB_LEDGER_TABLE
+        self._cache_table = Config.DYNAMODB_CACHE_TABLE
         self._dynamodb = None
         self._tables = {}  # 테이블별 캐시
 
@@ -262,3 +264,134 @@ class DynamoDBBackend(StorageBackend):
         except ClientError as e:
             logger.error(f"DynamoDB 실패 기록 삭제 실패: {e}")
             return False
+
+    # --- Delivery Ledger ---
+    def get_delivered_emails(self, issue_key: str) -> Set[str]:
+        """발송 단위별 전송 성공 수신인 조회 (issue_key 파티션 Query)"""
+        try:
+            table = self._get_table(self._ledger_table)
+            query_kwargs = {
+                "KeyConditionExpression": "issue_key = :issue_key",
+                "ExpressionAttributeValues": {":issue_key": issue_key},
+                "ProjectionExpression": "email",
+            }
+            response = table.query(**query_kwargs)
+            items = response.get("Items", [])
+
+            # 페이지네이션 처리
+            while "LastEvaluatedKey" in response:
+                response = table.query(
+                    ExclusiveStartKey=response["LastEvaluatedKey"], **query_kwargs
+                )
+                items.extend(response.get("Items", []))
+
+            delivered = {item["email"] for item in items}
+            logger.info(f"DynamoDB 발송 원장 조회: {issue_key} ({len(delivered)}건)")
+            return delivered
+
+        except ClientError as e:
+            logger.error(f"DynamoDB 발송 원장 조회 실패: {e}")
+            return set()
+
+    def put_delivery_record(self, issue_key: str, email: str, ttl_days: int = 14) -> bool:
+        """수신인 1명의 전송 성공 기록"""
+        try:
+            table = self._get_table(self._ledger_table)
+            table.put_item(
+                Item={
+                    "issue_key": issue_key,
+                    "email": email,
+                    "delivered_at": datetime.now(timezone.utc).isoformat(),
+                    "ttl": _get_ttl(ttl_days),
+                }
+            )
+            return True
+
+        except ClientError as e:
+            logger.error(f"DynamoDB 발송 원장 기록 실패: {email} - {e}")
+            return False
+
+    # --- Cache ---
+    def get_cache_items(self, namespace: str, keys: List[str]) -> Dict[str, str]:
+        """네임스페이스별 캐시 조회 (BatchGetItem, 100건 단위)
+
+        DynamoDB TTL 삭제는 지연될 수 있으므로 만료 여부를 직접 확인한다.
+        """
+        try:
+            dynamodb = self._get_dynamodb()
+            now = int(datetime.now(timezone.utc).timestamp())
+            found: Dict[str, str] = {}
+
+            for i in range(0, len(keys), 100):
+                request = {
+                    self._cache_table: {
+                        "Keys": [
+                            {"namespace": namespace, "cache_key": key}
+                            for key in keys[i:i + 100]
+                        ]
+                    }
+                }
+                while request:
+                    response = dynamodb.batch_get_item(RequestItems=request)
+                    for item in response.get("Responses", {}).get(self._cache_table, []):
+                        if int(item.get("ttl", now)) >= now:
+                            found[item["cache_key"]] = item["value"]
+                    request = response.get("UnprocessedKeys") or None
+
+            return found
+
+        except ClientError as e:
+            logger.error(f"DynamoDB 캐시 조회 실패: {e}")
+            return {}
+
+    def put_cache_items(self, namespace: str, items: Dict[str, str], ttl_days: int = 7) -> bool:
+        """네임스페이스별 캐시 일괄 저장 (batch_writer — 25건 단위·미처리 재시도 자동)"""
+        try:
+            table = self._get_table(self._cache_table)
+            ttl = _get_ttl(ttl_days)
+            with table.batch_writer(overwrite_by_pkeys=["namespace", "cache_key"]) as batch:
+                for key, value in items.items():
+                    batch.put_item(
+                        Item={"namespace": namespace, "cache_key": key, "value": value, "ttl": ttl}
+                    )
+            logger.info(f"DynamoDB 캐시 저장: {namespace} ({len(items)}건)")
+            return True
+
+        except ClientError as e:
+            logger.error(f"DynamoDB 캐시 저장 실패: {e}")
+            return False
+
+    def prune_cache_items(self, namespace: str, max_items: int) -> int:
+        """네임스페이스 항목 수 상한 적용 (namespace 파티션 Query 후 ttl이 이른 항목부터 삭제)"""
+        try:
+            table = self._get_table(self._cache_table)
+            query_kwargs = {
+                "KeyConditionExpression": "#ns = :ns",
+                "ExpressionAttributeNames": {"#ns": "namespace", "#ttl": "ttl"},
+                "ExpressionAttributeValues": {":ns": namespace},
+                "ProjectionExpression": "cache_key, #ttl",
+            }
+            response = table.query(**query_kwargs)
+            items = response.get("Items", [])
+
+            # 페이지네이션 처리
+            while "LastEvaluatedKey" in response:
+                response = table.query(
+                    ExclusiveStartKey=response["LastEvaluatedKey"], **query_kwargs
+                )
+                items.extend(response.get("Items", []))
+
+            excess = len(items) - max(0, max_items)
+            if excess <= 0:
+                return 0
+
+            items.sort(key=lambda item: int(item.get("ttl", 0)))
+            with table.batch_writer() as batch:
+                for item in items[:excess]:
+                    batch.delete_item(Key={"namespace": namespace, "cache_key": item["cache_key"]})
+            logger.info(f"DynamoDB 캐시 축출: {namespace} ({excess}건)")
+            return excess
+
+        except ClientError as e:
+            logger.error(f"DynamoDB 캐시 축출 실패: {e}")
+            return 0
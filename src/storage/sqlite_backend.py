@@ -6,7 +6,7 @@ Mac Mini 로컬 환경에서 SQLite를 사용하여 DynamoDB를 대체
 import logging
 import sqlite3
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime, timezone, timedelta
 
 from .base import StorageBackend
@@ -99,6 +99,28 @@ class SQLiteBackend(StorageBackend):
             )
         """)
 
+        # 4. 수신인별 발송 원장 (발송 단위 × 수신인)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS delivery_ledger (
+                issue_key TEXT NOT NULL,
+                email TEXT NOT NULL,
+                delivered_at TEXT NOT NULL,
+                ttl INTEGER,
+                PRIMARY KEY (issue_key, email)
+            )
+        """)
+
+        # 5. 범용 캐시 (네임스페이스 × 키)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS kv_cache (
+                namespace TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                ttl INTEGER,
+                PRIMARY KEY (namespace, cache_key)
+            )
+        """)
+
         self._connection.commit()
         self._tables_created = True
         logger.info("SQLite 테이블 생성 완료")
@@ -328,6 +350,108 @@ class SQLiteBackend(StorageBackend):
         logger.info(f"실패 기록 삭제: {date}")
         return True
 
+    # --- Delivery Ledger ---
+    def get_delivered_emails(self, issue_key: str) -> Set[str]:
+        """발송 단위별 전송 성공 수신인 조회"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        self._cleanup_expired_items(cursor, "delivery_ledger")
+
+        cursor.execute(
+            "SELECT email FROM delivery_ledger WHERE issue_key = ?", (issue_key,)
+        )
+        delivered = {row[0] for row in cursor.fetchall()}
+
+        logger.info(f"발송 원장 조회: {issue_key} ({len(delivered)}건)")
+        return delivered
+
+    def put_delivery_record(self, issue_key: str, email: str, ttl_days: int = 14) -> bool:
+        """수신인 1명의 전송 성공 기록"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        now = datetime.now(timezone.utc)
+        ttl = int((now + timedelta(days=ttl_days)).timestamp())
+
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO delivery_ledger (issue_key, email, delivered_at, ttl)
+            VALUES (?, ?, ?, ?)
+        """,
+            (issue_key, email, now.isoformat(), ttl),
+        )
+
+        conn.commit()
+        return True
+
+    # --- Cache ---
+    # SQLite 바인딩 변수 한도(구버전 999) 이내로 IN 절을 나눠 조회
+    _CACHE_QUERY_BATCH = 500
+
+    def get_cache_items(self, namespace: str, keys: List[str]) -> Dict[str, str]:
+        """네임스페이스별 캐시 조회"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        now = int(datetime.now(timezone.utc).timestamp())
+        found: Dict[str, str] = {}
+        for i in range(0, len(keys), self._CACHE_QUERY_BATCH):
+            batch = keys[i:i + self._CACHE_QUERY_BATCH]
+            placeholders = ", ".join("?" for _ in batch)
+            cursor.execute(
+                f"""
+                SELECT cache_key, value FROM kv_cache
+                WHERE namespace = ? AND cache_key IN ({placeholders})
+                AND (ttl IS NULL OR ttl >= ?)
+            """,
+                [namespace, *batch, now],
+            )
+            found.update(cursor.fetchall())
+
+        return found
+
+    def put_cache_items(self, namespace: str, items: Dict[str, str], ttl_days: int = 7) -> bool:
+        """네임스페이스별 캐시 일괄 저장"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        self._cleanup_expired_items(cursor, "kv_cache")
+
+        ttl = int((datetime.now(timezone.utc) + timedelta(days=ttl_days)).timestamp())
+        cursor.executemany(
+            """
+            INSERT OR REPLACE INTO kv_cache (namespace, cache_key, value, ttl)
+            VALUES (?, ?, ?, ?)
+        """,
+            [(namespace, key, value, ttl) for key, value in items.items()],
+        )
+
+        conn.commit()
+        logger.info(f"캐시 저장: {namespace} ({len(items)}건)")
+        return True
+
+    def prune_cache_items(self, namespace: str, max_items: int) -> int:
+        """네임스페이스 항목 수 상한 적용 (ttl이 이른 항목부터 삭제)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            DELETE FROM kv_cache
+            WHERE namespace = ? AND cache_key NOT IN (
+                SELECT cache_key FROM kv_cache WHERE namespace = ?
+                ORDER BY ttl DESC LIMIT ?
+            )
+        """,
+            (namespace, namespace, max(0, max_items)),
+        )
+        deleted = cursor.rowcount
+        conn.commit()
+        if deleted:
+            logger.info(f"캐시 축출: {namespace} ({deleted}건)")
+        return deleted
+
     def __del__(self):
         """DB 커넥션 종료"""
         if self._connection is not None:
@@ -6,13 +6,16 @@ HMAC 기반의 안전한 토큰 생성/검증을 제공합니다.
 - email: 수신인 이메일 주소
 - timestamp: YYYY-MM 형식의 년월 (월별 로테이션)
 - signature: HMAC-SHA256 서명
+
+[S11] 벌크 발송용 일괄 생성(generate_tokens)과 월별 토큰 캐시(get_monthly_tokens) 제공.
+토큰은 (email, YYYY-MM)에만 의존하므로 한 달 동안 같은 URL이 유지된다.
 """
 import base64
 import hmac
 import hashlib
 import logging
 from datetime import datetime
-from typing import Tuple, Optional
+from typing import Dict, Iterable, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +69,88 @@ def generate_token(email: str, secret: str) -> str:
         raise UnsubscribeTokenError(f"토큰 생성 실패: {e}")
 
 
+def _build_token(mac_base: "hmac.HMAC", email: str, month: str) -> str:
+    """키 스케줄이 계산된 HMAC 상태를 복제해 토큰 1개 생성 (generate_token과 동일한 결과)"""
+    mac = mac_base.copy()
+    mac.update(f"{email}:{month}".encode())
+    signature_b64 = base64.urlsafe_b64encode(mac.digest()).decode()
+    return base64.urlsafe_b64encode(f"{email}:{month}:{signature_b64}".encode()).decode()
+
+
+def generate_tokens(
+    emails: Iterable[str], secret: str, month: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    [S11] 수신거부 토큰 일괄 생성
+
+    HMAC 키 스케줄(ipad/opad 블록)을 1회만 계산하고 수신인마다 상태를 복제해 서명한다.
+
+    Args:
+        emails: 수신인 이메일 목록
+        secret: HMAC 시크릿 키
+        month: YYYY-MM (None이면 현재 년월)
+
+    Returns:
+        {email: token} — generate_token(email, secret)과 동일한 토큰
+    """
+    try:
+        month = month or datetime.now().strftime('%Y-%m')
+        mac_base = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+        return {email: _build_token(mac_base, email, month) for email in emails}
+
+    except Exception as e:
+        logger.error(f"토큰 일괄 생성 실패: {e}")
+        raise UnsubscribeTokenError(f"토큰 일괄 생성 실패: {e}")
+
+
+def _cache_namespace(secret: str, month: str) -> str:
+    """토큰 캐시 네임스페이스 (시크릿이 바뀌면 캐시도 자동으로 분리)"""
+    fingerprint = hmac.new(secret.encode(), b"unsubscribe-token-cache", hashlib.sha256).hexdigest()[:12]
+    return f"unsubscribe_token:{month}:{fingerprint}"
+
+
+def get_monthly_tokens(
+    emails: Iterable[str], secret: str, backend=None, ttl_days: int = 62
+) -> Dict[str, str]:
+    """
+    [S11] 월별 캐시를 이용한 수신거부 토큰 조회
+
+    (email, YYYY-MM) 단위로 스토리지 캐시에서 먼저 찾고, 없는 수신인만 일괄 생성해 저장한다.
+    캐시 조회·저장이 실패해도 토큰은 항상 반환된다.
+
+    Args:
+        emails: 수신인 이메일 목록
+        secret: HMAC 시크릿 키
+        backend: StorageBackend (None이면 캐시 없이 생성만)
+        ttl_days: 캐시 보관 기간 (일)
+
+    Returns:
+        {email: token}
+    """
+    emails = list(dict.fromkeys(emails))
+    month = datetime.now().strftime('%Y-%m')
+    namespace = _cache_namespace(secret, month)
+
+    cached: Dict[str, str] = {}
+    if backend is not None:
+        try:
+            cached = backend.get_cache_items(namespace, emails)
+        except Exception as e:
+            logger.warning(f"토큰 캐시 조회 실패 (전체 생성으로 대체): {e}")
+
+    missing = [email for email in emails if email not in cached]
+    generated = generate_tokens(missing, secret, month) if missing else {}
+
+    if backend is not None and generated:
+        try:
+            backend.put_cache_items(namespace, generated, ttl_days=ttl_days)
+        except Exception as e:
+            logger.warning(f"토큰 캐시 저장 실패: {e}")
+
+    logger.info(f"수신거부 토큰 준비: 캐시 {len(cached)}건, 신규 생성 {len(generated)}건 ({month})")
+    return {**cached, **generated}
+
+
 def verify_token(token: str, secret: str) -> Tuple[bool, Optional[str]]:
     """
     수신거부 토큰 검증
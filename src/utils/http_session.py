@@ -0,0 +1,120 @@
+"""
+ITFIND HTTP 세션 유틸리티
+
+[S25] ITFIND 다운로드 파이프라인(RSS → 상세 페이지 → StreamDocs 리다이렉트 → PDF)은 모두
+www.itfind.or.kr로 가지만 단계마다 requests.get / 일회용 Session으로 새 TCP+TLS 연결을 열었다.
+keep-alive 연결 풀을 가진 Session 1개를 공유해 핸드셰이크를 한 번으로 줄인다.
+
+- 공통 헤더(User-Agent, Referer)는 세션에 한 번만 설정 (단계별 Accept 헤더는 요청마다 지정)
+- 연결 실패·429/5xx는 urllib3 Retry로 지수 백오프 재시도 (GET/HEAD만, Retry-After 존중)
+- 응답 hook에서 요청 수·서버 응답 시간·새로 연 연결 수를 집계해 한 곳에서 계측
+"""
+import logging
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Referer": "https://www.itfind.or.kr/",
+}
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _record_timing(session: requests.Session):
+    """응답 hook: 요청 수·응답 시간 집계"""
+    def hook(response, *args, **kwargs):
+        elapsed_ms = response.elapsed.total_seconds() * 1000
+        stats = session.http_stats
+        stats["requests"] += 1
+        stats["elapsed_ms"] += elapsed_ms
+        logger.debug(f"HTTP {response.request.method} {response.url} → {response.status_code} ({elapsed_ms:.0f}ms)")
+        return response
+    return hook
+
+
+def create_http_session(
+    pool_maxsize: Optional[int] = None,
+    retry_total: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+) -> requests.Session:
+    """
+    keep-alive 연결 풀 + 재시도 설정이 된 Session 생성
+
+    Args:
+        pool_maxsize: 호스트별 유지할 연결 수 (None이면 Config.HTTP_POOL_MAXSIZE)
+        retry_total: 재시도 횟수 (None이면 Config.HTTP_RETRY_TOTAL)
+        backoff_factor: 재시도 대기 = backoff × 2^(n-1)초 (None이면 Config.HTTP_RETRY_BACKOFF)
+
+    Returns:
+        requests.Session — http_stats 속성에 계측 값 누적
+    """
+    retry = Retry(
+        total=Config.HTTP_RETRY_TOTAL if retry_total is None else retry_total,
+        backoff_factor=Config.HTTP_RETRY_BACKOFF if backoff_factor is None else backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # 재시도 후에도 실패하면 응답을 돌려주고 raise_for_status()에서 처리
+    )
+    maxsize = Config.HTTP_POOL_MAXSIZE if pool_maxsize is None else pool_maxsize
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    session.http_stats = {"requests": 0, "elapsed_ms": 0.0}
+    session.hooks["response"].append(_record_timing(session))
+    return session
+
+
+def connections_opened(session: requests.Session) -> Optional[int]:
+    """세션이 지금까지 새로 연 연결 수 (urllib3 풀 집계, 확인할 수 없으면 None)"""
+    total = 0
+    try:
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    total += pool.num_connections
+    except Exception:
+        return None
+    return total
+
+
+def http_stats(session: requests.Session) -> Dict[str, float]:
+    """요청 수·누적 응답 시간·새로 연 연결 수"""
+    stats = dict(getattr(session, "http_stats", {}))
+    stats["connections"] = connections_opened(session)
+    return stats
+
+
+def get_http_session() -> requests.Session:
+    """프로세스 공용 세션 (Lambda warm 컨테이너에서는 다음 실행에서도 재사용)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_http_session()
+        return _session
+
+
+def close_http_session() -> None:
+    """공용 세션 닫기 (연결 풀 반납)"""
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
@@ -0,0 +1,134 @@
+"""
+다중 키워드 매칭 유틸리티
+
+[S17] 키워드 목록을 Aho-Corasick 오토마톤으로 한 번 컴파일해 두고,
+텍스트 한 번 순회로 키워드별 출현 횟수를 구한다.
+
+- 횟수는 키워드마다 str.count와 같은 규칙(왼쪽부터 겹치지 않게)으로 센다.
+  다른 키워드끼리는 겹쳐도 각각 센다 (예: "전면광고"는 "광고"도 1회).
+- ignore_case=True이면 텍스트를 한 번만 소문자로 바꿔 비교한다.
+- CPython에서는 패턴이 적을 때 C 구현 str.count 반복이 파이썬 수준 상태 전이보다 빠르므로,
+  고유 패턴이 SCAN_PATTERN_LIMIT개 이하이면 같은 결과를 str.count로 계산한다.
+  (광고 키워드 5개, 2만 자 기준 str.count 약 30µs / 오토마톤 순회 약 600µs)
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+# 이 개수 이하의 고유 패턴은 str.count로 센다
+SCAN_PATTERN_LIMIT = 8
+
+
+class KeywordMatcher:
+    """컴파일된 다중 키워드 매처 (Aho-Corasick)"""
+
+    def __init__(self, keywords: Iterable[str], ignore_case: bool = True):
+        """
+        Args:
+            keywords: 찾을 키워드 목록 (빈 문자열은 무시)
+            ignore_case: 대소문자 구분 없이 비교할지 여부
+        """
+        self.keywords: Tuple[str, ...] = tuple(k for k in keywords if k)
+        self.ignore_case = ignore_case
+
+        # 고유 패턴 (소문자 변환 후 같은 키워드는 하나로 센다)
+        self._patterns: List[str] = []
+        self._pattern_of: Dict[str, int] = {}
+        for keyword in self.keywords:
+            pattern = keyword.lower() if ignore_case else keyword
+            if pattern not in self._pattern_of:
+                self._pattern_of[pattern] = len(self._patterns)
+                self._patterns.append(pattern)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._use_automaton = len(self._patterns) > SCAN_PATTERN_LIMIT
+        if self._use_automaton:
+            self._build()
+
+    def _build(self) -> None:
+        """트라이 + 실패 링크를 만들고 상태 전이표(DFA)로 펼친다"""
+        goto, output = self._goto, [[]]
+        for index, pattern in enumerate(self._patterns):
+            state = 0
+            for ch in pattern:
+                if ch not in goto[state]:
+                    goto.append({})
+                    output.append([])
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            output[state].append(index)
+
+        fail = [0] * len(goto)
+        order: List[int] = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(ch, 0)
+                output[child].extend(output[fail[child]])
+
+        # 얕은 상태부터 실패 링크의 전이를 물려받아 순회 중 실패 링크를 따라가지 않게 한다
+        for state in order:
+            for ch, target in goto[fail[state]].items():
+                goto[state].setdefault(ch, target)
+
+        self._output = [tuple(out) for out in output]
+
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def _pattern_counts(self, text: str) -> List[int]:
+        """고유 패턴별 겹치지 않는 출현 횟수"""
+        if not self._use_automaton:
+            return [text.count(pattern) for pattern in self._patterns]
+
+        goto, output, patterns = self._goto, self._output, self._patterns
+        root = goto[0]
+        counts = [0] * len(patterns)
+        next_free = [0] * len(patterns)  # 패턴별로 다음 출현이 시작될 수 있는 위치
+        state = 0
+        for pos, ch in enumerate(text):
+            state = goto[state].get(ch) or root.get(ch, 0)
+            for index in output[state]:
+                start = pos + 1 - len(patterns[index])
+                if start >= next_free[index]:
+                    counts[index] += 1
+                    next_free[index] = pos + 1
+        return counts
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """
+        키워드별 출현 횟수
+
+        Returns:
+            {키워드: 횟수} — 모든 키워드 포함 (없으면 0)
+        """
+        pattern_counts = self._pattern_counts(self._normalize(text or ""))
+        return {
+            keyword: pattern_counts[self._pattern_of[self._normalize(keyword)]]
+            for keyword in self.keywords
+        }
+
+    def found(self, text: str) -> List[str]:
+        """텍스트에 한 번 이상 나오는 키워드 (목록 순서)"""
+        return [keyword for keyword, count in self.counts(text).items() if count]
+
+    def contains_any(self, text: str) -> bool:
+        """키워드가 하나라도 나오는지 여부"""
+        return any(self._pattern_counts(self._normalize(text or "")))
+
+    def contains_all(self, text: str) -> bool:
+        """모든 키워드가 나오는지 여부"""
+        return all(self._pattern_counts(self._normalize(text or "")))
+
+
+@lru_cache(maxsize=32)
+def compile_keywords(keywords: Tuple[str, ...], ignore_case: bool = True) -> KeywordMatcher:
+    """키워드 튜플별로 한 번만 컴파일된 매처 반환 (설정값 그대로 넘겨 재사용)"""
+    return KeywordMatcher(keywords, ignore_case=ignore_case)
@@ -2,7 +2,7 @@
 Lambda 워크플로우 모듈
 """
 from .execution import check_idempotency, check_failure_limit
-from .pdf_workflow import download_and_process_pdf, download_itfind_pdf
+from .pdf_workflow import download_and_process_pdf, download_itfind_pdf, optimize_attachment
 from .email_workflow import send_emails
 from .icloud_workflow import upload_to_icloud
 
@@ -11,6 +11,7 @@ __all__ = [
     "check_failure_limit",
     "download_and_process_pdf",
     "download_itfind_pdf",
+    "optimize_attachment",
     "send_emails",
     "upload_to_icloud",
 ]
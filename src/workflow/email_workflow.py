@@ -12,7 +12,8 @@ def send_emails(
     processed_pdf_path: str,
     test_mode: bool,
     itfind_pdf_path: Optional[str] = None,
-    itfind_info: Optional[dict] = None
+    itfind_info: Optional[dict] = None,
+    engine: Optional[str] = None,
 ) -> tuple[bool, List[str], bool, List[str]]:
     """
     이메일 발송 (전자신문 + ITFIND 별도 발송)
@@ -22,6 +23,7 @@ def send_emails(
         test_mode: 테스트 모드 여부
         itfind_pdf_path: ITFIND PDF 경로 (선택)
         itfind_info: ITFIND 메타데이터 (선택)
+        engine: 전송 엔진 "sync" 또는 "async" (None이면 Config.EMAIL_DELIVERY_ENGINE)
 
     Returns:
         (전자신문 성공 여부, 전자신문 성공 이메일 목록,
@@ -33,7 +35,8 @@ def send_emails(
         processed_pdf_path,
         test_mode=test_mode,
         itfind_pdf_path=None,  # 전자신문만 첨부
-        itfind_info=None
+        itfind_info=None,
+        engine=engine,
     )
 
     if email_success:
@@ -58,7 +61,8 @@ def send_emails(
             subject=email_subject,
             test_mode=test_mode,
             itfind_pdf_path=itfind_pdf_path,  # 같은 경로 전달 (목차 이미지 추출용)
-            itfind_info=itfind_info
+            itfind_info=itfind_info,
+            engine=engine,
         )
 
         if itfind_email_success:
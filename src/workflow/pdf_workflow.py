@@ -9,6 +9,9 @@ from collections import namedtuple
 from typing import Optional, Tuple
 from ..scraper import download_pdf_sync
 from ..pdf_processor import process_pdf
+from ..pdf_optimizer import optimize_pdf
+from ..pdf_session import open_session, session_scope
+from ..storage import get_storage_backend
 from ..failure_tracker import FailureTracker
 from ..utils.notification import send_admin_notification
 from ..itfind_scraper import WeeklyTrend
@@ -32,12 +35,26 @@ def sanitize_error(error_msg: str) -> str:
     return sanitized
 
 
-def download_and_process_pdf(failure_tracker: 'FailureTracker') -> Tuple[Optional[str], Optional[str], Optional[dict]]:
+def _cache_backend():
+    """
+    [S16][S26] 광고 판정·RSS 피드 캐시 스토리지 (운영 실행에서만 기록, 초기화 실패 시 None → 메모리 캐시만)
+    """
+    try:
+        return get_storage_backend()
+    except Exception as e:
+        logger.warning(f"캐시 스토리지 초기화 실패 (메모리 캐시만 사용): {e}")
+        return None
+
+
+def download_and_process_pdf(
+    failure_tracker: 'FailureTracker', pdf_writer: Optional[str] = None
+) -> Tuple[Optional[str], Optional[str], Optional[dict]]:
     """
     전자신문 PDF 다운로드 및 처리
 
     Args:
         failure_tracker: 실패 추적 인스턴스
+        pdf_writer: 광고 제거 PDF 저장 엔진 (None이면 Config.PDF_WRITER_ENGINE)
 
     Returns:
         (원본 PDF 경로, 처리된 PDF 경로, 페이지 정보)
@@ -92,7 +109,11 @@ def download_and_process_pdf(failure_tracker: 'FailureTracker') -> Tuple[Optiona
 
     # PDF 처리 (광고 제거)
     logger.info("3단계: PDF 광고 제거 처리")
-    processed_pdf_path = process_pdf(pdf_path)
+    # [S20] 지문·판정·저장이 같은 문서 세션을 공유 (신문 PDF 파싱 1회)
+    with session_scope(pdf_path):
+        processed_pdf_path = process_pdf(
+            pdf_path, writer=pdf_writer, verdict_cache_backend=_cache_backend()
+        )
 
     if not processed_pdf_path:
         logger.error("PDF 처리 실패")
@@ -102,6 +123,59 @@ def download_and_process_pdf(failure_tracker: 'FailureTracker') -> Tuple[Optiona
     return pdf_path, processed_pdf_path, page_info
 
 
+def written_by_pymupdf(pdf_path: str, processed_pdf_path: Optional[str], pdf_writer: Optional[str] = None) -> bool:
+    """
+    [S18] 광고 제거 결과를 PyMuPDF 저장 엔진(폰트 서브셋 + garbage/deflate)으로 새로 저장했는지
+
+    광고가 없어 원본을 그대로 돌려받았으면 False. PyMuPDF 저장이 실패해 pypdf로 대체된 경우는
+    구분하지 않는다 (첨부 최적화의 무손실 정리를 건너뛰어도 크기만 조금 클 뿐 결과는 유효).
+    """
+    from ..config import Config
+
+    if not processed_pdf_path or processed_pdf_path == pdf_path:
+        return False
+    return (pdf_writer or Config.PDF_WRITER_ENGINE or "pypdf").lower() == "pymupdf"
+
+
+def optimize_attachment(processed_pdf_path: Optional[str], compacted: bool = False) -> Optional[str]:
+    """
+    [S19] 첨부 PDF 크기 최적화 (process_pdf와 send_emails 사이)
+
+    Args:
+        processed_pdf_path: 광고 제거된 PDF 경로
+        compacted: [S18] PyMuPDF 저장 엔진으로 광고를 제거해 이미 무손실 정리된 PDF인지
+
+    Returns:
+        첨부할 PDF 경로 (최적화에 실패하거나 비활성화되면 processed_pdf_path 그대로)
+    """
+    from ..config import Config
+
+    if not processed_pdf_path or not Config.PDF_OPTIMIZE_ENABLED:
+        return processed_pdf_path
+
+    logger.info("3-1단계: 첨부 PDF 크기 최적화")
+    try:
+        result = optimize_pdf(processed_pdf_path, compacted=compacted)
+    except Exception as e:
+        logger.warning(f"첨부 PDF 최적화 실패 (원본 사용): {e}")
+        return processed_pdf_path
+
+    before_mb = result.original_bytes / (1024 * 1024)
+    after_mb = result.optimized_bytes / (1024 * 1024)
+    if result.optimized:
+        method = "무손실 정리" if result.step is None else f"{result.step[1]}dpi/q{result.step[2]}"
+        logger.info(
+            f"✅ 첨부 PDF 최적화 완료: {before_mb:.2f} MB → {after_mb:.2f} MB "
+            f"({result.saved_ratio:.0%} 감소, {method}, {result.duration_ms:.0f} ms)"
+        )
+    else:
+        logger.info(
+            f"첨부 PDF 최적화 미적용 — 원본 사용: {before_mb:.2f} MB "
+            f"({result.reason}, {result.duration_ms:.0f} ms)"
+        )
+    return result.path
+
+
 def download_itfind_pdf() -> Tuple[Optional[str], Optional[object]]:
     """
     ITFIND 주간기술동향 PDF 다운로드
@@ -145,7 +219,7 @@ def download_itfind_pdf() -> Tuple[Optional[str], Optional[object]]:
             from lambda_itfind_downloader import download_itfind_pdf as _download_async
 
             logger.info("ITFIND 다운로드 함수 직접 호출 중... (로컬 모드)")
-            data = asyncio.run(_download_async())
+            data = asyncio.run(_download_async(feed_cache_backend=_cache_backend()))
 
             if data is None:
                 logger.warning("ITFIND PDF를 찾지 못했습니다 (주간기술동향 없음)")
@@ -159,6 +233,9 @@ def download_itfind_pdf() -> Tuple[Optional[str], Optional[object]]:
         with open(itfind_pdf_path, 'wb') as f:
             f.write(pdf_data)
 
+        # [S20] 디코딩한 바이트로 세션 등록 → 목차 렌더링·첨부에서 파일을 다시 읽지 않음
+        open_session(itfind_pdf_path, data=pdf_data)
+
         logger.info(f"✅ ITFIND PDF 다운로드 성공: {itfind_pdf_path}")
         logger.info(f"   제목: {data['title']}")
         logger.info(f"   호수: {data['issue_number']}호")
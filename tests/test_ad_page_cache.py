@@ -0,0 +1,130 @@
+"""
+[S16] 광고 판정 캐시 검증
+
+- 같은 광고 소재는 다른 날 PDF(xref 번호가 다름)에서도 같은 지문
+- 두 번째 분석에서 반복 페이지는 캐시 판정을 쓰고 분석 대상에서 빠짐
+- 적중·미스 카운터, 메모리 LRU 축출, SQLite 항목 수 상한(ttl 순) 축출
+- 판정 설정이 바뀌면 네임스페이스가 달라짐
+"""
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+fitz = pytest.importorskip("fitz")
+
+from pypdf import PdfReader
+
+from src import ad_page_cache
+from src.ad_page_cache import AdPageVerdictCache, fingerprint_pages, verdict_namespace
+from src.config import Config
+from src.pdf_processor import PDFProcessor
+from src.storage.sqlite_backend import SQLiteBackend
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "cache.db"))
+    ad_page_cache.clear_memory_cache()
+    sqlite = SQLiteBackend()
+    with patch.object(ad_page_cache, "get_storage_backend", return_value=sqlite):
+        yield sqlite
+    ad_page_cache.clear_memory_cache()
+
+
+def _edition(path, article_texts, with_ad=True):
+    """기사 면들 + (선택) 동일 이미지 광고 면으로 된 PDF"""
+    doc = fitz.open()
+    banner = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 120, 160), False)
+    banner.set_rect(banner.irect, (10, 120, 200))
+    for text in article_texts:
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(40, 40, 560, 800), text * 60, fontsize=9)
+    if with_ad:
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=banner)
+        page.insert_text((40, 810), "SALE", fontsize=18)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class TestFingerprint:
+
+    def test_same_creative_matches_across_editions(self, tmp_path):
+        day1 = _edition(str(tmp_path / "d1.pdf"), ["Monday news. "])
+        day2 = _edition(str(tmp_path / "d2.pdf"), ["Tuesday news. ", "More tuesday news. "])
+
+        fp1 = fingerprint_pages(day1, range(2))
+        fp2 = fingerprint_pages(day2, range(3))
+        assert fp1[1] == fp2[2]        # 같은 광고 소재
+        assert fp1[0] != fp2[0]        # 다른 기사
+
+    def test_namespace_tracks_verdict_settings(self):
+        base = verdict_namespace(Config)
+        with patch.object(Config, "AD_TEXT_LENGTH_THRESHOLD", 80):
+            assert verdict_namespace(Config) != base
+
+
+class TestVerdictCache:
+
+    def test_second_edition_reuses_known_verdicts(self, backend, tmp_path):
+        day1 = _edition(str(tmp_path / "d1.pdf"), ["Monday news. "])
+        day2 = _edition(str(tmp_path / "d2.pdf"), ["Monday news. ", "Tuesday news. "])
+
+        processor = PDFProcessor(verdict_cache_backend=backend)
+        assert processor._identify_ad_pages(PdfReader(day1), None, pdf_path=day1) == [1]
+        assert processor.verdict_cache_stats["misses"] == 2
+        assert processor.verdict_cache_stats["stored"] == 2
+
+        # 다른 프로세스(콜드 스타트) 가정: 메모리 캐시 비우고 스토리지에서 조회
+        ad_page_cache.clear_memory_cache()
+        with patch.object(processor, "_cascade_classify",
+                          wraps=processor._cascade_classify) as cascade:
+            assert processor._identify_ad_pages(PdfReader(day2), None, pdf_path=day2) == [2]
+
+        assert cascade.call_args.args[0] == [1]  # 새 기사 면만 분석
+        stats = processor.verdict_cache_stats
+        assert stats["storage_hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["stored"] == 1
+
+        # 같은 프로세스 재실행: 메모리 적중
+        processor._identify_ad_pages(PdfReader(day2), None, pdf_path=day2)
+        assert processor.verdict_cache_stats["memory_hits"] == 3
+
+    def test_processor_without_backend_stays_in_memory(self, backend, tmp_path):
+        """스토리지를 주입하지 않은 PDFProcessor는 판정을 운영 스토리지에 기록하지 않는다"""
+        day1 = _edition(str(tmp_path / "d1.pdf"), ["Monday news. "])
+
+        with patch.object(ad_page_cache, "get_storage_backend") as storage:
+            processor = PDFProcessor()
+            assert processor._identify_ad_pages(PdfReader(day1), None, pdf_path=day1) == [1]
+            assert processor._identify_ad_pages(PdfReader(day1), None, pdf_path=day1) == [1]
+
+        storage.assert_not_called()
+        assert processor.verdict_cache_stats["memory_hits"] == 2
+        assert processor.verdict_cache_stats["stored"] == 0
+
+    def test_memory_lru_evicts_least_recently_used(self, backend):
+        with patch.object(Config, "AD_PAGE_CACHE_MAX_ENTRIES", 2):
+            cache = AdPageVerdictCache(Config, backend=None)
+        cache._backend = None  # 메모리만 사용
+        cache.store({"a": True, "b": False})
+        assert cache.lookup({0: "a"}) == {0: True}   # a 최근 사용
+        cache.store({"c": True})                      # b 축출
+        assert cache.lookup({0: "a", 1: "b", 2: "c"}) == {0: True, 2: True}
+        assert cache.stats["memory_evicted"] == 1
+
+    def test_sqlite_prune_keeps_most_recently_refreshed(self, backend):
+        backend.put_cache_items("ns", {"old": "1"}, ttl_days=1)
+        backend.put_cache_items("ns", {"mid": "1"}, ttl_days=2)
+        backend.put_cache_items("ns", {"new": "0"}, ttl_days=3)
+        backend.put_cache_items("other", {"old": "1"}, ttl_days=1)
+
+        assert backend.prune_cache_items("ns", 2) == 1
+        assert backend.get_cache_items("ns", ["old", "mid", "new"]) == {"mid": "1", "new": "0"}
+        assert backend.get_cache_items("other", ["old"]) == {"old": "1"}
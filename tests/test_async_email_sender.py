@@ -0,0 +1,198 @@
+"""
+[S6] asyncio 전송 엔진 검증 (로컬 aiosmtpd 싱크 대상)
+
+- 세마포어 한도 이내에서 모든 수신자에게 실제 SMTP 트랜잭션으로 전달되는지
+- 메시지별 타임아웃 초과 시 실패로 집계되고 연속 실패 회로가 동작하는지
+- [S9] 속도 제어기가 줄인 동시성 한도를 지키고, 메시지 조립은 이벤트 루프 밖에서 하는지
+- send_emails / send_pdf_bulk_email에서 engine="async"로 선택되는지
+"""
+import asyncio
+import email
+import os
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip("aiosmtplib")
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+
+from src.async_email_sender import AsyncEmailSender
+from src.email_sender import EmailSender, create_email_sender
+from src.smtp_rate_controller import SMTPRateController
+
+
+@dataclass
+class _FakeRecipient:
+    email: str
+    name: str = "Test"
+
+
+class _SinkHandler:
+    """수신 메시지를 메모리에 보관하는 aiosmtpd 핸들러 (동시 트랜잭션 수 기록)"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.envelopes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            self.envelopes.append(envelope)
+            return "250 Message accepted for delivery"
+        finally:
+            self.in_flight -= 1
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_sink():
+    def _start(delay: float = 0.0):
+        handler = _SinkHandler(delay=delay)
+        controller = aiosmtpd_controller.Controller(
+            handler, hostname="127.0.0.1", port=_free_port()
+        )
+        controller.start()
+        started.append(controller)
+        return handler, controller
+
+    started = []
+    yield _start
+    for controller in started:
+        controller.stop()
+
+
+@pytest.fixture
+def tmp_etnews_pdf(tmp_path):
+    pdf = tmp_path / "etnews_20260417.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n" + b"x" * 2048 + b"\n%%EOF")
+    return str(pdf)
+
+
+def _make_sender(controller) -> AsyncEmailSender:
+    s = AsyncEmailSender()
+    s.config = Mock()
+    s.config.GMAIL_USER = "sender@example.com"
+    s.config.GMAIL_APP_PASSWORD = ""  # 로컬 싱크: 로그인 생략
+    s.config.ADMIN_EMAIL = "admin@example.com"
+    s.config.SMTP_MAX_RETRIES = 1
+    s.config.SMTP_RETRY_DELAY = 0
+    s.config.SMTP_CONSECUTIVE_FAIL_LIMIT = 5
+    s.config.SMTP_RECONNECT_EVERY = 50
+    s.config.SMTP_ASYNC_CONCURRENCY = 3
+    s.config.SMTP_MESSAGE_TIMEOUT = 5
+    s.smtp_host = controller.hostname
+    s.smtp_port = controller.port
+    s.use_starttls = False
+    s.unsubscribe_url_base = "https://example.com/u"
+    s.unsubscribe_secret = "test_secret_for_unit_tests"
+    return s
+
+
+class TestAsyncDeliveryEngine:
+
+    def test_delivers_every_recipient_within_concurrency_bound(self, smtp_sink, tmp_etnews_pdf):
+        """수신자 8명 전원에게 전달되고, 동시 DATA 트랜잭션은 세마포어 한도(3) 이하여야 한다"""
+        handler, controller = smtp_sink(delay=0.05)
+        sender = _make_sender(controller)
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(8)]
+
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email",
+                   return_value=b"\xff\xd8\xff" + b"\x00" * 64):
+            ok, success = sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert ok is True
+        assert success == [r.email for r in recipients]
+        assert len(handler.envelopes) == 8
+        assert 1 < handler.max_in_flight <= 3
+
+        delivered = {env.rcpt_tos[0]: email.message_from_bytes(env.content) for env in handler.envelopes}
+        assert set(delivered) == {r.email for r in recipients}
+        for addr, msg in delivered.items():
+            assert msg["To"] == addr
+            types = [p.get_content_type() for p in msg.get_payload()]
+            assert types == ["text/html", "image/jpeg", "application/pdf"]
+
+    def test_message_timeout_counts_as_failure_and_trips_circuit(self, smtp_sink, tmp_etnews_pdf):
+        """메시지별 타임아웃을 넘기면 실패로 집계되고 연속 실패 한도에서 중단되어야 한다"""
+        handler, controller = smtp_sink(delay=2.0)
+        sender = _make_sender(controller)
+        sender.config.SMTP_MESSAGE_TIMEOUT = 0.3
+        sender.config.SMTP_ASYNC_CONCURRENCY = 1
+        sender.config.SMTP_CONSECUTIVE_FAIL_LIMIT = 2
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(6)]
+
+        started = time.monotonic()
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email", return_value=None):
+            ok, success = sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+        elapsed = time.monotonic() - started
+
+        assert ok is False
+        assert success == []
+        # 2회 타임아웃 후 중단 → 6명 × 2초를 기다리지 않음
+        assert elapsed < 6
+
+    def test_reduced_concurrency_limit_and_off_loop_assembly(self, smtp_sink, tmp_etnews_pdf):
+        """제어기가 동시성을 1로 줄여 두면 한 번에 1건만 진행하고, 한도가 오르면 대기 중인 수신자가 이어서 전송"""
+        handler, controller = smtp_sink(delay=0.05)
+        sender = _make_sender(controller)
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(6)]
+
+        rate = SMTPRateController(max_concurrency=3, max_rate=1000.0, latency_target=10.0)
+        rate._window = 1.0  # 스로틀링으로 한도가 줄어든 상태
+        sender._create_rate_controller = Mock(return_value=rate)
+
+        assembled_on = []
+        original = sender._assemble_message
+
+        def assemble(*args, **kwargs):
+            assembled_on.append(threading.get_ident())
+            return original(*args, **kwargs)
+        sender._assemble_message = assemble
+
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email", return_value=None):
+            ok, success = sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert ok is True
+        assert success == [r.email for r in recipients]
+        assert rate.concurrency > 1  # 성공이 이어지며 한도 상향
+        assert handler.max_in_flight <= rate.concurrency
+        assert threading.get_ident() not in assembled_on
+        assert len(assembled_on) == len(recipients)
+
+
+class TestEngineSelection:
+
+    def test_create_email_sender_async(self):
+        assert isinstance(create_email_sender("async"), AsyncEmailSender)
+
+    def test_create_email_sender_defaults_to_sync(self):
+        sender = create_email_sender("sync")
+        assert type(sender) is EmailSender
+
+    def test_send_emails_passes_engine_through(self):
+        from src.workflow import email_workflow
+
+        with patch.object(email_workflow, "send_pdf_bulk_email",
+                          return_value=(True, ["a@example.com"])) as mock_send:
+            email_workflow.send_emails("/tmp/etnews.pdf", test_mode=True, engine="async")
+
+        assert mock_send.call_args.kwargs["engine"] == "async"
@@ -0,0 +1,46 @@
+"""
+벌크 전송 벤치마크 하네스 스모크 테스트
+
+로컬 SMTP 싱크로 실제 전송이 이루어지고, 리포트 JSON과 회귀 판정이 동작하는지만 확인한다
+(처리량 수치 자체는 검증하지 않음).
+"""
+import json
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scripts.benchmark_bulk_email import find_regressions, main  # noqa: E402
+
+
+def test_benchmark_reports_per_phase_metrics(tmp_path):
+    output = tmp_path / "bench.json"
+    # 합성 수신자 토큰·원장 기록이 실제 스토리지에 남으면 안 됨
+    with patch("src.storage.get_storage_backend", side_effect=AssertionError("스토리지 사용 금지")) as storage:
+        code = main([
+            "--recipients", "3", "--pdf-mb", "0.05", "--engine", "sync",
+            "--output", str(output),
+        ])
+    storage.assert_not_called()
+
+    assert code == 0
+    report = json.loads(output.read_text(encoding="utf-8"))
+    (result,) = report["results"]
+    assert result["ok"] is True
+    assert result["delivered"] == 3
+    assert result["sink_messages"] == 3
+    assert result["sink_bytes"] > result["pdf_bytes"] * 3  # base64 팽창 포함
+    assert result["messages_per_sec"] > 0
+    assert set(result["phases"]) == {"prepare", "deliver"}
+    for phase in result["phases"].values():
+        assert phase["wall_sec"] >= 0 and phase["peak_rss_mb"] > 0
+
+
+def test_find_regressions_flags_throughput_drop():
+    base = [{"engine": "sync", "recipients": 10, "pdf_bytes": 1, "messages_per_sec": 100.0}]
+    slower = [{"engine": "sync", "recipients": 10, "pdf_bytes": 1, "messages_per_sec": 70.0}]
+    similar = [{"engine": "sync", "recipients": 10, "pdf_bytes": 1, "messages_per_sec": 85.0}]
+
+    assert len(find_regressions(slower, base, tolerance=0.2)) == 1
+    assert find_regressions(similar, base, tolerance=0.2) == []
@@ -0,0 +1,170 @@
+"""
+[S8] 수신인별 발송 원장 검증
+
+- SQLite 백엔드에 발송 단위(issue_key)별로 기록·조회되는지
+- 회로 차단으로 중단된 발송을 재실행하면 원장에 없는 수신인에게만 전송되는지
+- TEST 모드에서는 원장을 사용하지 않는지
+"""
+import os
+import smtplib
+import sys
+from dataclasses import dataclass
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.delivery_tracker import DeliveryLedger
+from src.email_sender import EmailSender
+from src.storage.sqlite_backend import SQLiteBackend
+
+
+@dataclass
+class _FakeRecipient:
+    email: str
+    name: str = "Test"
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "ledger.db"))
+    return SQLiteBackend()
+
+
+@pytest.fixture
+def tmp_etnews_pdf(tmp_path):
+    pdf = tmp_path / "etnews_20260417.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n" + b"x" * 1024 + b"\n%%EOF")
+    return str(pdf)
+
+
+@pytest.fixture
+def sender(backend):
+    s = EmailSender()
+    s.config = Mock()
+    s.config.GMAIL_USER = "sender@example.com"
+    s.config.ADMIN_EMAIL = "admin@example.com"
+    s.config.SMTP_MAX_RETRIES = 1
+    s.config.SMTP_RETRY_DELAY = 0
+    s.config.SMTP_CONSECUTIVE_FAIL_LIMIT = 2
+    s.config.SMTP_RECONNECT_EVERY = 50
+    s.config.SMTP_POOL_SIZE = 1
+    s.config.DELIVERY_LEDGER_ENABLED = True
+    s.config.DELIVERY_LEDGER_TTL_DAYS = 14
+    s.unsubscribe_url_base = "https://example.com/u"
+    s.unsubscribe_secret = "test_secret_for_unit_tests"
+    s._open_smtp_connection = Mock(return_value=Mock(name="FakeSMTPServer"))
+    return s
+
+
+class TestSQLiteLedger:
+
+    def test_records_are_scoped_by_issue_key(self, backend):
+        backend.put_delivery_record("2026-04-17#A", "a@example.com")
+        backend.put_delivery_record("2026-04-17#A", "b@example.com")
+        backend.put_delivery_record("2026-04-17#B", "a@example.com")
+        # 같은 수신인 재기록은 덮어쓰기
+        backend.put_delivery_record("2026-04-17#A", "a@example.com")
+
+        assert backend.get_delivered_emails("2026-04-17#A") == {"a@example.com", "b@example.com"}
+        assert backend.get_delivered_emails("2026-04-17#B") == {"a@example.com"}
+        assert backend.get_delivered_emails("2026-04-18#A") == set()
+
+
+class TestResumableBulkSend:
+
+    def _run(self, sender, backend, recipients, pdf_path, test_mode=False):
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.delivery_tracker.get_storage_backend", return_value=backend), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email", return_value=None):
+            return sender.send_bulk_email(pdf_path=pdf_path, subject="IT뉴스", test_mode=test_mode)
+
+    def test_rerun_after_circuit_break_only_targets_missing(self, sender, backend, tmp_etnews_pdf):
+        """회로 차단 후 재실행 시 이미 수락된 수신인에게는 다시 보내지 않아야 한다"""
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(6)]
+
+        # 1차: 3명 성공 후 SMTP 장애 → 연속 2회 실패로 중단
+        calls = []
+
+        def flaky(server, msg, to):
+            calls.append(to[0])
+            if len(calls) > 3:
+                raise smtplib.SMTPException("simulated outage")
+            return server
+
+        sender._send_on_server = Mock(side_effect=flaky)
+        ok, success = self._run(sender, backend, recipients, tmp_etnews_pdf)
+        assert ok is True
+        assert success == ["u0@example.com", "u1@example.com", "u2@example.com"]
+
+        issue_key = DeliveryLedger.make_issue_key("IT뉴스")
+        assert backend.get_delivered_emails(issue_key) == set(success)
+
+        # 2차: 장애 복구 후 재실행 → 남은 3명만 전송
+        sender._send_on_server = Mock(side_effect=lambda server, msg, to: server)
+        ok, success = self._run(sender, backend, recipients, tmp_etnews_pdf)
+
+        sent_to = [c.args[2][0] for c in sender._send_on_server.call_args_list]
+        assert sent_to == ["u3@example.com", "u4@example.com", "u5@example.com"]
+        assert ok is True
+        assert success == [r.email for r in recipients]
+
+        # 3차: 모두 전송 완료 → SMTP 연결 없이 종료
+        sender._open_smtp_connection.reset_mock()
+        sender._send_on_server.reset_mock()
+        ok, success = self._run(sender, backend, recipients, tmp_etnews_pdf)
+        assert ok is True
+        assert success == [r.email for r in recipients]
+        sender._open_smtp_connection.assert_not_called()
+        sender._send_on_server.assert_not_called()
+
+    def test_complete_when_another_worker_delivered_the_rest(self, sender, backend, tmp_etnews_pdf):
+        """이번 실행에서 보낸 건이 없어도 원장상 전원이 받았으면 성공으로 보고"""
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(3)]
+        issue_key = DeliveryLedger.make_issue_key("IT뉴스")
+        backend.put_delivery_record(issue_key, "u0@example.com")
+
+        def delivered_elsewhere(pending, shared):
+            # 같은 스풀을 비우는 다른 전송 워커가 남은 수신인을 먼저 보낸 경우
+            for recipient in pending:
+                backend.put_delivery_record(issue_key, recipient.email)
+            return [], 0
+
+        sender._deliver = Mock(side_effect=delivered_elsewhere)
+        ok, success = self._run(sender, backend, recipients, tmp_etnews_pdf)
+
+        assert ok is True
+        assert success == [r.email for r in recipients]
+
+    def test_default_subject_uses_ledger_date(self, sender, backend, tmp_etnews_pdf):
+        """UTC 자정 전(KST 다음 날 새벽)에도 기본 제목 날짜와 원장 키 날짜가 같아야 한다"""
+        from datetime import datetime as real_datetime, timezone
+
+        class _FixedDatetime(real_datetime):
+            @classmethod
+            def now(cls, tz=None):
+                utc = real_datetime(2026, 10, 16, 15, 30, tzinfo=timezone.utc)  # KST 10/17 00:30
+                return utc.astimezone(tz) if tz else utc.replace(tzinfo=None)
+
+        sender._send_on_server = Mock(side_effect=lambda server, msg, to: server)
+        with patch("src.email_sender.get_active_recipients", return_value=[_FakeRecipient("a@example.com")]), \
+             patch("src.delivery_tracker.get_storage_backend", return_value=backend), \
+             patch("src.delivery_tracker.datetime", _FixedDatetime), \
+             patch("src.email_sender.datetime", _FixedDatetime), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email", return_value=None):
+            ok, _ = sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert ok is True
+        assert backend.get_delivered_emails("2026-10-17#IT뉴스 [2026-10-17]") == {"a@example.com"}
+
+    def test_test_mode_does_not_use_ledger(self, sender, backend, tmp_etnews_pdf):
+        """TEST 모드 발송은 원장에 기록하지 않고, 재실행 시에도 다시 전송해야 한다"""
+        sender._send_on_server = Mock(side_effect=lambda server, msg, to: server)
+
+        for _ in range(2):
+            ok, _ = self._run(sender, backend, [], tmp_etnews_pdf, test_mode=True)
+            assert ok is True
+
+        assert sender._send_on_server.call_count == 2
+        assert backend.get_delivered_emails(DeliveryLedger.make_issue_key("IT뉴스")) == set()
@@ -12,7 +12,9 @@ email_workflow.py의 실제 호출 시나리오는 두 가지뿐이다:
 를 검증한다.
 
 실제 SMTP는 호출하지 않는다 (_send_via_smtp mock).
+[S4] _assemble_message는 전송용 bytes를 반환하므로 검증 시 파싱해서 사용한다.
 """
+import email
 import os
 import sys
 import hashlib
@@ -26,6 +28,7 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.email_sender import EmailSender
+from src.mime_template import RenderedMessage
 
 
 @dataclass
@@ -87,9 +90,18 @@ def sender():
     return s
 
 
+def _as_message(msg):
+    """[S4] 전송용 bytes 메시지를 email.message.Message로 파싱 (MIME 객체는 그대로)"""
+    if isinstance(msg, RenderedMessage):
+        msg = bytes(msg)
+    if isinstance(msg, bytes):
+        return email.message_from_bytes(msg)
+    return msg
+
+
 def _get_html_body(msg):
     """MIME 메시지에서 text/html 파트의 디코딩된 문자열 추출"""
-    for part in msg.walk():
+    for part in _as_message(msg).walk():
         if part.get_content_type() == "text/html":
             payload = part.get_payload(decode=True)
             if isinstance(payload, bytes):
@@ -254,6 +266,42 @@ class TestBulkEmailPersonalization:
         assert "alice@example.com" in alice_body or True  # body는 html임, To는 헤더에
 
 
+# ────────────────────────────────────────────────────────────────
+# [S12] 사전 인코딩 본문 템플릿
+# ────────────────────────────────────────────────────────────────
+class TestBulkEmailPrecompiledBody:
+
+    def test_body_built_once_and_matches_per_recipient_rendering(
+        self, sender, tmp_itfind_pdf
+    ):
+        """본문 HTML은 발송당 1회만 만들고, 수신자별 결과는 기존 렌더링과 같아야 한다"""
+        sender.config.EMAIL_BODY_PRECOMPILE = True
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(3)]
+        info = _FakeWeeklyTrend()
+        info.categorized_topics = {"AI": ["거대 언어 모델 " * 10, "에이전트"], "반도체": ["HBM"]}
+        sent = []
+
+        def capture(server, msg, to_emails):
+            sent.append((to_emails[0], _as_message(msg)))
+            return server
+
+        sender._send_on_server = Mock(side_effect=capture)
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_toc_page_for_email", return_value=None), \
+             patch.object(sender, "_create_email_body", wraps=sender._create_email_body) as body_spy:
+            ok, _ = sender.send_bulk_email(
+                pdf_path=tmp_itfind_pdf, itfind_pdf_path=tmp_itfind_pdf, itfind_info=info
+            )
+
+        assert ok is True
+        assert body_spy.call_count == 1
+        for addr, msg in sent:
+            html_part = next(p for p in msg.walk() if p.get_content_type() == "text/html")
+            assert html_part["Content-Transfer-Encoding"] == "quoted-printable"
+            expected = sender._create_email_body(addr, info)
+            assert _get_html_body(msg).replace("\r\n", "\n") == expected
+
+
 # ────────────────────────────────────────────────────────────────
 # PDF 바이트 일관성
 # ────────────────────────────────────────────────────────────────
@@ -357,7 +405,7 @@ class TestBulkEmailPdfConsistency:
         hashes = []
 
         def capture(server, msg, to_emails):
-            for part in msg.walk():
+            for part in _as_message(msg).walk():
                 if part.get_content_type() == "application/pdf":
                     payload = part.get_payload(decode=True)
                     hashes.append(hashlib.md5(payload).hexdigest())
@@ -374,3 +422,194 @@ class TestBulkEmailPdfConsistency:
         assert len(hashes) == 3
         assert len(set(hashes)) == 1, \
             f"수신자 간 PDF 해시 불일치: {hashes}"
+
+
+# ────────────────────────────────────────────────────────────────
+# [S5] 다중 SMTP 세션 병렬 전송
+# ────────────────────────────────────────────────────────────────
+class TestBulkEmailParallelPool:
+
+    def test_pool_opens_one_connection_per_worker(self, sender, tmp_etnews_pdf):
+        """SMTP_POOL_SIZE=3이면 세션 3개로 전원 발송, 성공 목록은 원래 순서 유지"""
+        import time
+
+        sender.config.SMTP_POOL_SIZE = 3
+        sender._open_smtp_connection = Mock(side_effect=lambda: Mock(name="Server"))
+
+        def slow_send(server, msg, to):
+            time.sleep(0.01)  # 한 워커가 큐를 독식하지 않도록 전송 지연 흉내
+            return server
+
+        sender._send_on_server = Mock(side_effect=slow_send)
+        recipients = [_FakeRecipient(f"u{i}@ex.com") for i in range(10)]
+
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email",
+                   return_value=b"ETN"):
+            ok, success = sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert ok is True
+        assert success == [r.email for r in recipients]
+        assert sender._open_smtp_connection.call_count == 3
+        assert sender._send_on_server.call_count == 10
+
+    def test_pool_circuit_breaker_stops_all_workers(self, sender, tmp_etnews_pdf):
+        """병렬 모드에서도 연속 실패 한도에 도달하면 남은 수신자를 건너뛰어야 한다"""
+        import smtplib
+
+        sender.config.SMTP_POOL_SIZE = 2
+        sender.config.SMTP_CONSECUTIVE_FAIL_LIMIT = 3
+        sender._open_smtp_connection = Mock(side_effect=lambda: Mock(name="Server"))
+        sender._send_on_server = Mock(side_effect=smtplib.SMTPException("simulated"))
+        recipients = [_FakeRecipient(f"u{i}@ex.com") for i in range(50)]
+
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email",
+                   return_value=b"ETN"):
+            ok, success = sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert ok is False
+        assert success == []
+        # 워커 2개가 동시에 한도를 넘길 수 있으므로 한도 + 워커 수 이내에서 중단
+        assert sender._send_on_server.call_count <= 3 + 2
+
+    def test_pool_worker_connection_failure_requeues_recipient(self, sender, tmp_etnews_pdf):
+        """한 세션의 연결이 실패해도 다른 세션이 남은 수신자를 처리해야 한다"""
+        sender.config.SMTP_POOL_SIZE = 2
+        calls = {"n": 0}
+
+        def open_conn():
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise Exception("connect refused")
+            return Mock(name="Server")
+
+        sender._open_smtp_connection = Mock(side_effect=open_conn)
+        recipients = [_FakeRecipient(f"u{i}@ex.com") for i in range(6)]
+
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email",
+                   return_value=b"ETN"):
+            ok, success = sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert ok is True
+        assert sorted(success) == sorted(r.email for r in recipients)
+
+    def test_requeued_recipients_retried_after_all_workers_exit(self, sender, tmp_etnews_pdf):
+        """모든 워커가 연결 실패로 종료해도 큐에 남은 수신자는 단일 연결로 재시도"""
+        sender.config.SMTP_POOL_SIZE = 2
+        calls = {"n": 0}
+
+        def open_conn():
+            calls["n"] += 1
+            if calls["n"] <= 2:
+                raise Exception("connect refused")
+            return Mock(name="Server")
+
+        sender._open_smtp_connection = Mock(side_effect=open_conn)
+        recipients = [_FakeRecipient(f"u{i}@ex.com") for i in range(6)]
+
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email",
+                   return_value=b"ETN"):
+            ok, success = sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert ok is True
+        assert success == [r.email for r in recipients]
+        assert sender._send_on_server.call_count == 6
+
+    def test_unreachable_leftovers_counted_as_failures(self, sender, tmp_etnews_pdf, caplog):
+        """재시도 연결까지 실패하면 남은 수신자는 경고가 아니라 실패로 집계"""
+        import logging
+
+        sender.config.SMTP_POOL_SIZE = 2
+        sender._open_smtp_connection = Mock(side_effect=Exception("connect refused"))
+        recipients = [_FakeRecipient(f"u{i}@ex.com") for i in range(6)]
+
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email",
+                   return_value=b"ETN"), \
+             caplog.at_level(logging.INFO, logger="src.email_sender"):
+            ok, success = sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert ok is False
+        assert success == []
+        assert "성공 0명, 실패 6명" in caplog.text
+
+
+# ────────────────────────────────────────────────────────────────
+# [S21] 미리보기 렌더링 · PDF 로딩 · SMTP 연결 수립 겹치기
+# ────────────────────────────────────────────────────────────────
+class TestBulkEmailPreviewOverlap:
+
+    @pytest.fixture
+    def overlap_sender(self, sender):
+        sender.config.EMAIL_PREVIEW_RENDER_WORKERS = 2
+        sender.config.EMAIL_SMTP_PREWARM = True
+        return sender
+
+    def test_previews_and_handshake_run_concurrently(
+        self, overlap_sender, tmp_etnews_pdf, tmp_itfind_pdf
+    ):
+        """1면·목차 렌더링과 첫 SMTP 연결이 동시에 진행되고, 선행 연결을 전송에 그대로 사용"""
+        import threading
+
+        # 세 작업이 모두 동시에 진행 중이어야만 통과하는 장벽 (순차 실행이면 시간 초과)
+        barrier = threading.Barrier(3, timeout=5)
+        server = Mock(name="PrewarmedServer")
+
+        def render(tag):
+            def _render(path):
+                barrier.wait()
+                return tag
+            return _render
+
+        def handshake():
+            barrier.wait()
+            return server
+
+        overlap_sender._open_smtp_connection = Mock(side_effect=handshake)
+        recipients = [_FakeRecipient("a@example.com"), _FakeRecipient("b@example.com")]
+
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email", side_effect=render(b"ETN")), \
+             patch("src.pdf_image_extractor.extract_toc_page_for_email", side_effect=render(b"TOC")):
+            ok, success = overlap_sender.send_bulk_email(
+                pdf_path=tmp_etnews_pdf, itfind_pdf_path=tmp_itfind_pdf
+            )
+
+        assert ok is True
+        assert len(success) == 2
+        assert overlap_sender._open_smtp_connection.call_count == 1
+        sent_servers = {c.args[0] for c in overlap_sender._send_on_server.call_args_list}
+        assert sent_servers == {server}
+        msg = _as_message(overlap_sender._send_on_server.call_args_list[0].args[1])
+        images = [p.get_payload(decode=True) for p in msg.walk() if p.get_content_maintype() == "image"]
+        assert images == [b"ETN", b"TOC"]
+
+    def test_render_failure_falls_back_to_text(self, overlap_sender, tmp_etnews_pdf):
+        """워커 스레드의 렌더링 예외는 기존처럼 이미지 없이 발송"""
+        with patch("src.email_sender.get_active_recipients",
+                   return_value=[_FakeRecipient("a@example.com")]), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email",
+                   side_effect=RuntimeError("render boom")):
+            ok, _ = overlap_sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert ok is True
+        msg = _as_message(overlap_sender._send_on_server.call_args_list[0].args[1])
+        assert not [p for p in msg.walk() if p.get_content_maintype() == "image"]
+        assert "cid:etnews_first_page" not in _get_html_body(msg)
+
+    def test_unused_prewarm_connection_is_closed(self, overlap_sender, tmp_etnews_pdf):
+        """공통 자산 준비가 실패해 전송하지 않으면 선행 연결을 닫음"""
+        server = overlap_sender._open_smtp_connection.return_value
+
+        with patch("src.email_sender.get_active_recipients",
+                   return_value=[_FakeRecipient("a@example.com")]), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email", return_value=b"ETN"), \
+             patch("src.email_sender.read_pdf_bytes", side_effect=OSError("disk")):
+            ok, success = overlap_sender.send_bulk_email(pdf_path=tmp_etnews_pdf)
+
+        assert (ok, success) == (False, [])
+        server.quit.assert_called_once()
+        assert overlap_sender._smtp_prewarm is None
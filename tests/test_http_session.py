@@ -0,0 +1,152 @@
+"""
+[S25] ITFIND 공유 HTTP 세션 검증
+
+- 같은 호스트로 여러 번 요청해도 keep-alive 연결 1개를 재사용하는지
+- 503 응답은 재시도 후 성공하는지
+- 공통 헤더(User-Agent, Referer)가 세션에서 붙는지
+- download_pdf_direct가 스트리밍 응답을 닫아 연결을 풀에 돌려주는지
+"""
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import lambda_itfind_downloader
+from src.utils import http_session
+from src.utils.http_session import (
+    DEFAULT_HEADERS,
+    close_http_session,
+    create_http_session,
+    get_http_session,
+    http_stats,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        server.seen.append(dict(self.headers))
+        if self.path == "/flaky" and server.failures > 0:
+            server.failures -= 1
+            status, body = 503, b"busy"
+        else:
+            status, body = 200, b"ok:" + self.path.encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.seen = []
+    httpd.failures = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+class TestHttpSession:
+
+    def test_connection_reused_across_requests(self, server):
+        session = create_http_session(retry_total=0)
+        for path in ("/rss", "/detail", "/pdf"):
+            response = session.get(_url(server, path), timeout=5)
+            assert response.text == "ok:" + path
+
+        stats = http_stats(session)
+        assert stats["requests"] == 3
+        assert stats["connections"] == 1
+        session.close()
+
+    def test_retries_503(self, server):
+        server.failures = 2
+        session = create_http_session(retry_total=3, backoff_factor=0)
+        response = session.get(_url(server, "/flaky"), timeout=5)
+        assert response.status_code == 200
+        assert len(server.seen) == 3
+        session.close()
+
+    def test_gives_up_with_last_response(self, server):
+        server.failures = 5
+        session = create_http_session(retry_total=1, backoff_factor=0)
+        response = session.get(_url(server, "/flaky"), timeout=5)
+        assert response.status_code == 503  # raise_for_status()에서 처리
+        session.close()
+
+    def test_default_headers(self, server):
+        session = create_http_session(retry_total=0)
+        session.get(_url(server, "/detail"), headers={"Accept": "*/*"}, timeout=5)
+        sent = server.seen[0]
+        assert sent["User-Agent"] == DEFAULT_HEADERS["User-Agent"]
+        assert sent["Referer"] == DEFAULT_HEADERS["Referer"]
+        assert sent["Accept"] == "*/*"
+        session.close()
+
+    def test_shared_session(self):
+        close_http_session()
+        try:
+            first = get_http_session()
+            assert get_http_session() is first
+            close_http_session()
+            assert http_session._session is None
+            assert get_http_session() is not first
+        finally:
+            close_http_session()
+
+
+class TestDownloaderUsesSession:
+
+    def test_download_pdf_direct_closes_stream(self, tmp_path):
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.headers = {"content-type": "application/pdf"}
+        response.iter_content.return_value = iter([b"%PDF-1.7\n", b"body"])
+        session = MagicMock()
+        session.get.return_value = response
+
+        save_path = str(tmp_path / "out.pdf")
+        assert lambda_itfind_downloader.download_pdf_direct("sd", save_path, session=session)
+
+        assert session.get.call_args.kwargs["stream"] is True
+        response.__exit__.assert_called_once()
+        with open(save_path, "rb") as f:
+            assert f.read() == b"%PDF-1.7\nbody"
+
+    def test_rejects_non_pdf_and_closes_stream(self, tmp_path):
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.headers = {"content-type": "text/html"}
+        response.iter_content.return_value = iter([b"<html>"])
+        session = MagicMock()
+        session.get.return_value = response
+
+        assert not lambda_itfind_downloader.download_pdf_direct("sd", str(tmp_path / "x.pdf"), session=session)
+        response.__exit__.assert_called_once()
+
+    def test_defaults_to_shared_session(self):
+        fake = MagicMock()
+        fake.url = "https://www.itfind.or.kr/streamdocs/view/sd;streamdocsId=abc123"
+        fake.text = ""
+        shared = MagicMock()
+        shared.get.return_value = fake
+        with patch.object(lambda_itfind_downloader, "get_http_session", return_value=shared):
+            assert lambda_itfind_downloader.extract_streamdocs_id_from_detail_page("1") == "abc123"
+        shared.get.assert_called_once()
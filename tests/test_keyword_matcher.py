@@ -0,0 +1,69 @@
+"""
+[S17] 다중 키워드 매처 검증
+
+- 키워드별 횟수가 str.count(겹치지 않게)와 같은지 — str.count 경로와 오토마톤 경로 모두
+- 서로 겹치는 키워드(전면광고 ⊃ 광고, advertisement ⊃ ad)를 각각 세는지
+- PDFProcessor._contains_ad_keywords 판정이 그대로인지
+"""
+import os
+import random
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import Config
+from src.pdf_processor import PDFProcessor
+from src.utils import keyword_matcher
+from src.utils.keyword_matcher import KeywordMatcher, compile_keywords
+
+
+@pytest.fixture(params=[8, 0], ids=["str-count", "automaton"])
+def scan_limit(request):
+    with patch.object(keyword_matcher, "SCAN_PATTERN_LIMIT", request.param):
+        yield request.param
+
+
+class TestKeywordMatcher:
+
+    def test_overlapping_keywords_are_counted_separately(self, scan_limit):
+        matcher = KeywordMatcher(Config.AD_KEYWORDS)
+        counts = matcher.counts("전면광고 Advertisement 광고 ADVERTORIAL read")
+        assert counts == {
+            "광고": 2, "AD": 3, "Advertisement": 1, "전면광고": 1, "advertorial": 1,
+        }
+
+    def test_matches_str_count_semantics(self, scan_limit):
+        rng = random.Random(17)
+        for _ in range(500):
+            keywords = ["".join(rng.choice("abA") for _ in range(rng.randint(1, 4)))
+                        for _ in range(rng.randint(1, 10))]
+            text = "".join(rng.choice("abAc") for _ in range(rng.randint(0, 40)))
+            expected = {k: text.lower().count(k.lower()) for k in keywords}
+            assert KeywordMatcher(keywords).counts(text) == expected
+
+    def test_case_sensitive_contains(self, scan_limit):
+        matcher = KeywordMatcher(["본 내용은", "문의하시기 바랍니다"], ignore_case=False)
+        assert matcher.contains_all("** 본 내용은 필자의 의견이며 ... 문의하시기 바랍니다.")
+        assert not matcher.contains_all("본 내용은 요약입니다")
+        assert matcher.contains_any("본 내용은 요약입니다")
+        assert KeywordMatcher(["AD"], ignore_case=False).found("ad Ad") == []
+
+    def test_compiled_once_per_keyword_tuple(self):
+        assert compile_keywords(("광고", "AD")) is compile_keywords(("광고", "AD"))
+
+
+class TestContainsAdKeywords:
+
+    @pytest.mark.parametrize("text,expected", [
+        ("", False),
+        ("이 면은 전면광고 입니다", True),
+        ("Sponsored Advertisement", True),
+        ("광고 산업과 광고 시장 동향", False),         # 2회 = 임계값, 광고 아님
+        ("광고 광고 광고", True),                      # 3회 > 임계값
+        ("Memory shipments recovered faster than expected.", False),
+    ])
+    def test_verdicts_unchanged(self, text, expected):
+        assert PDFProcessor()._contains_ad_keywords(text) is expected
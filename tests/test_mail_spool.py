@@ -0,0 +1,264 @@
+"""
+[S10] 디스크 스풀 발송 큐 검증
+
+- 렌더링한 메시지가 스풀을 거쳐도 바이트 단위로 동일하게 복원되는지
+- 여러 워커가 동시에 점유해도 메시지가 한 번씩만 점유되는지
+- send_bulk_email이 스풀 모드에서 재시도 시 메시지를 다시 렌더링하지 않는지
+- 중단 후 남은 메시지를 별도 전송 워커가 이어서 보낼 수 있는지
+"""
+import os
+import smtplib
+import sys
+import threading
+from dataclasses import dataclass
+from email.mime.application import MIMEApplication
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.email_sender import EmailSender
+from src.mail_spool import MailSpool, SpoolTransmitter
+from src.mime_template import MessageTemplate
+
+
+@dataclass
+class _FakeRecipient:
+    email: str
+    name: str = "Test"
+
+
+@pytest.fixture
+def spool(tmp_path):
+    return MailSpool(str(tmp_path / "spool"))
+
+
+@pytest.fixture
+def template():
+    t = MessageTemplate(
+        "sender@example.com", "subject",
+        [MIMEApplication(b"%PDF-1.4" + os.urandom(3000), _subtype="pdf")],
+    )
+    yield t
+    t.close()
+
+
+@pytest.fixture
+def sender(tmp_path):
+    s = EmailSender()
+    s.config = Mock()
+    s.config.GMAIL_USER = "sender@example.com"
+    s.config.SMTP_CONSECUTIVE_FAIL_LIMIT = 3
+    s.config.SMTP_RECONNECT_EVERY = 50
+    s.config.SMTP_POOL_SIZE = 2
+    s.config.DELIVERY_LEDGER_ENABLED = False
+    s.config.EMAIL_SPOOL_DIR = str(tmp_path / "spool")
+    s.config.SPOOL_MAX_ATTEMPTS = 3
+    s.config.SPOOL_STALE_SECONDS = 600
+    s.unsubscribe_url_base = "https://example.com/u"
+    s.unsubscribe_secret = "test_secret_for_unit_tests"
+    s._open_smtp_connection = Mock(side_effect=lambda: Mock(name="FakeSMTPServer"))
+    return s
+
+
+class TestMailSpool:
+
+    def test_roundtrip_preserves_message_bytes(self, spool, template):
+        batch_id = spool.new_batch(template)
+        original = template.render("a+tag@example.com", "<p>a</p>")
+        spool.enqueue(batch_id, 0, "a+tag@example.com", original.head)
+
+        entry = spool.claim()
+        assert entry.email == "a+tag@example.com"
+        assert entry.attempts == 0
+        assert bytes(spool.load(entry)) == bytes(original)
+        assert b"".join(spool.load(entry).iter_chunks(512)) == bytes(original)
+
+        spool.retry(entry)
+        entry = spool.claim()
+        assert entry.attempts == 1
+        spool.fail(entry)
+
+        assert spool.pending(batch_id) == 0
+        assert spool.claim() is None
+        # 실패 보관 메시지가 있으면 공유 구간 유지
+        assert spool.release_batch(batch_id) is False
+
+    def test_concurrent_claims_are_exclusive(self, spool, template):
+        batch_id = spool.new_batch(template)
+        for i in range(60):
+            spool.enqueue(batch_id, i, f"u{i}@example.com", b"head")
+
+        claimed = []
+        lock = threading.Lock()
+
+        def drain():
+            while True:
+                entry = spool.claim()
+                if entry is None:
+                    return
+                with lock:
+                    claimed.append(entry.email)
+                spool.complete(entry)
+
+        threads = [threading.Thread(target=drain) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(claimed) == sorted(f"u{i}@example.com" for i in range(60))
+        assert spool.release_batch(batch_id) is True
+
+
+class TestSpooledBulkSend:
+
+    def _send(self, sender, recipients, tmp_path):
+        pdf = tmp_path / "etnews_20260417.pdf"
+        pdf.write_bytes(b"%PDF-1.4\n" + b"x" * 512)
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email", return_value=None):
+            return sender.send_bulk_email(pdf_path=str(pdf))
+
+    def test_retry_does_not_rerender(self, sender, tmp_path):
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(5)]
+        failed_once = set()
+        payloads = {}
+
+        def send(server, msg, to):
+            payloads.setdefault(to[0], []).append(bytes(msg))
+            if to[0] not in failed_once and to[0] in ("u1@example.com", "u3@example.com"):
+                failed_once.add(to[0])
+                raise smtplib.SMTPException("temporary")
+            return server
+
+        sender._send_on_server = Mock(side_effect=send)
+        with patch.object(sender, "_assemble_message", wraps=sender._assemble_message) as spy:
+            ok, success = self._send(sender, recipients, tmp_path)
+
+        assert ok is True
+        assert success == [r.email for r in recipients]
+        assert spy.call_count == 5
+        # 재시도 메시지는 처음 보낸 것과 바이트 단위로 동일
+        assert payloads["u1@example.com"][0] == payloads["u1@example.com"][1]
+
+        spool = MailSpool(sender.config.EMAIL_SPOOL_DIR)
+        assert spool.pending() == 0
+        assert os.listdir(os.path.join(spool.root, "shared")) == []
+
+    def test_leftovers_drained_by_separate_transmitter(self, sender, tmp_path):
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(6)]
+        sender.config.SMTP_POOL_SIZE = 1
+
+        # SMTP 장애로 연속 실패 한도 도달 → 나머지는 스풀에 보존
+        sender._send_on_server = Mock(side_effect=smtplib.SMTPException("outage"))
+        ok, success = self._send(sender, recipients, tmp_path)
+        assert ok is False
+        spool = MailSpool(sender.config.EMAIL_SPOOL_DIR)
+        # u0은 시도 한도(3회) 소진으로 failed/, 나머지 5건은 전송 대기
+        assert spool.pending() == 5
+        assert len(os.listdir(os.path.join(spool.root, "failed"))) == 1
+
+        # 장애 복구 후 별도 전송 워커(다른 프로세스 역할)가 재렌더링 없이 전송
+        drainer = EmailSender()
+        drainer.config = sender.config
+        drainer._open_smtp_connection = Mock(return_value=Mock(name="FakeSMTPServer"))
+        drainer._send_on_server = Mock(side_effect=lambda server, msg, to: server)
+        drainer._assemble_message = Mock()
+
+        delivered, fail_count = SpoolTransmitter(drainer, spool, workers=2).run()
+
+        assert sorted(e.email for e in delivered) == [r.email for r in recipients[1:]]
+        assert fail_count == 0
+        drainer._assemble_message.assert_not_called()
+        assert spool.pending() == 0
+
+
+class TestSpoolResumeWithLedger:
+    """[S8]+[S10] 조기 중단 후 재실행·별도 전송 워커가 원장과 함께 중복 없이 동작하는지"""
+
+    @pytest.fixture
+    def backend(self, tmp_path, monkeypatch):
+        from src.storage.sqlite_backend import SQLiteBackend
+
+        monkeypatch.setenv("DB_PATH", str(tmp_path / "ledger.db"))
+        backend = SQLiteBackend()
+        with patch("src.delivery_tracker.get_storage_backend", return_value=backend):
+            yield backend
+
+    @pytest.fixture
+    def ledger_sender(self, sender, backend):
+        sender.config.SMTP_POOL_SIZE = 1
+        sender.config.DELIVERY_LEDGER_ENABLED = True
+        sender.config.DELIVERY_LEDGER_TTL_DAYS = 14
+        return sender
+
+    def _send(self, sender, recipients, tmp_path):
+        return TestSpooledBulkSend._send(self, sender, recipients, tmp_path)
+
+    def _abort_after_two(self, sender, recipients, tmp_path):
+        """2명 전송 후 SMTP 장애로 연속 실패 한도 도달 → 나머지는 이전 배치에 보존"""
+        def outage(server, msg, to):
+            if len(outage.sent) >= 2:
+                raise smtplib.SMTPException("outage")
+            outage.sent.append(to[0])
+            return server
+        outage.sent = []
+
+        sender._send_on_server = Mock(side_effect=outage)
+        self._send(sender, recipients, tmp_path)
+        return outage.sent
+
+    def test_abort_then_rerun_sends_each_recipient_once(self, ledger_sender, tmp_path):
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(6)]
+        delivered = self._abort_after_two(ledger_sender, recipients, tmp_path)
+        spool = MailSpool(ledger_sender.config.EMAIL_SPOOL_DIR)
+        assert delivered == ["u0@example.com", "u1@example.com"]
+        assert spool.pending() == 3  # u2는 시도 한도로 failed/, u3~u5 대기
+
+        ledger_sender._send_on_server = Mock(side_effect=lambda server, msg, to: server)
+        ok, success = self._send(ledger_sender, recipients, tmp_path)
+
+        resent = [c.args[2][0] for c in ledger_sender._send_on_server.call_args_list]
+        assert sorted(delivered + resent) == [r.email for r in recipients]
+        assert ok is True
+        assert success == [r.email for r in recipients]
+        assert spool.pending() == 0
+
+    def test_drained_batch_recorded_in_its_own_ledger(self, ledger_sender, backend, tmp_path):
+        from src.delivery_tracker import DeliveryLedger
+
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(6)]
+        self._abort_after_two(ledger_sender, recipients, tmp_path)
+        spool = MailSpool(ledger_sender.config.EMAIL_SPOOL_DIR)
+
+        # 별도 전송 워커는 원장 컨텍스트 없이 실행 → 배치에 기록된 발송 단위 키로 원장 기록
+        drainer = EmailSender()
+        drainer.config = ledger_sender.config
+        drainer._open_smtp_connection = Mock(return_value=Mock(name="FakeSMTPServer"))
+        drainer._send_on_server = Mock(side_effect=lambda server, msg, to: server)
+        delivered, fail_count = SpoolTransmitter(drainer, spool).run()
+        assert sorted(e.email for e in delivered) == ["u3@example.com", "u4@example.com", "u5@example.com"]
+
+        issue_key = next(iter({spool.batch_issue_key(e.batch_id) for e in delivered}))
+        assert issue_key.startswith(DeliveryLedger.today_kst())
+        assert len(backend.get_delivered_emails(issue_key)) == 5
+
+        # 재실행은 원장에 없는 u2에게만 전송
+        ledger_sender._send_on_server = Mock(side_effect=lambda server, msg, to: server)
+        ok, success = self._send(ledger_sender, recipients, tmp_path)
+        assert [c.args[2][0] for c in ledger_sender._send_on_server.call_args_list] == ["u2@example.com"]
+        assert ok is True and success == [r.email for r in recipients]
+
+    def test_claim_limited_to_batch(self, spool, template):
+        first = spool.new_batch(template, issue_key="k1")
+        second = spool.new_batch(template)
+        spool.enqueue(first, 0, "a@example.com", b"A")
+        spool.enqueue(second, 0, "b@example.com", b"B")
+
+        entry = spool.claim(second)
+        assert entry.batch_id == second and entry.email == "b@example.com"
+        assert spool.claim(second) is None
+        assert spool.batch_issue_key(first) == "k1"
+        assert spool.batch_issue_key(second) is None
@@ -0,0 +1,198 @@
+"""
+[S4] MessageTemplate 검증
+
+- 공유 파트(이미지·PDF)는 수신자 수와 무관하게 1회만 MIME 인코딩되는지
+- 템플릿으로 렌더링한 바이트가 표준 파서로 기존 메시지와 동일한 구조로 읽히는지
+- _send_on_server가 bytes 메시지를 재직렬화 없이 sendmail로 넘기는지
+- [S7] 임시 파일 보관·청크 스트리밍·dot-stuffing이 전체 바이트 전송과 동일한 결과를 내는지
+"""
+import email
+import os
+import smtplib
+import socket
+import sys
+from email.header import decode_header, make_header
+from email.mime.application import MIMEApplication
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.email_sender import EmailSender
+from src.mime_template import DotStuffer, MessageTemplate
+
+
+@pytest.fixture
+def sender():
+    s = EmailSender()
+    s.config = Mock()
+    s.config.GMAIL_USER = "sender@example.com"
+    s.config.ADMIN_EMAIL = "admin@example.com"
+    s.unsubscribe_url_base = "https://example.com/u"
+    s.unsubscribe_secret = "test_secret_for_unit_tests"
+    return s
+
+
+@pytest.fixture
+def tmp_etnews_pdf(tmp_path):
+    pdf = tmp_path / "etnews_20260417.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n" + os.urandom(4096) + b"\n%%EOF")
+    return str(pdf)
+
+
+class TestMessageTemplate:
+
+    def test_render_parses_as_multipart_related(self):
+        """렌더링 결과가 To/Subject/본문/첨부를 갖춘 multipart/related로 파싱되어야 한다"""
+        pdf_bytes = b"%PDF-1.4 dummy"
+        template = MessageTemplate(
+            "sender@example.com",
+            "IT뉴스 [2026-04-17]",
+            [MIMEApplication(pdf_bytes, _subtype="pdf")],
+        )
+
+        raw = bytes(template.render("alice@example.com", "<p>안녕하세요</p>"))
+        msg = email.message_from_bytes(raw)
+
+        assert msg.get_content_type() == "multipart/related"
+        assert msg["From"] == "sender@example.com"
+        assert msg["To"] == "alice@example.com"
+        assert str(make_header(decode_header(msg["Subject"]))) == "IT뉴스 [2026-04-17]"
+
+        parts = msg.get_payload()
+        assert [p.get_content_type() for p in parts] == ["text/html", "application/pdf"]
+        assert parts[0].get_payload(decode=True).decode("utf-8") == "<p>안녕하세요</p>"
+        assert parts[1].get_payload(decode=True) == pdf_bytes
+
+    def test_render_uses_crlf_line_endings(self):
+        """SMTP DATA로 바로 보낼 수 있도록 줄바꿈은 CRLF여야 한다"""
+        template = MessageTemplate("s@example.com", "subject", [])
+        raw = bytes(template.render("a@example.com", "<p>x</p>"))
+
+        assert b"\r\n" in raw
+        assert b"\n" not in raw.replace(b"\r\n", b"")
+
+    def test_shared_bytes_identical_across_recipients(self):
+        """수신자별 렌더링 결과의 공유 구간(tail)은 바이트 단위로 동일해야 한다"""
+        template = MessageTemplate(
+            "s@example.com", "subject",
+            [MIMEApplication(b"%PDF" + b"z" * 1000, _subtype="pdf")],
+        )
+        a = bytes(template.render("a@example.com", "<p>a</p>"))
+        b = bytes(template.render("b@example.com", "<p>b</p>"))
+
+        tail_len = template.shared_size
+        assert a[-tail_len:] == b[-tail_len:]
+
+
+class TestSharedAssetsEncodedOnce:
+
+    def test_pdf_part_built_once_for_many_recipients(self, sender, tmp_etnews_pdf):
+        """수신자 5명이어도 PDF 첨부 파트(base64 인코딩)는 1회만 생성되어야 한다"""
+        with patch("src.pdf_image_extractor.extract_first_page_for_email",
+                   return_value=b"\xff\xd8\xff" + b"\x00" * 100):
+            shared = sender._prepare_shared_assets(
+                pdf_path=tmp_etnews_pdf, subject="IT뉴스 [2026-04-17]"
+            )
+
+        with patch.object(sender, "_build_pdf_part", wraps=sender._build_pdf_part) as spy:
+            messages = [
+                sender._assemble_message(f"u{i}@example.com", shared) for i in range(5)
+            ]
+
+        assert spy.call_count == 0
+        with open(tmp_etnews_pdf, "rb") as f:
+            original = f.read()
+        for raw in messages:
+            msg = email.message_from_bytes(bytes(raw))
+            types = [p.get_content_type() for p in msg.get_payload()]
+            assert types == ["text/html", "image/jpeg", "application/pdf"]
+            assert msg.get_payload()[2].get_payload(decode=True) == original
+            assert msg.get_payload()[2].get_filename() == "etnews_20260417.pdf"
+
+    def test_send_on_server_uses_sendmail_for_bytes(self, sender):
+        """bytes 메시지는 send_message가 아닌 sendmail로 그대로 전달되어야 한다"""
+        server = Mock()
+        sender._send_on_server(server, b"raw message", ["a@example.com"])
+
+        server.sendmail.assert_called_once_with(
+            "sender@example.com", ["a@example.com"], b"raw message"
+        )
+        server.send_message.assert_not_called()
+
+
+class TestStreamingTransmit:
+
+    def test_spooled_template_matches_in_memory(self, tmp_path):
+        """임시 파일에 보관된 공유 파트도 메모리 보관과 동일한 바이트를 청크로 반환해야 한다"""
+        pdf_bytes = os.urandom(200_000)
+        part = MIMEApplication(pdf_bytes, _subtype="pdf")
+        spooled = MessageTemplate("s@example.com", "subject", [part],
+                                  spool_threshold=1024, spool_dir=str(tmp_path))
+        in_memory = MessageTemplate("s@example.com", "subject", [part])
+        try:
+            assert spooled.is_spooled and not in_memory.is_spooled
+            assert spooled.shared_size == in_memory.shared_size
+
+            msg = spooled.render("a@example.com", "<p>a</p>")
+            chunks = list(msg.iter_chunks(4096))
+            assert max(len(c) for c in chunks[1:]) <= 4096
+            assert b"".join(chunks) == bytes(msg)
+            parsed = email.message_from_bytes(bytes(msg))
+            assert parsed.get_payload()[1].get_payload(decode=True) == pdf_bytes
+        finally:
+            spooled.close()
+
+    def test_dot_stuffing_across_chunk_boundaries(self):
+        """줄 첫 "."은 청크 경계에서 나뉘어도 smtplib와 동일하게 ".."로 바뀌어야 한다"""
+        data = b".a\r\nb\r\n.c\r\n..d\r\n"
+        expected = smtplib.quotedata(data.decode("ascii")).encode("ascii")
+        for size in (1, 2, 3, 5, len(data)):
+            stuffer = DotStuffer()
+            out = b"".join(stuffer.feed(data[i:i + size]) for i in range(0, len(data), size))
+            assert out == expected
+            assert stuffer.finish() == b".\r\n"
+
+    def test_streaming_delivers_same_message_over_real_smtp(self, sender, tmp_path):
+        """로컬 SMTP 싱크로 스트리밍 전송한 메시지가 원본과 동일하게 수신되어야 한다"""
+        controller_mod = pytest.importorskip("aiosmtpd.controller")
+
+        received = []
+
+        class _Handler:
+            async def handle_DATA(self, server, session, envelope):
+                received.append(envelope)
+                return "250 OK"
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        controller = controller_mod.Controller(_Handler(), hostname="127.0.0.1", port=port)
+        controller.start()
+
+        sender.config.SMTP_STREAMING = True
+        sender.config.SMTP_STREAM_CHUNK_SIZE = 1000
+        body_pdf = b"%PDF\n" + b"\n.".join([b"line"] * 500)
+        template = MessageTemplate(
+            "sender@example.com", "subject",
+            [MIMEApplication(body_pdf, _subtype="pdf")],
+            spool_threshold=0, spool_dir=str(tmp_path),
+        )
+        try:
+            msg = template.render("a@example.com", "<p>\n.dot line</p>")
+            expected = bytes(msg)
+            server = smtplib.SMTP("127.0.0.1", port)
+            try:
+                sender._send_on_server(server, msg, ["a@example.com"])
+            finally:
+                server.quit()
+        finally:
+            template.close()
+            controller.stop()
+
+        assert len(received) == 1
+        assert received[0].rcpt_tos == ["a@example.com"]
+        parsed = email.message_from_bytes(received[0].original_content)
+        assert parsed.get_payload()[1].get_payload(decode=True) == body_pdf
+        assert received[0].original_content == expected
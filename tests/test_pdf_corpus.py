@@ -0,0 +1,93 @@
+"""
+합성 PDF 코퍼스(scripts/pdf_corpus.py) 검증
+
+- 같은 seed → 같은 바이트, 다른 seed → 다른 지면
+- 생성된 지면의 광고 페이지 정답을 PDFProcessor가 그대로 찾는지
+- ITFIND형 호에서 Chapter 기반·3면 목차 기반 토픽 추출이 정답과 같은지
+- 1면·목차 면 이미지 추출이 동작하는지
+"""
+import hashlib
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+fitz = pytest.importorskip("fitz")
+
+from pypdf import PdfReader
+
+from lambda_itfind_downloader import extract_topics_from_chapters, extract_topics_from_pdf_page3
+from scripts.pdf_corpus import PAGE_SIZES, build_edition, build_itfind_issue, main
+from src.config import Config
+from src.pdf_image_extractor import extract_first_page_for_email, extract_toc_page_for_email
+from src.pdf_processor import PDFProcessor
+
+
+def _sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@pytest.fixture(scope="module")
+def edition(tmp_path_factory):
+    return build_edition(str(tmp_path_factory.mktemp("corpus") / "etnews.pdf"), pages=16, seed=7)
+
+
+class TestEdition:
+
+    def test_deterministic_from_seed(self, edition, tmp_path):
+        again = build_edition(str(tmp_path / "again.pdf"), pages=16, seed=7)
+        other = build_edition(str(tmp_path / "other.pdf"), pages=16, seed=8)
+
+        assert _sha256(again.path) == _sha256(edition.path)
+        assert _sha256(other.path) != _sha256(edition.path)
+        assert again.ad_pages == edition.ad_pages
+
+    def test_layout(self, edition, tmp_path):
+        assert edition.image_ad_pages and edition.marked_ad_pages
+        assert 0 not in edition.ad_pages
+        with fitz.open(edition.path) as doc:
+            assert doc.page_count == 16
+            assert len(doc[0].get_text().strip()) > Config.AD_TEXT_LENGTH_THRESHOLD
+
+        a3 = build_edition(str(tmp_path / "a3.pdf"), pages=2, seed=1, page_size="a3")
+        with fitz.open(a3.path) as doc:
+            assert tuple(doc[0].rect)[2:] == PAGE_SIZES["a3"]
+
+    @pytest.mark.parametrize("engine", ["pypdf", "pymupdf"])
+    def test_processor_finds_ground_truth(self, edition, engine):
+        with patch.object(Config, "PDF_CLASSIFIER_ENGINE", engine), \
+             patch.object(Config, "AD_PAGE_CACHE_ENABLED", False):
+            found = PDFProcessor()._identify_ad_pages(PdfReader(edition.path), None, pdf_path=edition.path)
+        assert found == edition.ad_pages
+
+    def test_first_page_renders(self, edition):
+        assert extract_first_page_for_email(edition.path)[:3] == b"\xff\xd8\xff"
+
+
+class TestItfindIssue:
+
+    @pytest.mark.parametrize("planning,ict", [(1, 1), (2, 1), (2, 2)])
+    def test_topic_extractors_match_ground_truth(self, tmp_path, planning, ict):
+        issue = build_itfind_issue(str(tmp_path / "itfind.pdf"), seed=3,
+                                   planning_topics=planning, ict_topics=ict)
+
+        assert extract_topics_from_pdf_page3(issue.path) == issue.categorized_topics
+        chapters = extract_topics_from_chapters(issue.path)
+        assert chapters["기획시리즈"] + chapters["ICT 신기술"] == issue.topics
+
+    def test_toc_page_renders(self, tmp_path):
+        issue = build_itfind_issue(str(tmp_path / "itfind.pdf"))
+        assert extract_toc_page_for_email(issue.path)[:3] == b"\xff\xd8\xff"
+
+
+def test_cli_writes_manifest(tmp_path):
+    assert main(["--output-dir", str(tmp_path), "--pages", "4", "--itfind", "1"]) == 0
+    with open(tmp_path / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert [e["pages"] for e in manifest["editions"]] == [4]
+    assert os.path.exists(manifest["itfind"][0]["path"])
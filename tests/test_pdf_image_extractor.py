@@ -10,6 +10,7 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.config import Config
 from src.pdf_image_extractor import (
     extract_page_as_image,
     extract_toc_page_for_email,
@@ -99,11 +100,12 @@ class TestPDFImageExtractionIntegration:
 
             result = extract_toc_page_for_email("/tmp/test_itfind.pdf")
 
-            # [S3] JPEG + max_width=800 기본값 검증
+            # [S3] JPEG + max_width=800 기본값 검증, [S23] 바이트 예산 적용
             mock_extract.assert_called_once_with(
                 "/tmp/test_itfind.pdf",
                 page_number=2, dpi=200, max_width=800,
                 output_format="jpeg", jpeg_quality=85,
+                budget_bytes=Config.EMAIL_PREVIEW_BUDGET_KB * 1024, clip=None,
             )
 
     def test_extraction_failure_returns_none(self):
@@ -288,3 +290,112 @@ class TestPDFImageExtractionIntegration:
                 f"JPEG={len(jpeg_result)}, PNG={len(png_result)} — "
                 f"S3 최적화 효과가 반영되지 않음"
             )
+
+
+@pytest.fixture(scope="module")
+def edition_pdf(tmp_path_factory):
+    from scripts.pdf_corpus import build_edition
+    return build_edition(str(tmp_path_factory.mktemp("budget") / "etnews.pdf"), pages=2, seed=1).path
+
+
+@pytest.mark.skipif(not PYMUPDF_AVAILABLE, reason="PyMuPDF not installed")
+class TestByteBudgetEncoding:
+    """[S23] 바이트 예산 인코딩·영역(clip) 렌더링"""
+
+    @staticmethod
+    def _size(image_bytes):
+        import fitz
+        pix = fitz.Pixmap(image_bytes)
+        return pix.width, pix.height
+
+    def test_lands_under_budget_at_full_width(self, edition_pdf):
+        full = extract_page_as_image(edition_pdf, page_number=0)
+        budget = len(full) * 3 // 4
+
+        result = extract_page_as_image(edition_pdf, page_number=0, budget_bytes=budget)
+
+        assert result[:3] == b'\xff\xd8\xff'
+        assert budget * 0.8 < len(result) <= budget  # 예산 바로 아래 (품질을 과하게 낮추지 않음)
+        assert self._size(result)[0] == 800
+
+    def test_within_budget_keeps_requested_quality(self, edition_pdf):
+        full = extract_page_as_image(edition_pdf, page_number=0)
+        assert extract_page_as_image(edition_pdf, page_number=0, budget_bytes=len(full)) == full
+
+    def test_small_budget_downscales_to_min_width(self, edition_pdf):
+        result = extract_page_as_image(edition_pdf, page_number=0, budget_bytes=20 * 1024)
+        width, _ = self._size(result)
+        assert 480 <= width < 800
+
+    def test_clip_renders_region_at_higher_resolution(self, edition_pdf):
+        clip = (0.0, 0.0, 1.0, 0.35)
+        result = extract_page_as_image(edition_pdf, page_number=0, dpi=300, max_width=1000, clip=clip)
+
+        width, height = self._size(result)
+        assert width == 1000
+        assert abs(height / width - 0.35 * 842 / 595) < 0.01  # A4 상단 35%
+        assert extract_page_as_image(edition_pdf, page_number=0, clip=(0.5, 0, 0.2, 1)) is None
+
+    def test_first_page_clip_from_config(self, edition_pdf):
+        with patch.object(Config, "EMAIL_FIRST_PAGE_CLIP", (0.0, 0.0, 1.0, 0.35)), \
+             patch.object(Config, "PREVIEW_RENDER_CACHE_ENABLED", False):
+            from src.pdf_image_extractor import extract_first_page_for_email
+            result = extract_first_page_for_email(edition_pdf)
+
+        width, height = self._size(result)
+        assert width == Config.EMAIL_FIRST_PAGE_CLIP_MAX_WIDTH and height < width
+        assert len(result) <= Config.EMAIL_PREVIEW_BUDGET_KB * 1024
+
+
+@pytest.mark.skipif(not PYMUPDF_AVAILABLE, reason="PyMuPDF not installed")
+class TestRenditions:
+    """[S24] 1회 래스터화 → 여러 출력"""
+
+    @staticmethod
+    def _size(image_bytes):
+        import fitz
+        pix = fitz.Pixmap(image_bytes)
+        return pix.width, pix.height
+
+    def test_single_rasterization_for_all_outputs(self, edition_pdf):
+        import fitz
+        from src.pdf_image_extractor import default_renditions, extract_renditions
+
+        original = fitz.Page.get_pixmap
+        with patch.object(fitz.Page, "get_pixmap", autospec=True, side_effect=original) as rasterize:
+            outputs = extract_renditions(edition_pdf, page_number=0)
+
+        assert rasterize.call_count == 1
+        assert list(outputs) == [spec.name for spec in default_renditions()]
+        assert self._size(outputs["archive"])[0] == 2480
+        assert self._size(outputs["email"])[0] == 800
+        assert self._size(outputs["thumbnail"])[0] == 240
+        assert outputs["png"][:4] == b'\x89PNG' and self._size(outputs["png"])[0] == 800
+        assert len(outputs["email"]) <= Config.EMAIL_PREVIEW_BUDGET_KB * 1024
+        assert len(outputs["thumbnail"]) < len(outputs["email"]) < len(outputs["archive"])
+
+    def test_custom_specs_and_clip(self, edition_pdf):
+        from src.pdf_image_extractor import RenditionSpec, extract_renditions
+
+        specs = [RenditionSpec("headline", max_width=1000, dpi=300), RenditionSpec("small", max_width=300)]
+        outputs = extract_renditions(edition_pdf, page_number=0, specs=specs, clip=(0, 0, 1, 0.35))
+
+        headline_w, headline_h = self._size(outputs["headline"])
+        small_w, small_h = self._size(outputs["small"])
+        assert (headline_w, small_w) == (1000, 300)
+        assert abs(headline_h / headline_w - small_h / small_w) < 0.01
+
+    def test_missing_page_and_session_path(self, edition_pdf):
+        from src import pdf_session
+        from src.pdf_image_extractor import RenditionSpec, extract_renditions
+
+        specs = [RenditionSpec("thumb", max_width=200)]
+        assert extract_renditions(edition_pdf, page_number=9, specs=specs) == {"thumb": None}
+
+        session = pdf_session.open_session(edition_pdf)
+        try:
+            outputs = extract_renditions(edition_pdf, page_number=1, specs=specs)
+            assert self._size(outputs["thumb"])[0] == 200
+            assert session.stats["parses"] == 1
+        finally:
+            pdf_session.close_all()
@@ -0,0 +1,124 @@
+"""
+[S19] 첨부 PDF 크기 최적화 검증
+
+- 고해상도 이미지 PDF가 예산 안으로 줄어들고 페이지 구성이 유지되는지
+- 예산을 맞추지 못하거나 검증에 실패하면 원본을 쓰는지
+- 워크플로우 단계가 비활성화·실패 시 처리된 PDF를 그대로 돌려주는지
+- PyMuPDF 저장 엔진이 이미 정리한 PDF는 예산 이내면 다시 열지 않는지
+"""
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+fitz = pytest.importorskip("fitz")
+
+from src import pdf_optimizer
+from src.config import Config
+from src.pdf_optimizer import optimize_pdf
+from src.workflow.pdf_workflow import optimize_attachment, written_by_pymupdf
+
+
+@pytest.fixture
+def photo_pdf(tmp_path):
+    """A4 2면, 면마다 약 600dpi 사진 + 제목 텍스트"""
+    path = str(tmp_path / "photo.pdf")
+    samples = b"".join(bytes(((y * 7) % 255, 90, (y * 3) % 255)) * 1200 for y in range(1700))
+    jpeg = fitz.Pixmap(fitz.csRGB, 1200, 1700, samples, False).tobytes("jpeg", jpg_quality=95)
+
+    doc = fitz.open()
+    for i in range(2):
+        page = doc.new_page()
+        page.insert_image(fitz.Rect(0, 0, 144, 204), stream=jpeg)
+        page.insert_text((200, 100), f"Headline {i}", fontsize=24)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class TestOptimizePdf:
+
+    def test_shrinks_within_budget(self, photo_pdf):
+        original = os.path.getsize(photo_pdf)
+        result = optimize_pdf(photo_pdf, budget_bytes=original - 1)
+
+        assert result.optimized
+        assert result.path.endswith("_optimized.pdf")
+        assert result.optimized_bytes == os.path.getsize(result.path) < original
+        assert result.step == Config.PDF_OPTIMIZE_STEPS[0]
+        with fitz.open(result.path) as doc:
+            assert doc.page_count == 2
+            assert "Headline 1" in doc[1].get_text()
+
+    def test_over_budget_keeps_original(self, photo_pdf):
+        result = optimize_pdf(photo_pdf, budget_bytes=100)
+
+        assert not result.optimized
+        assert result.path == photo_pdf
+        assert "예산 초과" in result.reason
+        assert not os.path.exists(photo_pdf.replace(".pdf", "_optimized.pdf"))
+
+    def test_under_budget_is_lossless(self, photo_pdf):
+        """이미 예산 안이면 이미지를 재압축하지 않는다"""
+        with fitz.open(photo_pdf) as doc:
+            original_image = doc.extract_image(doc[0].get_images()[0][0])["image"]
+
+        with patch.object(fitz.Document, "rewrite_images") as rewrite:
+            result = optimize_pdf(photo_pdf, budget_bytes=10 * 1024 * 1024)
+        rewrite.assert_not_called()
+        assert result.step is None
+
+        with fitz.open(result.path) as doc:
+            assert doc.extract_image(doc[0].get_images()[0][0])["image"] == original_image
+
+    def test_compacted_under_budget_is_not_reopened(self, photo_pdf):
+        """PyMuPDF 저장 엔진 출력은 무손실 정리 결과와 같으므로 예산 이내면 그대로 사용"""
+        with patch.object(fitz, "open", side_effect=AssertionError("다시 열면 안 됨")):
+            result = optimize_pdf(photo_pdf, budget_bytes=10 * 1024 * 1024, compacted=True)
+
+        assert not result.optimized
+        assert result.path == photo_pdf
+        assert "이미 무손실 정리됨" in result.reason
+
+    def test_attempt_opens_twice_without_text_extraction(self, photo_pdf):
+        """단계마다 재압축 1회 + 검증 1회만 열고, 검증은 페이지 크기만 비교"""
+        original = os.path.getsize(photo_pdf)
+        with patch.object(fitz, "open", wraps=fitz.open) as opened, \
+             patch.object(fitz.Page, "get_text", side_effect=AssertionError("본문 추출 금지")):
+            result = optimize_pdf(photo_pdf, budget_bytes=original - 1)
+
+        assert result.optimized
+        assert opened.call_count == 2
+
+    def test_validation_failure_keeps_original(self, photo_pdf):
+        with patch.object(pdf_optimizer, "_validate", return_value=False):
+            result = optimize_pdf(photo_pdf, budget_bytes=10 * 1024 * 1024)
+
+        assert result.path == photo_pdf
+        assert "검증 실패" in result.reason
+
+
+class TestOptimizeAttachmentStage:
+
+    def test_returns_optimized_path(self, photo_pdf):
+        budget_mb = (os.path.getsize(photo_pdf) - 1) / (1024 * 1024)
+        with patch.object(Config, "PDF_OPTIMIZE_BUDGET_MB", budget_mb):
+            assert optimize_attachment(photo_pdf).endswith("_optimized.pdf")
+
+    def test_disabled_or_failing_stage_returns_input(self, photo_pdf):
+        with patch.object(Config, "PDF_OPTIMIZE_ENABLED", False):
+            assert optimize_attachment(photo_pdf) == photo_pdf
+        with patch("src.workflow.pdf_workflow.optimize_pdf", side_effect=OSError("boom")):
+            assert optimize_attachment(photo_pdf) == photo_pdf
+        assert optimize_attachment(None) is None
+
+    def test_written_by_pymupdf(self):
+        assert written_by_pymupdf("a.pdf", "a_processed.pdf", "pymupdf")
+        assert not written_by_pymupdf("a.pdf", "a_processed.pdf", "pypdf")
+        assert not written_by_pymupdf("a.pdf", "a.pdf", "pymupdf")  # 광고 없음 → 원본 그대로
+        assert not written_by_pymupdf("a.pdf", None, "pymupdf")
+        with patch.object(Config, "PDF_WRITER_ENGINE", "pymupdf"):
+            assert written_by_pymupdf("a.pdf", "a_processed.pdf")
@@ -0,0 +1,109 @@
+"""
+[S15] 레이아웃 특성 행렬·벡터 점수 검증
+
+- 특성 추출 값 (이미지 면적, 블록 수, 글자 크기 차이, 텍스트 밀도, 키워드 수)
+- 기존 텍스트 규칙에 걸리던 페이지는 점수로도 광고
+- 문구가 많은 이미지 광고는 텍스트 규칙으로는 놓치지만 점수로는 광고
+- NumPy가 없으면 텍스트 규칙으로 대체
+"""
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+fitz = pytest.importorskip("fitz")
+np = pytest.importorskip("numpy")
+
+from pypdf import PdfReader
+
+from src import pdf_page_features
+from src.config import Config
+from src.pdf_page_features import FEATURE_NAMES, build_feature_matrix, score_pages
+from src.pdf_processor import PDFProcessor
+
+_COPY = "Visit our showroom this weekend for the spring collection with free delivery. " * 3
+
+
+
+@pytest.fixture(autouse=True)
+def _no_verdict_cache():
+    """[S16] 판정 캐시는 test_ad_page_cache.py에서 검증 (여기서는 매번 분석)"""
+    with patch.object(Config, "AD_PAGE_CACHE_ENABLED", False):
+        yield
+
+@pytest.fixture
+def pages_pdf(tmp_path):
+    """0: 기사 면, 1: 문구가 많은 이미지 광고, 2: 약한 키워드 반복 면"""
+    path = str(tmp_path / "pages.pdf")
+    doc = fitz.open()
+    banner = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 100, 140), False)
+
+    article = doc.new_page()
+    for col in range(3):
+        article.insert_textbox(
+            fitz.Rect(30 + col * 185, 40, 200 + col * 185, 800),
+            "Memory shipments recovered faster than expected this quarter. " * 40, fontsize=8,
+        )
+
+    ad = doc.new_page()
+    ad.insert_image(fitz.Rect(0, 0, ad.rect.width, 650), pixmap=banner)
+    ad.insert_text((40, 700), "SPRING SALE", fontsize=40)
+    ad.insert_textbox(fitz.Rect(40, 720, 560, 830), _COPY, fontsize=8)
+
+    notice = doc.new_page()
+    notice.insert_textbox(fitz.Rect(40, 40, 560, 800), "광고 광고 광고 " + "notice text " * 40,
+                          fontname="korea", fontsize=10)
+
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _identify(path, scorer):
+    with patch.object(Config, "PDF_CLASSIFIER_ENGINE", "pymupdf"), \
+         patch.object(Config, "AD_CASCADE_ENABLED", False), \
+         patch.object(Config, "AD_SCORER", scorer):
+        return PDFProcessor()._identify_ad_pages(PdfReader(path), None, pdf_path=path)
+
+
+class TestFeatures:
+
+    def test_feature_matrix_values(self, pages_pdf):
+        pages, matrix = build_feature_matrix(pages_pdf, range(3), Config.AD_KEYWORDS)
+        assert pages == [0, 1, 2]
+        assert matrix.shape == (3, len(FEATURE_NAMES))
+
+        article, ad, notice = matrix
+        col = {name: i for i, name in enumerate(FEATURE_NAMES)}
+        assert article[col["image_ratio"]] == 0.0
+        assert article[col["text_density"]] > Config.AD_DENSE_TEXT_DENSITY
+        assert ad[col["image_ratio"]] > 0.5
+        assert ad[col["font_spread"]] >= 30
+        assert ad[col["text_chars"]] > Config.AD_TEXT_LENGTH_THRESHOLD
+        assert notice[col["weak_keywords"]] == 3
+
+    def test_score_keeps_rule_indicators(self):
+        row = np.zeros((3, len(FEATURE_NAMES)))
+        row[:, pdf_page_features.TEXT_CHARS] = [10, 500, 500]
+        row[:, pdf_page_features.TEXT_DENSITY] = [0.1, 5.0, 5.0]
+        row[:, pdf_page_features.TEXT_BLOCKS] = [1, 20, 20]
+        row[2, pdf_page_features.STRONG_KEYWORDS] = 1
+
+        scores = score_pages(row, Config)
+        assert scores[0] >= Config.AD_SCORE_THRESHOLD  # 짧은 텍스트
+        assert scores[1] < Config.AD_SCORE_THRESHOLD   # 기사 면
+        assert scores[2] >= Config.AD_SCORE_THRESHOLD  # 강한 키워드
+
+
+class TestVectorScorer:
+
+    def test_image_ad_with_copy_is_caught_only_by_vector_score(self, pages_pdf):
+        assert _identify(pages_pdf, "rules") == [2]
+        assert _identify(pages_pdf, "vector") == [1, 2]
+
+    def test_falls_back_to_rules_without_numpy(self, pages_pdf):
+        with patch.object(pdf_page_features, "NUMPY_AVAILABLE", False):
+            assert _identify(pages_pdf, "vector") == [2]
@@ -0,0 +1,151 @@
+"""
+[S13] PDFProcessor 광고 페이지 분석 엔진 검증
+
+- pypdf / PyMuPDF 순차 / PyMuPDF 프로세스 풀이 같은 광고 페이지를 찾는지
+- remove_ads 출력 계약(광고 제거된 *_processed.pdf 경로 반환)이 유지되는지
+- 프로세스 풀을 만들 수 없는 환경에서 순차 추출로 대체되는지
+- [S14] 단계별 판정이 저비용 신호로 결정되는 페이지의 전체 텍스트 추출을 생략하는지
+- [S18] PyMuPDF 저장 엔진 출력이 pypdf보다 작고, 실패 시 pypdf로 대체되는지
+"""
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip("fitz")
+
+from pypdf import PdfReader
+
+from scripts.benchmark_pdf_classifier import build_fixture, main
+from src import pdf_ad_classifier
+from src.config import Config
+from src.pdf_processor import PDFProcessor
+
+
+
+@pytest.fixture(autouse=True)
+def _no_verdict_cache():
+    """[S16] 판정 캐시는 test_ad_page_cache.py에서 검증 (여기서는 매번 분석)"""
+    with patch.object(Config, "AD_PAGE_CACHE_ENABLED", False):
+        yield
+
+@pytest.fixture
+def newspaper(tmp_path):
+    path = str(tmp_path / "etnews_20260417.pdf")
+    ad_pages = build_fixture(path, pages=12)
+    return path, ad_pages
+
+
+def _identify(path, engine, workers=1):
+    with patch.object(Config, "PDF_CLASSIFIER_ENGINE", engine), \
+         patch.object(Config, "PDF_CLASSIFIER_WORKERS", workers), \
+         patch.object(Config, "PDF_CLASSIFIER_PARALLEL_MIN_PAGES", 1):
+        return PDFProcessor()._identify_ad_pages(PdfReader(path), None, pdf_path=path)
+
+
+class TestEngines:
+
+    @pytest.mark.parametrize("engine,workers", [("pypdf", 1), ("pymupdf", 1), ("pymupdf", 2)])
+    def test_engines_agree_on_ad_pages(self, newspaper, engine, workers):
+        path, ad_pages = newspaper
+        assert _identify(path, engine, workers) == ad_pages
+
+    def test_page_info_pages_are_not_extracted(self, newspaper):
+        path, ad_pages = newspaper
+        page_info = [{"page_number": "1", "is_ad": True}]
+        with patch.object(Config, "PDF_CLASSIFIER_ENGINE", "pymupdf"), \
+             patch.object(Config, "AD_CASCADE_ENABLED", False), \
+             patch.object(pdf_ad_classifier, "map_pages", wraps=pdf_ad_classifier.map_pages) as spy:
+            result = PDFProcessor()._identify_ad_pages(PdfReader(path), page_info, pdf_path=path)
+
+        assert result == sorted([0] + ad_pages)
+        assert 0 not in spy.call_args.args[1]
+
+    def test_pool_unavailable_falls_back_to_serial(self, newspaper):
+        path, _ = newspaper
+        with patch.object(pdf_ad_classifier, "ProcessPoolExecutor", side_effect=OSError("no /dev/shm")):
+            texts = pdf_ad_classifier.extract_page_texts(
+                path, range(12), workers=4, min_parallel_pages=1
+            )
+        assert sorted(texts) == list(range(12))
+
+
+class TestCascade:
+
+    def test_cheap_tiers_settle_fixture_pages(self, newspaper):
+        path, ad_pages = newspaper
+        processor = PDFProcessor()
+        with patch.object(Config, "PDF_CLASSIFIER_ENGINE", "pymupdf"), \
+             patch.object(pdf_ad_classifier, "map_pages", wraps=pdf_ad_classifier.map_pages) as full_extract:
+            assert processor._identify_ad_pages(PdfReader(path), None, pdf_path=path) == ad_pages
+
+        # 전면 이미지 광고(5)는 1단계, 상단 "Advertisement" 면(11)은 2단계, 나머지는 2단계 기사 면
+        assert processor.cascade_stats == {
+            "pages": 12, "tier1_ad": 1, "tier2_ad": 1, "tier2_article": 10, "tier3": 0,
+        }
+        full_extract.assert_not_called()
+
+    def test_ambiguous_pages_fall_through_to_full_extraction(self, tmp_path):
+        import fitz
+
+        path = str(tmp_path / "sparse.pdf")
+        doc = fitz.open()
+        doc.new_page()  # 빈 페이지 → 1단계 광고
+        doc.new_page().insert_text((40, 400), "Short notice")  # 짧은 텍스트 → 3단계 (길이 규칙으로 광고)
+        doc.save(path)
+        doc.close()
+
+        processor = PDFProcessor()
+        with patch.object(Config, "PDF_CLASSIFIER_ENGINE", "pymupdf"):
+            assert processor._identify_ad_pages(PdfReader(path), None, pdf_path=path) == [0, 1]
+        assert processor.cascade_stats["tier1_ad"] == 1
+        assert processor.cascade_stats["tier3"] == 1
+
+    def test_disabled_cascade_extracts_every_page(self, newspaper):
+        path, ad_pages = newspaper
+        processor = PDFProcessor()
+        with patch.object(Config, "PDF_CLASSIFIER_ENGINE", "pymupdf"), \
+             patch.object(Config, "AD_CASCADE_ENABLED", False):
+            assert processor._identify_ad_pages(PdfReader(path), None, pdf_path=path) == ad_pages
+        assert processor.cascade_stats["tier3"] == 12
+
+
+class TestRemoveAds:
+
+    @pytest.mark.parametrize("writer", ["pypdf", "pymupdf"])
+    def test_output_contract_unchanged(self, newspaper, writer):
+        path, ad_pages = newspaper
+        with patch.object(Config, "PDF_CLASSIFIER_ENGINE", "pymupdf"):
+            output = PDFProcessor().remove_ads(path, writer=writer)
+
+        assert output == path.replace(".pdf", "_processed.pdf")
+        assert len(PdfReader(output).pages) == 12 - len(ad_pages)
+
+    def test_pymupdf_writer_output_is_smaller(self, newspaper):
+        path, ad_pages = newspaper
+        keep = [p for p in range(12) if p not in ad_pages]
+        sizes = {}
+        for writer in ("pypdf", "pymupdf"):
+            output = path.replace(".pdf", f"_{writer}.pdf")
+            assert PDFProcessor()._write_pages(PdfReader(path), path, keep, output, writer) == writer
+            sizes[writer] = os.path.getsize(output)
+            texts = [page.extract_text() for page in PdfReader(output).pages]
+            assert len(texts) == len(keep)
+        assert sizes["pymupdf"] < sizes["pypdf"]
+
+    def test_pymupdf_writer_failure_falls_back_to_pypdf(self, newspaper):
+        path, ad_pages = newspaper
+        output = path.replace(".pdf", "_out.pdf")
+        with patch.object(pdf_ad_classifier.fitz.Document, "save", side_effect=RuntimeError("disk full")):
+            used = PDFProcessor()._write_pages(PdfReader(path), path, [0, 1], output, "pymupdf")
+        assert used == "pypdf"
+        assert len(PdfReader(output).pages) == 2
+
+
+def test_benchmark_smoke(tmp_path):
+    output = tmp_path / "bench.json"
+    assert main(["--pages", "6", "--workers", "--repeat", "1", "--output", str(output)]) == 0
+    assert output.exists()
@@ -0,0 +1,198 @@
+"""
+[S20] PDF 문서 세션 검증
+
+- 세션 안에서는 파일 읽기·파싱이 한 번만 일어나는지
+- 페이지 텍스트·렌더링 캐시, 메타데이터 증분 저장 후 바이트가 파일과 같은지
+- 파일이 세션 밖에서 바뀌면 세션이 무효화되는지
+- 기존 함수(이미지 추출, 토픽 추출, ITFIND 전체 흐름)가 등록된 세션을 쓰는지
+"""
+import asyncio
+import base64
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+fitz = pytest.importorskip("fitz")
+
+import lambda_itfind_downloader
+from lambda_itfind_downloader import extract_topics_from_chapters, extract_topics_from_pdf_page3
+from scripts.pdf_corpus import build_edition, build_itfind_issue
+from src import ad_page_cache, pdf_session
+from src.config import Config
+from src.pdf_image_extractor import extract_first_page_for_email, extract_toc_page_for_email
+from src.pdf_processor import PDFProcessor
+from src.pdf_session import PDFSession, get_session, open_session, read_pdf_bytes, session_scope
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    # 세션 동작만 검증하도록 [S22] 디스크 렌더링 캐시·[S16] 광고 판정 캐시는 끔
+    # (판정 캐시가 켜져 있으면 메모리 LRU가 다른 테스트 결과에 영향을 줌)
+    ad_page_cache.clear_memory_cache()
+    with patch.object(Config, "PREVIEW_RENDER_CACHE_ENABLED", False), \
+         patch.object(Config, "AD_PAGE_CACHE_ENABLED", False):
+        yield
+    pdf_session.close_all()
+    ad_page_cache.clear_memory_cache()
+
+
+@pytest.fixture
+def issue(tmp_path):
+    return build_itfind_issue(str(tmp_path / "itfind.pdf"), seed=5, planning_topics=2, ict_topics=1)
+
+
+class TestPDFSession:
+
+    def test_reads_and_parses_once(self, issue):
+        with PDFSession(issue.path) as session:
+            assert session.data == read_pdf_bytes(issue.path)
+            session.full_text()
+            session.page_text(2)
+            session.reader()
+            session.reader()
+
+            assert session.stats["reads"] == 1
+            assert session.stats["parses"] == 2  # PyMuPDF 1회 + pypdf 1회
+            assert session.stats["text_hits"] == 1
+
+    def test_preloaded_data_skips_read(self, issue):
+        with open(issue.path, "rb") as f:
+            data = f.read()
+        session = open_session(issue.path, data=data)
+        assert read_pdf_bytes(issue.path) is data
+        assert session.stats["reads"] == 0
+
+    def test_render_cache(self, issue):
+        with PDFSession(issue.path) as session:
+            first = session.render(2)
+            assert first[:3] == b"\xff\xd8\xff"
+            assert session.render(2) is first
+            assert session.render(2, output_format="png")[:4] == b"\x89PNG"
+            assert session.render(99) is None
+            assert session.stats["render_hits"] == 1
+
+    def test_set_metadata_keeps_bytes_in_sync(self, issue):
+        with PDFSession(issue.path) as session:
+            before = session.data
+            session.set_metadata({"subject": "토픽"})
+
+            with open(issue.path, "rb") as f:
+                on_disk = f.read()
+            assert session.data == on_disk
+            assert session.data.startswith(before) and len(on_disk) > len(before)
+            assert session.stats["reads"] == 1
+            assert session.is_current()
+
+        with fitz.open(issue.path) as doc:
+            assert doc.metadata["subject"] == "토픽"
+
+    def test_stale_session_invalidated(self, issue, tmp_path):
+        open_session(issue.path)
+        assert get_session(issue.path) is not None
+
+        build_edition(issue.path, pages=2, seed=1)  # 세션 밖에서 파일 교체
+        assert get_session(issue.path) is None
+        assert get_session(str(tmp_path / "missing.pdf")) is None
+
+    def test_scope_unregisters(self, issue):
+        with session_scope(issue.path) as session:
+            assert get_session(issue.path) is session
+        assert get_session(issue.path) is None
+
+
+class TestPipelineUsesSession:
+
+    def test_image_extraction_uses_session(self, issue):
+        session = open_session(issue.path)
+        session.doc  # 파싱은 세션에서 1회만
+        with patch.object(fitz, "open", side_effect=AssertionError("세션 밖에서 파일을 열면 안 됨")):
+            first = extract_toc_page_for_email(issue.path)
+            again = extract_toc_page_for_email(issue.path)
+        assert first[:3] == b"\xff\xd8\xff"
+        assert again is first
+        assert session.stats["render_hits"] == 1
+
+    def test_topic_extractors_share_text(self, issue):
+        session = open_session(issue.path)
+        assert extract_topics_from_pdf_page3(issue.path) == issue.categorized_topics
+        chapters = extract_topics_from_chapters(issue.path)
+        assert chapters["기획시리즈"] + chapters["ICT 신기술"] == issue.topics
+        assert session.stats["parses"] == 1
+        assert session.stats["text_hits"] >= 1
+
+    def test_remove_ads_parses_once(self, tmp_path):
+        """지문·단계별 판정·특성 추출·저장이 세션 문서 1개를 공유하고 pypdf 리더는 만들지 않음"""
+        edition = build_edition(str(tmp_path / "etnews.pdf"), pages=6, seed=2)
+        session = open_session(edition.path)
+        with patch.object(Config, "AD_PAGE_CACHE_ENABLED", True), \
+             patch.object(Config, "AD_CASCADE_ENABLED", True), \
+             patch.object(Config, "AD_SCORER", "vector"), \
+             patch.object(Config, "PDF_CLASSIFIER_ENGINE", "pymupdf"), \
+             patch.object(Config, "PDF_CLASSIFIER_WORKERS", 1), \
+             patch.object(fitz, "open", wraps=fitz.open) as opened, \
+             patch.object(session, "reader", side_effect=AssertionError("pypdf 리더를 만들면 안 됨")):
+            output = PDFProcessor().remove_ads(edition.path, writer="pymupdf")
+
+        assert output != edition.path
+        assert session.stats["parses"] == 1
+        assert opened.call_count == 1
+        with fitz.open(output) as doc:
+            assert len(doc) == 6 - len(edition.ad_pages)
+        # 저장 단계에서 문서를 떼어 갔어도 세션은 다시 파싱해 계속 사용 가능
+        assert extract_first_page_for_email(edition.path)[:3] == b"\xff\xd8\xff"
+
+    def test_process_pdf_runs_in_session_scope(self, tmp_path):
+        """워크플로우가 광고 제거 동안 신문 PDF 세션을 등록하고 끝나면 해제"""
+        from src.workflow import pdf_workflow
+
+        edition = build_edition(str(tmp_path / "etnews.pdf"), pages=4, seed=3)
+        seen = []
+
+        def _process(path, **kwargs):
+            seen.append(get_session(path))
+            return path
+
+        with patch.object(pdf_workflow, "download_pdf_sync", return_value=(edition.path, [])), \
+             patch.object(pdf_workflow, "process_pdf", side_effect=_process), \
+             patch.object(pdf_workflow, "_cache_backend", return_value=None):
+            pdf_workflow.download_and_process_pdf(failure_tracker=MagicMock())
+
+        assert seen[0] is not None
+        assert get_session(edition.path) is None
+
+    def test_itfind_download_base64_matches_saved_file(self, issue):
+        """토픽 추출 → 메타데이터 저장 → base64 인코딩이 한 세션에서 처리되고 결과가 파일과 같음"""
+        with open(issue.path, "rb") as f:
+            source = f.read()
+        saved = []
+
+        def _download(_streamdocs_id, save_path):
+            with open(save_path, "wb") as out:
+                out.write(source)
+            saved.append(save_path)
+            return True
+
+        trend = {"title": "주간기술동향", "issue_number": "2200", "publish_date": "2026-10-15",
+                 "detail_id": "1"}
+        with patch.object(lambda_itfind_downloader, "get_latest_weekly_trend_from_rss", return_value=trend), \
+             patch.object(lambda_itfind_downloader, "is_content_fresh", return_value=True), \
+             patch.object(lambda_itfind_downloader, "extract_streamdocs_id_from_detail_page", return_value="sd"), \
+             patch.object(lambda_itfind_downloader, "download_pdf_direct", side_effect=_download):
+            result = asyncio.run(lambda_itfind_downloader.download_itfind_pdf())
+
+        try:
+            assert result["categorized_topics"] == {
+                "기획시리즈": issue.topics[:2], "ICT 신기술": issue.topics[2:]}
+            with open(saved[0], "rb") as f:
+                on_disk = f.read()
+            assert base64.b64decode(result["pdf_base64"]) == on_disk
+            with fitz.open(saved[0]) as doc:
+                assert json.loads(doc.metadata["subject"]) == result["categorized_topics"]
+            assert get_session(saved[0]) is None
+        finally:
+            os.remove(saved[0])
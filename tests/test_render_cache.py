@@ -0,0 +1,113 @@
+"""
+[S22] 미리보기 렌더링 디스크 캐시 검증
+
+- 같은 호를 다시 처리하면 래스터화 없이 캐시에서 반환하는지 (경로가 달라도)
+- 렌더링 인자·PDF 내용이 다르면 다른 항목인지
+- 크기 상한을 넘으면 오래 안 쓴 항목부터 삭제되는지
+- 캐시 디렉터리를 쓸 수 없으면 캐시 없이 렌더링하는지
+"""
+import os
+import shutil
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+fitz = pytest.importorskip("fitz")
+
+from scripts.pdf_corpus import build_edition, build_itfind_issue
+from src import pdf_image_extractor, render_cache
+from src.config import Config
+from src.pdf_image_extractor import extract_first_page_for_email, extract_toc_page_for_email
+from src.render_cache import RenderCache, pdf_digest
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    directory = str(tmp_path / "render_cache")
+    with patch.object(Config, "PREVIEW_RENDER_CACHE_ENABLED", True), \
+         patch.object(Config, "PREVIEW_RENDER_CACHE_DIR", directory), \
+         patch.object(Config, "PREVIEW_RENDER_CACHE_MAX_MB", 32):
+        yield directory
+    render_cache.clear_digest_memo()
+
+
+@pytest.fixture
+def issue(tmp_path):
+    return build_itfind_issue(str(tmp_path / "itfind.pdf"), seed=4)
+
+
+class TestEmailPreviewCache:
+
+    def test_repeat_run_skips_rasterization(self, cache_dir, issue, tmp_path):
+        first = extract_toc_page_for_email(issue.path)
+        assert first[:3] == b"\xff\xd8\xff"
+
+        # 같은 호를 다른 경로로 다시 받아도 (수동 재발송 등) 렌더링하지 않음
+        rerun = str(tmp_path / "rerun.pdf")
+        shutil.copyfile(issue.path, rerun)
+        with patch.object(pdf_image_extractor, "render_page",
+                          side_effect=AssertionError("래스터화하면 안 됨")):
+            assert extract_toc_page_for_email(rerun) == first
+            assert extract_toc_page_for_email(issue.path) == first
+
+    def test_key_covers_page_and_content(self, cache_dir, issue, tmp_path):
+        toc = extract_toc_page_for_email(issue.path)
+        first_page = extract_first_page_for_email(issue.path)
+        assert toc != first_page
+
+        other = build_itfind_issue(str(tmp_path / "other.pdf"), seed=9, planning_topics=2)
+        assert pdf_digest(other.path) != pdf_digest(issue.path)
+        assert extract_toc_page_for_email(other.path) != toc
+        assert len(os.listdir(cache_dir)) == 3
+
+        key = RenderCache.make_key(pdf_digest(issue.path), 2, 200, 800, "jpeg", 85)
+        assert key != RenderCache.make_key(pdf_digest(issue.path), 2, 200, 800, "jpeg", 70)
+        assert key != RenderCache.make_key(pdf_digest(issue.path), 2, 200, 600, "JPEG", 85)
+        assert key == RenderCache.make_key(pdf_digest(issue.path), 2, 200, 800, "JPEG", 85)
+
+    def test_disabled_or_unusable_cache_renders(self, issue, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_bytes(b"")
+        with patch.object(Config, "PREVIEW_RENDER_CACHE_ENABLED", True), \
+             patch.object(Config, "PREVIEW_RENDER_CACHE_DIR", str(blocker / "cache")):
+            assert extract_toc_page_for_email(issue.path)[:3] == b"\xff\xd8\xff"
+        with patch.object(Config, "PREVIEW_RENDER_CACHE_ENABLED", False), \
+             patch.object(pdf_image_extractor, "RenderCache") as cache_cls:
+            assert extract_toc_page_for_email(issue.path)[:3] == b"\xff\xd8\xff"
+        cache_cls.make_key.assert_not_called()
+
+    def test_missing_pdf_returns_none(self, cache_dir, tmp_path):
+        assert extract_first_page_for_email(str(tmp_path / "missing.pdf")) is None
+
+
+class TestRenderCacheEviction:
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        cache = RenderCache(str(tmp_path / "c"), max_bytes=250)
+        for name in ("a", "b"):
+            cache.put(name, b"x" * 100)
+        past = time.time() - 60
+        os.utime(cache._path("a"), (past, past))
+        os.utime(cache._path("b"), (past + 1, past + 1))
+
+        assert cache.get("a") == b"x" * 100  # a를 최근 사용으로 갱신
+        cache.put("c", b"y" * 100)  # 300 > 250 → 가장 오래 안 쓴 b 삭제
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats["evicted"] == 1
+        assert not [n for n in os.listdir(cache.directory) if n.endswith(".tmp")]
+
+    def test_digest_uses_session_bytes(self, issue):
+        from src.pdf_session import session_scope
+
+        render_cache.clear_digest_memo()
+        with session_scope(issue.path) as session:
+            digest = pdf_digest(issue.path)
+            assert session.stats["reads"] == 1
+        render_cache.clear_digest_memo()
+        assert pdf_digest(issue.path) == digest
@@ -0,0 +1,255 @@
+"""
+[S26] RSS 피드 조건부 조회 캐시 검증
+
+- ETag/Last-Modified가 있으면 다음 조회에 If-None-Match/If-Modified-Since를 보내고 304면 파싱하지 않는지
+- 검증자가 없는 서버에서도 본문 sha256이 같으면 파싱하지 않는지
+- 피드가 바뀌면 다시 파싱하는지
+- 프로세스 메모리가 비어도(콜드 스타트) 스토리지에 남은 검증자로 조건부 조회하는지
+- get_latest_weekly_trend_from_rss / ItfindScraper가 같은 결과를 캐시에서 돌려주는지
+- 진입점이 backend를 넘기지 않으면 스토리지를 열지 않고 메모리만 쓰는지
+- pubDate가 없을 때 현재 날짜 fallback이 캐시된 결과에 고정되지 않는지
+"""
+import hashlib
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import lambda_itfind_downloader
+from src import rss_feed_cache
+from src.config import Config
+from src.rss_feed_cache import FeedCache
+from src.storage.sqlite_backend import SQLiteBackend
+from src.utils.http_session import create_http_session
+
+
+def _rss(issue: str, topics, pubdate: bool = True) -> bytes:
+    items = "".join(
+        f"<item><title>{topic} [주간기술동향 {issue}호]</title>"
+        f"<link>https://www.itfind.or.kr/admin/getStreamDocsRegi.htm?identifier=TVOL_{issue}</link>"
+        + ("<pubDate>Wed, 14 Oct 2026 00:00:00 GMT</pubDate>" if pubdate else "")
+        + "</item>"
+        for topic in topics
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+FEED_A = _rss("2210", ["양자 컴퓨팅 동향", "AI 반도체"])
+FEED_B = _rss("2211", ["6G 이동통신"])
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.seen.append(dict(self.headers))
+        body = server.body
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if server.validators and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        if server.validators:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", "Wed, 14 Oct 2026 00:00:00 GMT")
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    httpd.seen = []
+    httpd.body = FEED_A
+    httpd.validators = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/rss.do"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "cache.db"))
+    rss_feed_cache.clear_memory_cache()
+    yield SQLiteBackend()
+    rss_feed_cache.clear_memory_cache()
+
+
+@pytest.fixture
+def http():
+    session = create_http_session(retry_total=0)
+    yield session
+    session.close()
+
+
+def _counting_parser():
+    calls = []
+
+    def parse(content):
+        calls.append(content)
+        return lambda_itfind_downloader._parse_weekly_trend_rss(content)
+    return parse, calls
+
+
+class TestFeedCache:
+
+    def test_not_modified_skips_parse(self, server, backend, http):
+        cache = FeedCache("test", backend=backend)
+        parse, calls = _counting_parser()
+
+        first = cache.fetch(server.url, parse, session=http)
+        second = cache.fetch(server.url, parse, session=http)
+
+        assert first["issue_number"] == "2210"
+        assert second == first
+        assert len(calls) == 1
+        assert server.seen[1]["If-None-Match"] == '"%s"' % hashlib.md5(FEED_A).hexdigest()
+        assert server.seen[1]["If-Modified-Since"] == "Wed, 14 Oct 2026 00:00:00 GMT"
+        assert cache.stats == {"not_modified": 1, "unchanged": 0, "parsed": 1}
+
+    def test_unchanged_body_without_validators(self, server, backend, http):
+        server.validators = False
+        cache = FeedCache("test", backend=backend)
+        parse, calls = _counting_parser()
+
+        cache.fetch(server.url, parse, session=http)
+        cache.fetch(server.url, parse, session=http)
+
+        assert "If-None-Match" not in server.seen[1]
+        assert len(calls) == 1
+        assert cache.stats["unchanged"] == 1
+
+    def test_changed_feed_reparsed(self, server, backend, http):
+        cache = FeedCache("test", backend=backend)
+        parse, calls = _counting_parser()
+
+        cache.fetch(server.url, parse, session=http)
+        server.body = FEED_B
+        result = cache.fetch(server.url, parse, session=http)
+
+        assert result["issue_number"] == "2211"
+        assert result["topics"] == ["6G 이동통신"]
+        assert len(calls) == 2
+
+    def test_validators_survive_cold_start(self, server, backend, http):
+        parse, calls = _counting_parser()
+        FeedCache("test", backend=backend).fetch(server.url, parse, session=http)
+
+        rss_feed_cache.clear_memory_cache()  # 새 컨테이너
+        cache = FeedCache("test", backend=backend)
+        result = cache.fetch(server.url, parse, session=http)
+
+        assert result["detail_id"] == "2210"
+        assert len(calls) == 1
+        assert cache.stats["not_modified"] == 1
+
+    def test_parse_error_not_cached(self, server, backend, http):
+        cache = FeedCache("test", backend=backend)
+
+        with pytest.raises(ValueError):
+            cache.fetch(server.url, MagicMock(side_effect=ValueError("bad feed")), session=http)
+        parse, calls = _counting_parser()
+        assert cache.fetch(server.url, parse, session=http)["issue_number"] == "2210"
+        assert len(calls) == 1
+
+    def test_names_do_not_share_results(self, server, backend, http):
+        FeedCache("a", backend=backend).fetch(server.url, lambda content: "a", session=http)
+        assert FeedCache("b", backend=backend).fetch(server.url, lambda content: "b", session=http) == "b"
+
+    def test_without_backend_stays_in_memory(self, server, http):
+        """backend를 주입하지 않으면 운영 스토리지를 열지 않고 프로세스 메모리만 사용"""
+        rss_feed_cache.clear_memory_cache()
+        parse, calls = _counting_parser()
+        with patch("src.storage.get_storage_backend") as get_backend:
+            rss_feed_cache.fetch_feed("test", server.url, parse, session=http)
+            rss_feed_cache.fetch_feed("test", server.url, parse, session=http)
+        rss_feed_cache.clear_memory_cache()
+
+        get_backend.assert_not_called()
+        assert len(calls) == 1
+        assert server.seen[1].get("If-None-Match")
+
+
+class TestTrendLookupUsesCache:
+
+    def _session(self, server, http):
+        """하드코딩된 ITFIND URL 대신 로컬 서버로 보내는 세션"""
+        session = MagicMock()
+        session.get.side_effect = lambda url, **kwargs: http.get(server.url, **kwargs)
+        return session
+
+    def test_module_function(self, server, backend, http):
+        session = self._session(server, http)
+        with patch.object(lambda_itfind_downloader, "_parse_weekly_trend_rss",
+                          wraps=lambda_itfind_downloader._parse_weekly_trend_rss) as parse:
+            first = lambda_itfind_downloader.get_latest_weekly_trend_from_rss(session=session, backend=backend)
+            second = lambda_itfind_downloader.get_latest_weekly_trend_from_rss(session=session, backend=backend)
+
+        assert first == second
+        assert first["topics"] == ["양자 컴퓨팅 동향", "AI 반도체"]
+        assert first["publish_date"] == "2026-10-14"
+        assert parse.call_count == 1
+
+    def test_cache_disabled_always_parses(self, server, backend, http):
+        session = self._session(server, http)
+        with patch.object(Config, "RSS_FEED_CACHE_ENABLED", False):
+            lambda_itfind_downloader.get_latest_weekly_trend_from_rss(session=session, backend=backend)
+            lambda_itfind_downloader.get_latest_weekly_trend_from_rss(session=session, backend=backend)
+        assert all("If-None-Match" not in headers for headers in server.seen)
+
+    def test_missing_pubdate_falls_back_per_lookup(self, server, backend, http):
+        """pubDate가 없으면 조회 시점 날짜를 쓰고, 캐시된 결과에는 날짜를 남기지 않는다"""
+        from datetime import datetime as real_datetime
+
+        server.body = _rss("2212", ["메타버스"], pubdate=False)
+        session = self._session(server, http)
+
+        def lookup_on(day):
+            class _FixedDatetime(real_datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return real_datetime(2026, 10, day, 9, 0, tzinfo=tz)
+            with patch.object(lambda_itfind_downloader, "datetime", _FixedDatetime):
+                return lambda_itfind_downloader.get_latest_weekly_trend_from_rss(session=session, backend=backend)
+
+        first = lookup_on(14)
+        second = lookup_on(21)  # 일주일 뒤 304 응답
+
+        assert server.seen[1].get("If-None-Match")
+        assert first["publish_date"] == "2026-10-14"
+        assert second["publish_date"] == "2026-10-21"
+        stored = backend.get_cache_items("rss_feed:v1:itfind_weekly_trend", [
+            "https://www.itfind.or.kr/ccenter/rss.do?codeAlias=all&rssType=02"
+        ])
+        assert '"publish_date": null' in next(iter(stored.values()))
+
+    def test_scraper_returns_weekly_trend(self, server, backend, http):
+        from src.itfind_scraper import ItfindScraper, WeeklyTrend
+
+        scraper = ItfindScraper()
+        session = self._session(server, http)
+        with patch.object(rss_feed_cache, "get_http_session", return_value=session):
+            first = scraper.get_latest_weekly_trend_from_rss(backend=backend)
+            second = scraper.get_latest_weekly_trend_from_rss(backend=backend)
+
+        assert isinstance(second, WeeklyTrend)
+        assert second == first
+        assert first.detail_id == "2210"
+        assert server.seen[1].get("If-None-Match")
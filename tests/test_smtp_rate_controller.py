@@ -0,0 +1,196 @@
+"""
+[S9] SMTPRateController 검증
+
+- 응답 코드 분류 (스로틀링 / 일일 한도 / 일반 실패)
+- AIMD: 성공 시 가산 증가, 스로틀링·지연 초과 시 배수 감소
+- 스로틀링 응답 시 지수 백오프 정지 후 재개, 누적 정지 한도 초과 시 중단
+- 순차 전송 엔진에서 421 응답 수신자가 실패 대신 재시도되는지
+"""
+import os
+import smtplib
+import sys
+from dataclasses import dataclass
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.email_sender import EmailSender
+from src.smtp_rate_controller import (
+    FAILED,
+    HALTED,
+    THROTTLED,
+    SMTPRateController,
+    extract_smtp_reply,
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@dataclass
+class _FakeRecipient:
+    email: str
+    name: str = "Test"
+
+
+def _controller(clock, **kwargs):
+    params = dict(
+        max_concurrency=4, max_rate=4.0, rate_increase=0.5,
+        latency_target=10.0, pause_base=5.0, pause_max=20.0, pause_budget=60.0,
+        clock=clock,
+    )
+    params.update(kwargs)
+    return SMTPRateController(**params)
+
+
+class TestReplyClassification:
+
+    def test_extract_reply_from_smtplib_exceptions(self):
+        assert extract_smtp_reply(smtplib.SMTPDataError(451, b"4.3.0 try later")) == (
+            451, "4.3.0 try later"
+        )
+        refused = smtplib.SMTPRecipientsRefused({"a@example.com": (450, b"4.2.1 slow down")})
+        assert extract_smtp_reply(refused) == (450, "4.2.1 slow down")
+        assert extract_smtp_reply(smtplib.SMTPServerDisconnected("gone"))[0] is None
+
+    def test_extract_reply_from_aiosmtplib_exceptions(self):
+        aiosmtplib = pytest.importorskip("aiosmtplib")
+        assert extract_smtp_reply(aiosmtplib.SMTPResponseException(421, "4.7.0 busy")) == (
+            421, "4.7.0 busy"
+        )
+
+    def test_failure_verdicts(self):
+        c = _controller(_FakeClock())
+        assert c.on_failure(smtplib.SMTPDataError(421, b"4.7.0 Try again later")) == THROTTLED
+        assert c.on_failure(smtplib.SMTPRecipientsRefused(
+            {"a@example.com": (550, b"5.1.1 user unknown")})) == FAILED
+        assert not c.halted
+        assert c.on_failure(smtplib.SMTPDataError(
+            550, b"5.4.5 Daily user sending limit exceeded")) == HALTED
+        assert c.halted
+
+    def test_disabled_controller_passes_through(self):
+        c = _controller(_FakeClock(), enabled=False)
+        assert c.on_failure(smtplib.SMTPDataError(421, b"busy")) == FAILED
+        assert c.reserve() == 0.0
+        assert c.concurrency == 4
+
+
+class TestAimd:
+
+    def test_throttle_halves_and_success_recovers_additively(self):
+        clock = _FakeClock()
+        c = _controller(clock)
+        c.on_failure(smtplib.SMTPDataError(454, b"4.7.0 temporary"))
+        snap = c.snapshot()
+        assert snap["rate_per_sec"] == 2.0
+        assert snap["concurrency"] == 2
+
+        c.on_success(1.0)
+        c.on_success(1.0)
+        assert c.snapshot()["rate_per_sec"] == 3.0
+
+        # 지연 목표 초과는 정지 없이 감속만
+        c.on_success(30.0)
+        snap = c.snapshot()
+        assert snap["rate_per_sec"] == 1.5
+        assert snap["pauses"] == 1
+        assert snap["latency_max_sec"] == 30.0
+
+    def test_reserve_spaces_sends_by_current_rate(self):
+        clock = _FakeClock()
+        c = _controller(clock, max_rate=2.0)
+        assert c.reserve() == 0.0
+        assert c.reserve() == pytest.approx(0.5)
+        assert c.reserve() == pytest.approx(1.0)
+
+
+class TestPauseResume:
+
+    def test_throttle_pauses_with_exponential_backoff(self):
+        clock = _FakeClock()
+        c = _controller(clock)
+        err = smtplib.SMTPDataError(421, b"4.7.0 Try again later")
+
+        c.on_failure(err)
+        assert c.reserve() == pytest.approx(5.0)
+
+        clock.now += 10
+        c.on_failure(err)
+        assert c.reserve() == pytest.approx(10.0)
+
+        # 성공하면 백오프 단계 초기화
+        clock.now += 20
+        c.on_success(1.0)
+        c.on_failure(err)
+        assert c.reserve() == pytest.approx(5.0)
+        assert c.snapshot()["paused_seconds"] == 20.0
+
+    def test_pause_budget_exhaustion_halts(self):
+        clock = _FakeClock()
+        c = _controller(clock, pause_budget=12.0)
+        err = smtplib.SMTPDataError(450, b"4.2.1 rate limited")
+
+        assert c.on_failure(err) == THROTTLED  # 5s
+        clock.now += 5
+        assert c.on_failure(err) == HALTED     # 5 + 10 > 12
+        assert c.snapshot()["halted"] is True
+
+
+class TestSerialEngineThrottleRetry:
+
+    @pytest.fixture
+    def sender(self):
+        s = EmailSender()
+        s.config = Mock()
+        s.config.GMAIL_USER = "sender@example.com"
+        s.config.SMTP_CONSECUTIVE_FAIL_LIMIT = 2
+        s.config.SMTP_RECONNECT_EVERY = 50
+        s.config.SMTP_POOL_SIZE = 1
+        s.config.DELIVERY_LEDGER_ENABLED = False
+        s.config.SMTP_ADAPTIVE_RATE = True
+        s.config.SMTP_MAX_RATE = 100.0
+        s.config.SMTP_RATE_INCREASE = 1.0
+        s.config.SMTP_LATENCY_TARGET = 60
+        s.config.SMTP_THROTTLE_PAUSE = 0.01
+        s.config.SMTP_THROTTLE_PAUSE_MAX = 0.05
+        s.config.SMTP_THROTTLE_PAUSE_BUDGET = 10
+        s.config.SMTP_THROTTLE_MAX_RETRIES = 3
+        s.unsubscribe_url_base = "https://example.com/u"
+        s.unsubscribe_secret = "test_secret_for_unit_tests"
+        s._open_smtp_connection = Mock(return_value=Mock(name="FakeSMTPServer"))
+        return s
+
+    def test_421_is_retried_after_pause_instead_of_failing(self, sender, tmp_path):
+        pdf = tmp_path / "etnews_20260417.pdf"
+        pdf.write_bytes(b"%PDF-1.4\n" + b"x" * 256)
+        recipients = [_FakeRecipient(f"u{i}@example.com") for i in range(4)]
+
+        # u1 전송 시 2회 연속 421 — 연속 실패 한도(2)에 걸리지 않고 재시도되어야 함
+        throttles = {"left": 2}
+
+        def send(server, msg, to):
+            if to[0] == "u1@example.com" and throttles["left"]:
+                throttles["left"] -= 1
+                raise smtplib.SMTPDataError(421, b"4.7.0 Try again later")
+            return server
+
+        sender._send_on_server = Mock(side_effect=send)
+        with patch("src.email_sender.get_active_recipients", return_value=recipients), \
+             patch("src.pdf_image_extractor.extract_first_page_for_email", return_value=None):
+            ok, success = sender.send_bulk_email(pdf_path=str(pdf))
+
+        assert ok is True
+        assert success == [r.email for r in recipients]
+        assert sender._send_on_server.call_count == 6
+        assert sender.rate_metrics["throttled"] == 2
+        assert sender.rate_metrics["pauses"] == 2
+        assert sender.rate_metrics["reply_codes"] == {421: 2}
+        assert sender.rate_metrics["sent"] == 4
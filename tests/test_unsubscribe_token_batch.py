@@ -0,0 +1,88 @@
+"""
+[S11] 수신거부 토큰 일괄 생성·월별 캐시 검증
+
+- generate_tokens 결과가 generate_token과 동일하고 verify_token을 통과하는지
+- SQLite 캐시 왕복 (조회·저장·TTL)
+- 캐시 적중 시 토큰을 다시 계산하지 않는지
+"""
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import unsubscribe_token
+from src.storage.sqlite_backend import SQLiteBackend
+from src.unsubscribe_token import (
+    generate_token,
+    generate_tokens,
+    get_monthly_tokens,
+    verify_token,
+)
+
+SECRET = "test_secret_for_unit_tests"
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "cache.db"))
+    return SQLiteBackend()
+
+
+class TestGenerateTokens:
+
+    def test_batch_matches_single_generation(self):
+        emails = [f"user{i}@example.com" for i in range(20)]
+        tokens = generate_tokens(emails, SECRET)
+
+        assert list(tokens) == emails
+        for email in emails:
+            assert tokens[email] == generate_token(email, SECRET)
+            assert verify_token(tokens[email], SECRET) == (True, email)
+
+
+class TestSQLiteCache:
+
+    def test_cache_items_round_trip(self, backend):
+        assert backend.put_cache_items("ns", {"a": "1", "b": "2"}) is True
+        assert backend.get_cache_items("ns", ["a", "b", "c"]) == {"a": "1", "b": "2"}
+        assert backend.get_cache_items("other", ["a"]) == {}
+
+        # 덮어쓰기
+        backend.put_cache_items("ns", {"a": "3"})
+        assert backend.get_cache_items("ns", ["a"]) == {"a": "3"}
+
+    def test_expired_items_are_ignored(self, backend):
+        backend.put_cache_items("ns", {"a": "1"}, ttl_days=-1)
+        assert backend.get_cache_items("ns", ["a"]) == {}
+
+
+class TestMonthlyTokens:
+
+    def test_cache_hit_skips_generation(self, backend):
+        emails = ["a@example.com", "b@example.com"]
+        first = get_monthly_tokens(emails, SECRET, backend=backend)
+        assert first == generate_tokens(emails, SECRET)
+
+        with patch.object(unsubscribe_token, "generate_tokens", wraps=generate_tokens) as gen:
+            second = get_monthly_tokens(emails + ["c@example.com"], SECRET, backend=backend)
+
+        # 캐시에 없던 c만 생성
+        gen.assert_called_once()
+        assert gen.call_args.args[0] == ["c@example.com"]
+        assert second == generate_tokens(emails + ["c@example.com"], SECRET)
+
+    def test_cache_is_scoped_by_secret(self, backend):
+        get_monthly_tokens(["a@example.com"], SECRET, backend=backend)
+        other = get_monthly_tokens(["a@example.com"], "another_secret", backend=backend)
+        assert other["a@example.com"] == generate_token("a@example.com", "another_secret")
+
+    def test_cache_failure_falls_back_to_generation(self):
+        broken = Mock()
+        broken.get_cache_items.side_effect = RuntimeError("db down")
+        broken.put_cache_items.side_effect = RuntimeError("db down")
+
+        tokens = get_monthly_tokens(["a@example.com"], SECRET, backend=broken)
+        assert tokens == {"a@example.com": generate_token("a@example.com", SECRET)}